@@ -7,9 +7,39 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@gmail.com ana.Ortega.Ort@gmail.com"
 
+import re
 from import_export import neutral_load_description as nld
 from postprocess.reports import graphical_reports
 
+# Term of a combination expression: sign, optional factor and load case
+# name. A '-' is part of the name (i.e. 'LC-1') unless it is surrounded
+# by blanks or followed by a factor.
+_number= r'(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?'
+_combTermPattern= re.compile(r'\s*(?P<sign>[+-])?\s*(?:(?P<factor>[+-]?\s*'+_number+r')\s*\*\s*)?(?P<name>[^\s+*\-0-9.](?:[^\s+*-]|-(?!\s|[+-]?\s*'+_number+r'\s*\*))*)\s*')
+
+def getLoadCaseFactors(combExpr):
+    '''Return a dictionary containing the factor that corresponds to
+       each load case in the combination expression (i.e. for 
+       '1.35*G+1.5*Q' returns {'G': 1.35, 'Q': 1.5}). Terms without
+       factor have a unit one (i.e. 'G+1.5*Q' gives {'G': 1.0, 'Q': 1.5}).
+
+    :param combExpr: combination expression.
+    '''
+    retval= dict()
+    pos= 0
+    while(pos<len(combExpr) and combExpr[pos:].strip()):
+        term= _combTermPattern.match(combExpr, pos)
+        if((term is None) or (pos>0 and not term.group('sign'))):
+            raise ValueError('getLoadCaseFactors; can\'t interpret: \''+combExpr[pos:]+'\' in expression: \''+combExpr+'\'')
+        factor= 1.0
+        if(term.group('factor')):
+            factor= float(term.group('factor').replace(' ',''))
+        if(term.group('sign')=='-'):
+            factor= -factor
+        loadCaseName= term.group('name')
+        retval[loadCaseName]= retval.get(loadCaseName, 0.0)+factor
+        pos= term.end()
+    return retval
 
 class CombinationRecord(object):
    '''Combination name and expression (i.e. ELS01= 1.0*G+1.0*Q)'''
@@ -17,6 +47,11 @@ class CombinationRecord(object):
        self.name= name
        self.expr= expr
        
+   def getLoadCaseFactors(self):
+       '''Return a dictionary containing the factor that corresponds
+          to each load case of the combination.'''
+       return getLoadCaseFactors(self.expr)
+       
    def createCombination(self,xcCombHandler):
        '''Create combination and insert it into the XC combination handler.'''
        xcCombHandler.newLoadCombination(self.name,self.expr)
@@ -0,0 +1,517 @@
+# -*- coding: utf-8 -*-
+''' Influence surfaces of a deck and moving load envelopes.
+
+    Unit loads are applied (one load pattern each) at the nodes of the
+    deck and solved only once (use the MultiLoadCaseStaticLinear solution
+    procedure to factorize the stiffness matrix only one time). The
+    values of the chosen response quantities for each unit load are the
+    influence coefficients. Then a load model (vehicle, train,...) is
+    swept along a lane: the effect of the vehicle at each position is
+    obtained convolving the influence surface with the loads of the
+    vehicle, without solving the model again. Only valid for linear
+    analysis.
+'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import math
+import numpy
+import scipy.interpolate
+import geom
+import xc
+from actions import load_cases as lcases
+from actions.roadway_trafic import load_model_base as lmb
+from model.sets import spatial_index
+from materials.sections import internal_forces
+from misc_utils import log_messages as lmsg
+
+class ResponseQuantity(object):
+    ''' Response quantity whose influence surface is computed.
+
+    :ivar name: name of the response quantity.
+    :ivar needsReactions: true if the nodal reactions must be computed
+                          to obtain its value.
+    '''
+    needsReactions= False
+
+    def __init__(self, name):
+        ''' Constructor.
+
+        :param name: name of the response quantity.
+        '''
+        self.name= name
+
+    def getValue(self):
+        ''' Return the current value of the response quantity.'''
+        lmsg.error('getValue not implemented for: '+self.name)
+        return 0.0
+
+class NodeDisplacement(ResponseQuantity):
+    ''' Displacement of a node.
+
+    :ivar node: node to read the displacement from.
+    :ivar dof: index of the degree of freedom.
+    '''
+    def __init__(self, name, node, dof):
+        ''' Constructor.
+
+        :param name: name of the response quantity.
+        :param node: node to read the displacement from.
+        :param dof: index of the degree of freedom.
+        '''
+        super(NodeDisplacement,self).__init__(name)
+        self.node= node
+        self.dof= dof
+
+    def getValue(self):
+        ''' Return the current value of the displacement.'''
+        return self.node.getDisp[self.dof]
+
+class NodeReaction(ResponseQuantity):
+    ''' Reaction in a node.
+
+    :ivar node: node to read the reaction from.
+    :ivar dof: index of the degree of freedom.
+    '''
+    needsReactions= True
+
+    def __init__(self, name, node, dof):
+        ''' Constructor.
+
+        :param name: name of the response quantity.
+        :param node: node to read the reaction from.
+        :param dof: index of the degree of freedom.
+        '''
+        super(NodeReaction,self).__init__(name)
+        self.node= node
+        self.dof= dof
+
+    def getValue(self):
+        ''' Return the current value of the reaction.'''
+        return self.node.getReaction[self.dof]
+
+class ElementInternalForce(ResponseQuantity):
+    ''' Internal force of a bar element ('N', 'Vy', 'Vz', 'T', 'My', 'Mz'
+        or, for 2D elements, 'N', 'V', 'M') at one of its nodes.
+
+    :ivar element: element to read the internal force from.
+    :ivar code: identifier of the internal force.
+    :ivar nodeIndex: index of the node (0 or 1).
+    '''
+    def __init__(self, name, element, code, nodeIndex= 0):
+        ''' Constructor.
+
+        :param name: name of the response quantity.
+        :param element: element to read the internal force from.
+        :param code: identifier of the internal force.
+        :param nodeIndex: index of the node (defaults to 0).
+        '''
+        super(ElementInternalForce,self).__init__(name)
+        self.element= element
+        self.code= code
+        self.nodeIndex= nodeIndex
+
+    def getValue(self):
+        ''' Return the current value of the internal force.'''
+        self.element.getResistingForce()
+        values= self.element.getValuesAtNodes(self.code, False)
+        if(len(values)<=self.nodeIndex):
+            lmsg.error("response '"+self.code+"' not found in element: "+str(self.element.tag))
+            return 0.0
+        return values[self.nodeIndex]
+
+class ShellInternalForce(ResponseQuantity):
+    ''' Average internal force of a shell element ('n1', 'n2', 'n12', 'm1',
+        'm2', 'm12', 'q13' or 'q23').
+
+    :ivar element: shell element to read the internal force from.
+    :ivar component: identifier of the internal force.
+    '''
+    def __init__(self, name, element, component):
+        ''' Constructor.
+
+        :param name: name of the response quantity.
+        :param element: shell element to read the internal force from.
+        :param component: identifier of the internal force.
+        '''
+        super(ShellInternalForce,self).__init__(name)
+        self.element= element
+        self.component= component
+
+    def getValue(self):
+        ''' Return the current value of the internal force.'''
+        shellForces= internal_forces.ShellMaterialInternalForces()
+        shellForces.setFromAverageInShellElement(self.element)
+        return getattr(shellForces, self.component)
+
+class Lane(object):
+    ''' Traffic lane (or track) along which the load models are moved.
+
+    :ivar origin: start point of the lane axis (geom.Pos2d).
+    :ivar end: end point of the lane axis (geom.Pos2d).
+    :ivar width: width of the lane (the vehicle centroid is moved across
+                 it too, defaults to 0: vehicle on the lane axis).
+    '''
+    def __init__(self, origin, end, width= 0.0):
+        ''' Constructor.
+
+        :param origin: start point of the lane axis (geom.Pos2d).
+        :param end: end point of the lane axis (geom.Pos2d).
+        :param width: width of the lane (defaults to 0).
+        '''
+        self.origin= origin
+        self.end= end
+        self.width= width
+
+    def getLength(self):
+        ''' Return the length of the lane axis.'''
+        return math.hypot(self.end.x-self.origin.x, self.end.y-self.origin.y)
+
+    def getDirection(self):
+        ''' Return the unit vector along the lane axis (longitudinal
+            direction) and the unit vector normal to it (transversal
+            direction). For a lane parallel to the global Y axis the
+            transversal direction is the global X axis.'''
+        length= self.getLength()
+        d= numpy.array([self.end.x-self.origin.x, self.end.y-self.origin.y])/length
+        n= numpy.array([d[1], -d[0]])
+        return d, n
+
+    def getPositions(self, longStep, transvStep= None):
+        ''' Return the positions of the vehicle centroid that will be
+            considered (array of (x,y) rows).
+
+        :param longStep: distance between positions along the lane axis.
+        :param transvStep: distance between positions across the lane
+                           (if None only the positions on the lane axis
+                           are considered).
+        '''
+        d, n= self.getDirection()
+        length= self.getLength()
+        numLong= max(int(math.ceil(length/longStep)),1)+1
+        longCoo= numpy.linspace(0.0, length, numLong)
+        transvCoo= numpy.array([0.0])
+        if(transvStep and (self.width>0.0)):
+            numTransv= max(int(math.ceil(self.width/transvStep)),1)+1
+            transvCoo= numpy.linspace(-self.width/2.0, self.width/2.0, numTransv)
+        l, t= numpy.meshgrid(longCoo, transvCoo, indexing= 'ij')
+        origin= numpy.array([self.origin.x, self.origin.y])
+        return origin+numpy.outer(l.ravel(), d)+numpy.outer(t.ravel(), n)
+
+def getGlobalLoadModel(loadModel, lane, reverse= False):
+    ''' Return the load model with the positions of the wheels expressed
+        in global axes (x: transversal, y: longitudinal offsets of the
+        load model are rotated to follow the lane). The wheel
+        dimensions are replaced by those of the bounding rectangle
+        of the rotated footprint (the same when the lane is parallel
+        to a global axis).
+
+    :param loadModel: load model (see load_model_base.LoadModel).
+    :param lane: lane where the vehicle is placed.
+    :param reverse: if true, the vehicle is rotated 180 degrees.
+    '''
+    d, n= lane.getDirection()
+    if(reverse):
+        d= -d; n= -n
+    wLoads= list()
+    for w in loadModel.wheelLoads:
+        offset= w.position.x*n+w.position.y*d
+        lx= abs(w.lx*n[0])+abs(w.ly*d[0])
+        ly= abs(w.lx*n[1])+abs(w.ly*d[1])
+        wLoads.append(lmb.WheelLoad(pos= geom.Pos2d(float(offset[0]),float(offset[1])),ld= w.load,lx= float(lx),ly= float(ly)))
+    return lmb.LoadModel(wLoads)
+
+class GoverningPosition(object):
+    ''' Vehicle position that produces the extreme value of a response.
+
+    :ivar value: value of the response.
+    :ivar xCentr: global X coordinate of the vehicle reference point.
+    :ivar yCentr: global Y coordinate of the vehicle reference point.
+    :ivar loadModel: load model with the wheel positions in global axes
+                     (see getGlobalLoadModel).
+    '''
+    def __init__(self, value, xCentr, yCentr, loadModel):
+        ''' Constructor.
+
+        :param value: value of the response.
+        :param xCentr: global X coordinate of the vehicle centroid.
+        :param yCentr: global Y coordinate of the vehicle centroid.
+        :param loadModel: load model in global axes.
+        '''
+        self.value= value
+        self.xCentr= xCentr
+        self.yCentr= yCentr
+        self.loadModel= loadModel
+
+    def getVehicleDistrLoad(self, name, deckSet, hDistr, slopeDistr, spatialIndex= None):
+        ''' Return the vehicle load at this position (to add it to a
+            load case).
+
+        :param name: name identifying the load.
+        :param deckSet: set of shell elements to distribute the loads.
+        :param hDistr: height considered to distribute each wheel load.
+        :param slopeDistr: slope (H/V) through hDistr to distribute the
+                           load of a wheel.
+        :param spatialIndex: spatial index of deckSet (defaults to None).
+        '''
+        return lmb.VehicleDistrLoad(name= name,xcSet= deckSet,loadModel= self.loadModel,xCentr= self.xCentr,yCentr= self.yCentr,hDistr= hDistr,slopeDistr= slopeDistr,spatialIndex= spatialIndex)
+
+class InfluenceSurfaces(object):
+    ''' Influence surfaces of some response quantities for unit loads
+        applied at the nodes of a deck.
+
+    :ivar name: name of the influence surfaces (used as prefix of
+                the unit load patterns).
+    :ivar nodes: nodes where the unit loads are applied.
+    :ivar responses: response quantities.
+    :ivar unitLoad: components of the unit load (defaults to [0,0,-1]:
+                    downwards vertical load).
+    :ivar positions: array with the (x,y) coordinates of the nodes.
+    :ivar coefficients: array (number of nodes x number of responses)
+                        containing the influence coefficients.
+    '''
+    def __init__(self, name, nodeSet, responses, unitLoad= None):
+        ''' Constructor.
+
+        :param name: name of the influence surfaces.
+        :param nodeSet: nodes where the unit loads are applied (i.e.
+                        deckSet.nodes).
+        :param responses: response quantities (see ResponseQuantity).
+        :param unitLoad: components of the unit load (defaults to
+                         [0,0,-1]).
+        '''
+        self.name= name
+        self.nodes= [n for n in nodeSet]
+        self.responses= responses
+        if(unitLoad is None):
+            unitLoad= [0.0,0.0,-1.0]
+        self.unitLoad= list(unitLoad)
+        positions= list()
+        for n in self.nodes:
+            p= n.getInitialPos3d
+            positions.append((p.x, p.y))
+        self.positions= numpy.array(positions).reshape(-1,2)
+        self.coefficients= None
+        self.interpolator= None
+
+    def getResponseNames(self):
+        ''' Return the names of the response quantities.'''
+        return [r.name for r in self.responses]
+
+    def getResponseIndex(self, responseName):
+        ''' Return the index of the response quantity.
+
+        :param responseName: name of the response quantity.
+        '''
+        return self.getResponseNames().index(responseName)
+
+    def getUnitLoadPatternName(self, node):
+        ''' Return the name of the load pattern of the unit load
+            applied to the node argument.'''
+        return self.name+'_unit_'+str(node.tag)
+
+    def defineUnitLoadPatterns(self, preprocessor):
+        ''' Define a load pattern for each unit load and return
+            their names. The load patterns already defined (i.e. when
+            compute is called again) are reused as they are.
+
+        :param preprocessor: preprocessor of the finite element problem.
+        '''
+        lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+        tsName= self.name+'_unitTS'
+        lPatterns.newTimeSeries('constant_ts',tsName)
+        lPatterns.currentTimeSeries= tsName
+        retval= list()
+        for n in self.nodes:
+            lpName= self.getUnitLoadPatternName(n)
+            retval.append(lpName)
+            if(lPatterns[lpName] is not None): # already defined.
+                continue
+            lp= lPatterns.newLoadPattern('default',lpName)
+            loadValues= [0.0]*n.getNumberDOF
+            for i, v in enumerate(self.unitLoad[:n.getNumberDOF]):
+                loadValues[i]= v
+            lp.newNodalLoad(n.tag, xc.Vector(loadValues))
+        return retval
+
+    def compute(self, solutionProcedure):
+        ''' Solve the unit loads and store the influence coefficients.
+
+        :param solutionProcedure: linear solution procedure (use
+                                  MultiLoadCaseStaticLinear to factorize
+                                  the stiffness matrix only once).
+        '''
+        preprocessor= solutionProcedure.feProblem.getPreprocessor
+        lpNames= self.defineUnitLoadPatterns(preprocessor)
+        columns= dict()
+        for i, lpName in enumerate(lpNames):
+            columns[lpName]= i
+        self.coefficients= numpy.zeros((len(lpNames), len(self.responses)))
+        def storeCoefficients(lpName):
+            row= self.coefficients[columns[lpName]]
+            for j, r in enumerate(self.responses):
+                row[j]= r.getValue()
+        needsReactions= any(r.needsReactions for r in self.responses)
+        solutionProcedure.solveLoadCases(lpNames, getDisplacements= False, callback= storeCoefficients, calculateNodalReactions= needsReactions)
+        self.interpolator= None
+
+    def getInterpolator(self):
+        ''' Return the function that interpolates the influence
+            coefficients (built only once). If the nodes are aligned
+            (i.e. the deck is modelled with bar elements) the values
+            are interpolated along their line and the points outside
+            it (i.e. the wheels of an axle) are projected onto it.'''
+        if(self.interpolator is None):
+            origin= self.positions.mean(axis= 0)
+            u, sv, vt= numpy.linalg.svd(self.positions-origin, full_matrices= False)
+            if((len(sv)>1) and (sv[1]>1e-9*max(sv[0],1.0))):
+                self.interpolator= scipy.interpolate.LinearNDInterpolator(self.positions, self.coefficients, fill_value= 0.0)
+            else: # nodes on a line.
+                axis= vt[0]
+                s= numpy.dot(self.positions-origin, axis)
+                order= numpy.argsort(s)
+                lineInterpolator= scipy.interpolate.interp1d(s[order], self.coefficients[order], axis= 0, bounds_error= False, fill_value= 0.0)
+                def interpolator(points):
+                    return lineInterpolator(numpy.dot(points-origin, axis))
+                self.interpolator= interpolator
+        return self.interpolator
+
+    def getInfluenceValues(self, points):
+        ''' Return the influence coefficients of the responses for a unit
+            load at each of the points (array of (x,y) rows), obtained by
+            linear interpolation of the nodal values. The coefficients
+            are zero outside the deck.
+
+        :param points: positions of the unit load.
+        '''
+        if(self.coefficients is None):
+            lmsg.error('influence surfaces: '+self.name+' not computed yet.')
+            return None
+        return self.getInterpolator()(numpy.asarray(points, dtype= float).reshape(-1,2))
+
+    def getLoadKernel(self, loadModel, hDistr= 0.0, slopeDistr= 1.0, footprintDivisions= 1):
+        ''' Return the offsets (with respect to the vehicle centroid) and
+            the weights of the points that represent the loads of the
+            vehicle. Each wheel load is spread over its footprint,
+            enlarged in the same way as in load_model_base.VehicleDistrLoad.
+
+        :param loadModel: load model in global axes (see
+                          getGlobalLoadModel).
+        :param hDistr: height considered to distribute each wheel load.
+        :param slopeDistr: slope (H/V) through hDistr to distribute the
+                           load of a wheel.
+        :param footprintDivisions: number of divisions of each side of
+                                   the footprint (defaults to 1: point
+                                   loads at the wheel centers).
+        '''
+        deltaL= 2*slopeDistr*hDistr
+        nDiv= max(int(footprintDivisions),1)
+        s= (numpy.arange(nDiv)+0.5)/nDiv-0.5 # centers of the divisions.
+        offsets= list()
+        weights= list()
+        for w in loadModel.wheelLoads:
+            Lx= w.lx+deltaL
+            Ly= w.ly+deltaL
+            if(Lx==0.0 and Ly==0.0):
+                offsets.append((w.position.x, w.position.y))
+                weights.append(w.load)
+            else:
+                for sx in s:
+                    for sy in s:
+                        offsets.append((w.position.x+sx*Lx, w.position.y+sy*Ly))
+                        weights.append(w.load/nDiv**2)
+        return numpy.array(offsets), numpy.array(weights)
+
+    def getEffects(self, loadModel, centroids, hDistr= 0.0, slopeDistr= 1.0, footprintDivisions= 1):
+        ''' Return the values of the responses (array: number of
+            positions x number of responses) for the vehicle placed at
+            each of the centroid positions.
+
+        :param loadModel: load model in global axes (see
+                          getGlobalLoadModel).
+        :param centroids: positions of the vehicle centroid (array of
+                          (x,y) rows).
+        :param hDistr: height considered to distribute each wheel load.
+        :param slopeDistr: slope (H/V) through hDistr to distribute the
+                           load of a wheel.
+        :param footprintDivisions: number of divisions of each side of
+                                   the wheel footprints.
+        '''
+        offsets, weights= self.getLoadKernel(loadModel, hDistr, slopeDistr, footprintDivisions)
+        centroids= numpy.asarray(centroids, dtype= float).reshape(-1,2)
+        # Discrete convolution of the influence surface with the loads.
+        points= (centroids[numpy.newaxis,:,:]+offsets[:,numpy.newaxis,:]).reshape(-1,2)
+        values= self.getInfluenceValues(points).reshape(len(weights), len(centroids), -1)
+        return numpy.tensordot(weights, values, axes= 1)
+
+    def sweep(self, loadModel, lanes, longStep, transvStep= None, hDistr= 0.0, slopeDistr= 1.0, footprintDivisions= 1, bothDirections= True):
+        ''' Move the load model along the lanes and return a dictionary
+            containing, for each response, the positions that produce
+            its maximum ('max') and minimum ('min') values (see
+            GoverningPosition).
+
+        :param loadModel: load model (see load_model_base.LoadModel).
+        :param lanes: lanes along which the vehicle is moved.
+        :param longStep: distance between positions along the lanes.
+        :param transvStep: distance between positions across the lanes
+                           (if None the vehicle is kept on the lane axis).
+        :param hDistr: height considered to distribute each wheel load.
+        :param slopeDistr: slope (H/V) through hDistr to distribute the
+                           load of a wheel.
+        :param footprintDivisions: number of divisions of each side of
+                                   the wheel footprints (defaults to 1).
+        :param bothDirections: if true consider also the vehicle rotated
+                               180 degrees.
+        '''
+        retval= dict()
+        for name in self.getResponseNames():
+            retval[name]= {'max':None, 'min':None}
+        for lane in lanes:
+            centroids= lane.getPositions(longStep, transvStep)
+            directions= [False, True] if bothDirections else [False]
+            for reverse in directions:
+                globalModel= getGlobalLoadModel(loadModel, lane, reverse)
+                effects= self.getEffects(globalModel, centroids, hDistr, slopeDistr, footprintDivisions)
+                for j, name in enumerate(self.getResponseNames()):
+                    iMax= int(numpy.argmax(effects[:,j]))
+                    iMin= int(numpy.argmin(effects[:,j]))
+                    current= retval[name]
+                    if((current['max'] is None) or (effects[iMax,j]>current['max'].value)):
+                        current['max']= GoverningPosition(float(effects[iMax,j]), float(centroids[iMax,0]), float(centroids[iMax,1]), globalModel)
+                    if((current['min'] is None) or (effects[iMin,j]<current['min'].value)):
+                        current['min']= GoverningPosition(float(effects[iMin,j]), float(centroids[iMin,0]), float(centroids[iMin,1]), globalModel)
+        return retval
+
+def defGoverningLoadCases(envelope, deckSet, hDistr, slopeDistr, prefix= 'gov'):
+    ''' Define a load case for each of the governing positions of the
+        envelope returned by InfluenceSurfaces.sweep (so they can be
+        solved and checked as ordinary load cases). Return a dictionary
+        containing the load cases with names like 'prefix_response_max'.
+
+    :param envelope: dictionary returned by InfluenceSurfaces.sweep.
+    :param deckSet: set of shell elements to distribute the loads.
+    :param hDistr: height considered to distribute each wheel load.
+    :param slopeDistr: slope (H/V) through hDistr to distribute the
+                       load of a wheel.
+    :param prefix: prefix of the load case names.
+    '''
+    preprocessor= deckSet.getPreprocessor
+    setIndex= spatial_index.SetSpatialIndex(deckSet) # shared by all the load cases.
+    retval= dict()
+    for responseName in envelope:
+        for key in ['max', 'min']:
+            pos= envelope[responseName][key]
+            if(pos is not None):
+                lcName= prefix+'_'+responseName+'_'+key
+                lc= lcases.LoadCase(preprocessor,lcName,"default","constant_ts")
+                lc.create()
+                lc.addLstLoads([pos.getVehicleDistrLoad(lcName+'Qp',deckSet,hDistr,slopeDistr,setIndex)])
+                retval[lcName]= lc
+    return retval
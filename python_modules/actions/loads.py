@@ -13,6 +13,7 @@ import xc
 import geom
 from actions.earth_pressure import earth_pressure as ep
 from model.sets import sets_mng as sets
+from model.sets import spatial_index
 from misc_utils import log_messages as lmsg
 import numpy as np
 from actions import load_cases
@@ -271,13 +272,23 @@ class PointLoadOverShellElems(BaseVectorLoad):
     :ivar refSystem:  reference system in which loadVector is defined:
                       'Local': element local coordinate system
                       'Global': global coordinate system (defaults to 'Global')
+    :ivar spatialIndex: spatial index of xcSet, shared by the loads 
+                      distributed over the same set (if None, it's
+                      built the first time it's needed).
     '''
-    def __init__(self,name, xcSet, loadVector,prismBase,prismAxis='Z',refSystem='Global'):
+    def __init__(self,name, xcSet, loadVector,prismBase,prismAxis='Z',refSystem='Global',spatialIndex=None):
         super(PointLoadOverShellElems,self).__init__(name,loadVector)
         self.xcSet=xcSet
         self.prismBase=prismBase
         self.prismAxis=prismAxis
         self.refSystem=refSystem
+        self.spatialIndex=spatialIndex
+
+    def getSpatialIndex(self):
+        '''Return the spatial index of the set of shell elements.'''
+        if self.spatialIndex is None:
+            self.spatialIndex=spatial_index.SetSpatialIndex(self.xcSet)
+        return self.spatialIndex
 
     def appendLoadToCurrentLoadPattern(self):
         ''' Append load to the current load pattern.'''
@@ -295,7 +306,7 @@ class PointLoadOverShellElems(BaseVectorLoad):
         aux_set=None
         factor=0.0
         prep=self.xcSet.getPreprocessor
-        aux_set=sets.set_included_in_orthoPrism(preprocessor=prep,setInit=self.xcSet,prismBase=self.prismBase,prismAxis=self.prismAxis,setName='aux_set'+self.name)
+        aux_set=sets.set_included_in_orthoPrism(preprocessor=prep,setInit=self.xcSet,prismBase=self.prismBase,prismAxis=self.prismAxis,setName='aux_set'+self.name,spatialIndex=self.getSpatialIndex())
         if aux_set.getNumElements==0:
             lmsg.warning('Can\'t distribute load: '+self.name+'(Elements in set = 0)')
         else:
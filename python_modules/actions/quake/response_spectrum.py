@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+''' Response spectrum analysis by modal superposition. The modal
+    responses (displacements, internal forces) are obtained from the
+    eigenvector arrays of the modal basis (see solution.modal_basis),
+    combined by the SRSS or CQC rules (vectorized over all the nodes and
+    elements) and written as pseudo-combinations in the internal forces
+    file of a limit state, so they can be verified as any other load
+    combination.
+
+    Example:
+
+      modalBasis= modal_basis.getModalBasis(preprocessor)
+      modalForces= modal_basis.getModalInternalForces(modalBasis, xcSet)
+      spectrum= lambda T: seismeSIA.designSpectrum('B', 1.0, 1.0, T, 1.5)
+      rs= response_spectrum.ResponseSpectrumAnalysis(modalBasis, {0: spectrum, 1: spectrum})
+      rows= rs.getPseudoCombinationRows(modalForces, 'EQ')
+      lsd.normalStressesResistance.appendCombinationRows(rows, modalForces.extractor)
+'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com, ana.ortega.ort@gmail.com"
+
+import numpy
+from misc_utils import log_messages as lmsg
+
+def getCQCCoefficients(angularFrequencies, dampingRatios):
+    ''' Return the matrix of cross-correlation coefficients of the
+        complete quadratic combination (CQC) rule (see expression 26-107
+        from book "Dynamics of Structures" from Clough and Penzien and
+        ModalAnalysis::getCQCModalCrossCorrelationCoefficients).
+
+    :param angularFrequencies: angular frequency of each mode.
+    :param dampingRatios: damping ratio of each mode (or a single value
+                          for all the modes).
+    '''
+    w= numpy.asarray(angularFrequencies, dtype= float)
+    z= numpy.broadcast_to(numpy.asarray(dampingRatios, dtype= float), w.shape)
+    wi, wj= numpy.meshgrid(w, w, indexing= 'ij')
+    zi, zj= numpy.meshgrid(z, z, indexing= 'ij')
+    r= wi/wj # modes in increasing order of frequency, the upper triangle is used.
+    numerator= 8.0*numpy.sqrt(zi*zj)*(zi+r*zj)*r**1.5
+    denominator= (1.0-r**2)**2+4.0*zi*zj*r*(1.0+r**2)+4.0*(zi**2+zj**2)*r**2
+    retval= numpy.triu(numerator/denominator)
+    return retval+numpy.triu(retval,1).T
+
+def combineModalResponses(modalResponses, correlationCoefficients= None):
+    ''' Return the combination of the modal responses: SRSS if no
+        correlation coefficients are given, CQC otherwise.
+
+    :param modalResponses: array (number of modes x ...) with the
+                           response of each mode.
+    :param correlationCoefficients: matrix of cross-correlation
+                                    coefficients between modes.
+    '''
+    R= numpy.asarray(modalResponses, dtype= float)
+    if(correlationCoefficients is None):
+        sumSq= numpy.einsum('i...,i...->...', R, R)
+    else:
+        sumSq= numpy.einsum('i...,ij,j...->...', R, correlationCoefficients, R)
+    return numpy.sqrt(numpy.maximum(sumSq, 0.0))
+
+def combineDirectionalResponses(responses, rule= 'SRSS', factor= 0.3):
+    ''' Return the combination of the responses to the action on each
+        direction.
+
+    :param responses: list of arrays with the (positive) response to
+                      the action on each direction.
+    :param rule: SRSS or percentage (E_i+factor*sum(E_j) for j!=i,
+                 the maximum over i is returned).
+    :param factor: factor for the percentage rule (defaults to 0.3).
+    '''
+    R= numpy.asarray(responses, dtype= float)
+    if(rule=='SRSS'):
+        retval= numpy.sqrt((R**2).sum(axis= 0))
+    elif(rule=='percentage'):
+        total= R.sum(axis= 0)
+        retval= ((1.0-factor)*R+factor*total).max(axis= 0)
+    else:
+        lmsg.error("combineDirectionalResponses; rule: '"+str(rule)+"' unknown.")
+        retval= None
+    return retval
+
+class ResponseSpectrumAnalysis(object):
+    ''' Response spectrum analysis by modal superposition.
+
+    :ivar modalBasis: modal basis of the model (see solution.modal_basis).
+    :ivar spectra: dictionary containing for each direction index
+                   (0: x, 1: y, 2: z) the function that returns the
+                   spectral acceleration for a period.
+    :ivar dampingRatio: damping ratio of the modes (used by the CQC rule).
+    :ivar modalCombination: rule to combine the modal responses
+                            (SRSS or CQC).
+    :ivar directionalCombination: rule to combine the responses to
+                                  each direction (SRSS or percentage).
+    '''
+    def __init__(self, modalBasis, spectra, dampingRatio= 0.05, modalCombination= 'CQC', directionalCombination= 'SRSS'):
+        ''' Constructor.
+
+        :param modalBasis: modal basis of the model.
+        :param spectra: dictionary containing for each direction index
+                        the spectral acceleration as a function of the
+                        period.
+        :param dampingRatio: damping ratio of the modes.
+        :param modalCombination: rule to combine the modal responses
+                                 (SRSS or CQC).
+        :param directionalCombination: rule to combine the responses to
+                                       each direction (SRSS or
+                                       percentage).
+        '''
+        self.modalBasis= modalBasis
+        self.spectra= spectra
+        self.dampingRatio= dampingRatio
+        self.modalCombination= modalCombination
+        self.directionalCombination= directionalCombination
+
+    def getSpectralAccelerations(self, direction):
+        ''' Return the spectral acceleration of each mode for the
+            action on the direction.
+
+        :param direction: direction index (0: x, 1: y, 2: z).
+        '''
+        spectrum= self.spectra[direction]
+        return numpy.array([spectrum(T) for T in self.modalBasis.getPeriods()])
+
+    def getModalAmplitudes(self, direction):
+        ''' Return the maximum value of the modal coordinate of each mode
+            for the action on the direction:
+            participationFactor*Sa(T)/omega^2.
+
+        :param direction: direction index.
+        '''
+        participationFactors= self.modalBasis.getModalParticipationFactors()[:,direction]
+        return participationFactors*self.getSpectralAccelerations(direction)/self.modalBasis.angularFrequencies**2
+
+    def getCorrelationCoefficients(self):
+        ''' Return the matrix of cross-correlation coefficients between
+            modes (None for the SRSS rule).'''
+        retval= None
+        if(self.modalCombination=='CQC'):
+            retval= getCQCCoefficients(self.modalBasis.angularFrequencies, self.dampingRatio)
+        elif(self.modalCombination!='SRSS'):
+            lmsg.error("ResponseSpectrumAnalysis; modal combination: '"+str(self.modalCombination)+"' unknown.")
+        return retval
+
+    def getDirectionalResponse(self, modalResponses, direction, correlationCoefficients= None):
+        ''' Return the combination of the modal responses for the action
+            on the direction.
+
+        :param modalResponses: array (number of modes x ...) with the
+                               response of each mode for a unit value
+                               of the modal coordinate.
+        :param direction: direction index.
+        :param correlationCoefficients: matrix of cross-correlation
+                                        coefficients (computed if None).
+        '''
+        if(correlationCoefficients is None):
+            correlationCoefficients= self.getCorrelationCoefficients()
+        R= numpy.asarray(modalResponses, dtype= float)
+        amplitudes= self.getModalAmplitudes(direction).reshape((-1,)+(1,)*(R.ndim-1))
+        return combineModalResponses(amplitudes*R, correlationCoefficients)
+
+    def getResponse(self, modalResponses):
+        ''' Return the (positive) response to the action on all the
+            directions.
+
+        :param modalResponses: array (number of modes x ...) with the
+                               response of each mode for a unit value
+                               of the modal coordinate.
+        '''
+        correlationCoefficients= self.getCorrelationCoefficients()
+        responses= [self.getDirectionalResponse(modalResponses, d, correlationCoefficients) for d in sorted(self.spectra)]
+        return combineDirectionalResponses(responses, self.directionalCombination)
+
+    def getNodeDisplacements(self):
+        ''' Return the array (number of nodes x maxDOF) with the
+            (positive) displacements of the nodes.'''
+        return self.getResponse(self.modalBasis.eigenvectors)
+
+    def getBaseShear(self, direction):
+        ''' Return the base shear on the direction for the action on the
+            same direction.
+
+        :param direction: direction index.
+        '''
+        modalShears= self.modalBasis.getEffectiveModalMasses()[:,direction]*self.getSpectralAccelerations(direction)
+        return float(combineModalResponses(modalShears, self.getCorrelationCoefficients()))
+
+    def getInternalForces(self, modalInternalForces):
+        ''' Return a dictionary containing for each element family the
+            tags of the elements and the array of (positive) internal
+            forces (same format as
+            SetInternalForcesExtractor.getFamilyForces).
+
+        :param modalInternalForces: internal forces for each mode (see
+                                    modal_basis.getModalInternalForces).
+        '''
+        retval= dict()
+        for family in modalInternalForces.modalForces:
+            retval[family]= (modalInternalForces.elementTags[family], self.getResponse(modalInternalForces.modalForces[family]))
+        return retval
+
+    def getPseudoCombinationRows(self, modalInternalForces, combName, baseFamilyForces= None):
+        ''' Return a dictionary containing the internal forces (as
+            structured arrays, see internal_forces_extractor module) of
+            the pseudo-combinations base+E and base-E where E is the
+            response to the spectrum; all the components of E have the
+            same sign. The shell internal forces are combined before
+            computing the Wood-Armer ones.
+
+        :param modalInternalForces: internal forces for each mode (see
+                                    modal_basis.getModalInternalForces).
+        :param combName: name of the pseudo-combinations (they will be
+                         called combName+'+' and combName+'-').
+        :param baseFamilyForces: internal forces of the combination of
+                                 the actions that accompany the seismic
+                                 action (obtained by the extractor of
+                                 modalInternalForces with getFamilyForces
+                                 after solving that combination);
+                                 if None only the seismic action is
+                                 considered.
+        '''
+        envelope= self.getInternalForces(modalInternalForces)
+        retval= dict()
+        for suffix, sign in [('+', 1.0), ('-', -1.0)]:
+            familyForces= dict()
+            for family in envelope:
+                tags, forces= envelope[family]
+                forces= sign*forces
+                if(baseFamilyForces):
+                    baseTags, baseForces= baseFamilyForces[family]
+                    if(not numpy.array_equal(baseTags, tags)):
+                        lmsg.error('getPseudoCombinationRows; the base internal forces of the '+family+' elements do not correspond to the same elements.')
+                    forces= forces+baseForces
+                familyForces[family]= (tags, forces)
+            retval[combName+suffix]= modalInternalForces.extractor.getFamilyRows(familyForces)
+        return retval
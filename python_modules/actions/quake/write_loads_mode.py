@@ -1,26 +1,42 @@
 # -*- coding: utf-8 -*-
+''' Equivalent static loads of a vibration mode.'''
 
-def write_loads_mode(preprocessor,fName, iModo, aceleraciones):
-  '''Write the equivalent static loads oftained for each node in the mode 
-  passed as parameter
+def getEquivalentStaticLoads(preprocessor, iModo, aceleraciones):
+  '''Return a dictionary containing the equivalent static load on each
+     node obtained for the mode passed as parameter (due to the mass
+     of the node and due to the mass of the elements connected to it).
+
+  :param preprocessor: pre-processor of the finite element problem.
+  :param iModo: index of the mode (first mode: 1).
+  :param aceleraciones: spectral acceleration of each mode.
   '''
-  fName.write("\# Due to mass in nodes.)\n")
+  retval= dict()
+  accel= aceleraciones[iModo-1]
+  # Due to mass in nodes.
   nodes= preprocessor.getNodeHandler
   for n in nodes:
-    if(n.tag>0):
-      node_force= getEquivalentStaticLoad(iModo,aceleraciones[iModo-1])
-      fName.write("\\nodal_load{ \\nod{",tag,"}")
-      fName.write(" \\val{",node_force,"} }\n")
+    retval[n.tag]= [float(v) for v in n.getEquivalentStaticLoad(iModo,accel)]
+  # Due to mass in elements.
+  elements= preprocessor.getElementHandler
+  for e in elements:
+    forces= e.getEquivalentStaticNodalLoads(iModo,accel)
+    for iNod, tagNod in enumerate(e.getNodes.getExternalNodes):
+      nodeForce= retval[tagNod]
+      for j in range(0,min(len(nodeForce),forces.noCols)):
+        nodeForce[j]+= forces(iNod,j)
+  return retval
 
-  fName.write("\n\n\# Due to mass in elements.)\n")
-  elementos= preprocessor.getElementHandler
-  for e in elementos:
-    if(e.tag>0):
-      numNodes= e.getNumExternalNodes
-      tagsNodes= e.getNodeTags
-      forces= getEquivalentStaticNodalLoads(iModo,aceleraciones[iModo-1])
-      node_force= 0
-      for iNod in range(0,Nod<numNodes):
-        fName.write("\\nodal_load{ \\nod{",tagsNodes[iNod],"}")
-        node_force= getFila(forces,iNod+1)
-        fName.write(" \\val{",node_force,"} }\n")
+def write_loads_mode(preprocessor,fName, iModo, aceleraciones):
+  '''Write the equivalent static loads obtained for each node in the mode
+  passed as parameter
+
+  :param preprocessor: pre-processor of the finite element problem.
+  :param fName: output file.
+  :param iModo: index of the mode (first mode: 1).
+  :param aceleraciones: spectral acceleration of each mode.
+  '''
+  fName.write("% Equivalent static loads for mode "+str(iModo)+" (due to mass in nodes and elements).\n")
+  loads= getEquivalentStaticLoads(preprocessor, iModo, aceleraciones)
+  for tag in sorted(loads):
+    nodeForce= ','.join(str(v) for v in loads[tag])
+    fName.write("\\nodal_load{ \\nod{"+str(tag)+"} \\val{"+nodeForce+"} }\n")
@@ -196,6 +196,25 @@ class LoadModel(object):
     
     
     
+  def getAxleLoads(self, trainLength= 0.0, spacing= 1.0):
+    ''' Return the distances from the first axle to each load and the
+        value of each load, to be used as a series of moving loads.
+        The qk load behind the Qk loads is replaced by point loads.
+
+        :param trainLength: length of the qk load (defaults to zero).
+        :param spacing: distance between the point loads that replace
+                        the qk load.
+    '''
+    positions= [i*self.dQk for i in range(0,self.numberOfAxes)]
+    values= [self.Qk]*self.numberOfAxes
+    numLoads= int(math.ceil(trainLength/spacing-1e-9))
+    start= positions[-1]+self.dQq
+    for i in range(0,numLoads):
+      l= min(spacing,trainLength-i*spacing)
+      positions.append(start+i*spacing+l/2.0)
+      values.append(self.qk*l)
+    return positions, values
+
   def writeData(self,f):
     print("LM ", self.loadModelNumber, " QBk= ", self.brakingLoad(1.0)/1e3, " kN/m")
     print("LM ", self.loadModelNumber, " QAk= ", self.accelerationLoad(1.0)/1e3, " kN")
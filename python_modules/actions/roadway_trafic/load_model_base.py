@@ -12,6 +12,7 @@ import xc_base
 import geom
 import xc
 from actions import loads
+from model.sets import spatial_index
 from model.geometry import geom_utils as gu
 
 class WheelLoad(object):
@@ -57,6 +58,19 @@ class LoadModel(object):
           retval+= l.load
         return retval
 
+    def getAxleLoads(self):
+        '''Return the distances from the front axle to each axle (the
+           longitudinal coordinate of the wheels is the y one) and the
+           load of each axle (sum of the loads of its wheels), to be
+           used as a series of moving loads.'''
+        axles= dict()
+        for w in self.wheelLoads:
+            y= round(w.position.y,6)
+            axles[y]= axles.get(y,0.0)+w.load
+        front= max(axles)
+        positions= sorted(axles, reverse= True)
+        return [front-y for y in positions], [axles[y] for y in positions]
+
     def getCentroid(self):
         '''Return the centroid of the loads.'''
         retvalPos= geom.Pos2d(0.0,0.0)
@@ -144,8 +158,11 @@ class VehicleDistrLoad(object):
                   slope slopeDistr 
     :ivar slopeDistr: slope (H/V) through hDistr to distribute the load of 
                   a wheel
+    :ivar spatialIndex: spatial index of xcSet; pass the same index to
+                  all the vehicle positions over a set to build it only
+                  once (if None, a new index is built).
      '''
-    def __init__(self,name,xcSet,loadModel, xCentr,yCentr,hDistr,slopeDistr):
+    def __init__(self,name,xcSet,loadModel, xCentr,yCentr,hDistr,slopeDistr,spatialIndex=None):
         self.name=name
         self.xcSet=xcSet
         self.loadModel= loadModel
@@ -153,6 +170,9 @@ class VehicleDistrLoad(object):
         self.yCentr=yCentr
         self.hDistr=hDistr
         self.slopeDistr=slopeDistr
+        if spatialIndex is None:
+            spatialIndex=spatial_index.SetSpatialIndex(self.xcSet)
+        self.spatialIndex=spatialIndex # shared by all the wheels.
         self.ldsWheels=self.genLstLoadDef()
 
     def genLstLoadDef(self):
@@ -167,7 +187,7 @@ class VehicleDistrLoad(object):
             xCwheel=self.xCentr+w.position.x
             yCwheel=self.yCentr+w.position.y
             basePrism=gu.rect2DPolygon(xCent=xCwheel,yCent=yCwheel,Lx=w.lx+deltaL,Ly=w.ly+deltaL)
-            ldWheels.append(loads.PointLoadOverShellElems(nm,self.xcSet,lVect,basePrism,'Z','Global'))
+            ldWheels.append(loads.PointLoadOverShellElems(nm,self.xcSet,lVect,basePrism,'Z','Global',self.spatialIndex))
             cont+=1
         return ldWheels
 
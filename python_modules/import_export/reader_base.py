@@ -11,8 +11,10 @@ __version__= "3.0"
 __email__= "l.pereztato@ciccp.es" "ana.ortega.ort@gmail.com"
 
 import re
+import math
 import datetime
 from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 from misc_utils import log_messages as lmsg
 from import_export import block_topology_entities as bte
 
@@ -28,6 +30,68 @@ def nameToImport(testName,namesToImport):
             return True
     return False
 
+class PointGrid(object):
+    ''' Uniform grid (spatial hash) used to find the points that are
+        closer than a threshold distance from a given one, without
+        computing the distances to all the points.
+
+     :ivar cellSize: size of the grid cells (slightly greater than
+                     the threshold so all the points closer than the
+                     threshold are in the neighbour cells).
+     :ivar points: list of the points inserted in the grid.
+     :ivar cells: dictionary containing the indexes of the points
+                  in each cell.
+    '''
+    def __init__(self, threshold):
+        ''' Constructor.
+
+           :param threshold: search radius.
+        '''
+        if(threshold>0.0):
+            self.cellSize= threshold*(1.0+1e-6)
+        else: # only coincident points are found.
+            self.cellSize= 1.0
+        self.points= list()
+        self.cells= dict()
+
+    def getCell(self, pt):
+        ''' Return the indexes of the cell containing the point.'''
+        return tuple(int(math.floor(x/self.cellSize)) for x in pt)
+
+    def append(self, pt):
+        ''' Append the point to the grid and return its index.'''
+        retval= len(self.points)
+        self.points.append(pt)
+        self.cells.setdefault(self.getCell(pt), list()).append(retval)
+        return retval
+
+    def getNeighbourIndexes(self, pt):
+        ''' Return the indexes of the points in the cells that surround
+            the one containing the point (sorted in insertion order).'''
+        retval= list()
+        cell= self.getCell(pt)
+        offsets= [()]
+        for i in range(len(cell)):
+            offsets= [o+(d,) for o in offsets for d in (-1, 0, 1)]
+        for o in offsets:
+            neighbour= tuple(c+d for c, d in zip(cell, o))
+            if(neighbour in self.cells):
+                retval.extend(self.cells[neighbour])
+        retval.sort()
+        return retval
+
+    def getIndexNearestPoint(self, pt):
+        ''' Return the index of the nearest point among those in the
+            neighbour cells (or -1 if there is none) and the distance to it.
+            In case of tie the first inserted point is returned.'''
+        indexes= self.getNeighbourIndexes(pt)
+        retval= (-1, None)
+        if(indexes):
+            distances= cdist([pt], [self.points[i] for i in indexes])[0]
+            i= distances.argmin()
+            retval= (indexes[i], distances[i])
+        return retval
+
 class ReaderBase(object):
     '''Base class for DXF and FreeCAD readers.
 
@@ -65,9 +129,30 @@ class ReaderBase(object):
         self.propertyDict= {}
         self.lines= {}
         self.facesTree= {}
+        self.kPointsTree= None
+
+    def getKPointsTree(self):
+        ''' Return the KD-tree of the k-points (built again if the
+            k-points have changed).'''
+        if((self.kPointsTree is None) or (self.kPointsTree.n!=len(self.kPoints))):
+            self.kPointsTree= cKDTree(self.kPoints)
+        return self.kPointsTree
 
     def getIndexNearestPoint(self, pt):
-        return cdist([pt], self.kPoints).argmin()
+        ''' Return the index of the k-point nearest to the argument (in
+            case of tie, the one with the lowest index).
+
+        :param pt: point to search for.
+        '''
+        tree= self.getKPointsTree()
+        dist, idx= tree.query(pt)
+        # Candidates at (almost) the same distance, to break ties in the
+        # same way that a linear search would.
+        candidates= sorted(tree.query_ball_point(pt, dist*(1.0+1e-9)+1e-12))
+        if(len(candidates)>1):
+            distances= cdist([pt], [self.kPoints[i] for i in candidates])[0]
+            idx= candidates[distances.argmin()]
+        return int(idx)
 
     def getNearestPoint(self, pt):
         return self.kPoints[self.getIndexNearestPoint(pt)]
@@ -136,8 +221,11 @@ class ReaderBase(object):
         '''
         points, layers= self.extractPoints()
         indexDict= None
+        self.kPointsTree= None
         if(len(points)>0):
-            self.kPoints= [points[0]]
+            grid= PointGrid(self.threshold) # only the near points are checked.
+            grid.append(points[0])
+            self.kPoints= grid.points
             pointName= layers[0][0]
             objProperties= layers[0][1]
             self.propertyDict[pointName]= objProperties
@@ -146,12 +234,9 @@ class ReaderBase(object):
             for p, l in zip(points, layers):
                 pointName= l[0]
                 objProperties= l[1]
-                indexNearestPoint= self.getIndexNearestPoint(p)
-                nearestPoint= self.kPoints[indexNearestPoint]
-                dist= cdist([p],[nearestPoint])[0][0]
-                if(dist>self.threshold): # new point.
-                    indexNearestPoint= len(self.kPoints) # The point itself.
-                    self.kPoints.append(p)
+                indexNearestPoint, dist= grid.getIndexNearestPoint(p)
+                if((indexNearestPoint<0) or (dist>self.threshold)): # new point.
+                    indexNearestPoint= grid.append(p) # The point itself.
                     self.propertyDict[pointName]= objProperties
                     indexDict[indexNearestPoint]= pointName
                 else:
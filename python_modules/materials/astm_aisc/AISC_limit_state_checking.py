@@ -234,9 +234,9 @@ class Member(buckling_base.MemberBase):
         recorder.setElements(idEleTags)
         self.shape.setupULSControlVars(self.elemSet,self.sectionClassif,chiN= chiN, chiLT= chiLT)
         if(nodes.numDOFs==3):
-            recorder.callbackRecord= controlULSCriterion2D()
+            recorder.callbackRecord= fnControlULSCriterion2D
         else:
-            recorder.callbackRecord= controlULSCriterion()
+            recorder.callbackRecord= fnControlULSCriterion
 #        recorder.callbackRestart= "print(\"Restart method called.\")" #20181121
         return recorder
     
@@ -399,7 +399,36 @@ class VonMisesStressController(lsc.LimitStateControllerBase):
                     e.setProp(self.limitStateLabel,cv.VonMisesControlVars(lf.idComb,CFtmp,lf.vonMisesStress))
 
                         
+def fnControlULSCriterion(recorder, element):
+    ''' Check the ULS criterion for the element on every commit (callable
+        to assign to recorder.callbackRecord).
+
+    :param recorder: recorder that calls this function.
+    :param element: element to check.
+    '''
+    nmbComb= recorder.getCurrentCombinationName
+    element.getResistingForce()
+    crossSection= element.getProp('crossSection')
+    crossSection.checkBiaxialBendingForElement(element,nmbComb)
+    crossSection.checkYShearForElement(element,nmbComb)
+    crossSection.checkZShearForElement(element,nmbComb)
+
+def fnControlULSCriterion2D(recorder, element):
+    ''' Check the ULS criterion for the element on every commit
+        (2D problems; callable to assign to recorder.callbackRecord).
+
+    :param recorder: recorder that calls this function.
+    :param element: element to check.
+    '''
+    nmbComb= recorder.getCurrentCombinationName
+    element.getResistingForce()
+    crossSection= element.getProp('crossSection')
+    crossSection.checkUniaxialBendingForElement(element,nmbComb)
+    crossSection.checkYShearForElement(element,nmbComb)
+
 def controlULSCriterion():
+    ''' Return the code (string) to check the ULS criterion (see
+        fnControlULSCriterion).'''
     return '''recorder= self.getProp('ULSControlRecorder')
 nmbComb= recorder.getCurrentCombinationName
 self.getResistingForce()
@@ -409,6 +438,8 @@ crossSection.checkYShearForElement(self,nmbComb)
 crossSection.checkZShearForElement(self,nmbComb)'''
 
 def controlULSCriterion2D():
+    ''' Return the code (string) to check the ULS criterion in 2D
+        problems (see fnControlULSCriterion2D).'''
     return '''recorder= self.getProp('ULSControlRecorder')
 nmbComb= recorder.getCurrentCombinationName
 self.getResistingForce()
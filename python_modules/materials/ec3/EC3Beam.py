@@ -88,9 +88,9 @@ class EC3Beam(buckling_base.MemberBase):
         recorder.setElements(idEleTags)
         self.shape.setupULSControlVars(self.elemSet,self.sectionClass,chiLT)
         if(nodes.numDOFs==3):
-            recorder.callbackRecord= EC3lsc.controlULSCriterion2D()
+            recorder.callbackRecord= EC3lsc.fnControlULSCriterion2D
         else:
-            recorder.callbackRecord= EC3lsc.controlULSCriterion()
+            recorder.callbackRecord= EC3lsc.fnControlULSCriterion
 #        recorder.callbackRestart= "print(\"Restart method called.\")" #20181121
         return recorder
 
@@ -353,6 +353,24 @@ self.getResistingForce()
 crossSection= self.getProp('crossSection')
 crossSection.checkYShearForElement(self,nmbComb)'''
 
+def fnControlULSCriterion(recorder, element):
+  '''Code to execute in every commit to check the ULS criterion (callable
+     to assign to recorder.callbackRecord).'''
+  nmbComb= recorder.getCurrentCombinationName
+  element.getResistingForce()
+  crossSection= element.getProp('crossSection')
+  crossSection.checkBiaxialBendingForElement(element,nmbComb)
+  crossSection.checkYShearForElement(element,nmbComb)
+
+def fnControlULSCriterion2D(recorder, element):
+  '''Code to execute in every commit to check the ULS criterion in 2D
+     problems (callable to assign to recorder.callbackRecord).'''
+  nmbComb= recorder.getCurrentCombinationName
+  element.getResistingForce()
+  crossSection= element.getProp('crossSection')
+  crossSection.checkUniaxialBendingForElement(element,nmbComb)
+  crossSection.checkYShearForElement(element,nmbComb)
+
 def controlULSCriterion():
   return '''recorder= self.getProp('ULSControlRecorder')
 nmbComb= recorder.getCurrentCombinationName
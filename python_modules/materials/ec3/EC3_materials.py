@@ -399,9 +399,9 @@ class EC3Shape(object):
             e.setProp('ULSControlRecorder',recorder)
         self.setupULSControlVars(elems,sectionClass,chiLT)
         if(nodes.numDOFs==3):
-            recorder.callbackRecord= EC3lsc.controlULSCriterion2D()
+            recorder.callbackRecord= EC3lsc.fnControlULSCriterion2D
         else:
-            recorder.callbackRecord= EC3lsc.controlULSCriterion()
+            recorder.callbackRecord= EC3lsc.fnControlULSCriterion
 
         recorder.callbackRestart= "print(\"Restart method called.\")"
         return recorder
@@ -56,12 +56,12 @@ class EC5TimberRectCrossSection(section_properties.RectangularSection):
         recorder.setElements(elemSet.getTags())
         if(nodes.numDOFs==3):
             self.setupULSControlVars2d(elemSet)
-            recorder.callbackRecord= callback_controls.controTensRecElastico2d()
+            recorder.callbackRecordSet= callback_controls.ElasticRangeStressControl(is3D= False)
         else:
             self.setupULSControlVars3d(elemSet)
-            recorder.callbackRecord= callback_controls.controTensRecElastico3d()
+            recorder.callbackRecordSet= callback_controls.ElasticRangeStressControl(is3D= True)
 
-        recorder.callbackRestart= "print(\"Restart method called.\")"
+        recorder.callbackRestart= callback_controls.fnRestartMessage
         return recorder
 
 def printResultsELU(elems,crossSection):
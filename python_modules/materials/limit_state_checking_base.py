@@ -11,12 +11,50 @@ __version__= "3.0"
 __email__= "l.pereztato@ciccp.es ana.ortega@ciccp.es"
 
 import math
+import numpy
 from misc_utils import log_messages as lmsg
 from materials.sections.fiber_section import fiber_sets
 from solution import predefined_solutions
 from postprocess import control_vars as cv
 import xc_base
 import geom
+import xc
+
+def getCapacityFactors(diagInt, internalForces):
+    '''Return an array with the capacity factors that correspond to the
+       internal forces argument (computed with a single call to the
+       interaction diagram).
+
+      :param diagInt: interaction diagram of the section (3D or 2D).
+      :param internalForces: array with the internal forces (N,My,Mz) for
+                             3D diagrams or (N,M) for 2D diagrams (one row
+                             for each point).
+    '''
+    values= numpy.asarray(internalForces, dtype= float)
+    if(len(values)==0):
+        return numpy.zeros(0)
+    return numpy.array(list(diagInt.getCapacityFactors(xc.Matrix(values.tolist()))))
+
+def getElementsCapacityFactors(elements, internalForces):
+    '''Return an array with the capacity factors that correspond to the
+       internal forces of each element, grouping the elements by its
+       section so the interaction diagram of each section is called only
+       once.
+
+      :param elements: phantom elements to check (with the "idSection" and
+                       "diagInt" properties).
+      :param internalForces: array with the internal forces (N,My,Mz) or
+                             (N,M) of each element.
+    '''
+    values= numpy.asarray(internalForces, dtype= float)
+    retval= numpy.zeros(len(elements))
+    sectionIndexes= dict()
+    for i, e in enumerate(elements):
+        sectionIndexes.setdefault(e.getProp("idSection"), list()).append(i)
+    for indexes in sectionIndexes.values():
+        diagInt= elements[indexes[0]].getProp("diagInt")
+        retval[indexes]= getCapacityFactors(diagInt, values[indexes])
+    return retval
 
 class LimitStateControllerBase(object):
     '''
@@ -181,6 +219,7 @@ class BiaxialBendingNormalStressControllerBase(LimitStateControllerBase):
 
   def __init__(self,limitStateLabel):
     super(BiaxialBendingNormalStressControllerBase,self).__init__(limitStateLabel)
+    self.directCheck= True # compute the capacity factors directly from the internal forces (no phantom model analysis).
 
   def initControlVars(self,elements):
     '''Initialize control variables over elements.
@@ -198,20 +237,55 @@ class BiaxialBendingNormalStressControllerBase(LimitStateControllerBase):
     '''
     if(self.verbose):
         lmsg.log("Postprocessing combination: "+nmbComb)
+    elements= [e for e in elements]
+    internalForces= list()
     for e in elements:
         e.getResistingForce()
-        TagTmp= e.tag
         scc= e.getSection()
-        idSection= e.getProp("idSection")
         Ntmp= scc.getStressResultantComponent("N")
         MyTmp= scc.getStressResultantComponent("My")
         MzTmp= scc.getStressResultantComponent("Mz")
-        posEsf= geom.Pos3d(Ntmp,MyTmp,MzTmp)
-        diagInt= e.getProp("diagInt")
-        CFtmp= diagInt.getCapacityFactor(posEsf)
+        internalForces.append([Ntmp,MyTmp,MzTmp])
+    CF= getElementsCapacityFactors(elements, internalForces)
+    for e, CFtmp, (Ntmp,MyTmp,MzTmp) in zip(elements, CF.tolist(), internalForces):
         if(CFtmp>e.getProp(self.limitStateLabel).CF):
+            idSection= e.getProp("idSection")
             e.setProp(self.limitStateLabel,cv.BiaxialBendingControlVars(idSection,nmbComb,CFtmp,Ntmp,MyTmp,MzTmp)) # Worst case.
 
+  def getCapacityFactors(self, diagInt, internalForces):
+    '''Return an array with the capacity factors that correspond to
+       the internal forces argument.
+
+      :param diagInt: interaction diagram of the section.
+      :param internalForces: array with the internal forces 
+                             [N,Vy,Vz,T,My,Mz] (one row for each
+                             combination).
+    '''
+    return getCapacityFactors(diagInt, internalForces[:,[0,4,5]])
+
+  def checkInternalForces(self, elements, combNames, internalForces):
+    '''Launch checking directly from the internal forces values (no
+       finite element analysis of the phantom model is needed).
+    
+      :param elements: phantom elements to check.
+      :param combNames: load combination names.
+      :param internalForces: array (number of elements x number of 
+                             combinations x 6) containing the internal
+                             forces [N,Vy,Vz,T,My,Mz] of each element
+                             under each combination.
+    '''
+    if(self.verbose):
+        lmsg.log("Postprocessing "+str(len(combNames))+" combinations.")
+    for e, elementInternalForces in zip(elements, internalForces):
+        idSection= e.getProp("idSection")
+        diagInt= e.getProp("diagInt")
+        CF= self.getCapacityFactors(diagInt, elementInternalForces)
+        i= int(numpy.argmax(CF)) # First occurrence of the worst case.
+        CFtmp= float(CF[i])
+        if(CFtmp>e.getProp(self.limitStateLabel).CF):
+            Ntmp, MyTmp, MzTmp= elementInternalForces[i,[0,4,5]].tolist()
+            e.setProp(self.limitStateLabel,cv.BiaxialBendingControlVars(idSection,combNames[i],CFtmp,Ntmp,MyTmp,MzTmp)) # Worst case.
+
 
 class UniaxialBendingNormalStressControllerBase(LimitStateControllerBase):
   '''Base class for object that controls normal stresses 
@@ -220,6 +294,7 @@ class UniaxialBendingNormalStressControllerBase(LimitStateControllerBase):
 
   def __init__(self,limitStateLabel):
       super(UniaxialBendingNormalStressControllerBase,self).__init__(limitStateLabel)
+      self.directCheck= True # compute the capacity factors directly from the internal forces (no phantom model analysis).
 
   def initControlVars(self,elements):
       '''Initialize control variables over elements.
@@ -238,19 +313,54 @@ class UniaxialBendingNormalStressControllerBase(LimitStateControllerBase):
       '''
       if(self.verbose):
           lmsg.log("Postprocessing combination: "+combName)
+      elements= [e for e in elements]
+      internalForces= list()
       for e in elements:
           e.getResistingForce()
-          TagTmp= e.tag
           scc= e.getSection()
-          idSection= e.getProp("idSection")
           Ntmp= scc.getStressResultantComponent("N")
           MyTmp= scc.getStressResultantComponent("My")
-          posEsf= geom.Pos2d(Ntmp,MyTmp)
-          diagInt= e.getProp("diagInt")
-          CFtmp= diagInt.getCapacityFactor(posEsf)
+          internalForces.append([Ntmp,MyTmp])
+      CF= getElementsCapacityFactors(elements, internalForces)
+      for e, CFtmp, (Ntmp,MyTmp) in zip(elements, CF.tolist(), internalForces):
           if(CFtmp>e.getProp(self.limitStateLabel).CF):
+              idSection= e.getProp("idSection")
               e.setProp(self.limitStateLabel,cv.BiaxialBendingControlVars(idSection,combName,CFtmp,Ntmp,MyTmp)) # Worst case.
 
+  def getCapacityFactors(self, diagInt, internalForces):
+      '''Return an array with the capacity factors that correspond to
+         the internal forces argument.
+
+        :param diagInt: interaction diagram of the section.
+        :param internalForces: array with the internal forces 
+                               [N,Vy,Vz,T,My,Mz] (one row for each
+                               combination).
+      '''
+      return getCapacityFactors(diagInt, internalForces[:,[0,4]])
+
+  def checkInternalForces(self, elements, combNames, internalForces):
+      '''Launch checking directly from the internal forces values (no
+         finite element analysis of the phantom model is needed).
+      
+        :param elements: phantom elements to check.
+        :param combNames: load combination names.
+        :param internalForces: array (number of elements x number of 
+                               combinations x 6) containing the internal
+                               forces [N,Vy,Vz,T,My,Mz] of each element
+                               under each combination.
+      '''
+      if(self.verbose):
+          lmsg.log("Postprocessing "+str(len(combNames))+" combinations.")
+      for e, elementInternalForces in zip(elements, internalForces):
+          idSection= e.getProp("idSection")
+          diagInt= e.getProp("diagInt")
+          CF= self.getCapacityFactors(diagInt, elementInternalForces)
+          i= int(numpy.argmax(CF)) # First occurrence of the worst case.
+          CFtmp= float(CF[i])
+          if(CFtmp>e.getProp(self.limitStateLabel).CF):
+              Ntmp, MyTmp= elementInternalForces[i,[0,4]].tolist()
+              e.setProp(self.limitStateLabel,cv.BiaxialBendingControlVars(idSection,combNames[i],CFtmp,Ntmp,MyTmp)) # Worst case.
+
 class ShearControllerBase(LimitStateControllerBase):
     '''Base class for shear controller classes.'''
     def initControlVars(self,elements):
@@ -11,9 +11,9 @@ import xc
 # Macros
 from misc_utils import log_messages as lmsg
 
-# TO ENHANCE: Interactions diagrams ("d" and "k") are calculated each time we 
-# call the checking routines. Maybe it's a good idea to calculate them once and
-# write them in a file to use them as needed.
+# Interactions diagrams ("d" and "k") are calculated each time we call the
+# checking routines unless an interaction diagram cache is assigned to the
+# container (see interaction_diagram_cache module).
 
 class SectionContainer(object):
 
@@ -25,11 +25,16 @@ class SectionContainer(object):
                                          associates each element with the two 
                                          interactions diagrams of materials 
                                          to be used in the verification
+        :ivar   interactionDiagramCache: on-disk cache of the 3D interaction
+                                         diagrams (see interaction_diagram_cache
+                                         module; defaults to None, which means
+                                         that the diagrams are always computed).
         '''
         self.sections= [] # List with the section definitions.
         self.mapSections= {} # Dictionary with pairs (sectionName, reference to
                              # section definition.
         self.mapInteractionDiagrams= None
+        self.interactionDiagramCache= None
 
     def append(self, rcSections):
         rcSections.createSections()
@@ -45,7 +50,7 @@ class SectionContainer(object):
             retval= s
         return retval
 
-    def createRCsections(self,preprocessor,matDiagType):
+    def createRCsections(self,preprocessor,matDiagType,sectionNames= None):
         '''Creates for each element in the container the fiber sections 
         (RCsimpleSections) associated with it.
         Depending on the value of attribute 'initTensStiff' of the concrete 
@@ -55,13 +60,16 @@ class SectionContainer(object):
         check the cracking limit state (tension stiffening models).
 
         :param matDiagType: type of stress-strain diagram (="k" for characteristic diagram, ="d" for design diagram)
+        :param sectionNames: names of the sections to create (defaults to
+                             None which means all the sections).
         '''
         for s in self.sections:
             for i in range(len(s.lstRCSects)):
-                s.lstRCSects[i].defRCSection(preprocessor,matDiagType)
+                if((sectionNames is None) or (s.lstRCSects[i].sectionName in sectionNames)):
+                    s.lstRCSects[i].defRCSection(preprocessor,matDiagType)
 
 
-    def calcInteractionDiagrams(self,preprocessor,matDiagType, diagramType= 'NMyMz'):
+    def calcInteractionDiagrams(self,preprocessor,matDiagType, diagramType= 'NMyMz', sectionNames= None):
         '''Calculates 3D interaction diagrams for each section.
 
         :param preprocessor:    FEA problem preprocessor
@@ -69,13 +77,22 @@ class SectionContainer(object):
         :param diagramType:    three dimensional diagram: NMyMz
                                bi-dimensional diagram: NMy
                                bi-dimensional diagram: NMz
+        :param sectionNames: names of the sections to compute the diagrams
+                             for (defaults to None which means all the 
+                             sections).
         '''
         self.mapInteractionDiagrams= {}
+        diagramCache= getattr(self, 'interactionDiagramCache', None) # Objects pickled by older versions lack this attribute.
         for s in self.sections:
             for i in range(len(s.lstRCSects)):
+                if((sectionNames is not None) and (not s.lstRCSects[i].sectionName in sectionNames)):
+                    continue
                 diag= None
                 if(diagramType=='NMyMz'):
-                    diag= s.lstRCSects[i].defInteractionDiagram(preprocessor)
+                    if(diagramCache):
+                        diag= diagramCache.getInteractionDiagram(s.lstRCSects[i], preprocessor)
+                    else:
+                        diag= s.lstRCSects[i].defInteractionDiagram(preprocessor)
                 elif(diagramType=='NMy'):
                     diag= s.lstRCSects[i].defInteractionDiagramNMy(preprocessor,matDiagType)
                 elif(diagramType=='NMz'):
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+''' On-disk cache of the 3D (N-My-Mz) interaction diagrams of reinforced
+    concrete sections. Each diagram is stored in a file whose name is a
+    hash of the data used to compute it (fibers of the section, material
+    parameters, type of the material diagrams and interaction diagram
+    parameters), so the diagrams of the sections that don't change are
+    read from disk instead of being computed again.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2020, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+import os
+import json
+import hashlib
+from misc_utils import log_messages as lmsg
+
+cacheFormatVersion= 1 # Change it to invalidate the existing caches.
+
+def getAttributesSignature(obj):
+    ''' Return a list with the (name, value) pairs of the attributes of the
+        object whose values are numbers, strings or booleans (the material
+        tags are ignored because they depend on the order of definition of
+        the materials).
+
+    :param obj: object to get the signature from.
+    '''
+    retval= [obj.__class__.__module__+'.'+obj.__class__.__name__]
+    if(obj is not None):
+        for name in sorted(vars(obj)):
+            value= getattr(obj, name)
+            if(isinstance(value, (bool, int, float, str)) and not name.startswith('matTag')):
+                retval.append((name, repr(value)))
+    return retval
+
+def getSectionSignature(rcSection):
+    ''' Return a list containing the data that determines the interaction
+        diagram of the section.
+
+    :param rcSection: reinforced concrete section (its fiber model and its
+                      interaction diagram parameters must be already
+                      defined; see defRCSection and
+                      defInteractionDiagramParameters).
+    '''
+    fiberSectionParameters= rcSection.fiberSectionParameters
+    idParams= fiberSectionParameters.idParams
+    pivots= idParams.pivotsUltimateStrains
+    retval= [cacheFormatVersion, fiberSectionParameters.diagType]
+    retval.append(getAttributesSignature(fiberSectionParameters.concrType))
+    retval.append(getAttributesSignature(fiberSectionParameters.reinfSteelType))
+    retval.append([repr(idParams.threshold), repr(idParams.incEps), repr(idParams.incTheta), repr(pivots.ultimateStrainAPivot), repr(pivots.ultimateStrainBPivot), repr(pivots.ultimateStrainCPivot)])
+    # Section geometry and reinforcement (fibers).
+    fibers= list()
+    for f in rcSection.fs.getFibers():
+        matTag= f.getMaterial().tag
+        if(matTag==idParams.concreteTag):
+            role= 'c'
+        elif(matTag==idParams.reinforcementTag):
+            role= 's'
+        else:
+            role= str(matTag)
+        fibers.append((role, repr(f.getLocY()), repr(f.getLocZ()), repr(f.getArea())))
+    retval.append(sorted(fibers))
+    return retval
+
+class InteractionDiagramCache(object):
+    ''' On-disk cache of interaction diagrams.
+
+    :ivar path: directory containing the diagram files.
+    '''
+    def __init__(self, path):
+        ''' Constructor.
+
+        :param path: directory containing the diagram files.
+        '''
+        self.path= path
+
+    def getKey(self, rcSection):
+        ''' Return the key (hash of the data that determines the
+            interaction diagram) of the section.
+
+        :param rcSection: reinforced concrete section.
+        '''
+        signature= json.dumps(getSectionSignature(rcSection))
+        return hashlib.sha256(signature.encode('utf-8')).hexdigest()
+
+    def getFileName(self, key):
+        ''' Return the name of the file that stores the diagram.
+
+        :param key: key of the section.
+        '''
+        return os.path.join(self.path, 'diagInt_'+key+'.dat')
+
+    def getInteractionDiagram(self, rcSection, preprocessor):
+        ''' Return the 3D interaction diagram of the section, read from
+            the cache if it's there, otherwise computed and stored in it.
+
+        :param rcSection: reinforced concrete section.
+        :param preprocessor: preprocessor of the finite element problem.
+        '''
+        if(not rcSection.fiberSectionRepr):
+            lmsg.error("getInteractionDiagram: fiber section representation for section: "+ rcSection.sectionName + ";  not defined yet; use defRCSection method.\n")
+        rcSection.defInteractionDiagramParameters(preprocessor)
+        fileName= self.getFileName(self.getKey(rcSection))
+        materialHandler= preprocessor.getMaterialHandler
+        if(os.path.isfile(fileName)):
+            retval= materialHandler.newInteractionDiagram('diagInt'+rcSection.sectionName)
+            retval.readFrom(fileName)
+        else:
+            retval= rcSection.defInteractionDiagram(preprocessor)
+            if(not os.path.exists(self.path)):
+                os.makedirs(self.path)
+            # Write to a temporary file and rename it, so other processes
+            # never read a partially written diagram.
+            tmpFileName= fileName+'.'+str(os.getpid())+'.tmp'
+            retval.writeTo(tmpFileName)
+            os.replace(tmpFileName, fileName)
+        return retval
+
+    def clear(self):
+        ''' Remove the diagram files from the cache.'''
+        if(os.path.exists(self.path)):
+            for fileName in os.listdir(self.path):
+                if(fileName.startswith('diagInt_') and fileName.endswith('.dat')):
+                    os.remove(os.path.join(self.path, fileName))
@@ -8,6 +8,7 @@ __version__= "3.0"
 __email__= "l.pereztato@gmail.com"
 
 import math
+import numpy
 from misc_utils import log_messages as lmsg
 
 class CrossSectionInternalForces:
@@ -149,6 +150,67 @@ def transformInternalForces(iForces,theta):
     retval[1]= tmpA-tmpB
     return retval
 
+def transformInternalForcesArray(iForces,theta):
+    '''Computes internal forces in a system rotated theta
+       degrees with respect to the z(3) axis (vectorized version of
+       transformInternalForces).
+
+    :param iForces: array (number of points x 3) with the internal forces.
+    :param theta: array with the rotation angle for each point.
+    '''
+    iForces= numpy.asarray(iForces, dtype= float)
+    cos2T= numpy.cos(2*numpy.asarray(theta, dtype= float))
+    sin2T= numpy.sin(2*numpy.asarray(theta, dtype= float))
+    tmpA= (iForces[:,0]+iForces[:,1])/2.0
+    tmpB= (iForces[:,0]-iForces[:,1])/2.0*cos2T+iForces[:,2]*sin2T
+    retval= numpy.empty(iForces.shape)
+    retval[:,0]= tmpA+tmpB
+    retval[:,2]= -(iForces[:,0]-iForces[:,1])/2.0*sin2T+iForces[:,2]*cos2T
+    retval[:,1]= tmpA-tmpB
+    return retval
+
+shellInternalForcesComponents= ['n1', 'n2', 'n12', 'm1', 'm2', 'm12', 'q13', 'q23']
+
+def transformShellInternalForcesArray(shellForces,theta):
+    '''Calculates the components of the shell internal forces for
+       reference systems rotated the angles being passed as parameter
+       (vectorized version of ShellMaterialInternalForces.transform).
+
+    :param shellForces: array (number of points x 8) with the internal
+                        forces [n1, n2, n12, m1, m2, m12, q13, q23].
+    :param theta: array with the rotation angle for each point.
+    '''
+    shellForces= numpy.asarray(shellForces, dtype= float)
+    retval= numpy.empty(shellForces.shape)
+    retval[:,0:3]= transformInternalForcesArray(shellForces[:,0:3],theta)
+    retval[:,3:6]= transformInternalForcesArray(shellForces[:,3:6],theta)
+    Q= numpy.zeros((len(shellForces),3))
+    Q[:,0:2]= shellForces[:,6:8]
+    retval[:,6:8]= transformInternalForcesArray(Q,theta)[:,0:2]
+    return retval
+
+def getWoodArmerArray(shellForces):
+    '''Return an array (number of points x 2 x 6) with the internal
+       forces [N, Vy, Vz, T, My, Mz] obtained by the Wood-Armer method
+       for the axis 1 and the axis 2 (vectorized version of
+       ShellMaterialInternalForces.getWoodArmer).
+
+    :param shellForces: array (number of points x 8) with the internal
+                        forces [n1, n2, n12, m1, m2, m12, q13, q23].
+    '''
+    shellForces= numpy.asarray(shellForces, dtype= float)
+    n1, n2, n12, m1, m2, m12, q13, q23= shellForces.T
+    retval= numpy.zeros((len(shellForces),2,6))
+    retval[:,0,0]= n1
+    retval[:,0,1]= q13
+    retval[:,0,2]= n12
+    retval[:,0,4]= m1+numpy.copysign(m12,m1)
+    retval[:,1,0]= n2
+    retval[:,1,1]= q23
+    retval[:,1,2]= n12
+    retval[:,1,4]= m2+numpy.copysign(m12,m2)
+    return retval
+
 class ShellMaterialInternalForces:
     '''Internal forces on a material point of a shell element
 
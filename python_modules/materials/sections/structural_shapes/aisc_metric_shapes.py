@@ -22,7 +22,7 @@ from __future__ import division
 # are swapped with respect to those in the catalog.
 
 import math
-from materials.sections.structural_shapes import aisc_shapes_dictionaries as shapes
+from materials.sections.structural_shapes import shapes_catalogue
 from materials.sections.structural_shapes import aisc_shapes_labels as labels
 from materials.sections import structural_steel
 from misc_utils import log_messages as lmsg
@@ -30,6 +30,9 @@ import xc_base
 import geom
 from import_export import block_topology_entities as bte
 
+# Catalogue of AISC shapes (read on demand).
+shapes= shapes_catalogue.aiscShapes
+
 # Shear areas.
 
 # In y axis: Ay = depth of the section* web thickness
@@ -38,8 +41,9 @@ from import_export import block_topology_entities as bte
 # *************************************************************************
 # AISC W profiles.
 # *************************************************************************
-for item in shapes.W:
-    shape= shapes.W[item]
+def setWShapeDerivedProperties(shape):
+    ''' Compute the properties of the W shape that are not
+        stored in the catalogue (shear areas, shear modulus,...).'''
     shape['Avy']= shape['h']*shape['tw'] # depth of the section* web thickness
     shape['Avz']= 2/3.0*(2*shape['b']*shape['tf']) # 2/3 * combined area of the flanges. 
     shape['alpha']= shape['Avy']/shape['A']
@@ -47,7 +51,8 @@ for item in shapes.W:
     shape['hi']= shape['h']-2*shape['tf']
     shape['AreaQz']= 2*shape['b']*shape['tf'] 
     shape['AreaQy']= shape['A']-shape['AreaQz']
-W= shapes.W
+
+W= shapes.getFamily('W', setWShapeDerivedProperties)
 
 def getShapePlasticAxialLoad(shape):
     ''' Return the plastic axial load of the shape.
@@ -1025,15 +1030,17 @@ class WShape(structural_steel.IShape):
 # AISC C profiles.
 # *************************************************************************
 
-for item in shapes.C:
-    shape= shapes.C[item]
+def setCShapeDerivedProperties(shape):
+    ''' Compute the properties of the C shape that are not
+        stored in the catalogue (shear areas, shear modulus,...).'''
     shape['G']= shape['E']/(2*(1+shape['nu']))
     shape['hi']= shape['h']-2*shape['tf']
     shape['Avy']= shape['h']*shape['tw'] # depth of the section* web thickness
     shape['Avz']= 2/3.0*(2*shape['b']*shape['tf']) # 2/3 * combined area of the flanges. 
     shape['AreaQz']= 2*shape['b']*shape['tf']
     shape['AreaQy']= shape['A']-shape['AreaQz']
-C= shapes.C
+
+C= shapes.getFamily('C', setCShapeDerivedProperties)
 
 class CShape(structural_steel.UShape):
     '''C shape.
@@ -1346,8 +1353,9 @@ class CShape(structural_steel.UShape):
 # AISC Hollow Structural Sections.
 # *************************************************************************
 
-for item in shapes.HSS:
-    shape= shapes.HSS[item]
+def setHSSShapeDerivedProperties(shape):
+    ''' Compute the properties of the hollow structural section that
+        are not stored in the catalogue (shear areas, shear modulus,...).'''
     shape['alpha']= 5/12.0
     shape['G']= shape['E']/(2*(1+shape['nu']))
     if('h_flat' in shape): # rectangular
@@ -1359,8 +1367,8 @@ for item in shapes.HSS:
         shape['Avz']= tmp
     shape['AreaQz']= shape['Avz']
     shape['AreaQy']= shape['Avy']
-    
-HSS= shapes.HSS
+
+HSS= shapes.getFamily('HSS', setHSSShapeDerivedProperties)
 
 class HSSShape(structural_steel.QHShape):
     ''' Hollow structural section.
@@ -1884,8 +1892,10 @@ class HSSShape(structural_steel.QHShape):
         Ry= shape.steelType.Ry
         return 0.65*math.sqrt(E/Fy/Ry) # Case 4
     
-for item in shapes.CHSS:
-    shape= shapes.CHSS[item]
+def setCHSSShapeDerivedProperties(shape):
+    ''' Compute the properties of the circular hollow structural section
+        that are not stored in the catalogue (shear areas, shear
+        modulus,...).'''
     shape['alpha']= 5/12.0
     shape['G']= shape['E']/(2*(1+shape['nu']))
     tmp= math.pi*(shape['OD']-shape['t'])/2.0*shape['t']
@@ -1894,7 +1904,7 @@ for item in shapes.CHSS:
     shape['AreaQz']= shape['Avz']
     shape['AreaQy']= shape['Avy']
 
-CHSS= shapes.CHSS
+CHSS= shapes.getFamily('CHSS', setCHSSShapeDerivedProperties)
 
 class CHSSShape(structural_steel.CHShape):
     ''' Circular hollow structural section.
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+''' Write the tables (.npz files) of the shapes catalogue from the
+    dictionaries modules. Run it after modifying any of them.'''
+
+from __future__ import print_function
+
+from materials.sections.structural_shapes import shapes_catalogue
+
+for table in [shapes_catalogue.aiscShapes, shapes_catalogue.arcelorShapes]:
+    table.write()
+    print('file: '+table.fileName+' written.')
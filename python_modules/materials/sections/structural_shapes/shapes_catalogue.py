@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+''' Lazy catalogue of structural shapes. The properties of the shapes are
+    read on demand from a compressed NumPy (.npz) table generated from the
+    dictionaries modules (i.e. aisc_shapes_dictionaries.py), so importing
+    a shapes module doesn't execute the (very large) literal dictionaries.
+
+    Each family of shapes (W, C, HSS, IPE, HE,...) is stored as one array
+    for each property (values of the shapes in the same order as in the
+    dictionaries module) so the catalogue can be queried by property
+    ranges (i.e. the lightest W shape with Wzpl >= x and h <= y) without
+    looping over the shape dictionaries.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import os
+import importlib
+import numpy
+from misc_utils import log_messages as lmsg
+
+# Kind of the values stored in the table.
+absentValue= 0
+floatValue= 1
+intValue= 2
+noneValue= 3
+
+def getFamilies(dictModule):
+    ''' Return a dictionary containing the families of shapes (dictionaries
+        of shape dictionaries) defined in the module.
+
+    :param dictModule: module containing the dictionaries of shapes.
+    '''
+    retval= dict()
+    for name, value in vars(dictModule).items():
+        if(name.startswith('_') or not isinstance(value, dict) or (len(value)==0)):
+            continue
+        if(all(isinstance(shape, dict) for shape in value.values())):
+            retval[name]= value
+    return retval
+
+def getFamilyArrays(familyName, family):
+    ''' Return a dictionary containing the arrays that store the shapes of
+        the family in the table.
+
+        For each property "key" the table stores the array "family:key:"
+        containing the values (NaN if not defined for the shape) and, when
+        not all of them are floats, the array "family:key:kind" containing
+        the kind of each value (see absentValue, floatValue,...).
+
+    :param familyName: name of the family (i.e. 'W').
+    :param family: dictionary of shape dictionaries.
+    '''
+    names= list(family.keys())
+    keys= list() # keep the order of the keys in the shape dictionaries.
+    for shape in family.values():
+        previous= None
+        for key in shape:
+            if(key not in keys):
+                keys.insert(keys.index(previous)+1 if previous else len(keys), key)
+            previous= key
+    prefix= familyName+':'
+    retval= {prefix+'names': numpy.array(names, dtype= str), prefix+'keys': numpy.array(keys, dtype= str)}
+    for key in keys:
+        values= [family[name].get(key, None) for name in names]
+        kinds= [absentValue if(key not in family[name]) else noneValue if(v is None) else intValue if(isinstance(v, int)) else floatValue for name, v in zip(names, values)]
+        strings= [v for v in values if isinstance(v, str)]
+        if(len(strings)>0):
+            if(len(strings)+kinds.count(absentValue)!=len(names)):
+                lmsg.error(familyName+': property '+key+' mixes strings and numbers.')
+            retval[prefix+key+':']= numpy.array([v if isinstance(v, str) else '' for v in values], dtype= str)
+            kinds= [absentValue if(k==absentValue) else floatValue for k in kinds]
+        else:
+            retval[prefix+key+':']= numpy.array([numpy.nan if(v is None) else v for v in values], dtype= numpy.float64)
+        if(any(k!=floatValue for k in kinds)):
+            retval[prefix+key+':kind']= numpy.array(kinds, dtype= numpy.int8)
+    return retval
+
+def getTableArrays(dictModule):
+    ''' Return the arrays of the table for the shapes defined in the module.
+
+    :param dictModule: module containing the dictionaries of shapes.
+    '''
+    retval= dict()
+    families= getFamilies(dictModule)
+    retval['families']= numpy.array(list(families.keys()), dtype= str)
+    for name, family in families.items():
+        retval.update(getFamilyArrays(name, family))
+    return retval
+
+def writeTable(fileName, dictModule):
+    ''' Write the table for the shapes defined in the module.
+
+    :param fileName: name of the .npz file.
+    :param dictModule: module containing the dictionaries of shapes.
+    '''
+    with open(fileName, 'wb') as f:
+        numpy.savez_compressed(f, **getTableArrays(dictModule))
+
+class ShapeFamily(object):
+    ''' Family of shapes (W, C, IPE,...) read on demand from the table.
+        It can be used as the dictionary of shapes of the family (name ->
+        shape dictionary); the shape dictionaries are created the first
+        time they are requested.
+
+    :ivar name: name of the family.
+    :ivar table: table containing the shapes.
+    :ivar derivedProperties: function that computes the properties that
+                             are not stored in the table (shear areas,
+                             shear modulus,...) when a shape dictionary
+                             is created (f(shape)).
+    :ivar shapes: shape dictionaries already created.
+    :ivar names: names of the shapes (in the order of the table).
+    :ivar propertyNames: names of the properties stored in the table.
+    '''
+    def __init__(self, name, table, derivedProperties= None):
+        ''' Constructor.
+
+        :param name: name of the family.
+        :param table: table containing the shapes (ShapesTable object).
+        :param derivedProperties: function that computes the properties
+                                  that are not stored in the table.
+        '''
+        self.name= name
+        self.table= table
+        self.derivedProperties= derivedProperties
+        self.shapes= dict()
+        self.names= self.getArray('names').tolist()
+        self.nameIndexes= {shapeName: i for i, shapeName in enumerate(self.names)}
+        self.propertyNames= self.getArray('keys').tolist()
+        self.columns= dict()
+        self.sortedIndexes= dict()
+
+    def getArray(self, suffix):
+        ''' Return the array of the table with the given suffix.'''
+        return self.table.getArray(self.name+':'+suffix)
+
+    def getValues(self, key):
+        ''' Return the (values, kinds) arrays of the property stored in the
+            table (kinds is None if all the values are floats).
+
+        :param key: property name (i.e. 'Wzpl').
+        '''
+        retval= self.columns.get(key, None)
+        if(retval is None):
+            kindKey= self.name+':'+key+':kind'
+            kinds= self.table.getArray(kindKey) if(self.table.hasArray(kindKey)) else None
+            retval= (self.getArray(key+':'), kinds)
+            self.columns[key]= retval
+        return retval
+
+    def buildShape(self, index):
+        ''' Return the dictionary of the index-th shape of the table.'''
+        retval= dict()
+        for key in self.propertyNames:
+            values, kinds= self.getValues(key)
+            kind= floatValue if(kinds is None) else kinds[index]
+            if(kind==absentValue):
+                continue
+            value= values[index]
+            if(kind==noneValue):
+                value= None
+            elif(kind==intValue):
+                value= int(value)
+            elif(values.dtype.kind=='U'):
+                value= str(value)
+            else:
+                value= float(value)
+            retval[key]= value
+        if(self.derivedProperties):
+            self.derivedProperties(retval)
+        return retval
+
+    def __getitem__(self, shapeName):
+        ''' Return the dictionary of the shape.
+
+        :param shapeName: name of the shape (i.e. 'W8X21').
+        '''
+        retval= self.shapes.get(shapeName, None)
+        if(retval is None):
+            retval= self.buildShape(self.nameIndexes[shapeName])
+            self.shapes[shapeName]= retval
+        return retval
+
+    def get(self, shapeName, default= None):
+        ''' Return the dictionary of the shape or default if not found.'''
+        if(shapeName in self.nameIndexes):
+            return self[shapeName]
+        return default
+
+    def __contains__(self, shapeName):
+        return shapeName in self.nameIndexes
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def keys(self):
+        ''' Return the names of the shapes.'''
+        return list(self.names)
+
+    def values(self):
+        ''' Return the shape dictionaries.'''
+        return [self[shapeName] for shapeName in self.names]
+
+    def items(self):
+        ''' Return the (name, shape dictionary) pairs.'''
+        return [(shapeName, self[shapeName]) for shapeName in self.names]
+
+    def getColumn(self, key):
+        ''' Return an array containing the value of the property for each
+            shape of the family (NaN if not defined). The properties that
+            are not stored in the table (see derivedProperties) are
+            obtained from the shape dictionaries.
+
+        :param key: property name (i.e. 'Wzpl').
+        '''
+        if(key in self.propertyNames):
+            values, kinds= self.getValues(key)
+            if((kinds is None) or (values.dtype.kind=='U')):
+                return values
+            retval= numpy.array(values, dtype= numpy.float64)
+            retval[kinds==absentValue]= numpy.nan
+            return retval
+        return numpy.array([self[shapeName].get(key, numpy.nan) for shapeName in self.names], dtype= numpy.float64)
+
+    def getSortedIndexes(self, key):
+        ''' Return the indexes of the shapes sorted by the value of the
+            property (shapes without value at the end).
+
+        :param key: property name (i.e. 'P').
+        '''
+        retval= self.sortedIndexes.get(key, None)
+        if(retval is None):
+            retval= numpy.argsort(self.getColumn(key), kind= 'mergesort')
+            self.sortedIndexes[key]= retval
+        return retval
+
+    def getIndexesInRange(self, key, minValue= None, maxValue= None):
+        ''' Return the indexes of the shapes with the value of the property
+            in the interval [minValue, maxValue].
+
+        :param key: property name (i.e. 'Wzpl').
+        :param minValue: lower bound (None for no lower bound).
+        :param maxValue: upper bound (None for no upper bound).
+        '''
+        indexes= self.getSortedIndexes(key)
+        values= self.getColumn(key)[indexes]
+        first= 0 if(minValue is None) else numpy.searchsorted(values, minValue, side= 'left')
+        last= numpy.searchsorted(values, numpy.inf, side= 'right') if(maxValue is None) else numpy.searchsorted(values, maxValue, side= 'right')
+        return indexes[first:last]
+
+    def select(self, minValues= None, maxValues= None, sortBy= 'P'):
+        ''' Return the names of the shapes whose properties are in the given
+            ranges sorted by the value of the sortBy property (weight by
+            default).
+
+            Example: lightest W shape with Wzpl >= 2e-3 and h <= 0.5:
+            W.select(minValues= {'Wzpl':2e-3}, maxValues= {'h':0.5})[0]
+
+        :param minValues: dictionary containing the lower bounds
+                          (property name: value).
+        :param maxValues: dictionary containing the upper bounds
+                          (property name: value).
+        :param sortBy: property used to sort the shapes (None to keep
+                       the order of the table).
+        '''
+        bounds= dict()
+        for key, value in (minValues or dict()).items():
+            bounds.setdefault(key, [None, None])[0]= value
+        for key, value in (maxValues or dict()).items():
+            bounds.setdefault(key, [None, None])[1]= value
+        mask= numpy.ones(len(self.names), dtype= bool)
+        for key, (minValue, maxValue) in bounds.items():
+            keyMask= numpy.zeros(len(self.names), dtype= bool)
+            keyMask[self.getIndexesInRange(key, minValue, maxValue)]= True
+            mask&= keyMask
+        if(sortBy):
+            indexes= self.getSortedIndexes(sortBy)
+            indexes= indexes[mask[indexes]]
+        else:
+            indexes= numpy.nonzero(mask)[0]
+        return [self.names[i] for i in indexes]
+
+    def getLightest(self, minValues= None, maxValues= None, weightKey= 'P'):
+        ''' Return the name of the lightest shape whose properties are in
+            the given ranges (None if there is no such shape).
+
+        :param minValues: dictionary containing the lower bounds
+                          (property name: value).
+        :param maxValues: dictionary containing the upper bounds
+                          (property name: value).
+        :param weightKey: property that contains the weight of the shape.
+        '''
+        retval= None
+        names= self.select(minValues, maxValues, sortBy= weightKey)
+        if(len(names)>0):
+            retval= names[0]
+        return retval
+
+class ShapesTable(object):
+    ''' Table containing the shapes of a catalogue (i.e. AISC shapes). The
+        arrays are read from the .npz file when first requested; if the
+        file doesn't exist they are computed from the dictionaries module.
+
+    :ivar fileName: name of the .npz file.
+    :ivar dictModuleName: name of the module containing the dictionaries of
+                          shapes (i.e. 'materials.sections.structural_shapes.aisc_shapes_dictionaries').
+    :ivar families: families of shapes already created.
+    '''
+    def __init__(self, fileName, dictModuleName):
+        ''' Constructor.
+
+        :param fileName: name of the .npz file.
+        :param dictModuleName: name of the module containing the
+                               dictionaries of shapes.
+        '''
+        self.fileName= fileName
+        self.dictModuleName= dictModuleName
+        self.data= None
+        self.arrayNames= None
+        self.familyNames= None
+        self.families= dict()
+
+    def load(self):
+        ''' Open the table.'''
+        if(os.path.isfile(self.fileName)):
+            self.data= numpy.load(self.fileName, allow_pickle= False)
+            self.arrayNames= set(self.data.files)
+        else:
+            lmsg.warning('file: '+self.fileName+' not found; shapes read from module: '+self.dictModuleName)
+            self.data= getTableArrays(importlib.import_module(self.dictModuleName))
+            self.arrayNames= set(self.data.keys())
+        self.familyNames= self.data['families'].tolist()
+
+    def write(self):
+        ''' Write the table from the dictionaries module.'''
+        writeTable(self.fileName, importlib.import_module(self.dictModuleName))
+        self.data= None
+
+    def hasArray(self, arrayName):
+        ''' Return true if the table contains the array.'''
+        if(self.data is None):
+            self.load()
+        return arrayName in self.arrayNames
+
+    def getArray(self, arrayName):
+        ''' Return the array of the table.'''
+        if(self.data is None):
+            self.load()
+        return self.data[arrayName]
+
+    def getFamilyNames(self):
+        ''' Return the names of the families of shapes in the table.'''
+        if(self.data is None):
+            self.load()
+        return self.familyNames
+
+    def getFamily(self, name, derivedProperties= None):
+        ''' Return the family of shapes.
+
+        :param name: name of the family (i.e. 'W').
+        :param derivedProperties: function that computes the properties
+                                  that are not stored in the table when a
+                                  shape dictionary is created (f(shape)).
+        '''
+        retval= self.families.get(name, None)
+        if(retval is None):
+            retval= ShapeFamily(name, self, derivedProperties)
+            self.families[name]= retval
+        elif(derivedProperties and (retval.derivedProperties!=derivedProperties)):
+            retval.derivedProperties= derivedProperties
+            for shape in retval.shapes.values(): # already created.
+                derivedProperties(shape)
+        return retval
+
+    def __getattr__(self, name):
+        ''' Return the family of shapes (i.e. table.W) as the dictionaries
+            module does.'''
+        if(name.startswith('_') or (name in ['data', 'arrayNames', 'familyNames', 'families'])):
+            raise AttributeError(name)
+        if(name in self.getFamilyNames()):
+            return self.getFamily(name)
+        raise AttributeError(name)
+
+def getTablePath(fileName):
+    ''' Return the path of a table stored with this module.
+
+    :param fileName: name of the .npz file.
+    '''
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), fileName)
+
+aiscShapes= ShapesTable(getTablePath('aisc_shapes.npz'), 'materials.sections.structural_shapes.aisc_shapes_dictionaries')
+arcelorShapes= ShapesTable(getTablePath('arcelor_shapes.npz'), 'materials.sections.structural_shapes.arcelor_shapes_dictionaries')
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+''' Low overhead instrumentation of the analysis pipeline: named stage
+    timers, counters and peak memory sampling. The profiler is disabled
+    by default (in that case the cost of each instrumented stage is a
+    single attribute lookup); it can be enabled from the script:
+
+      from misc import stage_profiler
+      stage_profiler.profiler.enable()
+      ...
+      stage_profiler.profiler.writeReport('profile.json')
+
+    or by defining the XC_STAGE_PROFILER environment variable.
+'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import os
+import sys
+import time
+import json
+
+try:
+    import resource
+except ImportError: # not available in Windows.
+    resource= None
+
+def getPeakRSS():
+    ''' Return the peak resident set size of the process (MB) or None
+        if not available.'''
+    retval= None
+    if(resource):
+        retval= resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.0
+        if(sys.platform=='darwin'): # bytes in macOS, kilobytes in Linux.
+            retval/= 1024.0
+    return retval
+
+class NullStage(object):
+    ''' Stage that does nothing (used when the profiler is disabled).'''
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        return False
+
+nullStage= NullStage()
+
+class Stage(object):
+    ''' Stage of the pipeline whose time is measured from the
+        entrance to the exit of the with statement.
+
+    :ivar profiler: profiler to report to.
+    :ivar name: name of the stage.
+    :ivar context: dictionary with the data that identify the stage
+                   (combination name, ...).
+    '''
+    def __init__(self, profiler, name, context):
+        ''' Constructor.
+
+        :param profiler: profiler to report to.
+        :param name: name of the stage.
+        :param context: dictionary with the data that identify the stage.
+        '''
+        self.profiler= profiler
+        self.name= name
+        self.context= context
+        self.start= None
+
+    def __enter__(self):
+        self.profiler.stack.append(self.name)
+        self.start= time.time()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        elapsed= time.time()-self.start
+        path= '/'.join(self.profiler.stack)
+        self.profiler.stack.pop()
+        self.profiler.addRecord(path, elapsed, self.context)
+        return False
+
+class StageProfiler(object):
+    ''' Named timers and counters of the stages of the analysis.
+
+    :ivar enabled: if false nothing is recorded.
+    :ivar records: list of dictionaries containing the path of the stage
+                   (names of the enclosing stages separated by '/'), its
+                   context, its elapsed time (seconds) and the peak
+                   resident set size (MB) at its end.
+    :ivar counters: dictionary containing the value of each counter.
+    :ivar stack: names of the stages being measured.
+    '''
+    def __init__(self, enabled= False):
+        ''' Constructor.
+
+        :param enabled: if true record the stages.
+        '''
+        self.enabled= enabled
+        self.reset()
+
+    def reset(self):
+        ''' Remove the data recorded.'''
+        self.records= list()
+        self.counters= dict()
+        self.stack= list()
+
+    def enable(self, value= True):
+        ''' Enable (or disable) the profiler.'''
+        self.enabled= value
+
+    def stage(self, name, **context):
+        ''' Return an object that measures the time of the stage
+            in a with statement.
+
+        :param name: name of the stage.
+        :param context: data that identify the stage (combination
+                        name,...).
+        '''
+        if(not self.enabled):
+            return nullStage
+        return Stage(self, name, context)
+
+    def addRecord(self, path, elapsed, context= None):
+        ''' Append the time of the stage.
+
+        :param path: path of the stage (names of the enclosing stages
+                     separated by '/').
+        :param elapsed: elapsed time (seconds).
+        :param context: dictionary with the data that identify the stage.
+        '''
+        self.records.append({'stage': path, 'time': elapsed, 'peakRSS': getPeakRSS(), 'context': context or dict()})
+
+    def addSubstageTimes(self, stageTimes, **context):
+        ''' Append the times of the substages of the current stage
+            (i.e. those measured by the C++ solution algorithm).
+
+        :param stageTimes: dictionary with the time of each substage.
+        :param context: data that identify the substages.
+        '''
+        prefix= '/'.join(self.stack)
+        for name in sorted(stageTimes):
+            self.addRecord(prefix+'/'+name if prefix else name, stageTimes[name], context)
+
+    def count(self, name, increment= 1):
+        ''' Increment the counter.
+
+        :param name: name of the counter.
+        :param increment: value to add.
+        '''
+        if(self.enabled):
+            self.counters[name]= self.counters.get(name, 0)+increment
+
+    def getSummary(self):
+        ''' Return a dictionary containing for each stage the number of
+            calls, the total and maximum times and the peak resident
+            set size.'''
+        retval= dict()
+        for record in self.records:
+            summary= retval.setdefault(record['stage'], {'calls': 0, 'time': 0.0, 'maxTime': 0.0, 'peakRSS': None})
+            summary['calls']+= 1
+            summary['time']+= record['time']
+            summary['maxTime']= max(summary['maxTime'], record['time'])
+            if(record['peakRSS'] is not None):
+                summary['peakRSS']= max(summary['peakRSS'] or 0.0, record['peakRSS'])
+        return retval
+
+    def getReport(self, includeRecords= False):
+        ''' Return a dictionary with the summary of the stages and the
+            counters.
+
+        :param includeRecords: if true include the time of each call
+                               (one record for each combination,...).
+        '''
+        retval= {'stages': self.getSummary(), 'counters': dict(self.counters), 'peakRSS': getPeakRSS()}
+        if(includeRecords):
+            retval['records']= self.records
+        return retval
+
+    def writeReport(self, fileName, includeRecords= False):
+        ''' Write the report in a JSON file (keys sorted, so two
+            reports can be compared with diff).
+
+        :param fileName: name of the output file.
+        :param includeRecords: if true include the time of each call.
+        '''
+        with open(fileName, 'w') as f:
+            json.dump(self.getReport(includeRecords), f, indent= 2, sort_keys= True)
+
+    def printSummary(self, out= sys.stdout):
+        ''' Print the time spent in each stage.'''
+        summary= self.getSummary()
+        for path in sorted(summary):
+            s= summary[path]
+            out.write('{:<60} {:>6} {:>12.4f} s\n'.format(path, s['calls'], s['time']))
+        for name in sorted(self.counters):
+            out.write('{:<60} {:>6}\n'.format(name, self.counters[name]))
+
+profiler= StageProfiler(enabled= ('XC_STAGE_PROFILER' in os.environ))
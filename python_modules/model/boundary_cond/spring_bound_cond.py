@@ -70,11 +70,16 @@ class SpringBC(object):
         lstnod=sets_mng.setNod_to_lst(setEnt)
         self.applyOnNodesLst(lstnod)
         
-    def applyOnNodesIn3Dpos(self,lst3DPos):
+    def applyOnNodesIn3Dpos(self,lst3DPos,tol= None):
         '''create springs in the nearest nodes to the coordinates in the 
         list of 3D positions given as parameter
+
+        :param lst3DPos: list of positions (geom.Pos3d).
+        :param tol: maximum distance between each position and its node;
+                    no spring is created for the positions without node
+                    closer than tol (defaults to None: no limit).
         '''
-        lstnod=sets_mng.get_lstNod_from_lst3DPos(self.modelSpace.preprocessor,lst3DPos)
+        lstnod=sets_mng.get_lstNod_from_lst3DPos(self.modelSpace.preprocessor,lst3DPos,tol)
         self.applyOnNodesLst(lstnod)
         
     def applyOnNodesLst(self,Nodelist):
@@ -6,9 +6,10 @@ usually referenced by their indices (i,j,k) that point to the global
 coordinates (x,y,z).
 
 Generally, an ijkGrid contains the grid of points itself and all the 
-geometric entities (lines, surfaces, ...) attached to it. Dictionaries with 
-those entities, identified by specific names, are created, in order to 
-facilitate and accelerate their creation, search, grouping in sets, ...
+geometric entities (lines, surfaces, ...) attached to it. Arrays with the 
+tags of those entities, indexed by the grid indices of their first point,
+are created, in order to facilitate and accelerate their creation, search,
+grouping in sets, ...
 
 Several grids can coexist in a FE problem.
 '''
@@ -24,8 +25,37 @@ import xc_base
 import geom
 import xc
 import math
+import numpy
 from misc_utils import data_struct_utils as dsu
 
+# Quadrangle surfaces of the grid. Orientations: 0: XY plane, 1: XZ plane
+# and 2: YZ plane. For each orientation: axis normal to the surfaces, order
+# of the loops used to traverse the range and offsets of the four vertices
+# with respect to the first one.
+quadSurfNormalAxis= [2, 1, 0]
+quadSurfLoopOrder= [(1,0,2), (2,0,1), (2,1,0)]
+quadSurfVertexOffsets= [[(0,0,0),(1,0,0),(1,1,0),(0,1,0)],
+                        [(0,0,0),(0,0,1),(1,0,1),(1,0,0)],
+                        [(0,0,0),(0,1,0),(0,1,1),(0,0,1)]]
+# Lines of the grid. Orientations: 0: parallel to X axis, 1: parallel to Y
+# and 2: parallel to Z. Order of the loops used to traverse the range.
+linLoopOrder= [(0,1,2), (1,0,2), (2,0,1)]
+
+def getIJKIndexes(ranges, loopOrder):
+    '''Return an array (number of indexes x 3) with the (i,j,k) indexes
+    obtained by traversing the ranges in the order of the nested loops
+    given by loopOrder.
+
+    :param ranges: list of ranges of the i, j and k indexes.
+    :param loopOrder: axes of the nested loops (outermost first) i.e.
+                      (1,0,2): for j in ... for i in ... for k in ...
+    '''
+    grids= numpy.meshgrid(*[numpy.array(ranges[axis], dtype= int) for axis in loopOrder], indexing= 'ij')
+    retval= numpy.empty((grids[0].size,3), dtype= int)
+    for pos, axis in enumerate(loopOrder):
+        retval[:,axis]= grids[pos].ravel()
+    return retval
+
 class IJKRange(object):
     '''Range of indexes (i,j,k) in the 3D-grid that defines a region 
     bounded by the coordinates associated with those indexes.
@@ -173,9 +203,10 @@ class GridModel(object):
     coordinates (x,y,z).
 
     Generally, an ijkGrid contains the grid of points itself and all the 
-    geometric entities (lines, surfaces, ...) attached to it. Dictionaries with 
-    those entities, identified by specific names, are created, in order to 
-    facilitate and accelerate their creation, search, grouping in sets, ...
+    geometric entities (lines, surfaces, ...) attached to it. Arrays with the 
+    tags of those entities, indexed by the grid indices of their first point,
+    are created, in order to facilitate and accelerate their creation, search,
+    grouping in sets, ...
 
     Several grids can coexist in a FE problem.
 
@@ -194,12 +225,21 @@ class GridModel(object):
     :ivar semiYellipList: (only used for elliptical coordinates) ordered list of 
                     semi-axes Y that correspond with each semi-axis X
                     in xList 
-    :ivar dicLin: generated dictionary with all the lines linked to the grid. 
-          Each key is the name of a line, the value associated is the line 
-          itself.
-    :ivar dicQuadSurf: generated dictionary with all the surfaces linked to the grid. 
-          Each key is the name of a surface, the value associated is the surface 
-          itself.
+    :ivar pointTags: array (indexes i, j, k) with the tags of the points
+          of the grid (-1 if not generated yet).
+    :ivar surfTags: array (indexes i, j, k, orientation) with the tags of
+          the quadrangle surfaces whose first vertex is the point (i,j,k)
+          (orientation 0: XY plane, 1: XZ plane, 2: YZ plane; -1 if not 
+          generated yet).
+    :ivar linTags: array (indexes i, j, k, orientation) with the tags of
+          the lines that start at the point (i,j,k) (orientation 0: 
+          parallel to X axis, 1: to Y axis, 2: to Z axis; -1 if not 
+          generated yet).
+    :ivar surfTagsByPnts: dictionary with the tags of all the surfaces
+          linked to the grid. Each key is the tuple of tags of its 
+          vertices.
+    :ivar linTagsByPnts: dictionary with the tags of all the lines linked
+          to the grid. Each key is the tuple of tags of its end points.
 
 
     '''
@@ -212,12 +252,32 @@ class GridModel(object):
         self.indices= self.prep.getMultiBlockTopology.get3DNets.new3DNet()
         self.indices.dim(len(self.gridCoo[0]),len(self.gridCoo[1]),len(self.gridCoo[2]))
         self.pointCounter=0
-        self.dicQuadSurf=dict()
-        self.dicLin=dict()
+        shape= (len(self.gridCoo[0]),len(self.gridCoo[1]),len(self.gridCoo[2]))
+        self.pointTags= numpy.full(shape, -1, dtype= int)
+        self.surfTags= numpy.full(shape+(3,), -1, dtype= int)
+        self.linTags= numpy.full(shape+(3,), -1, dtype= int)
+        self.surfTagsByPnts= dict()
+        self.linTagsByPnts= dict()
         self.xCentCoo=xCentCoo
         self.yCentCoo=yCentCoo
         self.semiYellipList=semiYellipList
 
+    @property
+    def dicQuadSurf(self):
+        '''Return a dictionary with all the surfaces linked to the grid.
+        Each key is the name of a surface (see gridSurfName), the value 
+        associated is the surface itself.'''
+        surfaces= self.prep.getMultiBlockTopology.getSurfaces
+        return {self.gridSurfName(*key):surfaces.get(tag) for key, tag in self.surfTagsByPnts.items()}
+
+    @property
+    def dicLin(self):
+        '''Return a dictionary with all the lines linked to the grid.
+        Each key is the name of a line (see gridLinName), the value 
+        associated is the line itself.'''
+        lines= self.prep.getMultiBlockTopology.getLines
+        return {self.gridLinName(*key):lines.get(tag) for key, tag in self.linTagsByPnts.items()}
+
     def lastXIndex(self):
         return len(self.gridCoo[0])-1
     def lastYIndex(self):
@@ -268,8 +328,27 @@ class GridModel(object):
         :param indPnt: grid indices that point to the global (X, Y, Z)
                  coordinates    
         '''
-        tagPto= self.indices.getPnt(indPnt[0]+1,indPnt[1]+1,indPnt[2]+1).tag
-        return tagPto
+        tagPto= self.pointTags[indPnt[0],indPnt[1],indPnt[2]]
+        if(tagPto<0): # not generated by this object.
+            tagPto= self.indices.getPnt(indPnt[0]+1,indPnt[1]+1,indPnt[2]+1).tag
+        return int(tagPto)
+
+    def getTagsPntGrid(self,indexes,offset=(0,0,0)):
+        '''Return an array with the tags of the points whose indexes 
+        (plus the offset) are passed as parameter.
+
+        :param indexes: array (number of points x 3) of grid indices.
+        :param offset: offset to add to the indices.
+        '''
+        i= indexes[:,0]+offset[0]
+        j= indexes[:,1]+offset[1]
+        k= indexes[:,2]+offset[2]
+        retval= self.pointTags[i,j,k] # a copy (advanced indexing).
+        for n in numpy.flatnonzero(retval<0): # not generated by this object.
+            pnt= self.getPntGrid((i[n],j[n],k[n]))
+            if(pnt is not None):
+                retval[n]= pnt.tag
+        return retval
 
     def gridSurfName(self,pt1,pt2,pt3,pt4):
         '''Return the name of the quadrangle surface defined by 4 points.
@@ -289,6 +368,52 @@ class GridModel(object):
         '''
         return 'l'+'%06.0f' % pt1 +'%06.0f' % pt2
 
+    def getQuadSurfGroupsInRange(self,ijkRange,closeCyl='N'):
+        '''Return a list of tuples (orientation, indexes, pntTags) with 
+        the quadrangle surfaces limited by a volume defined by the 
+        coordinates that correspond to the indices in the grid 
+        ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
+        ijkRange.ijkMax=(indXmax,indYmax,indZmax). The groups are 
+        the surfaces in XY planes, those that close the cylinder in XY 
+        planes, the surfaces in XZ planes, in YZ planes and those that close
+        the cylinder in YZ planes.
+
+          - indexes: array (number of surfaces x 3) with the grid indices
+            of the first vertex of each surface (None for the surfaces
+            that close the cylinder).
+          - pntTags: array (number of surfaces x 4) with the tags of the
+            vertices of each surface.
+
+        :param ijkRange: instance of IJKRange class
+        :param closeCyl: 'Y' to close cylinder when using cylindrical coordinate system
+                        (defaults to 'N')
+        '''
+        (imin,jmin,kmin)=ijkRange.ijkMin
+        (imax,jmax,kmax)=ijkRange.ijkMax
+        closeCyl= (closeCyl.lower()[0]=='y')
+        retval= list()
+        for orientation in range(0,3):
+            ranges= list()
+            for axis in range(0,3):
+                vMax= ijkRange.ijkMax[axis]
+                if(axis==quadSurfNormalAxis[orientation]):
+                    vMax+= 1
+                ranges.append(range(ijkRange.ijkMin[axis],vMax))
+            indexes= getIJKIndexes(ranges,quadSurfLoopOrder[orientation])
+            pntTags= numpy.column_stack([self.getTagsPntGrid(indexes,offset) for offset in quadSurfVertexOffsets[orientation]])
+            retval.append((orientation,indexes,pntTags.reshape(-1,4)))
+            if(closeCyl and (orientation==0)):
+                ik= getIJKIndexes([range(imin,imax),[jmax],range(kmin,kmax+1)],(0,1,2))
+                dj= jmin-jmax
+                pntTags= numpy.column_stack([self.getTagsPntGrid(ik,offset) for offset in [(0,0,0),(1,0,0),(1,dj,0),(0,dj,0)]])
+                retval.append((orientation,None,pntTags.reshape(-1,4)))
+            elif(closeCyl and (orientation==2)):
+                ik= getIJKIndexes([range(imin,imax+1),[jmax],range(kmin,kmax)],(2,0,1))
+                dj= jmin-jmax
+                pntTags= numpy.column_stack([self.getTagsPntGrid(ik,offset) for offset in [(0,0,0),(0,dj,0),(0,dj,1),(0,0,1)]])
+                retval.append((orientation,None,pntTags.reshape(-1,4)))
+        return retval
+
     def getNmSurfInRange(self,ijkRange,closeCyl='N'):
         '''Return a list with the names of the surfaces limited by a volume 
         defined by the coordinates that correspond to the indices in the grid 
@@ -299,52 +424,99 @@ class GridModel(object):
         :param closeCyl: 'Y' to close cylinder when using cylindrical coordinate system
                         (defaults to 'N')
         '''
-        (imin,jmin,kmin)=ijkRange.ijkMin
-        (imax,jmax,kmax)=ijkRange.ijkMax
-        'surfaces in XY plane'
-        indPtSurfXY=[((i,j,k),(i+1,j,k),(i+1,j+1,k),(i,j+1,k)) for j in range(jmin,jmax) for i in range(imin,imax) for k in range (kmin,kmax+1)]
-        if closeCyl.lower()[0]=='y':
-            indPtSurfXY+=[((i,jmax,k),(i+1,jmax,k),(i+1,jmin,k),(i,jmin,k)) for i in range(imin,imax) for k in range (kmin,kmax+1)]
-        nmSurfXY=[self.getNameQuadGridSurface(indPtsQs) for indPtsQs in indPtSurfXY]
-        'surfaces in XZ plane'
-        indPtSurfXZ=[((i,j,k),(i,j,k+1),(i+1,j,k+1),(i+1,j,k)) for k in range(kmin,kmax) for i in range(imin,imax) for j in range(jmin,jmax+1)]
-        nmSurfXZ=[self.getNameQuadGridSurface(indPtsQs) for indPtsQs in indPtSurfXZ]
-        'surfaces in YZ plane'
-        indPtSurfYZ=[((i,j,k),(i,j+1,k),(i,j+1,k+1),(i,j,k+1)) for k in range(kmin,kmax) for j in range(jmin,jmax) for i in range(imin,imax+1)]
-        if closeCyl.lower()[0]=='y':
-            indPtSurfYZ+=[((i,jmax,k),(i,jmin,k),(i,jmin,k+1),(i,jmax,k+1)) for k in range(kmin,kmax) for i in range(imin,imax+1)]
-        nmSurfYZ=[self.getNameQuadGridSurface(indPtsQs) for indPtsQs in indPtSurfYZ]
-        return (nmSurfXY+nmSurfXZ+nmSurfYZ)
+        retval= list()
+        for orientation, indexes, pntTags in self.getQuadSurfGroupsInRange(ijkRange,closeCyl):
+            retval.extend([self.gridSurfName(*tags) for tags in pntTags.tolist()])
+        return retval
+
+    def getSurfTagsInRange(self,ijkRange,closeCyl='N'):
+        '''Return a list with the tags of the existing surfaces limited 
+        by a volume defined by the coordinates that correspond to the 
+        indices in the grid ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
+        ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
+
+        :param ijkRange: instance of IJKRange class
+        :param closeCyl: 'Y' to close cylinder when using cylindrical coordinate system
+                        (defaults to 'N')
+        '''
+        retval= list()
+        for orientation, indexes, pntTags in self.getQuadSurfGroupsInRange(ijkRange,closeCyl):
+            if(indexes is not None):
+                tags= self.surfTags[indexes[:,0],indexes[:,1],indexes[:,2],orientation]
+                retval.extend(tags[tags>=0].tolist())
+            else:
+                for key in pntTags.tolist():
+                    tag= self.surfTagsByPnts.get(tuple(key),-1)
+                    if(tag>=0):
+                        retval.append(tag)
+        return retval
+
+    def getLinIndexesInRange(self,ijkRange,orientation):
+        '''Return an array (number of lines x 3) with the grid indices 
+        of the first point of the lines parallel to the axis given by
+        orientation (0: X, 1: Y, 2: Z) limited by a volume defined by the
+        coordinates that correspond to the indices in the grid 
+        ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
+        ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
+        '''
+        ranges= list()
+        for axis in range(0,3):
+            vMax= ijkRange.ijkMax[axis]
+            if(axis!=orientation):
+                vMax+= 1
+            ranges.append(range(ijkRange.ijkMin[axis],vMax))
+        return getIJKIndexes(ranges,linLoopOrder[orientation])
 
     def getNmLinInRange(self,ijkRange):
-        '''Return a list with the names of the surfaces limited by a volume 
+        '''Return a list with the names of the lines limited by a volume 
         defined by the coordinates that correspond to the indices in the grid 
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         '''
-        (imin,jmin,kmin)=ijkRange.ijkMin
-        (imax,jmax,kmax)=ijkRange.ijkMax
-        'lines parallel to X-axis'
-        indPtLinX=[((i,j,k),(i+1,j,k)) for  i in range(imin,imax) for j in range(jmin,jmax+1) for k in range(kmin,kmax+1)]
-        nmLinX=[self.getNameGridLine(indPtsLn) for indPtsLn in indPtLinX]
-        'lines parallel to Y-axis'
-        indPtLinY=[((i,j,k),(i,j+1,k)) for j in range(jmin,jmax)  for  i in range(imin,imax+1) for k in range(kmin,kmax+1)]
-        nmLinY=[self.getNameGridLine(indPtsLn) for indPtsLn in indPtLinY]
-        'lines parallel to Z-axis'
-        indPtLinZ=[((i,j,k),(i,j,k+1)) for  k in range(kmin,kmax) for i in range(imin,imax+1) for j in range(jmin,jmax+1)]
-        nmLinZ=[self.getNameGridLine(indPtsLn) for indPtsLn in indPtLinZ]
-        return (nmLinX+nmLinY+nmLinZ)
+        retval= list()
+        for orientation in range(0,3):
+            indexes= self.getLinIndexesInRange(ijkRange,orientation)
+            offset= [0,0,0]; offset[orientation]= 1
+            tags1= self.getTagsPntGrid(indexes).tolist()
+            tags2= self.getTagsPntGrid(indexes,offset).tolist()
+            retval.extend([self.gridLinName(t1,t2) for t1, t2 in zip(tags1,tags2)])
+        return retval
 
-    def generatePoints(self):
-        '''Point generation in a cartesian coordinate system.'''
+    def getLinTagsInRange(self,ijkRange):
+        '''Return a list with the tags of the existing lines limited by
+        a volume defined by the coordinates that correspond to the indices
+        in the grid ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
+        ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
+        '''
+        retval= list()
+        for orientation in range(0,3):
+            indexes= self.getLinIndexesInRange(ijkRange,orientation)
+            tags= self.linTags[indexes[:,0],indexes[:,1],indexes[:,2],orientation]
+            retval.extend(tags[tags>=0].tolist())
+        return retval
+
+    def newGridPoints(self,xyz):
+        '''Create the points of the grid from their coordinates.
+
+        :param xyz: array (number of x coord. x number of y coord. x 
+                    number of z coord. x 3) with the coordinates of the
+                    points.
+        '''
         points= self.prep.getMultiBlockTopology.getPoints
         inicTag=points.defaultTag
-        lstPt=[(i+1,j+1,k+1,self.gridCoo[0][i],self.gridCoo[1][j],self.gridCoo[2][k]) for i in range(len(self.gridCoo[0])) for j in range(len(self.gridCoo[1])) for k in range(len(self.gridCoo[2])) ]
-        for p in lstPt:
-            (i,j,k,x,y,z)=p
-            self.pointCounter+=1
-            pnt=points.newPntIDPos3d(self.pointCounter+inicTag,geom.Pos3d(x,y,z))
-            self.indices.setPnt(i,j,k,pnt.tag)
+        shape= self.pointTags.shape
+        tags= self.pointCounter+inicTag+numpy.arange(1,self.pointTags.size+1).reshape(shape)
+        coords= xyz.reshape(-1,3).tolist()
+        for (i,j,k), tag, (x,y,z) in zip(numpy.ndindex(shape),tags.ravel().tolist(),coords):
+            pnt=points.newPntIDPos3d(tag,geom.Pos3d(x,y,z))
+            self.indices.setPnt(i+1,j+1,k+1,pnt.tag)
+            self.pointTags[i,j,k]= pnt.tag
+        self.pointCounter+= self.pointTags.size
+
+    def generatePoints(self):
+        '''Point generation in a cartesian coordinate system.'''
+        x, y, z= numpy.meshgrid(self.gridCoo[0],self.gridCoo[1],self.gridCoo[2],indexing='ij')
+        self.newGridPoints(numpy.stack([x,y,z],axis=-1).astype(float))
 
     def generateCylZPoints(self):
         '''Point generation in the following cylindrical coordinate system:
@@ -359,19 +531,10 @@ class GridModel(object):
         - y: angular coordinate (degrees counterclockwise from X-axis)
         - z: height coordinate (Z axis)
         '''
-        points= self.prep.getMultiBlockTopology.getPoints
-        inicTag=points.defaultTag
-        lstPt=[(i+1,j+1,k+1,
-                self.xCentCoo+self.gridCoo[0][i]*math.cos(math.radians(self.gridCoo[1][j])),
-                self.yCentCoo+self.gridCoo[0][i]*math.sin(math.radians(self.gridCoo[1][j])),
-                self.gridCoo[2][k]) for i in range(len(self.gridCoo[0]))
-               for j in range(len(self.gridCoo[1]))
-               for k in range(len(self.gridCoo[2])) ]
-        for p in lstPt:
-            (i,j,k,x,y,z)=p
-            self.pointCounter+=1
-            pnt=points.newPntIDPos3d(self.pointCounter+inicTag,geom.Pos3d(x,y,z))
-            self.indices.setPnt(i,j,k,pnt.tag)
+        r, ang, z= numpy.meshgrid(self.gridCoo[0],numpy.radians(self.gridCoo[1]),self.gridCoo[2],indexing='ij')
+        x= self.xCentCoo+r*numpy.cos(ang)
+        y= self.yCentCoo+r*numpy.sin(ang)
+        self.newGridPoints(numpy.stack([x,y,z],axis=-1).astype(float))
             
     def generateEllipZPoints(self):
         '''Point generation in the following elliptical coordinate system:
@@ -388,31 +551,36 @@ class GridModel(object):
         - semiYellipList contains a list of semi-axis Y of the ellipse
           that correspond element to element with the semi-axis X in xList
         '''
-        points= self.prep.getMultiBlockTopology.getPoints
-        inicTag=points.defaultTag
-#        lstPt=[(i+1,j+1,k+1,
-#                self.xCentCoo+self.gridCoo[0][i]*math.cos(math.radians(self.gridCoo[1][j])),
-#                self.yCentCoo+self.gridCoo[0][i]*math.sin(math.radians(self.gridCoo[1][j])),
-#                self.gridCoo[2][k]) for i in range(len(self.gridCoo[0]))
-#               for j in range(len(self.gridCoo[1]))
-#               for k in range(len(self.gridCoo[2])) ]
-        lstPt=list()
-        for i in range(len(self.gridCoo[0])):
-            sx=self.gridCoo[0][i]
-            sy=self.semiYellipList[i]
-            for j in range(len(self.gridCoo[1])):
-                ang=math.radians(self.gridCoo[1][j])
-                paramCoo=math.sqrt((math.cos(ang)/sx)**2+(math.sin(ang)/sy)**2)
-                x=self.xCentCoo+1/paramCoo*math.cos(ang)
-                y=self.yCentCoo+1/paramCoo*math.sin(ang)
-                for k in range(len(self.gridCoo[2])):
-                    z=self.gridCoo[2][k]
-                    lstPt.append((i+1,j+1,k+1,x,y,z))
-        for p in lstPt:
-            (i,j,k,x,y,z)=p
-            self.pointCounter+=1
-            pnt=points.newPntIDPos3d(self.pointCounter+inicTag,geom.Pos3d(x,y,z))
-            self.indices.setPnt(i,j,k,pnt.tag)
+        sx, ang, z= numpy.meshgrid(self.gridCoo[0],numpy.radians(self.gridCoo[1]),self.gridCoo[2],indexing='ij')
+        sy, ang, z= numpy.meshgrid(self.semiYellipList,numpy.radians(self.gridCoo[1]),self.gridCoo[2],indexing='ij')
+        paramCoo= numpy.sqrt((numpy.cos(ang)/sx)**2+(numpy.sin(ang)/sy)**2)
+        x= self.xCentCoo+1/paramCoo*numpy.cos(ang)
+        y= self.yCentCoo+1/paramCoo*numpy.sin(ang)
+        self.newGridPoints(numpy.stack([x,y,z],axis=-1).astype(float))
+
+    def getPntCoordinatesRange(self,ijkRange):
+        '''Return the ordered list of points in a 3D grid-region limited by
+        ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
+        ijkRange.ijkMax=(indXmax,indYmax,indZmax) and an array 
+        (number of points x 3) with their coordinates.
+
+        :param ijkRange: range for the search.
+        '''
+        lstPnt= self.getLstPntRange(ijkRange)
+        xyz= numpy.array([[p.getPos.x,p.getPos.y,p.getPos.z] for p in lstPnt], dtype= float).reshape(-1,3)
+        return lstPnt, xyz
+
+    def setPntCoordinates(self,lstPnt,xyz):
+        '''Assign the coordinates to the points.
+
+        :param lstPnt: list of points.
+        :param xyz: array (number of points x 3) with the new coordinates.
+        '''
+        for p, (x,y,z) in zip(lstPnt,xyz.tolist()):
+            pos= p.getPos
+            pos.x= x
+            pos.y= y
+            pos.z= z
 
     def movePointsRange(self,ijkRange,vDisp):
         '''Move points  in a 3D grid-region limited by 
@@ -423,12 +591,9 @@ class GridModel(object):
         :param ijkRange: range for the search
         :param vDisp: xc vector displacement
         '''
-        sPtMove=self.getSetPntRange(ijkRange,'sPtMove')
-        for p in sPtMove.getPoints:
-          p.getPos.x+= vDisp[0]
-          p.getPos.y+= vDisp[1]
-          p.getPos.z+= vDisp[2]
-        sPtMove.clear()
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        xyz+= numpy.array([vDisp[0],vDisp[1],vDisp[2]])
+        self.setPntCoordinates(lstPnt,xyz)
 
     def slopePointsRange(self,ijkRange,slopeX=0,xZeroSlope=0,slopeY=0,yZeroSlope=0):
         '''Applies one or two slopes (in X and Y directions) 
@@ -445,10 +610,9 @@ class GridModel(object):
                        (defaults to 0 = no slope applied)
         :param yZeroSlope: coordinate Y of the "rotation axis".
         '''
-        sPtMove=self.getSetPntRange(ijkRange,'sPtMove')
-        for p in sPtMove.getPoints:
-          p.getPos.z+= slopeX*(p.getPos.x-xZeroSlope)+slopeY*(p.getPos.y-yZeroSlope)
-        sPtMove.clear()
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        xyz[:,2]+= slopeX*(xyz[:,0]-xZeroSlope)+slopeY*(xyz[:,1]-yZeroSlope)
+        self.setPntCoordinates(lstPnt,xyz)
 
 
     def rotPntsZAxis(self,ijkRange,angle,xyRotCent):
@@ -461,13 +625,12 @@ class GridModel(object):
         theta=math.radians(angle)
         sinTheta=math.sin(theta)
         cosTheta=math.cos(theta)
-        sPtMove=self.getSetPntRange(ijkRange,'sPtMove')
-        for p in sPtMove.getPoints:
-            xp=p.getPos.x
-            yp=p.getPos.y
-            p.getPos.x= xyRotCent[0]+cosTheta*(xp-xyRotCent[0])-sinTheta*(yp-xyRotCent[1])
-            p.getPos.y= xyRotCent[1]+sinTheta*(xp-xyRotCent[0])+cosTheta*(yp-xyRotCent[1])
-        sPtMove.clear()
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        xp= xyz[:,0]-xyRotCent[0]
+        yp= xyz[:,1]-xyRotCent[1]
+        xyz[:,0]= xyRotCent[0]+cosTheta*xp-sinTheta*yp
+        xyz[:,1]= xyRotCent[1]+sinTheta*xp+cosTheta*yp
+        self.setPntCoordinates(lstPnt,xyz)
         
     def scaleCoorXPointsRange(self,ijkRange,xOrig,scale):
         '''Applies a scale in X with origin xOrig (fixed axis: X=xOrig) 
@@ -483,11 +646,9 @@ class GridModel(object):
         :param scale: scale to apply to X coordinate
 
         '''
-        sPtXscale=self.getSetPntRange(ijkRange,'sPtXscale')
-        for p in sPtXscale.getPoints:
-            xpt=p.getPos.x
-            p.getPos.x= xOrig+scale*(xpt-xOrig)
-        sPtXscale.clear()
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        xyz[:,0]= xOrig+scale*(xyz[:,0]-xOrig)
+        self.setPntCoordinates(lstPnt,xyz)
 
     def scaleCoorYPointsRange(self,ijkRange,yOrig,scale):
         '''Applies a scale in Y with origin yOrig (fixed axis: y=yOrig) 
@@ -502,11 +663,9 @@ class GridModel(object):
                       are not affected by the transformation 
         :param scale: scale to apply to Y coordinate
         '''
-        sPtYscale=self.getSetPntRange(ijkRange,'sPtYscale')
-        for p in sPtYscale.getPoints:
-            ypt=p.getPos.y
-            p.getPos.y= yOrig+scale*(ypt-yOrig)
-        sPtYscale.clear()
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        xyz[:,1]= yOrig+scale*(xyz[:,1]-yOrig)
+        self.setPntCoordinates(lstPnt,xyz)
 
     def scaleCoorZPointsRange(self,ijkRange,zOrig,scale):
         '''Applies a scale in Z with origin zOrig (fixed axis: z=zOrig) 
@@ -521,79 +680,67 @@ class GridModel(object):
                       are not affected by the transformation 
         :param scale: scale to apply to Z coordinate
         '''
-        sPtZscale=self.getSetPntRange(ijkRange,'sPtZscale')
-        for p in sPtZscale.getPoints:
-            zpt=p.getPos.z
-            p.getPos.z= zOrig+scale*(zpt-zOrig)
-        sPtZscale.clear()
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        xyz[:,2]= zOrig+scale*(xyz[:,2]-zOrig)
+        self.setPntCoordinates(lstPnt,xyz)
 
     def moveCylPointsRadius(self,ijkRange,radius):
         '''Move points in a 3D grid-region limited by the ijkRange 
         in the cylindrical coordinate system to radius coordinate 
         given as parameter
         '''
-        sPtMove=self.getSetPntRange(ijkRange,'sPtMove')
-        for p in sPtMove.getPoints:
-            vdir=geom.Vector2d(p.getPos.x-self.xCentCoo,p.getPos.y-self.yCentCoo,).normalized()
-            p.getPos.x= self.xCentCoo+radius*vdir.x
-            p.getPos.y= self.yCentCoo+radius*vdir.y
-            
-        sPtMove.clear()
+        self.movePointsRangeToZcylinder(ijkRange,self.xCentCoo,self.yCentCoo,radius)
+
+    def movePointsRangeToCylinder(self,ijkRange,axes,center,R):
+        '''Moves the points in the range to make them belong to 
+        a cylinder with radius R and axis parallel to the global axis
+        normal to the plane defined by axes.
+
+        :param ijkRange: range for the search.
+        :param axes: indexes of the coordinates in the plane normal to 
+                     the cylinder axis (i.e. (0,1) for a cylinder parallel
+                     to Z axis).
+        :param center: coordinates of the cylinder axis in that plane.
+        :param R: radius of the cylinder.
+        '''
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        v= xyz[:,axes]-numpy.array(center,dtype= float)
+        vdir= v/numpy.linalg.norm(v,axis=1)[:,numpy.newaxis]
+        xyz[:,axes]= numpy.array(center,dtype= float)+R*vdir
+        self.setPntCoordinates(lstPnt,xyz)
 
     def movePointsRangeToZcylinder(self,ijkRange,xCent,yCent,R):
         '''Moves the points in the range to make them belong to 
         a cylinder with radius R and axis parallel to global Z passing 
         through the point (xCent,yCent,0).
         '''
-        vCent=geom.Vector2d(xCent,yCent)
-        setPnt=self.getSetPntRange(ijkRange,'setPnt')
-        for p in setPnt.getPoints:
-            v=geom.Vector2d(p.getPos.x,p.getPos.y)-vCent
-            vdir= v.normalized()
-            p.getPos.x=xCent+R*vdir.x
-            p.getPos.y=yCent+R*vdir.y
-        setPnt.clear()
+        self.movePointsRangeToCylinder(ijkRange,[0,1],[xCent,yCent],R)
 
     def movePointsRangeToXcylinder(self,ijkRange,yCent,zCent,R):
         '''Moves the points in the range to make them belong to 
         a cylinder with radius R and axis parallel to global X passing 
         through the point (0,yCent,zCent)
         '''
-        vCent=geom.Vector2d(yCent,zCent)
-        setPnt=self.getSetPntRange(ijkRange,'setPnt')
-        for p in setPnt.getPoints:
-            v=geom.Vector2d(p.getPos.y,p.getPos.z)-vCent
-            vdir=v.normalized()
-            p.getPos.y=yCent+R*vdir.x
-            p.getPos.z=zCent+R*vdir.y
-        setPnt.clear()
+        self.movePointsRangeToCylinder(ijkRange,[1,2],[yCent,zCent],R)
 
     def movePointsRangeToYcylinder(self,ijkRange,xCent,zCent,R):
         '''Moves the points in the range to make them belong to 
         a cylinder with radius R and axis parallel to global Y passing 
         through the point (xCent,0,zCent)
         '''
-        vCent=geom.Vector2d(xCent,zCent)
-        setPnt=self.getSetPntRange(ijkRange,'setPnt')
-        for p in setPnt.getPoints:
-            v=geom.Vector2d(p.getPos.x,p.getPos.z)-vCent
-            vdir=v.normalized()
-            p.getPos.x=xCent+R*vdir.x
-            p.getPos.z=zCent+R*vdir.y
-        setPnt.clear()
+        self.movePointsRangeToCylinder(ijkRange,[0,2],[xCent,zCent],R)
 
     def movePointsEllipse(self,ijkRange,semiAxX,semiAXY):
         ''''Move points in a 3D grid-region limited by the ijkRange 
         in the elliptical coordinate system to an ellipse of
         semi-axes semiAxX and semiAXY given as parameters
         '''
-        sPtMove=self.getSetPntRange(ijkRange,'sPtMove')
-        for p in sPtMove.getPoints:
-            ang=math.atan2(p.getPos.y-self.yCentCoo,p.getPos.x-self.xCentCoo)
-            paramCoo=math.sqrt((math.cos(ang)/semiAxX)**2+(math.sin(ang)/semiAXY)**2)
-            p.getPos.x=self.xCentCoo+1/paramCoo*math.cos(ang)
-            p.getPos.y= self.yCentCoo++1/paramCoo*math.sin(ang)
-        sPtMove.clear()
+        lstPnt, xyz= self.getPntCoordinatesRange(ijkRange)
+        ang= numpy.arctan2(xyz[:,1]-self.yCentCoo,xyz[:,0]-self.xCentCoo)
+        paramCoo= numpy.sqrt((numpy.cos(ang)/semiAxX)**2+(numpy.sin(ang)/semiAXY)**2)
+        xyz[:,0]= self.xCentCoo+1/paramCoo*numpy.cos(ang)
+        xyz[:,1]= self.yCentCoo+1/paramCoo*numpy.sin(ang)
+        self.setPntCoordinates(lstPnt,xyz)
             
     def newQuadGridSurface(self,surfName):
         '''Generate the quadrangle surface defined by the 4 vertex whose tags
@@ -602,13 +749,29 @@ class GridModel(object):
         :param surfName: name given to the grid surface
         return the quadrangle surface
         '''
-        points= self.prep.getMultiBlockTopology.getPoints
         (tgPt1,tgPt2,tgPt3,tgPt4)=(int(surfName[1:7]),int(surfName[7:13]),int(surfName[13:19]),int(surfName[19:25]))
+        return self.newQuadGridSurfacePts((tgPt1,tgPt2,tgPt3,tgPt4))
+
+    def newQuadGridSurfacePts(self,pntTags,ijko=None):
+        '''Generate the quadrangle surface defined by the 4 vertex whose tags
+        are passed as parameter and register it in the grid.
+
+        :param pntTags: tags of the vertices (in right order).
+        :param ijko: grid indices of the first vertex and orientation of 
+                     the surface (i,j,k,orientation) (None if the surface
+                     is not aligned with the grid, i.e. it closes a 
+                     cylinder).
+        return the quadrangle surface
+        '''
+        pntTags= tuple(pntTags)
         surfaces= self.prep.getMultiBlockTopology.getSurfaces
-        qs= surfaces.newQuadSurfacePts(tgPt1,tgPt2,tgPt3,tgPt4)
-        qs.name= surfName
+        qs= surfaces.newQuadSurfacePts(*pntTags)
+        qs.name= self.gridSurfName(*pntTags)
         qs.nDivI=1 #initialization values of number of divisions
         qs.nDivJ=1 
+        self.surfTagsByPnts[pntTags]= qs.tag
+        if(ijko is not None):
+            self.surfTags[tuple(ijko)]= qs.tag
         return qs
 
     def getNameQuadGridSurface(self,ind4Pnt):
@@ -642,21 +805,50 @@ class GridModel(object):
         :param linName: name given to the grid line
         return the line
         '''
-        points= self.prep.getMultiBlockTopology.getPoints
         (tgPt1,tgPt2)=(int(linName[1:7]),int(linName[7:15]))
+        return self.newGridLinePts((tgPt1,tgPt2))
+
+    def newGridLinePts(self,pntTags,ijko=None):
+        '''Generate the line defined by the 2 end-points whose tags
+        are passed as parameter and register it in the grid.
+
+        :param pntTags: tags of the end points (in right order).
+        :param ijko: grid indices of the first point and orientation of
+                     the line (i,j,k,orientation) (None if the line joins
+                     non consecutive points of the grid).
+        return the line
+        '''
+        pntTags= tuple(pntTags)
         lines= self.prep.getMultiBlockTopology.getLines
-        ln= lines.newLine(tgPt1,tgPt2)
-        ln.name= linName
+        ln= lines.newLine(*pntTags)
+        ln.name= self.gridLinName(*pntTags)
         ln.nDiv=1 #initialization value
+        self.linTagsByPnts[pntTags]= ln.tag
+        if(ijko is not None):
+            self.linTags[tuple(ijko)]= ln.tag
         return ln
 
+    def getGridLineIJKO(self,ind2Pnt):
+        '''Return the grid indices of the first point and the orientation
+        (i,j,k,orientation) of the line defined by the 2 vertices whose 
+        indices in the grid are passed as parameters, or None if they are
+        not consecutive points of the grid (in increasing order).
+
+        :param ind2Pnt: tuple of ordered points defined by their grid indices 
+                        (i,j,k)
+        '''
+        delta= [b-a for a, b in zip(ind2Pnt[0],ind2Pnt[1])]
+        if(sorted(delta)==[0,0,1]):
+            return tuple(ind2Pnt[0])+(delta.index(1),)
+        return None
+
     def appendSurfRange(self,ijkRange,setSurf,closeCyl='N'):
         '''generate the surfaces limited by a region defined by the coordinates
         that correspond to the indices in the grid 
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax)
         and append them to the set named 'setName'.
-        Add those surfaces to the dictionary dicQuadSurf.
+        Register those surfaces in the grid (see surfTags).
 
         :param ijkRange: instance of IJKRange class
         :param setSurf: name of the set
@@ -664,11 +856,14 @@ class GridModel(object):
                         (defaults to 'N')
         
         '''
-        nmSurfinRang=self.getNmSurfInRange(ijkRange,closeCyl)
-        for nameSurf in nmSurfinRang:
-            s= self.newQuadGridSurface(nameSurf)
-            self.dicQuadSurf[nameSurf]= s
-            setSurf.getSurfaces.append(s)
+        for orientation, indexes, pntTags in self.getQuadSurfGroupsInRange(ijkRange,closeCyl):
+            if(indexes is None):
+                ijkoList= [None]*len(pntTags)
+            else:
+                ijkoList= [(i,j,k,orientation) for i, j, k in indexes.tolist()]
+            for tags, ijko in zip(pntTags.tolist(),ijkoList):
+                s= self.newQuadGridSurfacePts(tags,ijko)
+                setSurf.getSurfaces.append(s)
 
     def genSurfOneRegion(self,ijkRange,setName,closeCyl='N'):
         '''generate the surfaces limited by a region defined by the coordinates
@@ -676,7 +871,7 @@ class GridModel(object):
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax).
         Return a set with the surfaces generated.
-        Add those surfaces to the dictionary dicQuadSurf.
+        Register those surfaces in the grid (see surfTags).
 
         :param ijkRange: instance of IJKRange class
         :param setName: name of the set
@@ -692,7 +887,7 @@ class GridModel(object):
         '''generate the surfaces limited by a region defined by the coordinates
         defined in the range  xyzRange=((xmin,ymin,zmin),(xmax,ymax,zmax))
         Return a set with the surfaces generated.
-        Add those surfaces to the dictionary dicQuadSurf.
+        Register those surfaces in the grid (see surfTags).
 
         :param xyzRange: range xyz
         :param setName: name of the set
@@ -710,7 +905,7 @@ class GridModel(object):
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         Return a set with the surfaces generated.
-        Add those surfaces to the dictionary dicQuadSurf.
+        Register those surfaces in the grid (see surfTags).
 
         :param lstIJKRange: list of instances of IJKRange class
         :param setName: name of the set
@@ -728,7 +923,7 @@ class GridModel(object):
         Each region defines a volume limited by the coordinates    
         that correspond to the coordinates in ranges xyzRange=((xmin,ymin,zmin),(xmax,ymax,zmax))
         Return a set with the surfaces generated.
-        Add those surfaces to the dictionary dicQuadSurf.
+        Register those surfaces in the grid (see surfTags).
 
         :param lstXYZRange: list of ranges xyz
         :param setName: name of the set
@@ -746,14 +941,17 @@ class GridModel(object):
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax)
         and append them to the set named 'setName'. 
-        Add those lines to the dictionary dicLin.
+        Register those lines in the grid (see linTags).
         '''
         setLin= self.prep.getSets.getSet(setName)
-        nmLinInRang=self.getNmLinInRange(ijkRange)
-        for nameLin in nmLinInRang:
-            l=self.newGridLine(nameLin)
-            self.dicLin[nameLin]=l
-            setLin.getLines.append(l)
+        for orientation in range(0,3):
+            indexes= self.getLinIndexesInRange(ijkRange,orientation)
+            offset= [0,0,0]; offset[orientation]= 1
+            tags1= self.getTagsPntGrid(indexes).tolist()
+            tags2= self.getTagsPntGrid(indexes,offset).tolist()
+            for (i,j,k), t1, t2 in zip(indexes.tolist(),tags1,tags2):
+                l=self.newGridLinePts((t1,t2),(i,j,k,orientation))
+                setLin.getLines.append(l)
        
     def genLinOneRegion(self,ijkRange,setName): 
         '''generate the lines limited by a region defined by the coordinates
@@ -761,7 +959,7 @@ class GridModel(object):
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         Return a set with the lines generated.
-        Add those lines to the dictionary dicLin.
+        Register those lines in the grid (see linTags).
         '''
         setLin= self.prep.getSets.defSet(setName)
         self.appendLinRange(ijkRange,setName)
@@ -773,7 +971,7 @@ class GridModel(object):
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         Return a set with the lines generated.
-        Add those lines to the dictionary dicLin.
+        Register those lines in the grid (see linTags).
         '''
         ijkRange=self.getIJKrangeFromXYZrange(xyzRange)
         return self.genLinOneRegion(ijkRange,setName)
@@ -786,7 +984,7 @@ class GridModel(object):
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         Return a set with the lines generated.
-        Add those lines to the dictionary dicLin.
+        Register those lines in the grid (see linTags).
         '''
         setLin= self.prep.getSets.defSet(setName)
         for rg in lstIJKRange:
@@ -799,7 +997,7 @@ class GridModel(object):
         Each region defines a volume limited by the coordinates    
         that correspond to the ranges xyzRange=((xmin,ymin,zmin),(xmax,ymax,zmax))
         Return a set with the lines generated.
-        Add those lines to the dictionary dicLin.
+        Register those lines in the grid (see linTags).
         '''
         lstIJKRange=list()
         for rg in lstXYZRange:
@@ -820,10 +1018,9 @@ class GridModel(object):
                         (defaults to 'N')
         '''
         setSurf= self.prep.getSets.defSet(setName)
-        nmSurfinRang=self.getNmSurfInRange(ijkRange,closeCyl)
-        for nameSurf in nmSurfinRang:
-            if nameSurf in self.dicQuadSurf:
-                setSurf.getSurfaces.append(self.dicQuadSurf[nameSurf])
+        surfaces= self.prep.getMultiBlockTopology.getSurfaces
+        for tag in self.getSurfTagsInRange(ijkRange,closeCyl):
+            setSurf.getSurfaces.append(surfaces.get(tag))
         setSurf.fillDownwards()    
         return setSurf
 
@@ -878,11 +1075,10 @@ class GridModel(object):
                         (defaults to 'N')
         '''
         setSurf= self.prep.getSets.defSet(setName)
+        surfaces= self.prep.getMultiBlockTopology.getSurfaces
         for rg in lstIJKRange:
-            nmSurfinRang=self.getNmSurfInRange(rg,closeCyl)
-            for nameSurf in nmSurfinRang:
-                if nameSurf in self.dicQuadSurf:
-                    setSurf.getSurfaces.append(self.dicQuadSurf[nameSurf])
+            for tag in self.getSurfTagsInRange(rg,closeCyl):
+                setSurf.getSurfaces.append(surfaces.get(tag))
         setSurf.fillDownwards()    
         return setSurf
 
@@ -934,10 +1130,9 @@ class GridModel(object):
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         '''
         setLin= self.prep.getSets.defSet(setName)
-        nmLininRang=self.getNmLinInRange(ijkRange)
-        for nameLin in nmLininRang:
-            if nameLin in self.dicLin:
-                setLin.getLines.append(self.dicLin[nameLin])
+        lines= self.prep.getMultiBlockTopology.getLines
+        for tag in self.getLinTagsInRange(ijkRange):
+            setLin.getLines.append(lines.get(tag))
         setLin.fillDownwards()    
         return setLin
         
@@ -983,11 +1178,10 @@ class GridModel(object):
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         '''
         setLin= self.prep.getSets.defSet(setName)
+        lines= self.prep.getMultiBlockTopology.getLines
         for rg in lstIJKRange:
-            nmLininRang=self.getNmLinInRange(rg)
-            for nameLin in nmLininRang:
-                if nameLin in self.dicLin:
-                    setLin.getLines.append(self.dicLin[nameLin])
+            for tag in self.getLinTagsInRange(rg):
+                setLin.getLines.append(lines.get(tag))
         setLin.fillDownwards()    
         return setLin
 
@@ -1039,12 +1233,8 @@ class GridModel(object):
         ijkRange.ijkMin=(indXmin,indYmin,indZmin) and
         ijkRange.ijkMax=(indXmax,indYmax,indZmax). 
         '''
-        retval=list()
-        nmLinInRang=self.getNmLinInRange(ijkRange)
-        for nameLin in nmLinInRang:
-            if nameLin in self.dicLin:
-                retval.append(self.dicLin[nameLin])
-        return retval
+        lines= self.prep.getMultiBlockTopology.getLines
+        return [lines.get(tag) for tag in self.getLinTagsInRange(ijkRange)]
 
     def getLstLinXYZRange(self,xyzRange):
         '''return a list of lines in a region limited by the coordinates
@@ -1060,15 +1250,21 @@ class GridModel(object):
 
         :param ijkRange: range for the search
         '''
-        retval=list()
         (imin,jmin,kmin)=ijkRange.ijkMin
         (imax,jmax,kmax)=ijkRange.ijkMax
-        lstTagPnt=[self.getTagPntGrid(indPnt=(i,j,k)) for i in range(imin,imax+1) for j in range(jmin,jmax+1) for k in range(kmin,kmax+1)] #list of point tags to include in the set
+        tags= self.pointTags[imin:imax+1,jmin:jmax+1,kmin:kmax+1]
+        lstTagPnt= tags.ravel().tolist() #list of point tags to include in the set
+        if((tags<0).any()): # some points not generated by this object.
+            lstTagPnt= list()
+            for (i,j,k), tg in numpy.ndenumerate(tags):
+                if(tg<0):
+                    pnt= self.getPntGrid((imin+i,jmin+j,kmin+k))
+                    if(pnt is None):
+                        continue
+                    tg= pnt.tag
+                lstTagPnt.append(int(tg))
         points= self.prep.getMultiBlockTopology.getPoints
-        for tg in lstTagPnt:
-          pnt=points.get(tg)
-          retval.append(pnt)
-        return retval
+        return [points.get(tg) for tg in lstTagPnt if points.exists(tg)]
     
     def getLstPntXYZRange(self,xyzRange):
         '''return the ordered list points in a 3D grid-region limited by 
@@ -1137,13 +1333,11 @@ class GridModel(object):
             setLin= self.prep.getSets.getSet(setName)
         else:
             setLin= self.prep.getSets.defSet(setName)
-        lines= self.prep.getMultiBlockTopology.getLines
-        pntTags=[self.getPntGrid(pind).tag for pind in lstGridPnt]
+        pntTags=[self.getTagPntGrid(pind) for pind in lstGridPnt]
         for i in range(len(pntTags)-1):
-            l=lines.newLine(pntTags[i],pntTags[i+1])
+            ijko= self.getGridLineIJKO((lstGridPnt[i],lstGridPnt[i+1]))
+            l=self.newGridLinePts((pntTags[i],pntTags[i+1]),ijko)
             setLin.getLines.append(l)
-            nameLin=self.gridLinName(pntTags[i],pntTags[i+1])
-            self.dicLin[nameLin]=l
         return setLin
 
     def getSetLinFromLstGridPnt(self,lstGridPnt,setName):
@@ -1154,9 +1348,10 @@ class GridModel(object):
         :param setName: name of the set.
         '''
         setLin= self.prep.getSets.defSet(setName)
+        lines= self.prep.getMultiBlockTopology.getLines
         for i in range(len(lstGridPnt)-1):
-            nameLin=self.getNameGridLine((lstGridPnt[i],lstGridPnt[i+1]))
-            setLin.getLines.append(self.dicLin[nameLin])
+            pntTags= (self.getTagPntGrid(lstGridPnt[i]),self.getTagPntGrid(lstGridPnt[i+1]))
+            setLin.getLines.append(lines.get(self.linTagsByPnts[pntTags]))
         return setLin
              
     def genSetLinFromMultiLstGridPnt(self,multiLstGridPnt,setName):
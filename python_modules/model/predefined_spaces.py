@@ -16,6 +16,7 @@ from materials import typical_materials as tm
 from postprocess import extrapolate_elem_attr
 from postprocess import get_reactions
 from solution import predefined_solutions
+from model.sets import spatial_index
 import uuid
 
 defaultSolutionProcedureType= predefined_solutions.SimpleStaticLinear
@@ -1875,11 +1876,12 @@ def ConstraintsForLineExtremeNodes(lineSet, constraint):
     constraint(fN)
     constraint(lN)
 
-def glueSets(preprocessor: xc.Preprocessor,DOF2Glue,masterSet,slaveSet,onCoord=None):
+def glueSets(preprocessor: xc.Preprocessor,DOF2Glue,masterSet,slaveSet,onCoord=None, tol= None, oneToOne= False):
     '''Creates rigid links between nodes in masterSet and their 
     corresponding ones (for reasons of proximity) in slaveSet.
     Each node in masterSet coupled with one and only one node in
-    slaveSet. 
+    slaveSet. All the pairs are computed in one pass using a KD-tree
+    of the slave nodes (see spatial_index.NodeMatching).
 
     :param preprocessor: preprocessor of the finite element problem.
     :param DOF2Glue: degrees of freedom to match. (e.g. [1,4] equals 
@@ -1889,20 +1891,25 @@ def glueSets(preprocessor: xc.Preprocessor,DOF2Glue,masterSet,slaveSet,onCoord=N
     :param onCoord: coordinate on which the search of the nearest node is 
            based ('X','Y','Z'). If None or other value, the search is
            based on the minimum distance. (Defaults to None)
+    :param tol: maximum distance between coupled nodes; the master nodes
+           without slave node closer than tol are not glued (they are
+           reported in a warning). Defaults to None (no limit).
+    :param oneToOne: if True check that each slave node is coupled with
+           only one master node; if not, no node is glued and the
+           problem is reported (defaults to False).
+    :returns: the matching of the nodes (spatial_index.NodeMatching).
     '''
     mdlSpace=getModelSpace(preprocessor)
-    if onCoord in ['x','y','z','X','Y','Z']:
-        indCoo=['x','y','z'].index(onCoord.lower())
-        nodSlave=np.array([n for n in slaveSet.nodes])
-        cooSlave=np.array([n.get3dCoo[indCoo] for n in nodSlave])
-        slSize=len(nodSlave)
-        for n in masterSet.nodes:
-            aux=np.full((slSize),n.get3dCoo[indCoo])
-            nSlave=nodSlave[abs(aux-cooSlave).argmin()]
-            mdlSpace.constraints.newEqualDOF(n.tag,nSlave.tag,xc.ID(DOF2Glue))
-    else:
-        for n in masterSet.nodes:
-            nSlave=slaveSet.nodes.getNearestNode(geom.Pos3d(n.get3dCoo[0],n.get3dCoo[1],n.get3dCoo[2]))
-            mdlSpace.constraints.newEqualDOF(n.tag,nSlave.tag,xc.ID(DOF2Glue))
+    matching= spatial_index.NodeMatching(masterSet.nodes, slaveSet.nodes, onCoord, tol)
+    if(oneToOne and not matching.isOneToOne()):
+        lmsg.error('glueSets: the matching of the nodes is not one to one; '+matching.getReport())
+        return matching
+    unmatched= matching.getUnmatchedNodes()
+    if(len(unmatched)>0):
+        lmsg.warning('glueSets: '+matching.getReport())
+    dofs= xc.ID(DOF2Glue)
+    for n, nSlave in matching.getPairs():
+        mdlSpace.constraints.newEqualDOF(n.tag,nSlave.tag,dofs)
+    return matching
   
 
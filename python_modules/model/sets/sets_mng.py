@@ -15,6 +15,7 @@ import geom
 import xc
 import math
 from misc_utils import log_messages as lmsg
+from model.sets import spatial_index
 
 def get_subset_inside(geomObj,fromSet,toSetName,tol=0.0):
     '''return a subset of fromSet composed by the entities inside the 
@@ -137,7 +138,7 @@ def lstLin_to_set(preprocessor,lstLin,setName):
         s.getLines.append(l)
     return s   
 
-def set_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName):
+def set_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName,spatialIndex=None):
     '''reselect from set setInit those elements included in a orthogonal prism
     defined by a 2D polygon and the direction of its axis. 
 
@@ -152,21 +153,18 @@ def set_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName)
     
     :param prismAxis:    axis of the prism (can be equal to 'X', 'Y', 'Z')
     :param setName:      name of the set to be generated                   
+    :param spatialIndex: spatial index of setInit (see spatial_index module).
+                         If None, an index is built for this query;
+                         pass it to reuse the index in repeated queries.
     '''
-    sElIni=setInit.elements
-    if prismAxis in ['X','x']:
-        elem_inside_prism=[e for e in sElIni if prismBase.In(geom.Pos2d(e.getPosCentroid(True).y,e.getPosCentroid(True).z),0)]
-    elif prismAxis in ['Y','y']:
-        elem_inside_prism=[e for e in sElIni if prismBase.In(geom.Pos2d(e.getPosCentroid(True).x,e.getPosCentroid(True).z),0)]
-    elif prismAxis in ['Z','z']:
-        elem_inside_prism=[e for e in sElIni if prismBase.In(geom.Pos2d(e.getPosCentroid(True).x,e.getPosCentroid(True).y),0)]
-    else:
-        lmsg.error("Wrong prisma axis. Available values: 'X', 'Y', 'Z' \n")
+    if spatialIndex is None:
+        spatialIndex=spatial_index.SetSpatialIndex(setInit)
+    elem_inside_prism=spatialIndex.getElementsInOrthoPrism(prismBase,prismAxis)
     s=lstElem_to_set(preprocessor,elem_inside_prism,setName)
     s.fillDownwards()
     return s
 
-def set_not_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName):
+def set_not_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName,spatialIndex=None):
     '''reselect from set setInit those elements NOT included in a orthogonal prism
     defined by a 2D polygon and the direction of its axis. 
 
@@ -181,8 +179,9 @@ def set_not_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setN
     
     :param prismAxis:    axis of the prism (can be equal to 'X', 'Y', 'Z')
     :param setName:      name of the set to be generated                   
+    :param spatialIndex: spatial index of setInit (defaults to None).
     '''
-    elementsToRemove= set_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName+'toRemove')
+    elementsToRemove= set_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName+'toRemove',spatialIndex)
     retval= setInit-elementsToRemove
     print('name: ', retval.name)
     retval.name= setName
@@ -303,26 +302,19 @@ def setAddOf(setA,setB):
     return nSet
     
 
-def get_nodes_wire(setBusq,lstPtsWire,tol=0.01):
+def get_nodes_wire(setBusq,lstPtsWire,tol=0.01,spatialIndex=None):
     '''return the list of nodes from the set `setBusq` that belong to 
     the line defined by the successive points in list `lstPtsWire`  
     (expressed as geom.Pos3d(x,y,z))
+
+    :param spatialIndex: spatial index of setBusq (defaults to None).
     '''
-    nodAux= setBusq.nodes
-    retval= list() 
-    for i in range(0,len(lstPtsWire)-1):
-        
-        segmAux= geom.Segment3d(lstPtsWire[i],lstPtsWire[i+1])
-        for n in nodAux:
-            p= n.getInitialPos3d
-            d= p.dist(segmAux)
-            if(d<tol):
-                retval.append(n)
-    retval= list(set(retval))       #clear duplicated nodes
-    return retval
+    if spatialIndex is None:
+        spatialIndex=spatial_index.SetSpatialIndex(setBusq)
+    return spatialIndex.getNodesWire(lstPtsWire,tol)
 
 
-def get_set_nodes_plane_XY(setName,setBusq,zCoord,tol=1e-4):
+def get_set_nodes_plane_XY(setName,setBusq,zCoord,tol=1e-4,spatialIndex=None):
     '''Return a set of nodes close to a plane parallel to XY
     within a tolerance.
 
@@ -330,14 +322,16 @@ def get_set_nodes_plane_XY(setName,setBusq,zCoord,tol=1e-4):
     :param setBusq: set from which to extract the nodes
     :param zCoord: Z-coordinate of the plane parallel to XY
     :param tol: tolerance (defaults to 1e-4)
+    :param spatialIndex: spatial index of setBusq (defaults to None).
     '''
     prep=setBusq.getPreprocessor
-    sNodBusq=setBusq.nodes
-    nodInPlane=[n for n in sNodBusq if abs(n.getCurrentPos3d(0).z-zCoord)<=tol]
+    if spatialIndex is None:
+        spatialIndex=spatial_index.SetSpatialIndex(setBusq)
+    nodInPlane=spatialIndex.getNodesInPlane('Z',zCoord,tol)
     return lstNod_to_set(prep,nodInPlane,setName)
     
     
-def get_set_nodes_plane_XZ(setName,setBusq,yCoord,tol=1e-4):
+def get_set_nodes_plane_XZ(setName,setBusq,yCoord,tol=1e-4,spatialIndex=None):
     '''Return a set of nodes close to a plane parallel to XZ
     within a tolerance.
 
@@ -345,14 +339,16 @@ def get_set_nodes_plane_XZ(setName,setBusq,yCoord,tol=1e-4):
     :param setBusq: set from which to extract the nodes
     :param yCoord: Y-coordinate of the plane parallel to XZ
     :param tol: tolerance (defaults to 1e-4)
+    :param spatialIndex: spatial index of setBusq (defaults to None).
     '''
     prep=setBusq.getPreprocessor
-    sNodBusq=setBusq.nodes
-    nodInPlane=[n for n in sNodBusq if abs(n.getCurrentPos3d(0).y-yCoord)<=tol]
+    if spatialIndex is None:
+        spatialIndex=spatial_index.SetSpatialIndex(setBusq)
+    nodInPlane=spatialIndex.getNodesInPlane('Y',yCoord,tol)
     return lstNod_to_set(prep,nodInPlane,setName)
     
     
-def get_set_nodes_plane_YZ(setName,setBusq,xCoord,tol=1e-4):
+def get_set_nodes_plane_YZ(setName,setBusq,xCoord,tol=1e-4,spatialIndex=None):
     '''Return a set of nodes close to a plane parallel to YZ
     within a tolerance.
 
@@ -360,18 +356,34 @@ def get_set_nodes_plane_YZ(setName,setBusq,xCoord,tol=1e-4):
     :param setBusq: set from which to extract the nodes
     :param xCoord: X-coordinate of the plane parallel to YZ
     :param tol: tolerance (defaults to 1e-4)
+    :param spatialIndex: spatial index of setBusq (defaults to None).
     '''
     prep=setBusq.getPreprocessor
-    sNodBusq=setBusq.nodes
-    nodInPlane=[n for n in sNodBusq if abs(n.getCurrentPos3d(0).x-xCoord)<=tol]
+    if spatialIndex is None:
+        spatialIndex=spatial_index.SetSpatialIndex(setBusq)
+    nodInPlane=spatialIndex.getNodesInPlane('X',xCoord,tol)
     return lstNod_to_set(prep,nodInPlane,setName)
 
-def get_lstNod_from_lst3DPos(preprocessor,lst3DPos):
+def get_lstNod_from_lst3DPos(preprocessor,lst3DPos,tol= None,spatialIndex= None):
     '''return the set of the nearest nodes to the points passed as a list of
-    points (expressed as geom.Pos3d(x,y,z))
+    points (expressed as geom.Pos3d(x,y,z)). All the nodes are searched
+    in one pass using a KD-tree of the nodes of the model.
+
+    :param preprocessor: preprocessor of the finite element problem.
+    :param lst3DPos: list of points (geom.Pos3d).
+    :param tol: maximum distance between each point and its node; the 
+                points without node closer than tol are skipped 
+                (defaults to None: no limit).
+    :param spatialIndex: spatial index of the 'total' set (optional,
+                         see spatial_index.SetSpatialIndex).
     '''
-    msNod=preprocessor.getNodeHandler.getDomain.getMesh
-    return[msNod.getNearestNode(pnt) for pnt in lst3DPos]
+    if(spatialIndex is None):
+        spatialIndex= spatial_index.SetSpatialIndex(preprocessor.getSets.getSet('total'))
+    nodes= spatialIndex.getNearestNodes(lst3DPos, tol)
+    retval= [n for n in nodes if n is not None]
+    if(len(retval)<len(nodes)):
+        lmsg.warning('no node found near '+str(len(nodes)-len(retval))+' of '+str(len(nodes))+' points.')
+    return retval
     
 
 def get_lstNod_on_points_fromSet(setFrom):
@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+''' Spatial index over the nodes and the element centroids of a set.
+    The index is built once and then it's used to answer box, prism,
+    plane, wire and nearest neighbour queries without checking every
+    node or element of the set.'''
+
+from __future__ import division
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es" "ana.ortega.ort@gmail.com"
+
+import numpy as np
+from scipy.spatial import cKDTree
+import geom
+from misc_utils import log_messages as lmsg
+
+axisIndexes= {'X':0, 'x':0, 'Y':1, 'y':1, 'Z':2, 'z':2}
+prismBaseAxes= {0:(1,2), 1:(0,2), 2:(0,1)} # coordinates of the prism base.
+
+def getAxisIndex(axis):
+    ''' Return the index of the axis (0, 1 or 2) or -1 if the axis
+        is not 'X', 'Y' or 'Z'.
+
+    :param axis: global axis (can be equal to 'X', 'Y', 'Z')
+    '''
+    return axisIndexes.get(axis, -1)
+
+class EntityIndex(object):
+    ''' Spatial index of a list of entities (nodes or elements) with a
+        position.
+
+     :ivar entities: list of the entities.
+     :ivar positions: array (n x 3) with the positions of the entities.
+     :ivar trees: KD-trees of the positions (or of their projections
+                  on a coordinate plane), built when needed.
+     :ivar sortedCoordinates: entity indexes sorted by each coordinate,
+                              computed when needed.
+    '''
+    def __init__(self, entities, positions):
+        ''' Constructor.
+
+           :param entities: list of entities.
+           :param positions: list of the positions (x,y,z) of the entities.
+        '''
+        self.entities= entities
+        self.positions= np.array(positions, dtype= float).reshape(-1,3)
+        self.trees= dict()
+        self.sortedCoordinates= dict()
+
+    def getNumEntities(self):
+        ''' Return the number of indexed entities.'''
+        return len(self.entities)
+
+    def getTree(self, axes= (0,1,2)):
+        ''' Return the KD-tree of the coordinates in axes.
+
+        :param axes: indexes of the coordinates to consider.
+        '''
+        if(axes not in self.trees):
+            self.trees[axes]= cKDTree(self.positions[:,list(axes)])
+        return self.trees[axes]
+
+    def getSortedCoordinate(self, axis):
+        ''' Return the entity indexes sorted by the coordinate and the
+            sorted values of that coordinate.
+
+        :param axis: index of the coordinate.
+        '''
+        if(axis not in self.sortedCoordinates):
+            order= np.argsort(self.positions[:,axis], kind= 'stable')
+            self.sortedCoordinates[axis]= (order, self.positions[order,axis])
+        return self.sortedCoordinates[axis]
+
+    def getEntities(self, indexes):
+        ''' Return the entities corresponding to the indexes (in the same
+            order as in the source set).'''
+        return [self.entities[i] for i in sorted(indexes)]
+
+    def getIndexesInBox(self, pMin, pMax, axes= (0,1,2)):
+        ''' Return the indexes of the entities whose coordinates (in
+            axes) lie inside the box [pMin, pMax] (boundary included).
+
+        :param pMin: minimum values of the coordinates.
+        :param pMax: maximum values of the coordinates.
+        :param axes: indexes of the coordinates to consider.
+        '''
+        if(self.getNumEntities()==0):
+            return list()
+        pMin= np.array(pMin, dtype= float)
+        pMax= np.array(pMax, dtype= float)
+        center= (pMin+pMax)/2.0
+        halfSides= (pMax-pMin)/2.0
+        # The ball in the maximum norm contains the box.
+        radius= float(np.max(halfSides))
+        candidates= self.getTree(axes).query_ball_point(center, radius*(1.0+1e-9)+1e-12, p= np.inf)
+        if(len(candidates)==0):
+            return list()
+        candidates= np.array(candidates, dtype= int)
+        coo= self.positions[candidates][:,list(axes)]
+        inside= np.all((coo>=pMin) & (coo<=pMax), axis= 1)
+        return sorted(candidates[inside].tolist())
+
+    def getIndexesInSlab(self, axis, value, tol):
+        ''' Return the indexes of the entities whose coordinate verifies
+            abs(coordinate-value)<=tol.
+
+        :param axis: index of the coordinate.
+        :param value: value of the coordinate.
+        :param tol: half thickness of the slab.
+        '''
+        order, sortedValues= self.getSortedCoordinate(axis)
+        margin= 1e-9*max(abs(value), abs(tol), 1.0) # round-off.
+        first= np.searchsorted(sortedValues, value-tol-margin, side= 'left')
+        last= np.searchsorted(sortedValues, value+tol+margin, side= 'right')
+        candidates= order[first:last]
+        inside= np.abs(self.positions[candidates,axis]-value)<=tol
+        return sorted(candidates[inside].tolist())
+
+    def getIndexesInOrthoPrism(self, prismBase, axis):
+        ''' Return the indexes of the entities inside the prism defined
+            by the 2D polygon prismBase and the axis.
+
+        :param prismBase: 2D polygon that defines the base of the prism.
+        :param axis: index of the prism axis.
+        '''
+        axes= prismBaseAxes[axis]
+        vertices= prismBase.getVertexList()
+        pMin= [min(v.x for v in vertices), min(v.y for v in vertices)]
+        pMax= [max(v.x for v in vertices), max(v.y for v in vertices)]
+        candidates= self.getIndexesInBox(pMin, pMax, axes)
+        retval= list()
+        for i in candidates:
+            p= self.positions[i]
+            if(prismBase.In(geom.Pos2d(p[axes[0]],p[axes[1]]),0)):
+                retval.append(i)
+        return retval
+
+    def getIndexesNearSegment(self, pA, pB, tol):
+        ''' Return the indexes of the entities whose distance to the
+            segment pA-pB is less than tol.
+
+        :param pA: first point of the segment (x,y,z).
+        :param pB: last point of the segment (x,y,z).
+        :param tol: distance threshold.
+        '''
+        if(self.getNumEntities()==0):
+            return list()
+        pA= np.array(pA, dtype= float)
+        pB= np.array(pB, dtype= float)
+        v= pB-pA
+        length= np.linalg.norm(v)
+        center= (pA+pB)/2.0
+        candidates= self.getTree().query_ball_point(center, length/2.0+tol)
+        if(len(candidates)==0):
+            return list()
+        candidates= np.array(candidates, dtype= int)
+        w= self.positions[candidates]-pA
+        if(length>0.0):
+            t= np.clip(np.dot(w, v)/length**2, 0.0, 1.0)
+        else:
+            t= np.zeros(len(candidates))
+        distances= np.linalg.norm(w-np.outer(t, v), axis= 1)
+        return sorted(candidates[distances<tol].tolist())
+
+    def getIndexNearest(self, pos):
+        ''' Return the index of the entity nearest to the position (in case
+            of tie the first one in the set) or -1 if there are no entities.
+
+        :param pos: position (x,y,z).
+        '''
+        if(self.getNumEntities()==0):
+            return -1
+        tree= self.getTree()
+        dist, retval= tree.query(pos)
+        candidates= tree.query_ball_point(pos, dist*(1.0+1e-9)+1e-12)
+        if(len(candidates)>1):
+            retval= min(candidates)
+        return int(retval)
+
+    def getIndexesNearestCoordinate(self, values, axis, tol= None):
+        ''' Return the indexes of the entities whose coordinate is the
+            nearest to each one of the values (in case of tie the first
+            one in the set) and the corresponding distances. The index is
+            -1 (and the distance infinite) if there are no entities at a
+            distance less or equal than tol.
+
+        :param values: values of the coordinate.
+        :param axis: index of the coordinate.
+        :param tol: maximum distance (None for no limit).
+        '''
+        order, sortedValues= self.getSortedCoordinate(axis)
+        numEntities= len(sortedValues)
+        values= np.asarray(values, dtype= float)
+        # Candidates: first entity (in the set) with the nearest value
+        # greater or equal than each value and the same for the lower one.
+        upper= np.searchsorted(sortedValues, values, side= 'left')
+        lower= np.searchsorted(sortedValues, sortedValues[np.maximum(upper-1, 0)], side= 'left')
+        upperOk= upper<numEntities
+        lowerOk= upper>0
+        upper= np.minimum(upper, numEntities-1)
+        upperDist= np.where(upperOk, np.abs(sortedValues[upper]-values), np.inf)
+        lowerDist= np.where(lowerOk, np.abs(values-sortedValues[lower]), np.inf)
+        upperIdx= order[upper]
+        lowerIdx= order[lower]
+        takeLower= (lowerDist<upperDist) | ((lowerDist==upperDist) & (lowerIdx<upperIdx))
+        retval= np.where(takeLower, lowerIdx, upperIdx).astype(int)
+        dist= np.minimum(lowerDist, upperDist)
+        if(tol is not None):
+            tooFar= dist>tol
+            retval[tooFar]= -1
+            dist[tooFar]= np.inf
+        return retval, dist
+
+    def getIndexesNearest(self, positions, axes= (0,1,2), tol= None):
+        ''' Return the indexes of the entities nearest to each one of the
+            positions (in case of tie the first one in the set) and the
+            corresponding distances. The index is -1 (and the distance
+            infinite) if there are no entities at a distance less or
+            equal than tol.
+
+        :param positions: array (n x 3) with the positions (x,y,z).
+        :param axes: indexes of the coordinates to consider (i.e. (2,) to
+                     compare only the z coordinate).
+        :param tol: maximum distance (None for no limit).
+        '''
+        positions= np.array(positions, dtype= float).reshape(-1,3)[:,list(axes)]
+        numPositions= len(positions)
+        if((self.getNumEntities()==0) or (numPositions==0)):
+            return np.full(numPositions, -1, dtype= int), np.full(numPositions, np.inf)
+        if(len(axes)==1):
+            return self.getIndexesNearestCoordinate(positions[:,0], axes[0], tol)
+        tree= self.getTree(tuple(axes))
+        upperBound= np.inf if(tol is None) else tol*(1.0+1e-9)+1e-12
+        k= min(2, self.getNumEntities())
+        distances, indexes= tree.query(positions, k= k, distance_upper_bound= upperBound)
+        if(k==1):
+            distances= distances.reshape(-1,1)
+            indexes= indexes.reshape(-1,1)
+        retval= indexes[:,0].astype(int)
+        dist= distances[:,0]
+        found= np.isfinite(dist)
+        retval[~found]= -1
+        if(k>1): # ties: take the first entity in the set.
+            ties= np.nonzero(found & (distances[:,1]<=dist*(1.0+1e-9)+1e-12))[0]
+            for i in ties:
+                candidates= tree.query_ball_point(positions[i], dist[i]*(1.0+1e-9)+1e-12)
+                retval[i]= min(candidates)
+        return retval, dist
+
+class NodeMatching(object):
+    ''' Pairs of nodes (master node, nearest slave node) obtained in a
+        single pass using a KD-tree of the slave nodes.
+
+     :ivar masterNodes: master nodes.
+     :ivar slaveNodes: slave node matched with each master node (None if
+                       there is no slave node closer than the tolerance).
+     :ivar distances: distance between each master node and its slave node.
+    '''
+    def __init__(self, masterNodes, slaveNodes, onCoord= None, tol= None):
+        ''' Constructor.
+
+        :param masterNodes: master nodes (set or list of nodes).
+        :param slaveNodes: slave nodes (set or list of nodes).
+        :param onCoord: coordinate on which the search of the nearest node
+                        is based ('X','Y','Z'). If None or other value, the
+                        search is based on the minimum distance.
+        :param tol: maximum distance between matched nodes (None for no
+                    limit).
+        '''
+        self.masterNodes= [n for n in masterNodes]
+        slaveIndex= getNodesEntityIndex([n for n in slaveNodes])
+        i= getAxisIndex(onCoord) if(onCoord) else -1
+        axes= (i,) if(i>=0) else (0,1,2)
+        indexes, self.distances= slaveIndex.getIndexesNearest(getNodesPositions(self.masterNodes), axes, tol)
+        self.slaveNodes= [slaveIndex.entities[j] if(j>=0) else None for j in indexes.tolist()]
+
+    def getPairs(self):
+        ''' Return the list of matched (master node, slave node) pairs.'''
+        return [(m, s) for m, s in zip(self.masterNodes, self.slaveNodes) if(s is not None)]
+
+    def getUnmatchedNodes(self):
+        ''' Return the master nodes without slave node.'''
+        return [m for m, s in zip(self.masterNodes, self.slaveNodes) if(s is None)]
+
+    def getMultipleMatchedNodes(self):
+        ''' Return a dictionary containing the slave nodes matched with more
+            than one master node (slave node tag: master node tags).'''
+        masterTags= dict()
+        for m, s in zip(self.masterNodes, self.slaveNodes):
+            if(s is not None):
+                masterTags.setdefault(s.tag, list()).append(m.tag)
+        return {tag: tags for tag, tags in masterTags.items() if(len(tags)>1)}
+
+    def isOneToOne(self):
+        ''' Return true if each slave node is matched with only one master
+            node.'''
+        return (len(self.getMultipleMatchedNodes())==0)
+
+    def getReport(self):
+        ''' Return a string describing the matching.'''
+        unmatched= self.getUnmatchedNodes()
+        multiple= self.getMultipleMatchedNodes()
+        retval= str(len(self.masterNodes)-len(unmatched))+' of '+str(len(self.masterNodes))+' master nodes matched'
+        if(len(unmatched)>0):
+            retval+= '; unmatched master nodes: '+str([n.tag for n in unmatched])
+        if(len(multiple)>0):
+            retval+= '; slave nodes matched more than once (slave: masters): '+str(multiple)
+        if(len(self.masterNodes)>len(unmatched)):
+            retval+= '; maximum distance: '+str(float(np.max(self.distances[np.isfinite(self.distances)])))
+        return retval
+
+def getNodesPositions(nodes):
+    ''' Return an array (n x 3) with the initial positions of the nodes.
+
+    :param nodes: list of nodes.
+    '''
+    retval= np.empty((len(nodes), 3))
+    for i, n in enumerate(nodes):
+        p= n.getInitialPos3d
+        retval[i]= (p.x, p.y, p.z)
+    return retval
+
+def getNodesEntityIndex(nodes):
+    ''' Return an index of the nodes by their initial positions.
+
+    :param nodes: list of nodes.
+    '''
+    return EntityIndex(nodes, getNodesPositions(nodes))
+
+class SetSpatialIndex(object):
+    '''Spatial index over the nodes and the element centroids of a set.
+       The positions are taken from the initial (undeformed) geometry
+       when each index is first needed, so a new SetSpatialIndex must be
+       created if the set is modified.
+
+     :ivar xcSet: indexed set.
+     :ivar nodeIndex: index of the nodes of the set (built when needed).
+     :ivar elementIndex: index of the elements of the set by the
+                         position of their centroids (built when needed).
+    '''
+    def __init__(self, xcSet):
+        ''' Constructor.
+
+           :param xcSet: set to index.
+        '''
+        self.xcSet= xcSet
+        self.nodeIndex= None
+        self.elementIndex= None
+
+    def getNodeIndex(self):
+        ''' Return the index of the nodes of the set.'''
+        if(self.nodeIndex is None):
+            self.nodeIndex= getNodesEntityIndex([n for n in self.xcSet.nodes])
+        return self.nodeIndex
+
+    def getElementIndex(self):
+        ''' Return the index of the elements of the set.'''
+        if(self.elementIndex is None):
+            elements= [e for e in self.xcSet.elements]
+            positions= list()
+            for e in elements:
+                p= e.getPosCentroid(True)
+                positions.append((p.x, p.y, p.z))
+            self.elementIndex= EntityIndex(elements, positions)
+        return self.elementIndex
+
+    def getNodesInBox(self, pMin, pMax):
+        ''' Return the nodes inside the box defined by its corners.
+
+        :param pMin: corner with the minimum coordinates (geom.Pos3d).
+        :param pMax: corner with the maximum coordinates (geom.Pos3d).
+        '''
+        nodeIndex= self.getNodeIndex()
+        idx= nodeIndex.getIndexesInBox((pMin.x, pMin.y, pMin.z), (pMax.x, pMax.y, pMax.z))
+        return nodeIndex.getEntities(idx)
+
+    def getElementsInBox(self, pMin, pMax):
+        ''' Return the elements whose centroid is inside the box defined
+            by its corners.
+
+        :param pMin: corner with the minimum coordinates (geom.Pos3d).
+        :param pMax: corner with the maximum coordinates (geom.Pos3d).
+        '''
+        elementIndex= self.getElementIndex()
+        idx= elementIndex.getIndexesInBox((pMin.x, pMin.y, pMin.z), (pMax.x, pMax.y, pMax.z))
+        return elementIndex.getEntities(idx)
+
+    def getNodesInPlane(self, axis, coord, tol= 1e-4):
+        ''' Return the nodes close to the plane normal to the axis
+            (i. e. abs(node coordinate - coord)<=tol).
+
+        :param axis: axis normal to the plane (can be equal to 'X', 'Y', 'Z')
+        :param coord: coordinate of the plane.
+        :param tol: tolerance (defaults to 1e-4)
+        '''
+        nodeIndex= self.getNodeIndex()
+        i= getAxisIndex(axis)
+        if(i<0):
+            lmsg.error("Wrong axis. Available values: 'X', 'Y', 'Z' \n")
+            return list()
+        return nodeIndex.getEntities(nodeIndex.getIndexesInSlab(i, coord, tol))
+
+    def getElementsInOrthoPrism(self, prismBase, prismAxis):
+        ''' Return the elements whose centroid is inside the orthogonal
+            prism defined by a 2D polygon and the direction of its axis.
+
+        :param prismBase: 2D polygon that defines the n-sided base of the
+                          prism (see sets_mng.set_included_in_orthoPrism).
+        :param prismAxis: axis of the prism (can be equal to 'X', 'Y', 'Z')
+        '''
+        elementIndex= self.getElementIndex()
+        i= getAxisIndex(prismAxis)
+        if(i<0):
+            lmsg.error("Wrong prisma axis. Available values: 'X', 'Y', 'Z' \n")
+            return list()
+        return elementIndex.getEntities(elementIndex.getIndexesInOrthoPrism(prismBase, i))
+
+    def getNodesWire(self, lstPtsWire, tol= 0.01):
+        ''' Return the nodes whose distance to the polyline defined by the
+            successive points in lstPtsWire is less than tol.
+
+        :param lstPtsWire: vertices of the polyline (geom.Pos3d).
+        :param tol: tolerance (defaults to 0.01)
+        '''
+        nodeIndex= self.getNodeIndex()
+        idx= set()
+        for pA, pB in zip(lstPtsWire[:-1], lstPtsWire[1:]):
+            idx.update(nodeIndex.getIndexesNearSegment((pA.x, pA.y, pA.z), (pB.x, pB.y, pB.z), tol))
+        return nodeIndex.getEntities(idx)
+
+    def getNearestNode(self, pos):
+        ''' Return the node nearest to the position (None if the set
+            has no nodes).
+
+        :param pos: position (geom.Pos3d).
+        '''
+        nodeIndex= self.getNodeIndex()
+        i= nodeIndex.getIndexNearest((pos.x, pos.y, pos.z))
+        return nodeIndex.entities[i] if(i>=0) else None
+
+    def getNearestNodes(self, positions, tol= None):
+        ''' Return the nodes nearest to each one of the positions (None
+            if there is no node at a distance less or equal than tol).
+
+        :param positions: list of positions (geom.Pos3d).
+        :param tol: maximum distance (None for no limit).
+        '''
+        nodeIndex= self.getNodeIndex()
+        indexes, distances= nodeIndex.getIndexesNearest([(p.x, p.y, p.z) for p in positions], tol= tol)
+        return [nodeIndex.entities[i] if(i>=0) else None for i in indexes.tolist()]
+
+    def getNearestElement(self, pos):
+        ''' Return the element whose centroid is the nearest to the
+            position (None if the set has no elements).
+
+        :param pos: position (geom.Pos3d).
+        '''
+        elementIndex= self.getElementIndex()
+        i= elementIndex.getIndexNearest((pos.x, pos.y, pos.z))
+        return elementIndex.entities[i] if(i>=0) else None
@@ -6,6 +6,7 @@ from __future__ import division
 from postprocess import element_section_map
 import pickle
 from misc_utils import log_messages as lmsg
+from misc import stage_profiler
 import xc_base
 import geom
 import xc
@@ -15,6 +16,8 @@ from postprocess import phantom_model as phm
 from materials.sections import RC_sections_container as sc
 from model.sets import sets_mng as sUtils
 from postprocess import limit_state_data as lsd
+from postprocess import parallel_checking
+from postprocess import incremental_checking
 
 __author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
 __copyright__= "Copyright 2016, LCPT and AO_O"
@@ -126,24 +129,42 @@ class RCMaterialDistribution(object):
                    elements to be analyzed, append or not the results to a file,
                    generation or not of lists, ...)
         '''
-        feProblem= xc.FEProblem()
-        preprocessor= feProblem.getPreprocessor
+        profiler= stage_profiler.profiler
+        with profiler.stage('runChecking', limitState= limitStateData.label):
+            feProblem= xc.FEProblem()
+            preprocessor= feProblem.getPreprocessor
+            with profiler.stage('setupSections'):
+                self.setupSections(preprocessor,limitStateData,matDiagType,threeDim)
+            limitStateData.controller.solutionProcedure= limitStateData.controller.solutionProcedureType(feProblem)
+            phantomModel= phm.PhantomModel(preprocessor,self)
+            result= phantomModel.runChecking(limitStateData,outputCfg)
+        return (feProblem, result)
+
+    def setupSections(self,preprocessor,limitStateData,matDiagType,threeDim= True,sectionNames= None):
+        '''Creates the fiber sections and its interaction diagrams.
+
+        :param preprocessor: preprocessor of the phantom model.
+        :param limitStateData: object that contains the controller to use
+                               for the checking.
+        :param matDiagType: type of the material diagram (d: design, 
+               k: characteristic).
+        :param threeDim: true if it's 3D (Fx,Fy,Fz,Mx,My,Mz) 
+               false if it's 2D (Fx,Fy,Mz).
+        :param sectionNames: names of the sections to create (defaults to
+                             None which means all the sections).
+        '''
         if 'straight' in str(limitStateData.controller).lower():
              for s in self.sectionDefinition.sections:
                  s.fiberSectionParameters.concrType.initTensStiff='Y'
-        self.sectionDefinition.createRCsections(preprocessor,matDiagType) #creates
+        self.sectionDefinition.createRCsections(preprocessor,matDiagType,sectionNames) #creates
                           #for each element in the container the fiber sections
                           #(RCsimpleSections) associated with it.
         if(threeDim):
-            self.sectionDefinition.calcInteractionDiagrams(preprocessor,matDiagType)
+            self.sectionDefinition.calcInteractionDiagrams(preprocessor,matDiagType,sectionNames= sectionNames)
         else:
-            self.sectionDefinition.calcInteractionDiagrams(preprocessor,matDiagType,'NMy')
-        limitStateData.controller.solutionProcedure= limitStateData.controller.solutionProcedureType(feProblem)
-        phantomModel= phm.PhantomModel(preprocessor,self)
-        result= phantomModel.runChecking(limitStateData,outputCfg)
-        return (feProblem, result)
+            self.sectionDefinition.calcInteractionDiagrams(preprocessor,matDiagType,'NMy',sectionNames)
 
-    def internalForcesVerification3D(self,limitStateData,matDiagType,outputCfg):
+    def internalForcesVerification3D(self,limitStateData,matDiagType,outputCfg,numProcesses= 1,incremental= False):
         '''Limit state verification based on internal force (Fx,Fy,Fz,Mx,My,Mz) values.
 
         :param limitStateData: object that contains the name of the file
@@ -156,9 +177,23 @@ class RCMaterialDistribution(object):
                    variables that control the output of the checking (set of 
                    elements to be analyzed, append or not the results to a file,
                    generation or not of lists, ...)
+        :param numProcesses: number of worker processes to check the 
+                             elements in parallel (defaults to 1 which 
+                             means serial checking; if None the number
+                             of CPUs is used).
+        :param incremental: if true check only the elements and 
+                            combinations whose data have changed since 
+                            the last run (see incremental_checking module;
+                            the changed elements are checked using 
+                            numProcesses worker processes).
         '''
-        (tmp, retval)= self.runChecking(limitStateData, matDiagType,True,outputCfg)
-        tmp.clearAll() #Free memory.
+        if(incremental):
+            retval= incremental_checking.runRCChecking(self,limitStateData,matDiagType,True,outputCfg,numProcesses= numProcesses)
+        elif(numProcesses==1):
+            (tmp, retval)= self.runChecking(limitStateData, matDiagType,True,outputCfg)
+            tmp.clearAll() #Free memory.
+        else:
+            retval= parallel_checking.runRCChecking(self,limitStateData,matDiagType,True,outputCfg,numProcesses)
         return retval
 
     def internalForcesVerification2D(self,limitStateData, matDiagType,setCalc=None):
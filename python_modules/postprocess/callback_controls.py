@@ -1,3 +1,17 @@
+# -*- coding: utf-8 -*-
+''' Callbacks to install in the property recorders (see recorders.py).
+
+    The functions that return strings return Python code that is
+    interpreted for each object at every commit (legacy form). The
+    functions with the "fn" prefix are callables f(recorder, obj) that
+    can be assigned to recorder.callbackRecord and the classes below are
+    set-level callables f(recorder, objects) to assign to
+    recorder.callbackRecordSet; these ones process all the objects of
+    the recorder at once using NumPy arrays.'''
+
+import math
+import numpy
+
 def controlMovU():
   return """U= self.getDisp[0]
 nmbComb= recorder.getCurrentCombinationName
@@ -52,6 +66,23 @@ if(modMov>self.getProp("dispMax")):
    self.setProp("dispMax",modMov)
    self.setProp("CombDispMax",nmbComb)"""
 
+def fnControlMovModulusUV(recorder, obj):
+  disp= obj.getDisp
+  modMov= math.sqrt(disp[0]**2+disp[1]**2)
+  if(modMov>obj.getProp("dispMax")):
+     obj.setProp("dispMax",modMov)
+     obj.setProp("CombDispMax",recorder.getCurrentCombinationName)
+
+def fnControlMovModulusUVW(recorder, obj):
+  disp= obj.getDisp
+  modMov= math.sqrt(disp[0]**2+disp[1]**2+disp[2]**2)
+  if(modMov>obj.getProp("dispMax")):
+     obj.setProp("dispMax",modMov)
+     obj.setProp("CombDispMax",recorder.getCurrentCombinationName)
+
+def fnRestartMessage(recorder, obj):
+  print("Restart method called.")
+
 def fnControlMovComponent(recorder, obj, codeComponent, value):
   propVMax= codeComponent+'Max'
   propCombVMax= 'Comb'+propVMax
@@ -384,3 +415,226 @@ if(self.getProp("FCV") > self.getProp("FCVCP")):
    self.setProp("FCVCP",self.getProp("FCV"))
    self.setProp("VyCP",self.getV())
    self.setProp("HIPCPV",nmbComb)"""
+
+# Incremented each time the control variables are (re)defined (see
+# resetSetControls).
+controlVarsGeneration= 0
+
+def resetSetControls():
+  '''Force the set-level callbacks to read again the control variables
+     from the object properties on its next call (the def_vars_control
+     functions call it; other changes of the properties are detected
+     by the callbacks themselves, see SetControlBase).'''
+  global controlVarsGeneration
+  controlVarsGeneration+= 1
+
+class SetControlBase(object):
+  '''Base class for the set-level callbacks (to assign to
+     recorder.callbackRecordSet). The values of the control variables
+     are read from the object properties the first time the callback
+     is called and kept in arrays; afterwards the properties are
+     written only for the objects whose values have changed. The
+     control variables are read again when the recorded objects change,
+     when resetSetControls is called or when the properties of the
+     witness variables (read on each call) differ from the stored
+     values (i.e. the properties have been reset directly).
+
+  :cvar witnessVars: control variables read back on each call to
+                     detect the changes of the properties made outside
+                     the callback (accumulated maxima: they remain
+                     zero only while nothing has been recorded, so a
+                     reset of the properties is always detected).
+  :ivar objects: recorded objects.
+  :ivar generation: value of controlVarsGeneration when the control
+                    variables were read.
+  '''
+  witnessVars= []
+
+  def __init__(self):
+    self.objects= None
+    self.generation= None
+
+  def setup(self, objects):
+    '''Read the control variables from the object properties.'''
+    self.objects= objects
+    self.generation= controlVarsGeneration
+
+  def reset(self):
+    '''Read again the control variables from the object properties
+       on the next call.'''
+    self.objects= None
+
+  def getPropArray(self, name, dtype= float):
+    '''Return an array with the values of the property for each object.'''
+    return numpy.array([obj.getProp(name) for obj in self.objects], dtype= dtype)
+
+  def setProps(self, mask, names):
+    '''Write the values of the control variables in the properties of
+       the objects selected by mask.
+
+    :param mask: boolean array to select the objects.
+    :param names: names of the control variables (they must be
+                  attributes of this object).
+    '''
+    values= [getattr(self, name) for name in names]
+    for i in numpy.nonzero(mask)[0]:
+      obj= self.objects[i]
+      for name, v in zip(names, values):
+        value= v[i]
+        if(isinstance(value, numpy.floating)):
+          value= float(value)
+        obj.setProp(name, value)
+
+  def update(self, recorder):
+    '''Update the control variables.'''
+    raise NotImplementedError
+
+  def isOutdated(self, objects):
+    '''Return true if the control variables must be read again from
+       the object properties.
+
+    :param objects: recorded objects.
+    '''
+    if((self.objects is not objects) or (self.generation!=controlVarsGeneration)):
+      return True
+    for name in self.witnessVars:
+      if(not numpy.array_equal(self.getPropArray(name), getattr(self, name))):
+        return True
+    return False
+
+  def __call__(self, recorder, objects):
+    if(self.isOutdated(objects)):
+      self.setup(objects)
+    self.update(recorder)
+
+class DisplacementModulusControl(SetControlBase):
+  '''Set-level callback that updates the maximum value of the
+     displacement modulus ("dispMax" and "CombDispMax" properties, see
+     def_vars_control.defVarsControlMovModulus) of the recorded nodes.
+
+  :ivar numComponents: number of displacement components to take
+                       into account (2: UV, 3: UVW).
+  '''
+  witnessVars= ['dispMax']
+
+  def __init__(self, numComponents= 3):
+    super(DisplacementModulusControl,self).__init__()
+    self.numComponents= numComponents
+
+  def setup(self, objects):
+    super(DisplacementModulusControl,self).setup(objects)
+    self.dispMax= self.getPropArray("dispMax")
+    self.CombDispMax= self.getPropArray("CombDispMax", dtype= object)
+
+  def getDisplacements(self):
+    '''Return an array (number of nodes x number of components)
+       with the current displacements of the nodes.'''
+    components= range(0,self.numComponents)
+    retval= list()
+    for n in self.objects:
+      disp= n.getDisp
+      retval.append([disp[i] for i in components])
+    return numpy.array(retval, dtype= float).reshape(-1,self.numComponents)
+
+  def update(self, recorder):
+    modMov= numpy.linalg.norm(self.getDisplacements(), axis= 1)
+    greater= modMov>self.dispMax
+    self.dispMax[greater]= modMov[greater]
+    self.CombDispMax[greater]= recorder.getCurrentCombinationName
+    self.setProps(greater, ['dispMax', 'CombDispMax'])
+
+class ElasticRangeStressControl(SetControlBase):
+  '''Set-level callback to check the stress criterion for bar
+     elements in elastic range (vectorized form of
+     controTensRecElastico3d and controTensRecElastico2d). Uses the
+     properties defined by def_vars_control.defVarsControlTensRegElastico3d
+     (or 2d) and defSteelShapeElasticRangeElementParameters.
+
+  :ivar is3D: true for bars in 3D problems.
+  '''
+  tnVars3d= ['SgMax', 'SgMin', 'FCTN', 'FCTNCP', 'NCP', 'MyCP', 'MzCP', 'HIPCPTN']
+  vVars3d= ['TauMax', 'FCV', 'FCVCP', 'VyCP', 'VzCP', 'HIPCPV']
+  tnVars2d= ['SgMax', 'SgMin', 'FCTN', 'FCTNCP', 'NCP', 'MzCP', 'HIPCPTN']
+  vVars2d= ['TauMax', 'FCV', 'FCVCP', 'VyCP', 'HIPCPV']
+  witnessVars= ['FCTNCP', 'FCVCP']
+
+  def __init__(self, is3D= True):
+    super(ElasticRangeStressControl,self).__init__()
+    self.is3D= is3D
+    if(is3D):
+      self.tnVars= self.tnVars3d
+      self.vVars= self.vVars3d
+    else:
+      self.tnVars= self.tnVars2d
+      self.vVars= self.vVars2d
+
+  def setup(self, objects):
+    super(ElasticRangeStressControl,self).setup(objects)
+    self.A= numpy.array([e.sectionProperties.A for e in objects], dtype= float)
+    self.fyd= self.getPropArray("fyd")
+    self.fydV= self.getPropArray("fydV")
+    if(self.is3D):
+      self.Wy= self.getPropArray("Wyel")
+      self.Wz= self.getPropArray("Wzel")
+      self.AreaQy= self.getPropArray("AreaQy")
+      self.AreaQz= self.getPropArray("AreaQz")
+    else:
+      self.Wz= self.getPropArray("Wel")
+    for name in self.tnVars+self.vVars:
+      dtype= object if name.startswith('HIP') else float
+      setattr(self, name, self.getPropArray(name, dtype))
+
+  def getInternalForces(self):
+    '''Return the arrays N, My, Mz (number of elements x 2: back and
+       front nodes), Vy and Vz with the internal forces of the elements
+       (My and Vz are zero in 2D problems).'''
+    retval= numpy.zeros((len(self.objects), 8))
+    if(self.is3D):
+      for i, e in enumerate(self.objects):
+        e.getResistingForce()
+        retval[i]= [e.getN1, e.getN2, e.getMy1, e.getMy2, e.getMz1, e.getMz2, e.getVy(), e.getVz()]
+    else:
+      for i, e in enumerate(self.objects):
+        e.getResistingForce()
+        retval[i]= [e.getN1, e.getN2, 0.0, 0.0, e.getM1, e.getM2, e.getV(), 0.0]
+    return retval[:,0:2], retval[:,2:4], retval[:,4:6], retval[:,6], retval[:,7]
+
+  def update(self, recorder):
+    nmbComb= recorder.getCurrentCombinationName
+    N, My, Mz, Vy, Vz= self.getInternalForces()
+    # Normal stresses (same sequence of checks as the string version).
+    signs= [(1.0,1.0),(1.0,-1.0),(-1.0,1.0),(-1.0,-1.0)] if(self.is3D) else [(0.0,1.0),(0.0,-1.0)]
+    tnChanged= numpy.zeros(len(self.objects), dtype= bool)
+    for j in range(0,2): # back and front nodes.
+      for sy, sz in signs:
+        Sg= N[:,j]/self.A+sz*Mz[:,j]/self.Wz
+        if(self.is3D):
+          Sg+= sy*My[:,j]/self.Wy
+        for extreme, greater in [(self.SgMax, True), (self.SgMin, False)]:
+          updated= (Sg>extreme) if(greater) else (Sg<extreme)
+          extreme[updated]= Sg[updated]
+          self.FCTN[updated]= numpy.abs(Sg[updated])/self.fyd[updated]
+          cp= self.FCTN>self.FCTNCP
+          self.FCTNCP[cp]= self.FCTN[cp]
+          self.NCP[cp]= N[cp,j]
+          if(self.is3D):
+            self.MyCP[cp]= My[cp,j]
+          self.MzCP[cp]= Mz[cp,j]
+          self.HIPCPTN[cp]= nmbComb
+          tnChanged|= updated|cp
+    self.setProps(tnChanged, self.tnVars)
+    # Shear stresses.
+    if(self.is3D):
+      Tau= numpy.maximum(numpy.abs(Vy)/self.AreaQy, numpy.abs(Vz)/self.AreaQz)
+    else:
+      Tau= numpy.abs(Vy)/self.A
+    updated= Tau>self.TauMax
+    self.TauMax[updated]= Tau[updated]
+    self.FCV[updated]= self.TauMax[updated]/self.fydV[updated]
+    cp= self.FCV>self.FCVCP
+    self.FCVCP[cp]= self.FCV[cp]
+    self.VyCP[cp]= Vy[cp]
+    if(self.is3D):
+      self.VzCP[cp]= Vz[cp]
+    self.HIPCPV[cp]= nmbComb
+    self.setProps(updated|cp, self.vVars)
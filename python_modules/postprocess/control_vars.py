@@ -23,6 +23,7 @@ import geom
 import xc
 from postprocess.reports import common_formats as fmt
 from postprocess import extrapolate_elem_attr as ext
+from postprocess import control_vars_store
 
 
 class ControlVarsBase(object):
@@ -971,39 +972,54 @@ def writeControlVarsFromPhantomElements(controlVarName,preprocessor,outputFileNa
            the results to a file, generation or not of lists, ...)
     '''
     elems= preprocessor.getSets['total'].elements
-    if outputCfg.appendToResFile.lower()[0]=='y':
-        xcOutput= open(outputFileName+".py","a+")
-    else:
-        xcOutput= open(outputFileName+".py","w+")
+    records= list()
     for e in elems:
-        eTag= e.getProp("idElem") 
-        idSection= e.getProp("idSection")  
-        controlVar= e.getProp(controlVarName)
-        outStr= controlVar.getLaTeXString(eTag,1e-3)
-        if(e.getProp("dir")==1):
-            xcOutput.write(controlVar.strElementProp(eTag,controlVarName+'Sect1'))
+        records.append((e.getProp("idElem"), e.getProp("dir"), e.getProp(controlVarName)))
+    return writeControlVarsFromRecords(controlVarName,records,outputFileName,outputCfg)
+
+def writeControlVarsFromRecords(controlVarName,records,outputFileName,outputCfg):
+    '''Writes in file 'outputFileName' the control-variable values calculated for
+     the sections of the RC elements.
+
+    :param controlVarName: name of the control var. 
+    :param records: list of (element tag, section index, control var) tuples.
+    :param outputFileName: name to the files (.py and .tex)
+    :param outputCfg: instance of class 'VerifOutVars' which defines the 
+           variables that control the output of the checking (append or not
+           the results to a file, generation or not of lists, ...)
+    '''
+    if outputCfg.structuredResults.lower()[0]=='y':
+        rows= list()
+        for (eTag, sectionIndex, controlVar) in records:
+            if(sectionIndex==1):
+                rows.append((eTag, controlVarName+'Sect1', controlVar))
+            else:
+                rows.append((eTag, controlVarName+'Sect2', controlVar))
+        control_vars_store.writeControlVars(outputFileName+".npz", rows, outputCfg.appendToResFile.lower()[0]=='y')
+    else:
+        if outputCfg.appendToResFile.lower()[0]=='y':
+            xcOutput= open(outputFileName+".py","a+")
         else:
-            xcOutput.write(controlVar.strElementProp(eTag,controlVarName+'Sect2'))
-    xcOutput.close()
+            xcOutput= open(outputFileName+".py","w+")
+        for (eTag, sectionIndex, controlVar) in records:
+            if(sectionIndex==1):
+                xcOutput.write(controlVar.strElementProp(eTag,controlVarName+'Sect1'))
+            else:
+                xcOutput.write(controlVar.strElementProp(eTag,controlVarName+'Sect2'))
+        xcOutput.close()
     if outputCfg.listFile.lower()[0]=='y':
         if outputCfg.appendToResFile.lower()[0]=='y':
             texOutput= open(outputFileName+".tex","a+")
         else:
             texOutput= open(outputFileName+".tex","w+")
         texOutput.write("Section 1\n")
-        for e in elems:
-            if(e.getProp("dir")==1):
-                eTag= e.getProp("idElem") 
-                idSection= e.getProp("idSection")  
-                controlVar= e.getProp(controlVarName)
+        for (eTag, sectionIndex, controlVar) in records:
+            if(sectionIndex==1):
                 outStr= controlVar.getLaTeXString(eTag,1e-3)
                 texOutput.write(outStr)
         texOutput.write("Section 2\n")
-        for e in elems:
-            if(e.getProp("dir")==2):
-                eTag= e.getProp("idElem") 
-                idSection= e.getProp("idSection")  
-                controlVar= e.getProp(controlVarName)
+        for (eTag, sectionIndex, controlVar) in records:
+            if(sectionIndex==2):
                 outStr= controlVar.getLaTeXString(eTag,1e-3)
                 texOutput.write(outStr)
         texOutput.close()
@@ -1011,12 +1027,10 @@ def writeControlVarsFromPhantomElements(controlVarName,preprocessor,outputFileNa
     if outputCfg.calcMeanCF.lower()[0]=='y':
         fcs1= [] #Capacity factors at section 1.
         fcs2= [] #Capacity factors at section 2.
-        for e in elems:
-            if(e.getProp("dir")==1):
-                controlVar= e.getProp(controlVarName)
+        for (eTag, sectionIndex, controlVar) in records:
+            if(sectionIndex==1):
                 fcs1.append(controlVar.getCF())
-            if(e.getProp("dir")==2):
-                controlVar= e.getProp(controlVarName)
+            if(sectionIndex==2):
                 fcs2.append(controlVar.getCF())
         retval= [scipy.mean(fcs1),scipy.mean(fcs2)]
     return retval
@@ -1045,6 +1059,8 @@ def getControlVarImportModuleStr(controlVarName, preprocessor, outputCfg, sectio
 
 def writeControlVarsFromElements(controlVarName, preprocessor, outputFileName, outputCfg, sections):
     '''Writes in file 'outputFileName' the control-variable values calculated for elements in set 'setCalc'. 
+    The values are written as Python sentences (.py) or, if 
+    outputCfg.structuredResults is 'Y', in a structured file (.npz).
 
     :param controlVarName: name of the control var (e.g. 'ULS_normalStressesResistance' )
     :param preprocessor:    preprocessor from FEA model.
@@ -1057,18 +1073,26 @@ def writeControlVarsFromElements(controlVarName, preprocessor, outputFileName, o
     :param sections: names of the sections to write the output for.
     '''
     elems= outputCfg.getCalcSetElements(preprocessor) # elements in set 'setCalc'
-    if outputCfg.appendToResFile.lower()[0]=='y':
-        xcOutput= open(outputFileName+".py","a+")
+    if outputCfg.structuredResults.lower()[0]=='y':
+        rows= list()
+        for e in elems:
+            for s in sections:
+                propName= controlVarName+s
+                rows.append((e.tag, propName, e.getProp(propName)))
+        control_vars_store.writeControlVars(outputFileName+".npz", rows, outputCfg.appendToResFile.lower()[0]=='y')
     else:
-        xcOutput= open(outputFileName+".py","w+")
-    importString= getControlVarImportModuleStr(controlVarName, preprocessor, outputCfg, sections)
-    xcOutput.write(importString+'\n')
-    for e in elems:
-        for s in sections:
-            propName= controlVarName+s
-            controlVar= e.getProp(propName)
-            xcOutput.write(controlVar.strElementProp(e.tag,propName))
-    xcOutput.close()
+        if outputCfg.appendToResFile.lower()[0]=='y':
+            xcOutput= open(outputFileName+".py","a+")
+        else:
+            xcOutput= open(outputFileName+".py","w+")
+        importString= getControlVarImportModuleStr(controlVarName, preprocessor, outputCfg, sections)
+        xcOutput.write(importString+'\n')
+        for e in elems:
+            for s in sections:
+                propName= controlVarName+s
+                controlVar= e.getProp(propName)
+                xcOutput.write(controlVar.strElementProp(e.tag,propName))
+        xcOutput.close()
     if outputCfg.listFile.lower()[0]=='y':
         if outputCfg.appendToResFile.lower()[0]=='y':
             texOutput= open(outputFileName+".tex","a+")
@@ -1143,36 +1167,46 @@ def writeControlVarsFromElementsForAnsys(controlVarName,preprocessor,outputFileN
     retval= [scipy.mean(fcs1),scipy.mean(fcs2)]
     return retval
 
-def extrapolate_control_var(elemSet,propName,argument,initialValue= 0.0):
-    '''Extrapolates element's function values to the nodes.
+def get_control_var_node_values(elemSet,propName,argument,initialValue= 0.0, weightedByArea= False):
+    '''Return the tags of the nodes of the elements and the values of the
+       control variable extrapolated to them (average of the values of the
+       elements connected to each node).
 
      :param elemSet: set of elements.
      :param propName: name of the property that contains the control variables.
-     :param function: name of the function to call for each element.
      :param argument: name of the control variable to extrapolate.
      :param initialValue: initial value for the prop defined at the nodes.
+     :param weightedByArea: if true weight the element values with
+                            their areas.
     '''
     elemSet.fillDownwards()
-    eSet= elemSet.elements
+    incidence= ext.get_element_node_incidence(elemSet.elements)
+    def getControlVarValue(e):
+        controlVar= e.getProp(propName)
+        if(controlVar):
+            return controlVar(argument)
+        else:
+            return None
+    elemValues= incidence.getElementValues(getControlVarValue)
+    weights= None
+    if(weightedByArea):
+        weights= incidence.getElementAreas()
+    return incidence.nodeTags, incidence.average(elemValues, weights, initialValue)
+
+def extrapolate_control_var(elemSet,propName,argument,initialValue= 0.0, weightedByArea= False):
+    '''Extrapolates element's function values to the nodes.
+
+     :param elemSet: set of elements.
+     :param propName: name of the property that contains the control variables.
+     :param argument: name of the control variable to extrapolate.
+     :param initialValue: initial value for the prop defined at the nodes.
+     :param weightedByArea: if true weight the element values with
+                            their areas.
+    '''
     nodePropName= propName+'_'+argument
-    nodeTags= ext.create_attribute_at_nodes(eSet,nodePropName,initialValue)
-    #Calculate totals.
-    for e in eSet:
-        elemNodes= e.getNodes
-        sz= len(elemNodes) 
-        for i in range(0,sz):
-            n= elemNodes[i]
-            controlVar= e.getProp(propName)
-            if(controlVar):
-                value= controlVar(argument)
-                oldValue= n.getProp(nodePropName)
-                n.setProp(nodePropName,oldValue+value)
-    #Divide by number of elements in the set that touch the node.
+    nodeTags, nodeValues= get_control_var_node_values(elemSet,propName,argument,initialValue,weightedByArea)
     preprocessor= elemSet.getPreprocessor
-    for tag in nodeTags:
-        n= preprocessor.getNodeHandler.getNode(tag)
-        denom= nodeTags[tag]
-        newValue= n.getProp(nodePropName)/denom
-        n.setProp(nodePropName,newValue)
+    ext.warn_existing_attribute(preprocessor, nodeTags.tolist(), nodePropName)
+    ext.set_node_property(preprocessor, nodeTags, nodePropName, nodeValues)
     return nodePropName
 
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+''' Structured (NumPy .npz) storage of the control variables computed
+    when checking limit states. It replaces the generated Python source
+    (one setProp sentence for each element and section) that needs to be
+    executed to reload the results.
+
+    Each row of the table corresponds to one element property (i.e.
+    'ULS_normalStressesResistanceSect1'). The attribute values of the
+    control variables (nested control variables included) are stored in
+    one array for each attribute; strings (combination names, section
+    identifiers,...) are stored as indexes in a string table.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import os
+import json
+import importlib
+import numpy
+from misc_utils import log_messages as lmsg
+
+columnPrefixes= {'f': 'f:', 'i': 'i:', 'b': 'i:', 's': 's:'}
+columnTypes= {'f:': numpy.float64, 'i:': numpy.int64, 's:': numpy.int32}
+
+def getClassName(obj):
+    ''' Return the full name (module.class) of the object class.'''
+    return obj.__class__.__module__+'.'+obj.__class__.__name__
+
+def getClass(className):
+    ''' Return the class from its full name (module.class).'''
+    moduleName, name= className.rsplit('.', 1)
+    return getattr(importlib.import_module(moduleName), name)
+
+def flattenControlVar(controlVar, prefix= ''):
+    ''' Return the schema (list of [path, kind, class name] entries) and
+        the values of the control variable attributes.
+
+    :param controlVar: control variable object.
+    :param prefix: prefix for the attribute names (nested objects).
+    '''
+    schema= list()
+    values= list()
+    for name, value in vars(controlVar).items():
+        path= prefix+name
+        if(isinstance(value, bool)):
+            schema.append([path, 'b', None]); values.append(int(value))
+        elif(isinstance(value, (int, numpy.integer))):
+            schema.append([path, 'i', None]); values.append(int(value))
+        elif(isinstance(value, (float, numpy.floating))):
+            schema.append([path, 'f', None]); values.append(float(value))
+        elif(isinstance(value, str)):
+            schema.append([path, 's', None]); values.append(value)
+        elif(value is None):
+            schema.append([path, 'n', None]); values.append(None)
+        elif(hasattr(value, '__dict__')):
+            schema.append([path, 'o', getClassName(value)]); values.append(None)
+            nestedSchema, nestedValues= flattenControlVar(value, path+'.')
+            schema.extend(nestedSchema)
+            values.extend(nestedValues)
+        else:
+            lmsg.warning("attribute: '"+path+"' of type: "+str(type(value))+' not stored.')
+    return schema, values
+
+def writeControlVars(fileName, rows, append= False):
+    ''' Write the control variables in a .npz file.
+
+    :param fileName: name of the output file.
+    :param rows: list of (element tag, property name, control var) tuples.
+    :param append: if true, append the rows to the existing ones.
+    '''
+    if(append and os.path.exists(fileName)):
+        rows= list(ControlVarsTable(fileName).getRows())+list(rows)
+    schemas= list()
+    schemaIndexes= dict()
+    strings= list()
+    stringIndexes= dict()
+    propNames= list()
+    propNameIndexes= dict()
+    flatRows= list()
+    for (elemTag, propName, controlVar) in rows:
+        schema, values= flattenControlVar(controlVar)
+        schema.insert(0, [None, 'o', getClassName(controlVar)])
+        values.insert(0, None)
+        key= json.dumps(schema)
+        if(not key in schemaIndexes):
+            schemaIndexes[key]= len(schemas)
+            schemas.append(schema)
+        if(not propName in propNameIndexes):
+            propNameIndexes[propName]= len(propNames)
+            propNames.append(propName)
+        flatRows.append((elemTag, propNameIndexes[propName], schemaIndexes[key], values))
+    numRows= len(flatRows)
+    columns= dict()
+    for schema in schemas:
+        for (path, kind, className) in schema:
+            if(kind in columnPrefixes):
+                columnName= columnPrefixes[kind]+path
+                if(not columnName in columns):
+                    prefix= columnPrefixes[kind]
+                    columns[columnName]= numpy.zeros(numRows, dtype= columnTypes[prefix])
+                    if(prefix=='f:'):
+                        columns[columnName][:]= numpy.nan
+    elemTags= numpy.zeros(numRows, dtype= numpy.int64)
+    propNameIdx= numpy.zeros(numRows, dtype= numpy.int32)
+    schemaIdx= numpy.zeros(numRows, dtype= numpy.int32)
+    for i, (elemTag, propIdx, sIdx, values) in enumerate(flatRows):
+        elemTags[i]= elemTag
+        propNameIdx[i]= propIdx
+        schemaIdx[i]= sIdx
+        for (path, kind, className), value in zip(schemas[sIdx], values):
+            if(kind=='s'):
+                if(not value in stringIndexes):
+                    stringIndexes[value]= len(strings)
+                    strings.append(value)
+                value= stringIndexes[value]
+            if(kind in columnPrefixes):
+                columns[columnPrefixes[kind]+path][i]= value
+    columns['elemTag']= elemTags
+    columns['propNameIdx']= propNameIdx
+    columns['schemaIdx']= schemaIdx
+    columns['propNames']= numpy.array(propNames, dtype= str)
+    columns['strings']= numpy.array(strings, dtype= str)
+    columns['schemas']= numpy.array(json.dumps(schemas))
+    with open(fileName, 'wb') as f:
+        numpy.savez(f, **columns)
+
+class ControlVarsTable(object):
+    ''' Control variables read from a .npz file.
+
+    :ivar columns: dictionary containing the arrays read from the file.
+    :ivar propNames: names of the element properties.
+    :ivar strings: string table.
+    :ivar schemas: list of schemas (attribute names, types and classes).
+    '''
+    def __init__(self, fileName):
+        ''' Constructor.
+
+        :param fileName: name of the file to read.
+        '''
+        with numpy.load(fileName, allow_pickle= False) as data:
+            self.columns= dict()
+            for key in data.files:
+                self.columns[key]= data[key]
+        self.propNames= self.columns['propNames'].tolist()
+        self.strings= self.columns['strings'].tolist()
+        self.schemas= json.loads(str(self.columns['schemas']))
+
+    def getNumRows(self):
+        ''' Return the number of rows.'''
+        return len(self.columns['elemTag'])
+
+    def getPropNameRows(self, propName):
+        ''' Return the indexes of the rows that correspond to the property.
+
+        :param propName: name of the element property.
+        '''
+        retval= numpy.empty(0, dtype= numpy.int64)
+        if(propName in self.propNames):
+            retval= numpy.nonzero(self.columns['propNameIdx']==self.propNames.index(propName))[0]
+        return retval
+
+    def getValues(self, propName, attributeName):
+        ''' Return the element tags and the values of the attribute of
+            the control variables stored in the property (i.e.
+            getValues('ULS_normalStressesResistanceSect1','CF')). Nested
+            attributes are accessed using dots (i.e.
+            'crackControlVarsPos.steelStress'). Strings are returned
+            as a list, numbers as an array.
+
+        :param propName: name of the element property.
+        :param attributeName: name of the control variable attribute.
+        '''
+        rows= self.getPropNameRows(propName)
+        elemTags= self.columns['elemTag'][rows]
+        for prefix in ['f:', 'i:']:
+            if(prefix+attributeName in self.columns):
+                return elemTags, self.columns[prefix+attributeName][rows]
+        if('s:'+attributeName in self.columns):
+            return elemTags, [self.strings[i] for i in self.columns['s:'+attributeName][rows].tolist()]
+        lmsg.error("attribute: '"+attributeName+"' not found.")
+        return elemTags, None
+
+    def getRows(self):
+        ''' Generator that returns (element tag, property name, control var)
+            tuples.'''
+        classes= dict()
+        values= dict()
+        for key in self.columns:
+            if(key[:2] in columnTypes):
+                values[key]= self.columns[key].tolist()
+        elemTags= self.columns['elemTag'].tolist()
+        propNameIdx= self.columns['propNameIdx'].tolist()
+        schemaIdx= self.columns['schemaIdx'].tolist()
+        for i in range(0, len(elemTags)):
+            schema= self.schemas[schemaIdx[i]]
+            objects= dict()
+            root= None
+            for (path, kind, className) in schema:
+                if(path is None): # the control variable itself.
+                    if(not className in classes):
+                        classes[className]= getClass(className)
+                    root= classes[className].__new__(classes[className])
+                    continue
+                parentPath, sep, name= path.rpartition('.')
+                obj= objects[parentPath] if parentPath else root
+                if(kind=='o'):
+                    if(not className in classes):
+                        classes[className]= getClass(className)
+                    value= classes[className].__new__(classes[className])
+                    objects[path]= value
+                elif(kind=='n'):
+                    value= None
+                elif(kind=='s'):
+                    value= self.strings[values['s:'+path][i]]
+                elif(kind=='b'):
+                    value= bool(values['i:'+path][i])
+                else:
+                    value= values[columnPrefixes[kind]+path][i]
+                setattr(obj, name, value)
+            yield (elemTags[i], self.propNames[propNameIdx[i]], root)
+
+    def setElementProps(self, preprocessor):
+        ''' Assign the control variables to the elements of the model.
+
+        :param preprocessor: preprocessor of the finite element problem.
+        '''
+        elementHandler= preprocessor.getElementHandler
+        for (elemTag, propName, controlVar) in self.getRows():
+            elementHandler.getElement(elemTag).setProp(propName, controlVar)
+
+def loadControlVars(fileName, preprocessor):
+    ''' Read the control variables from the file and assign them to the
+        elements of the model.
+
+    :param fileName: name of the file to read.
+    :param preprocessor: preprocessor of the finite element problem.
+    '''
+    table= ControlVarsTable(fileName)
+    table.setElementProps(preprocessor)
+    return table
+
+def loadOutputData(baseFileName, preprocessor):
+    ''' Read the results of a limit state checking and assign them to
+        the elements of the model. The structured file (.npz) is used if
+        it exists and is not older than the Python one (.py), otherwise
+        the Python file is executed (with the control variables classes
+        available, since the files written from records don't import
+        them).
+
+    :param baseFileName: name of the results file without extension.
+    :param preprocessor: preprocessor of the finite element problem.
+    '''
+    npzFileName= baseFileName+'.npz'
+    pyFileName= baseFileName+'.py'
+    if(os.path.exists(npzFileName) and ((not os.path.exists(pyFileName)) or (os.path.getmtime(npzFileName)>=os.path.getmtime(pyFileName)))):
+        loadControlVars(npzFileName, preprocessor)
+    else:
+        from postprocess import control_vars # avoid circular import.
+        globalVars= dict(vars(control_vars))
+        globalVars['preprocessor']= preprocessor
+        with open(pyFileName) as infile:
+            exec(infile.read(), globalVars)
@@ -18,6 +18,8 @@ from misc_utils import log_messages as lmsg
 import xc_base
 import geom
 import xc
+from postprocess import internal_forces_envelope as ife
+from postprocess import callback_controls
 
 
 
@@ -63,6 +65,7 @@ def defVarsControlMovModulus(nodes):
     tags.append(n.tag)
     n.setProp("dispMax",0.0)
     n.setProp("CombDispMax","")
+  callback_controls.resetSetControls()
   return tags
 
 
@@ -82,6 +85,7 @@ def defVarsControlTensRegElastico2d(elems):
     e.setProp("FCV",0)
     e.setProp("FCVCP",0)
     e.setProp("HIPCPV","")
+  callback_controls.resetSetControls()
 
 def defVarsControlTensRegElastico3d(elems):
   for e in elems:
@@ -101,9 +105,11 @@ def defVarsControlTensRegElastico3d(elems):
     e.setProp("FCV",0)
     e.setProp("FCVCP",0)
     e.setProp("HIPCPV","")
+  callback_controls.resetSetControls()
 
 def defVarsEnvelopeInternalForcesBeamElems(elems):
-  '''Defines properties to store extreme values of internal forces.'''
+  '''Defines properties to store extreme values of internal forces
+     (see internal_forces_envelope.BeamInternalForcesEnvelope).'''
   for e in elems:
     # [back node value, front node value]
     e.setProp('N+',[-6.023e23,-6.023e23]) #Positive axial force envelope
@@ -178,89 +184,23 @@ def updateEnvelopeInternalForcesBeamElem2D(beamElem2D):
 
 
 def updateEnvelopeInternalForcesBeamElem(beamElem):
-    '''Update values for extreme values of internal forces.
+    '''Update values for extreme values of internal forces (see
+    internal_forces_envelope.BeamInternalForcesEnvelope to update
+    the envelopes of a whole set of elements at once).
 
     :param beamElem: finite element to update internal forces.
      '''
-    beamElem.getResistingForce()
-    N1= 0.0; My1= 0.0; Mz1= 0.0; Vy1= 0.0; Vz1= 0.0
-    N2= 0.0; My2= 0.0; Mz2= 0.0; Vy2= 0.0; Vz2= 0.0
-    axialForces= beamElem.getValuesAtNodes('N', False)
-    if(len(axialForces)>1): # 'N' found.
-        N1= axialForces[0]
-        N2= axialForces[1]
-    bendingY= beamElem.getValuesAtNodes('My', False)
-    if(len(bendingY)>1): # 'My' found.
-        My1= bendingY[0]
-        My2= bendingY[1]
-    bendingZ= beamElem.getValuesAtNodes('Mz', False)
-    if(len(bendingZ)>1): # 'Mz' found.
-        Mz1= bendingZ[0]
-        Mz2= bendingZ[1]
-    shearY= beamElem.getValuesAtNodes('Vy', False)
-    if(len(shearY)>1): # 'Vy' found.
-        Vy1= shearY[0]
-        Vy2= shearY[1]
-    shearZ= beamElem.getValuesAtNodes('Vz', False)
-    if(len(shearZ)>1): # 'Vz' found.
-        Vz1= shearZ[0]
-        Vz2= shearZ[1]
-    maxN= beamElem.getProp('N+') # [back node value, front node value]
-    maxMy= beamElem.getProp('My+')
-    maxMz= beamElem.getProp('Mz+')
-    maxVy= beamElem.getProp('Vy+')
-    maxVz= beamElem.getProp('Vz+')
-    minT= beamElem.getProp('T+')
-    minN= beamElem.getProp('N-')
-    minMy= beamElem.getProp('My-')
-    minMz= beamElem.getProp('Mz-')
-    minVy= beamElem.getProp('Vy-')
-    minVz= beamElem.getProp('Vz-')
-    minT= beamElem.getProp('T-')
-    if(N1>maxN[0]):
-      maxN[0]= N1
-    if(N1<minN[0]):
-      minN[0]= N1
-    if(My1>maxMy[0]):
-      maxMy[0]= My1
-    if(My1<minMy[0]):
-      minMy[0]= My1
-    if(Mz1>maxMz[0]):
-      maxMz[0]= Mz1
-    if(Mz1<minMz[0]):
-      minMz[0]= Mz1
-    if(Vy1>maxVy[0]):
-      maxVy[0]= Vy1
-    if(Vy1<minVy[0]):
-      minVy[0]= Vy1
-    if(N2>maxN[1]):
-      maxN[1]= N2
-    if(N2<minN[1]):
-      minN[1]= N2
-    if(My2>maxMy[1]):
-      maxMy[1]= My2
-    if(My2<minMy[1]):
-      minMy[1]= My2
-    if(Mz2>maxMz[1]):
-      maxMz[1]= Mz2
-    if(Mz2<minMz[1]):
-      minMz[1]= Mz2
-    if(Vy2>maxVy[1]):
-      maxVy[1]= Vy2
-    if(Vy2<minVy[1]):
-      minVy[1]= Vy2
-    beamElem.setProp('N+',maxN)
-    beamElem.setProp('My+',maxMy)
-    beamElem.setProp('Mz+',maxMz)
-    beamElem.setProp('Vy+',maxVy)
-    beamElem.setProp('Vz+',maxVz)
-    beamElem.setProp('T+',minT)
-    beamElem.setProp('N-',minN)
-    beamElem.setProp('My-',minMy)
-    beamElem.setProp('Mz-',minMz)
-    beamElem.setProp('Vy-',minVy)
-    beamElem.setProp('Vz-',minVz)
-    beamElem.setProp('T-',minT)
+    values= ife.getElementInternalForces(beamElem) # [back node, front node]
+    for j, component in enumerate(ife.components):
+        maxValues= beamElem.getProp(component+'+')
+        minValues= beamElem.getProp(component+'-')
+        for k in range(0,2):
+            if(values[k,j]>maxValues[k]):
+                maxValues[k]= values[k,j]
+            if(values[k,j]<minValues[k]):
+                minValues[k]= values[k,j]
+        beamElem.setProp(component+'+',maxValues)
+        beamElem.setProp(component+'-',minValues)
   
 def defSteelShapeElasticRangeElementParameters(e,shape):
   e.setProp("nmbSecc",shape.sectionName)
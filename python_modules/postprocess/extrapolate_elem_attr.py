@@ -13,6 +13,8 @@ import xc_base
 import geom
 import xc
 import math
+import numpy
+from scipy import sparse
 from misc_utils import log_messages as lmsg
 
 def flatten_attribute(elemSet,attributeName, treshold, limit):
@@ -66,7 +68,195 @@ def average_on_nodes(preprocessor, touchedNodesTags, attributeName):
         denom= touchedNodesTags[tag]
         n.setProp(attributeName,n.getProp(attributeName)*(1.0/denom))
 
-def extrapolate_elem_function_attr(elemSet,attributeName,function, argument,initialValue= 0.0):
+class ElementNodeIncidence(object):
+    ''' Sparse incidence matrix between the nodes and the elements of a
+        set, used to average element values on the nodes with a single
+        matrix product.
+
+    :ivar elements: elements of the set.
+    :ivar elementTags: tags of the elements.
+    :ivar nodeTags: sorted tags of the nodes connected to the elements.
+    :ivar matrix: sparse matrix (number of nodes x number of elements)
+                  whose (i,j) entry is one if the j-th element is
+                  connected to the i-th node.
+    :ivar numElementsAtNodes: number of elements connected to each node.
+    '''
+    def __init__(self, elemSet, topology= None):
+        ''' Constructor.
+
+        :param elemSet: elements (set, container or list of elements).
+        :param topology: node tags and incidence matrix computed
+                         previously for the same elements (see
+                         getTopology); if None they are computed from
+                         the element connectivity.
+        '''
+        self.elements= [e for e in elemSet]
+        self.elementTags= numpy.array([e.tag for e in self.elements], dtype= int)
+        if(topology is None):
+            topology= self.computeTopology()
+        self.nodeTags, self.matrix= topology
+        self.numElementsAtNodes= numpy.asarray(self.matrix.sum(axis= 1)).ravel()
+
+    def computeTopology(self):
+        ''' Return the sorted tags of the nodes connected to the elements
+            and the incidence matrix.'''
+        rows= list()
+        cols= list()
+        for j, e in enumerate(self.elements):
+            elemNodes= e.getNodes
+            elemNodeTags= [elemNodes[i].tag for i in range(0,len(elemNodes))]
+            rows.extend(elemNodeTags)
+            cols.extend([j]*len(elemNodeTags))
+        nodeTags, rows= numpy.unique(numpy.array(rows, dtype= int), return_inverse= True)
+        data= numpy.ones(len(rows))
+        shape= (len(nodeTags), len(self.elements))
+        matrix= sparse.csr_matrix((data, (rows, numpy.array(cols, dtype= int))), shape= shape)
+        return nodeTags, matrix
+
+    def getTopology(self):
+        ''' Return the node tags and the incidence matrix (they don't
+            keep any reference to the elements).'''
+        return self.nodeTags, self.matrix
+
+    def getNumberOfNodes(self):
+        ''' Return the number of nodes connected to the elements.'''
+        return len(self.nodeTags)
+
+    def getNumberOfElements(self):
+        ''' Return the number of elements.'''
+        return len(self.elements)
+
+    def getElementAreas(self, initialGeometry= True):
+        ''' Return the areas of the elements.
+
+        :param initialGeometry: if true use the undeformed geometry.
+        '''
+        return numpy.array([e.getArea(initialGeometry) for e in self.elements])
+
+    def getElementValues(self, function, argument= None):
+        ''' Return the values obtained by calling the function for each
+            element (zero if the function returns None).
+
+        :param function: callable whose first argument is the element.
+        :param argument: second argument of the function (optional).
+        '''
+        retval= numpy.zeros(len(self.elements))
+        for j, e in enumerate(self.elements):
+            if(argument is None):
+                value= function(e)
+            else:
+                value= function(e, argument)
+            if(value):
+                retval[j]= value
+        return retval
+
+    def getNodeTotals(self, elemValues):
+        ''' Return the sum of the values of the elements connected to
+            each node.
+
+        :param elemValues: array (number of elements or number of
+                           elements x number of components) with the
+                           element values.
+        '''
+        return self.matrix.dot(numpy.asarray(elemValues, dtype= float))
+
+    def average(self, elemValues, weights= None, initialValue= 0.0):
+        ''' Return the average on each node of the values of the elements
+            connected to it.
+
+        :param elemValues: array (number of elements or number of
+                           elements x number of components) with the
+                           element values.
+        :param weights: weight of each element (i.e. its area), if None
+                        all the elements have the same weight.
+        :param initialValue: value added to the totals before dividing.
+        '''
+        elemValues= numpy.asarray(elemValues, dtype= float)
+        if(weights is None):
+            totals= self.getNodeTotals(elemValues)
+            denom= self.numElementsAtNodes
+        else:
+            weights= numpy.asarray(weights, dtype= float)
+            if(elemValues.ndim>1):
+                totals= self.getNodeTotals(elemValues*weights[:,numpy.newaxis])
+            else:
+                totals= self.getNodeTotals(elemValues*weights)
+            denom= self.matrix.dot(weights)
+        totals= totals+initialValue
+        factors= numpy.zeros(len(denom))
+        nonZero= (denom!=0.0)
+        factors[nonZero]= 1.0/denom[nonZero]
+        if(totals.ndim>1):
+            return totals*factors[:,numpy.newaxis]
+        else:
+            return totals*factors
+
+    def setNodeProperty(self, preprocessor, propName, nodeValues):
+        ''' Assign the nodal values to the property of the nodes.
+
+        :param preprocessor: preprocessor of the finite element problem.
+        :param propName: name of the property to define.
+        :param nodeValues: array with the values at each node (in the
+                           order of nodeTags).
+        '''
+        set_node_property(preprocessor, self.nodeTags, propName, nodeValues)
+
+# Topologies (node tags and incidence matrix, see
+# ElementNodeIncidence.getTopology) of the element sets used in the
+# extrapolations, indexed by domain stamp and element tags. Only the
+# entries of the current domain stamp are kept.
+incidenceCache= dict()
+
+def get_element_node_incidence(elemSet):
+    ''' Return the incidence matrix of the elements, reusing the topology
+        computed previously for the same elements if the domain has not
+        changed since.
+
+    :param elemSet: elements (set, container or list of elements).
+    '''
+    elements= [e for e in elemSet]
+    if(len(elements)==0):
+        return ElementNodeIncidence(elements)
+    geoTag= elements[0].getDomain.hasDomainChanged() # updated stamp.
+    key= (geoTag, numpy.array([e.tag for e in elements], dtype= int).tobytes())
+    topology= incidenceCache.get(key, None)
+    retval= ElementNodeIncidence(elements, topology)
+    if(topology is None):
+        for oldKey in [k for k in incidenceCache if k[0]!=geoTag]:
+            del incidenceCache[oldKey] # domain changed since.
+        incidenceCache[key]= retval.getTopology()
+    return retval
+
+def clear_incidence_cache():
+    ''' Remove the stored incidence matrices (i.e. after remeshing
+        the model without changing the tags of the elements).'''
+    incidenceCache.clear()
+
+def set_node_property(preprocessor, nodeTags, propName, nodeValues):
+    ''' Assign the values to the property of the nodes.
+
+    :param preprocessor: preprocessor of the finite element problem.
+    :param nodeTags: tags of the nodes.
+    :param propName: name of the property to define.
+    :param nodeValues: values of the property at each node.
+    '''
+    nodeHandler= preprocessor.getNodeHandler
+    for tag, value in zip(numpy.asarray(nodeTags).tolist(), numpy.asarray(nodeValues).tolist()):
+        nodeHandler.getNode(tag).setProp(propName,value)
+
+def warn_existing_attribute(preprocessor, nodeTags, attributeName):
+    ''' Write a warning for each node that already has the attribute.
+
+    :param preprocessor: preprocessor of the finite element problem.
+    :param nodeTags: tags of the nodes.
+    :param attributeName: name of the attribute.
+    '''
+    nodeHandler= preprocessor.getNodeHandler
+    for tag in nodeTags:
+        if(nodeHandler.getNode(tag).hasProp(attributeName)):
+            lmsg.warning('node: '+ str(tag) + ' already has a property named: \'' + attributeName +'\'.')
+
+def extrapolate_elem_function_attr(elemSet,attributeName,function, argument,initialValue= 0.0, weightedByArea= False):
     '''Extrapolate element's function values to the nodes.
 
     :param elemSet: set of elements.
@@ -75,22 +265,19 @@ def extrapolate_elem_function_attr(elemSet,attributeName,function, argument,init
     :param function: name of the function to call for each element.
     :param argument: name of the argument for the function call function (optional).
     :param initialValue: initial value for the attribute defined at the nodes.
+    :param weightedByArea: if true weight the element values with
+                           their areas.
     '''
-    touchedNodesTags= create_attribute_at_nodes(elemSet,attributeName,initialValue)
-    #Calculate totals.
-    for e in elemSet:
-        elemNodes= e.getNodes
-        sz= len(elemNodes)
-        for i in range(0,sz):
-            n= elemNodes[i]
-            f= getattr(e,function)
-            value= f(argument)
-            if(value):
-                oldValue= n.getProp(attributeName)
-                n.setProp(attributeName,oldValue+value)
-    #Divide by number of elements in the set that touch the node.
+    incidence= get_element_node_incidence(elemSet)
+    elemValues= incidence.getElementValues(lambda e: getattr(e,function)(argument))
+    weights= None
+    if(weightedByArea):
+        weights= incidence.getElementAreas()
+    nodeValues= incidence.average(elemValues, weights, initialValue)
     preprocessor= elemSet.owner.getPreprocessor
-    average_on_nodes(preprocessor,touchedNodesTags, attributeName)
+    warn_existing_attribute(preprocessor, incidence.nodeTags.tolist(), attributeName)
+    incidence.setNodeProperty(preprocessor, attributeName, nodeValues)
+    return nodeValues
 
 def extrapolate_elem_data_to_nodes(elemSet,attributeName, function, argument= None, initialValue= 0.0):
     '''Extrapolate element's function values to the nodes.
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from postprocess import utils_display
+from postprocess import control_vars_store
 
 
 
@@ -38,9 +39,7 @@ class FigsCollectionPlotter(object):
     figureList.append(utils_display.FigureDefinition(partName,"Flexion","MyCP2",txtMyCP2,self.reinforcementText2,self.mUnits))
     figureList.append(utils_display.FigureDefinition(partName,"Flexion","FCCP2",txtFCnormalStresses,self.reinforcementText2))
     #Load properties to display:
-    fName= self.fieldFilesPath + "verifRsl_normStrsULS.py"
-    with open(fName) as infile:
-        exec(infile.read())
+    control_vars_store.loadOutputData(self.fieldFilesPath + "verifRsl_normStrsULS",preprocessor)
 
     tp= utils_display.TakePhotos(elemSetName)
     tp.pthGraphOutput= self.graphicOutputPath
@@ -55,8 +54,7 @@ class FigsCollectionPlotter(object):
     figureList.append(utils_display.FigureDefinition(partName,eluStr,"VyCP2",txtVyCP2,self.reinforcementText2,self.fUnits))
     figureList.append(utils_display.FigureDefinition(partName,eluStr,"FCCP2",txtFCshearStresses,self.reinforcementText2))
     #Load properties to display:
-    fName= self.fieldFilesPath + "verifRsl_shearULS.py"
-    execfile(fName)
+    control_vars_store.loadOutputData(self.fieldFilesPath + "verifRsl_shearULS",preprocessor)
 
     tp= utils_display.TakePhotos(elemSetName)
     tp.pthGraphOutput= self.graphicOutputPath
@@ -69,8 +67,7 @@ class FigsCollectionPlotter(object):
     figureList.append(utils_display.FigureDefinition(partName,eluStr,"sg_s1",txtSGSFreq,self.reinforcementText1,self.sUnits))
     figureList.append(utils_display.FigureDefinition(partName,eluStr,"sg_s2",txtSGSFreq,self.reinforcementText2,self.sUnits))
     #Load properties to display:
-    fName= self.fieldFilesPath + "verifRsl_crackingSLS_freq.py"
-    execfile(fName)
+    control_vars_store.loadOutputData(self.fieldFilesPath + "verifRsl_crackingSLS_freq",preprocessor)
     elemSet= preprocessor.getSets.getSet(elemSetName).elements
     for e in elemSet:
       sgPos1= e.getProp("sg_sPos1")
@@ -92,8 +89,7 @@ class FigsCollectionPlotter(object):
     figureList.append(utils_display.FigureDefinition(partName,eluStr,"sg_s1",txtSGSQP,self.reinforcementText1,self.sUnits))
     figureList.append(utils_display.FigureDefinition(partName,eluStr,"sg_s2",txtSGSQP,self.reinforcementText2,self.sUnits))
     #Load properties to display:
-    fName= self.fieldFilesPath + "verifRsl_crackingSLS_qperm.py"
-    execfile(fName)
+    control_vars_store.loadOutputData(self.fieldFilesPath + "verifRsl_crackingSLS_qperm",preprocessor)
     elemSet= preprocessor.getSets.getSet(elemSetName).elements
     for e in elemSet:
       sgPos1= e.getProp("sg_sPos1")
@@ -122,8 +118,7 @@ class FigsCollectionPlotter(object):
 
 
     #Load properties to display:
-    fName= self.fieldFilesPath + "verifRsl_fatigueULS.py"
-    execfile(fName)
+    control_vars_store.loadOutputData(self.fieldFilesPath + "verifRsl_fatigueULS",preprocessor)
 
     elemSet= preprocessor.getSets.getSet(elemSetName).elements
     for e in elemSet:
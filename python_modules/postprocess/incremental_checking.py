@@ -0,0 +1,494 @@
+# -*- coding: utf-8 -*-
+''' Incremental limit state checking. The data that determine the results
+    of each element (the definition of its sections and the internal
+    forces of each combination) are fingerprinted and stored, with the
+    control variables obtained, in a state file. In the next run only the
+    (element, combination) pairs whose fingerprints have changed are
+    checked again, and the results are merged with the stored worst case.
+
+    The stored worst case of an element remains valid while its governing
+    combination (the one stored in the control variable) doesn't change:
+    the new worst case is the worst of the stored one and those obtained
+    for the changed combinations. Otherwise (new element, changed section,
+    changed or removed governing combination, control variables that
+    depend on more than one combination,...) all the combinations of the
+    element are checked again.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import os
+import json
+import pickle
+import hashlib
+import tempfile
+from misc_utils import log_messages as lmsg
+from misc import stage_profiler
+from postprocess import control_vars as cv
+from postprocess import limit_state_data as lsd
+from postprocess import parallel_checking
+
+stateFormatVersion= 1 # Change it to invalidate the existing state files.
+# Properties of the elements that define their sections (see the
+# controllers of the steel limit states).
+defaultSectionPropNames= ['crossSection', 'sectionClass', 'yieldStress']
+# Attributes computed when the sections are created (they are not part of
+# the section definition).
+derivedAttributes= ['diagType', 'concrDiagName', 'reinfDiagName', 'minCover', 'ft', 'epsct0', 'Ets', 'epsctu', 'initTensStiff']
+xcModules= ['xc', 'xc_base', 'geom']
+
+def isXCObject(obj):
+    ''' Return true if the object is defined in the C++ library.'''
+    return (type(obj).__module__.split('.')[0] in xcModules)
+
+def getObjectSignature(obj, depth= 0):
+    ''' Return the data (numbers, strings, lists and dictionaries) that
+        define the value of the object: for Python objects the values of
+        their attributes. The objects defined in the C++ library (fiber
+        sections, materials,...) and the attributes derived from them are
+        ignored because they are created when the model is built.
+
+    :param obj: object to get the signature from.
+    :param depth: depth of the object in the tree of attributes.
+    '''
+    retval= None
+    if(depth>16):
+        lmsg.warning('getObjectSignature: maximum depth reached.')
+    elif(isinstance(obj, (bool, int, str))):
+        retval= obj
+    elif(isinstance(obj, float)):
+        retval= repr(float(obj))
+    elif(isinstance(obj, type)):
+        retval= obj.__module__+'.'+obj.__name__
+    elif(isinstance(obj, (list, tuple, set))):
+        items= [getObjectSignature(item, depth+1) for item in obj if((item is not None) and not isXCObject(item))]
+        if(isinstance(obj, set)):
+            items= sorted(items, key= repr)
+        retval= items
+    elif(isinstance(obj, dict)):
+        retval= list()
+        for key in sorted(obj, key= repr):
+            value= obj[key]
+            if((value is not None) and not isXCObject(value)):
+                retval.append([repr(key), getObjectSignature(value, depth+1)])
+    elif(hasattr(obj, 'tolist')): # numpy arrays.
+        retval= getObjectSignature(obj.tolist(), depth+1)
+    elif(hasattr(obj, '__dict__') and not isXCObject(obj)):
+        attributes= dict()
+        for name in vars(obj):
+            if(not (name in derivedAttributes or name.startswith('matTag'))):
+                attributes[name]= getattr(obj, name)
+        retval= [obj.__class__.__module__+'.'+obj.__class__.__name__, getObjectSignature(attributes, depth+1)]
+    else:
+        retval= obj.__class__.__module__+'.'+obj.__class__.__name__
+    return retval
+
+def getFingerprint(obj):
+    ''' Return a hash of the signature of the object.
+
+    :param obj: object to get the fingerprint from.
+    '''
+    signature= json.dumps(getObjectSignature(obj))
+    return hashlib.sha256(signature.encode('utf-8')).hexdigest()
+
+def getControllerFingerprint(controller, extraData= None):
+    ''' Return the fingerprint of the controller (its class, its limit
+        state label and its parameters).
+
+    :param controller: object that checks the limit state.
+    :param extraData: other data that determine the results (type of the
+                      material diagrams, sections to write,...).
+    '''
+    parameters= dict()
+    for name in vars(controller):
+        if(not name in ['preprocessor', 'solutionProcedure']):
+            parameters[name]= getattr(controller, name)
+    return getFingerprint([stateFormatVersion, controller.__class__.__module__+'.'+controller.__class__.__name__, parameters, extraData])
+
+def getInternalForcesFingerprints(elementInternalForces):
+    ''' Return a dictionary containing the fingerprint of the internal
+        forces of the element for each combination.
+
+    :param elementInternalForces: list of the internal forces of the
+                                  element sections (see readIntForcesFile).
+    '''
+    combRows= dict()
+    for iForces in elementInternalForces:
+        row= [iForces.idSection, [repr(float(v)) for v in iForces.getComponents()]]
+        for name in ['chiLT', 'chiN', 'vonMisesStress']:
+            row.append(repr(getattr(iForces, name, None)))
+        combRows.setdefault(iForces.idComb, list()).append(row)
+    retval= dict()
+    for idComb in combRows:
+        signature= json.dumps(sorted(combRows[idComb]))
+        retval[idComb]= hashlib.sha256(signature.encode('utf-8')).hexdigest()
+    return retval
+
+def getGoverningCombination(controlVar):
+    ''' Return the name of the combination that produces the worst case
+        stored in the control variables or None if they are not obtained
+        from a single combination (crack control for both faces,
+        fatigue,...).
+
+    :param controlVar: control variables.
+    '''
+    return getattr(controlVar, 'combName', None)
+
+def getWorstCase(controlVarA, controlVarB):
+    ''' Return the control variables with the greatest capacity factor
+        (the first one if they are equal).
+
+    :param controlVarA: first control variables.
+    :param controlVarB: second control variables.
+    '''
+    retval= controlVarA
+    if(controlVarB.getCF()>controlVarA.getCF()):
+        retval= controlVarB
+    return retval
+
+class CheckingState(object):
+    ''' Data of the previous checking of a limit state.
+
+    :ivar controllerFingerprint: fingerprint of the controller.
+    :ivar sections: dictionary containing the fingerprint of the sections
+                    of each element.
+    :ivar internalForces: dictionary containing for each element a
+                          dictionary with the fingerprint of its internal
+                          forces under each combination.
+    :ivar controlVars: dictionary containing for each element a dictionary
+                       with the control variables of each section.
+    :ivar statistics: number of elements and (element, combination)
+                      pairs checked in the last run.
+    '''
+    def __init__(self):
+        ''' Constructor.'''
+        self.controllerFingerprint= None
+        self.sections= dict()
+        self.internalForces= dict()
+        self.controlVars= dict()
+        self.statistics= dict()
+
+    @staticmethod
+    def load(fileName):
+        ''' Read the state from the file (return an empty state if the
+            file doesn't exist).
+
+        :param fileName: name of the file.
+        '''
+        retval= CheckingState()
+        if(os.path.isfile(fileName)):
+            with open(fileName, 'rb') as f:
+                data= pickle.load(f)
+            if(data.get('version')==stateFormatVersion):
+                retval.controllerFingerprint= data['controllerFingerprint']
+                retval.sections= data['sections']
+                retval.internalForces= data['internalForces']
+                retval.controlVars= data['controlVars']
+                retval.statistics= data['statistics']
+        return retval
+
+    def save(self, fileName):
+        ''' Write the state in the file.
+
+        :param fileName: name of the file.
+        '''
+        data= {'version': stateFormatVersion, 'controllerFingerprint': self.controllerFingerprint, 'sections': self.sections, 'internalForces': self.internalForces, 'controlVars': self.controlVars, 'statistics': self.statistics}
+        tmpFileName= fileName+'.'+str(os.getpid())+'.tmp'
+        with open(tmpFileName, 'wb') as f:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpFileName, fileName)
+
+    def getElementsToCheck(self, controllerFingerprint, sections, internalForces):
+        ''' Return a dictionary containing, for each element that must be
+            checked, the combinations to check and a boolean that is true
+            if the results must be merged with the stored ones (false if
+            all the combinations are checked).
+
+        :param controllerFingerprint: fingerprint of the controller.
+        :param sections: dictionary containing the fingerprint of the
+                         sections of each element.
+        :param internalForces: dictionary containing for each element a
+                               dictionary with the fingerprint of its
+                               internal forces under each combination.
+        '''
+        sameController= (controllerFingerprint==self.controllerFingerprint)
+        retval= dict()
+        for tag in internalForces:
+            combFingerprints= internalForces[tag]
+            previousFingerprints= self.internalForces.get(tag)
+            previousControlVars= self.controlVars.get(tag)
+            if((not sameController) or (previousFingerprints is None) or (previousControlVars is None) or (sections.get(tag)!=self.sections.get(tag))):
+                retval[tag]= (sorted(combFingerprints), False)
+                continue
+            changed= [idComb for idComb in combFingerprints if(previousFingerprints.get(idComb)!=combFingerprints[idComb])]
+            removed= [idComb for idComb in previousFingerprints if(not idComb in combFingerprints)]
+            if(changed or removed):
+                merge= True
+                for controlVar in previousControlVars.values():
+                    governingComb= getGoverningCombination(controlVar)
+                    if((governingComb is None) or (governingComb in changed) or (governingComb in removed)):
+                        merge= False
+                if(merge):
+                    retval[tag]= (sorted(changed), True)
+                else:
+                    retval[tag]= (sorted(combFingerprints), False)
+        return retval
+
+    def update(self, controllerFingerprint, sections, internalForces, controlVars, elementsToCheck):
+        ''' Store the data of the last run.
+
+        :param controllerFingerprint: fingerprint of the controller.
+        :param sections: fingerprint of the sections of each element.
+        :param internalForces: fingerprints of the internal forces of
+                               each element.
+        :param controlVars: control variables of each element.
+        :param elementsToCheck: elements and combinations checked (see
+                                getElementsToCheck).
+        '''
+        self.controllerFingerprint= controllerFingerprint
+        self.sections= sections
+        self.internalForces= internalForces
+        self.controlVars= controlVars
+        numPairs= 0
+        for tag in internalForces:
+            numPairs+= len(internalForces[tag])
+        numCheckedPairs= 0
+        for tag in elementsToCheck:
+            numCheckedPairs+= len(elementsToCheck[tag][0])
+        self.statistics= {'elements': len(internalForces), 'checkedElements': len(elementsToCheck), 'pairs': numPairs, 'checkedPairs': numCheckedPairs}
+        profiler= stage_profiler.profiler
+        profiler.count('incrementalChecking.checkedElements', len(elementsToCheck))
+        profiler.count('incrementalChecking.checkedPairs', numCheckedPairs)
+
+def getStateFileName(limitStateData):
+    ''' Return the default name of the file that stores the state of the
+        checking of the limit state.
+
+    :param limitStateData: limit state data.
+    '''
+    return limitStateData.getOutputDataBaseFileName()+'_incremental.pkl'
+
+def filterInternalForces(internalForcesValues, elementsToCheck):
+    ''' Return the combinations and the internal forces of the
+        (element, combination) pairs to check.
+
+    :param internalForcesValues: dictionary containing the internal
+                                 forces for each element.
+    :param elementsToCheck: elements and combinations to check (see
+                            CheckingState.getElementsToCheck).
+    '''
+    idCombs= set()
+    retval= dict()
+    for tag in elementsToCheck:
+        combs= set(elementsToCheck[tag][0])
+        idCombs.update(combs)
+        retval[tag]= [iForces for iForces in internalForcesValues.get(tag, list()) if(iForces.idComb in combs)]
+    return idCombs, retval
+
+def writeInternalForces(fileName, internalForcesValues, elementTypes, vonMisesStressId= 'max_von_mises_stress'):
+    ''' Write the internal forces in a JSON file (same format as
+        the one written by LimitStateData.saveAll).
+
+    :param fileName: name of the file.
+    :param internalForcesValues: dictionary containing the internal
+                                 forces for each element.
+    :param elementTypes: dictionary containing the type of each element.
+    :param vonMisesStressId: identifier of the Von Mises stress.
+    '''
+    combInternalForcesDict= dict()
+    for tag in internalForcesValues:
+        for iForces in internalForcesValues[tag]:
+            forces= iForces.getDict()
+            for name in ['chiLT', 'chiN']:
+                if(hasattr(iForces, name)):
+                    forces[name]= getattr(iForces, name)
+            if(hasattr(iForces, 'vonMisesStress')):
+                forces[vonMisesStressId]= iForces.vonMisesStress
+            elements= combInternalForcesDict.setdefault(iForces.idComb, dict())
+            elementData= elements.setdefault(str(tag), {'type': elementTypes[tag], 'internalForces': dict()})
+            elementData['internalForces'][str(iForces.idSection)]= forces
+    with open(fileName, 'w') as outfile:
+        json.dump(combInternalForcesDict, outfile)
+
+def runSetChecking(limitStateData, outputCfg, sections= ['Sect1', 'Sect2'], stateFileName= None, sectionPropNames= defaultSectionPropNames, numProcesses= 1):
+    ''' Check the elements of the set (see LimitStateData.runChecking)
+        computing only the (element, combination) pairs whose data have
+        changed since the last run, and write the results.
+
+    :param limitStateData: object that contains the name of the file
+                           containing the internal forces and the
+                           controller to use for the checking.
+    :param outputCfg: instance of class 'VerifOutVars' which defines the
+           variables that control the output of the checking (set of
+           elements to be analyzed, append or not the results to the
+           result file [defatults to 'N'], generation or not
+           of list file [defatults to 'N', ...)
+    :param sections: names of the sections to write the output for.
+    :param stateFileName: name of the file that stores the results of
+                          the previous run (if None use the default one,
+                          see getStateFileName).
+    :param sectionPropNames: names of the element properties that define
+                             its sections.
+    :param numProcesses: number of worker processes to check the changed
+                         elements in parallel (defaults to 1 which means
+                         serial checking; if None the number of CPUs is
+                         used).
+    '''
+    retval= None
+    if outputCfg.setCalc:
+        setCalc= outputCfg.setCalc
+        prep= setCalc.getPreprocessor
+        controller= limitStateData.controller
+        if(not stateFileName):
+            stateFileName= getStateFileName(limitStateData)
+        propNames= [controller.limitStateLabel+s for s in sections]
+        vonMisesStressId= getattr(controller, 'vonMisesStressId', 'max_von_mises_stress')
+        profiler= stage_profiler.profiler
+        with profiler.stage('runIncrementalChecking', limitState= limitStateData.label):
+            with profiler.stage('fingerprints'):
+                intForcItems= lsd.readIntForcesFile(limitStateData.getInternalForcesFileName(), setCalc, vonMisesStressId)
+                internalForcesValues= intForcItems[2]
+                elementTypes= dict()
+                sectionFingerprints= dict()
+                internalForcesFingerprints= dict()
+                for e in setCalc.elements:
+                    elementTypes[e.tag]= e.type()
+                    sectionProps= [e.getProp(name) if e.hasProp(name) else None for name in sectionPropNames]
+                    sectionFingerprints[e.tag]= getFingerprint(sectionProps)
+                    internalForcesFingerprints[e.tag]= getInternalForcesFingerprints(internalForcesValues.get(e.tag, list()))
+                controllerFingerprint= getControllerFingerprint(controller, propNames)
+                state= CheckingState.load(stateFileName)
+                elementsToCheck= state.getElementsToCheck(controllerFingerprint, sectionFingerprints, internalForcesFingerprints)
+            if(elementsToCheck):
+                with profiler.stage('controller.check'):
+                    idCombs, pairsInternalForces= filterInternalForces(internalForcesValues, elementsToCheck)
+                    (fd, intForcFileName)= tempfile.mkstemp(suffix= '.json', dir= os.path.dirname(limitStateData.getInternalForcesFileName()) or None)
+                    os.close(fd)
+                    checkSet= prep.getSets.defSet('incrementalCheckingSet')
+                    try:
+                        writeInternalForces(intForcFileName, pairsInternalForces, elementTypes, vonMisesStressId)
+                        elementHandler= prep.getElementHandler
+                        for tag in elementsToCheck:
+                            checkSet.elements.append(elementHandler.getElement(tag))
+                        controller.initControlVars(checkSet)
+                        if((numProcesses!=1) and (len(elementsToCheck)>1)):
+                            parallel_checking.checkSetElementsInWorkers(limitStateData, prep, propNames, intForcFileName, list(elementsToCheck.keys()), numProcesses)
+                        else:
+                            controller.checkSetFromIntForcFile(intForcFileName, checkSet)
+                    finally:
+                        os.remove(intForcFileName)
+                        prep.getSets.removeSet('incrementalCheckingSet')
+            controlVars= dict()
+            for e in setCalc.elements:
+                elementControlVars= dict()
+                if(e.tag in elementsToCheck):
+                    merge= elementsToCheck[e.tag][1]
+                    for propName in propNames:
+                        controlVar= e.getProp(propName)
+                        if(merge):
+                            controlVar= getWorstCase(state.controlVars[e.tag][propName], controlVar)
+                            e.setProp(propName, controlVar)
+                        elementControlVars[propName]= controlVar
+                else:
+                    for propName in propNames:
+                        controlVar= state.controlVars[e.tag][propName]
+                        e.setProp(propName, controlVar)
+                        elementControlVars[propName]= controlVar
+                controlVars[e.tag]= elementControlVars
+            with profiler.stage('writeControlVars'):
+                retval= cv.writeControlVarsFromElements(controller.limitStateLabel,prep,limitStateData.getOutputDataBaseFileName(),outputCfg, sections)
+            state.update(controllerFingerprint, sectionFingerprints, internalForcesFingerprints, controlVars, elementsToCheck)
+            state.save(stateFileName)
+    else:
+        lmsg.error("Result file hasn't been created, you must specify a valid set of elements")
+    return retval
+
+def runRCChecking(rcMaterialDistribution, limitStateData, matDiagType, threeDim= True, outputCfg= lsd.VerifOutVars(), stateFileName= None, numProcesses= 1):
+    ''' Check the reinforced concrete sections (see
+        RCMaterialDistribution.runChecking) computing only the
+        (element, combination) pairs whose data have changed since the
+        last run, and write the results.
+
+    :param rcMaterialDistribution: reinforced concrete sections on each
+                                   element.
+    :param limitStateData: object that contains the name of the file
+                           containing the internal forces obtained for
+                           each element for the combinations analyzed and
+                           the controller to use for the checking.
+    :param matDiagType: type of the material diagram (d: design,
+           k: characteristic).
+    :param threeDim: true if it's 3D (Fx,Fy,Fz,Mx,My,Mz)
+           false if it's 2D (Fx,Fy,Mz).
+    :param outputCfg: instance of class 'VerifOutVars' which defines the
+               variables that control the output of the checking (set of
+               elements to be analyzed, append or not the results to a file,
+               generation or not of lists, ...)
+    :param stateFileName: name of the file that stores the results of
+                          the previous run (if None use the default one,
+                          see getStateFileName).
+    :param numProcesses: number of worker processes to check the changed
+                         elements in parallel (defaults to 1 which means
+                         serial checking; if None the number of CPUs is
+                         used).
+    '''
+    retval= None
+    controller= limitStateData.controller
+    if(controller):
+        if(not stateFileName):
+            stateFileName= getStateFileName(limitStateData)
+        profiler= stage_profiler.profiler
+        with profiler.stage('runIncrementalChecking', limitState= limitStateData.label):
+            with profiler.stage('fingerprints'):
+                intForcItems= lsd.readIntForcesFile(limitStateData.getInternalForcesFileName(), outputCfg.setCalc)
+                elementTags= list(intForcItems[0]) # Same order as the serial checking.
+                internalForcesValues= intForcItems[2]
+                sectionFingerprints= dict()
+                internalForcesFingerprints= dict()
+                for tagElem in elementTags:
+                    elementSectionNames= rcMaterialDistribution.getSectionNamesForElement(tagElem)
+                    if(elementSectionNames):
+                        sectionDefinitions= rcMaterialDistribution.getSectionDefinitionsForElement(tagElem)
+                        sectionFingerprints[tagElem]= getFingerprint([elementSectionNames, sectionDefinitions])
+                        internalForcesFingerprints[tagElem]= getInternalForcesFingerprints(internalForcesValues[tagElem])
+                controllerFingerprint= getControllerFingerprint(controller, [matDiagType, threeDim])
+                state= CheckingState.load(stateFileName)
+                elementsToCheck= state.getElementsToCheck(controllerFingerprint, sectionFingerprints, internalForcesFingerprints)
+            newControlVars= dict()
+            if(elementsToCheck):
+                with profiler.stage('controller.check'):
+                    idCombs, pairsInternalForces= filterInternalForces(internalForcesValues, elementsToCheck)
+                    tagsToCheck= [tagElem for tagElem in elementTags if tagElem in elementsToCheck]
+                    if((numProcesses!=1) and (len(tagsToCheck)>1)):
+                        records= parallel_checking.checkRCElementsInWorkers(rcMaterialDistribution, limitStateData, matDiagType, threeDim, tagsToCheck, idCombs, pairsInternalForces, numProcesses)
+                    else:
+                        records= parallel_checking.checkRCElements(rcMaterialDistribution, limitStateData, matDiagType, threeDim, tagsToCheck, idCombs, pairsInternalForces)
+                    for (tagElem, sectionIndex, controlVar) in records:
+                        newControlVars[(tagElem, sectionIndex)]= controlVar
+            controlVars= dict()
+            records= list()
+            for tagElem in internalForcesFingerprints:
+                elementControlVars= dict()
+                numSections= len(rcMaterialDistribution.getSectionNamesForElement(tagElem))
+                for sectionIndex in range(1, numSections+1):
+                    if(tagElem in elementsToCheck):
+                        controlVar= newControlVars[(tagElem, sectionIndex)]
+                        if(elementsToCheck[tagElem][1]): # merge.
+                            controlVar= getWorstCase(state.controlVars[tagElem][sectionIndex], controlVar)
+                    else:
+                        controlVar= state.controlVars[tagElem][sectionIndex]
+                    elementControlVars[sectionIndex]= controlVar
+                    records.append((tagElem, sectionIndex, controlVar))
+                controlVars[tagElem]= elementControlVars
+            with profiler.stage('writeControlVars'):
+                retval= cv.writeControlVarsFromRecords(controller.limitStateLabel, records, limitStateData.getOutputDataBaseFileName(), outputCfg)
+            state.update(controllerFingerprint, sectionFingerprints, internalForcesFingerprints, controlVars, elementsToCheck)
+            state.save(stateFileName)
+    else:
+        lmsg.error('runRCChecking: controller not defined.')
+    return retval
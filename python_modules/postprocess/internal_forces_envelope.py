@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+''' Envelopes of the internal forces of the bar elements of a set. The
+    maximum and minimum values of each component at each end of the
+    elements are stored in arrays (along with the index of the governing
+    combination) and updated in a single vectorized step for each load
+    combination.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import numpy
+from misc_utils import log_messages as lmsg
+from postprocess import internal_forces_extractor
+
+components= ['N', 'Vy', 'Vz', 'T', 'My', 'Mz']
+# Codes used by the 2D elements for each component.
+components2D= {'N':'N', 'Vy':'V', 'Mz':'M'}
+# Value used by def_vars_control to initialize the envelopes.
+initialValue= 6.023e23
+# Element families whose internal forces are read in bulk (see
+# internal_forces_extractor module).
+barFamilies= ['beam2d', 'beam3d', 'truss']
+
+def getElementInternalForces(element):
+    ''' Return an array (2 x 6) containing the internal forces
+        [N, Vy, Vz, T, My, Mz] at the back and front nodes of the element
+        (zero for the components not found).
+
+    :param element: bar element.
+    '''
+    retval= numpy.zeros((2, len(components)))
+    element.getResistingForce()
+    is2D= ('2d' in element.type())
+    for j, component in enumerate(components):
+        code= component
+        if(is2D):
+            code= components2D.get(component, None)
+            if(code is None): # not available in 2D elements.
+                continue
+        values= element.getValuesAtNodes(code, False)
+        if(len(values)>1): # code found.
+            retval[0,j]= values[0]
+            retval[1,j]= values[1]
+    return retval
+
+class BeamInternalForcesEnvelope(object):
+    ''' Envelope of the internal forces [N, Vy, Vz, T, My, Mz] at both
+        ends of the bar elements of a set.
+
+    :ivar elements: elements of the set.
+    :ivar extractor: object that reads the internal forces of the bar
+                     elements family by family.
+    :ivar familyIndexes: dictionary containing, for each bar family, the
+                         indexes (in elements) of its elements.
+    :ivar otherIndexes: indexes of the elements that don't belong to any
+                        bar family (read one by one).
+    :ivar maxValues: array (number of elements x 2 x 6) containing the
+                     maximum value of each component at the back (0)
+                     and front (1) node of each element.
+    :ivar minValues: array containing the minimum values.
+    :ivar maxCombIdx: index (in combNames) of the combination that
+                      produces each maximum value (-1 if none).
+    :ivar minCombIdx: index of the combination that produces each
+                      minimum value.
+    :ivar combNames: names of the combinations used to update the
+                     envelope.
+    '''
+    def __init__(self, elemSet):
+        ''' Constructor.
+
+        :param elemSet: set of bar elements (or list of elements).
+        '''
+        self.elements= [e for e in elemSet]
+        familyElements= dict([(family, list()) for family in barFamilies])
+        self.otherIndexes= list()
+        for i, e in enumerate(self.elements):
+            family= internal_forces_extractor.getElementFamily(e.type())
+            if(family in familyElements):
+                familyElements[family].append(i)
+            else:
+                self.otherIndexes.append(i)
+        self.familyIndexes= dict((family, numpy.array(familyElements[family], dtype= int)) for family in barFamilies)
+        self.extractor= internal_forces_extractor.SetInternalForcesExtractor([self.elements[i] for family in barFamilies for i in familyElements[family]])
+        shape= (len(self.elements), 2, len(components))
+        self.maxValues= numpy.full(shape, -initialValue)
+        self.minValues= numpy.full(shape, initialValue)
+        self.maxCombIdx= numpy.full(shape, -1, dtype= int)
+        self.minCombIdx= numpy.full(shape, -1, dtype= int)
+        self.combNames= list()
+
+    def getElementTags(self):
+        ''' Return the tags of the elements.'''
+        return [e.tag for e in self.elements]
+
+    def getInternalForces(self):
+        ''' Return an array (number of elements x 2 x 6) containing the
+            current internal forces of the elements.'''
+        retval= numpy.zeros(self.maxValues.shape)
+        familyForces= {'beam2d': self.extractor.getBeam2dForces, 'beam3d': self.extractor.getBeam3dForces, 'truss': self.extractor.getTrussForces}
+        for family in barFamilies:
+            indexes= self.familyIndexes[family]
+            if(len(indexes)>0):
+                retval[indexes]= familyForces[family]()
+        for i in self.otherIndexes:
+            retval[i]= getElementInternalForces(self.elements[i])
+        return retval
+
+    def getCombIndex(self, combName):
+        ''' Return the index of the combination (it's appended to the
+            combination names if not found).
+
+        :param combName: name of the combination.
+        '''
+        if(combName in self.combNames):
+            return self.combNames.index(combName)
+        self.combNames.append(combName)
+        return len(self.combNames)-1
+
+    def update(self, values, combName= ''):
+        ''' Update the envelope with the internal forces of a combination.
+
+        :param values: array (number of elements x 2 x 6) containing the
+                       internal forces (see getInternalForces).
+        :param combName: name of the combination.
+        '''
+        values= numpy.asarray(values, dtype= float)
+        if(values.shape!=self.maxValues.shape):
+            lmsg.error('wrong shape of the internal forces array: '+str(values.shape)+' expected: '+str(self.maxValues.shape))
+            return
+        combIdx= self.getCombIndex(combName)
+        greater= values>self.maxValues
+        self.maxValues[greater]= values[greater]
+        self.maxCombIdx[greater]= combIdx
+        smaller= values<self.minValues
+        self.minValues[smaller]= values[smaller]
+        self.minCombIdx[smaller]= combIdx
+
+    def updateFromModel(self, combName= ''):
+        ''' Update the envelope with the current internal forces of the
+            elements (i.e. after solving a combination).
+
+        :param combName: name of the combination.
+        '''
+        self.update(self.getInternalForces(), combName)
+
+    def getMax(self, component):
+        ''' Return the array (number of elements x 2) of maximum values
+            of the component.
+
+        :param component: internal force component (N, Vy, Vz, T, My or Mz).
+        '''
+        return self.maxValues[:,:,components.index(component)]
+
+    def getMin(self, component):
+        ''' Return the array (number of elements x 2) of minimum values
+            of the component.
+
+        :param component: internal force component (N, Vy, Vz, T, My or Mz).
+        '''
+        return self.minValues[:,:,components.index(component)]
+
+    def getGoverningCombinations(self, component, key= '+'):
+        ''' Return the names of the combinations that produce the maximum
+            ('+') or minimum ('-') values of the component ([back node,
+            front node] for each element; None if not updated).
+
+        :param component: internal force component (N, Vy, Vz, T, My or Mz).
+        :param key: '+' for maximum values, '-' for minimum values.
+        '''
+        j= components.index(component)
+        indexes= self.maxCombIdx[:,:,j] if(key=='+') else self.minCombIdx[:,:,j]
+        retval= list()
+        for row in indexes.tolist():
+            retval.append([self.combNames[i] if(i>=0) else None for i in row])
+        return retval
+
+    def exportToProperties(self):
+        ''' Store the envelope in the element properties used by
+            def_vars_control ('N+', 'N-', 'My+',... with the
+            [back node value, front node value] of each one).'''
+        maxValues= self.maxValues.tolist()
+        minValues= self.minValues.tolist()
+        for i, e in enumerate(self.elements):
+            for j, component in enumerate(components):
+                e.setProp(component+'+', [maxValues[i][0][j], maxValues[i][1][j]])
+                e.setProp(component+'-', [minValues[i][0][j], minValues[i][1][j]])
+
+    def importFromProperties(self):
+        ''' Read the envelope from the element properties used by
+            def_vars_control (the governing combinations are unknown).'''
+        for i, e in enumerate(self.elements):
+            for j, component in enumerate(components):
+                if(e.hasProp(component+'+')):
+                    self.maxValues[i,:,j]= e.getProp(component+'+')
+                if(e.hasProp(component+'-')):
+                    self.minValues[i,:,j]= e.getProp(component+'-')
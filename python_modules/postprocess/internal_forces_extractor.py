@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+''' Bulk extraction of the internal forces of the elements of a set. The
+    elements are classified once by family (2D beams, 3D beams, trusses,
+    shells and zero length elements) and the internal forces of each
+    family are returned in a structured array with one row for each
+    element section (the same rows written by
+    export_internal_forces.getInternalForcesDict).'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import numpy
+from materials.sections import internal_forces
+from misc_utils import log_messages as lmsg
+
+families= ['beam2d', 'beam3d', 'truss', 'shell', 'zeroLength']
+forceComponents= ['N', 'Vy', 'Vz', 'T', 'My', 'Mz']
+rowType= numpy.dtype([('elemTag', '<i8'), ('sectionIdx', '<i8')]+[(name, '<f8') for name in forceComponents+['chiLT', 'chiN', 'vonMises']])
+
+def getElementFamily(elementType):
+    ''' Return the family of the element type (None if unknown).
+
+    :param elementType: element type (as returned by element.type()).
+    '''
+    retval= None
+    if('Shell' in elementType):
+        retval= 'shell'
+    elif('Beam2d' in elementType):
+        retval= 'beam2d'
+    elif('Beam' in elementType):
+        retval= 'beam3d'
+    elif('Truss' in elementType):
+        retval= 'truss'
+    elif('ZeroLength' in elementType):
+        retval= 'zeroLength'
+    return retval
+
+def getValuesAtNodes(element, code, numValues= 2):
+    ''' Return the first values of the argument at the element nodes
+        (zero if not found).
+
+    :param element: element to read the values from.
+    :param code: identifier of the value (N, My, stress,...).
+    :param numValues: number of values to return.
+    '''
+    values= element.getValuesAtNodes(code, False)
+    if(len(values)>1): # code found.
+        return [values[i] for i in range(0,numValues)]
+    return [0.0]*numValues
+
+def getRows(elemTags, forces):
+    ''' Return an structured array with a row for each element section.
+
+    :param elemTags: tags of the elements.
+    :param forces: array (number of elements x number of sections x 6)
+                   with the internal forces.
+    '''
+    numElements, numSections= forces.shape[0:2]
+    retval= numpy.zeros(numElements*numSections, dtype= rowType)
+    retval['elemTag']= numpy.repeat(elemTags, numSections)
+    retval['sectionIdx']= numpy.tile(numpy.arange(numSections), numElements)
+    for j, name in enumerate(forceComponents):
+        retval[name]= forces[:,:,j].ravel()
+    for name in ['chiLT', 'chiN', 'vonMises']:
+        retval[name]= numpy.nan
+    return retval
+
+class SetInternalForcesExtractor(object):
+    ''' Extraction of the internal forces of the elements of a set as
+        typed arrays.
+
+    :ivar elements: dictionary containing the elements of each family.
+    :ivar elementTypes: dictionary containing the type of each element.
+    :ivar vonMisesStressId: identifier of the Von Mises stress to read
+                            (see NDMaterial and MembranePlateFiberSection).
+    '''
+    def __init__(self, elems, vonMisesStressId= 'max_von_mises_stress'):
+        ''' Constructor.
+
+        :param elems: element set.
+        :param vonMisesStressId: identifier of the Von Mises stress to read.
+        '''
+        self.vonMisesStressId= vonMisesStressId
+        self.elements= dict([(family, list()) for family in families])
+        self.elementTypes= dict()
+        for e in elems:
+            elementType= e.type()
+            self.elementTypes[e.tag]= elementType
+            family= getElementFamily(elementType)
+            if(family):
+                self.elements[family].append(e)
+            else:
+                lmsg.error("SetInternalForcesExtractor error; element type: '"+elementType+"' unknown.")
+
+    def getElementTags(self, family):
+        ''' Return the tags of the elements of the family.
+
+        :param family: element family (beam2d, beam3d, truss, shell or zeroLength).
+        '''
+        return numpy.array([e.tag for e in self.elements[family]], dtype= int)
+
+    def getChiValues(self, family):
+        ''' Return the arrays of chiLT and chiN values of the elements of
+            the family (NaN if not defined).
+
+        :param family: element family.
+        '''
+        numElements= len(self.elements[family])
+        chiLT= numpy.full(numElements, numpy.nan)
+        chiN= numpy.full(numElements, numpy.nan)
+        for i, e in enumerate(self.elements[family]):
+            if e.hasProp('chiLT'): # steel beam
+                chiLT[i]= e.getProp('chiLT')
+            if e.hasProp('chiN'):
+                chiN[i]= e.getProp('chiN')
+        return chiLT, chiN
+
+    def getBeam2dForces(self):
+        ''' Return an array (number of elements x 2 x 6) with the internal
+            forces at both ends of the 2D beams.'''
+        retval= numpy.zeros((len(self.elements['beam2d']), 2, 6))
+        for i, e in enumerate(self.elements['beam2d']):
+            e.getResistingForce()
+            retval[i,:,0]= getValuesAtNodes(e, 'N')
+            retval[i,:,1]= getValuesAtNodes(e, 'V')
+            retval[i,:,5]= getValuesAtNodes(e, 'M')
+        return retval
+
+    def getBeam3dForces(self):
+        ''' Return an array (number of elements x 2 x 6) with the internal
+            forces at both ends of the 3D beams.'''
+        retval= numpy.zeros((len(self.elements['beam3d']), 2, 6))
+        for i, e in enumerate(self.elements['beam3d']):
+            e.getResistingForce()
+            for j, code in enumerate(forceComponents):
+                retval[i,:,j]= getValuesAtNodes(e, code)
+        return retval
+
+    def getTrussForces(self):
+        ''' Return an array (number of elements x 2 x 6) with the internal
+            forces at both ends of the trusses.'''
+        retval= numpy.zeros((len(self.elements['truss']), 2, 6))
+        for i, e in enumerate(self.elements['truss']):
+            e.getResistingForce()
+            retval[i,:,0]= getValuesAtNodes(e, 'N')
+        return retval
+
+    def getZeroLengthForces(self):
+        ''' Return an array (number of elements x 2 x 6) with the internal
+            forces at both nodes of the zero length elements and an array
+            with the indexes of the elements with six degrees of freedom
+            (the others are ignored).'''
+        retval= numpy.zeros((len(self.elements['zeroLength']), 2, 6))
+        valid= list()
+        for i, e in enumerate(self.elements['zeroLength']):
+            e.getResistingForce()
+            F= e.getValuesAtNodes("stress", False)
+            nDOFs= len(F[0]) # Number of degrees of freedom.
+            if(nDOFs!= 6):
+                lmsg.warning('SetInternalForcesExtractor for '+str(nDOFs)+ " DOFs in element type: '"+self.elementTypes[e.tag]+"' not implemented.")
+            else:
+                retval[i,0,:]= [F[0][j] for j in range(0,6)]
+                retval[i,1,:]= [F[1][j] for j in range(0,6)]
+                valid.append(i)
+        return retval, numpy.array(valid, dtype= int)
+
+    def getShellForces(self):
+        ''' Return an array (number of elements x 8) with the average
+            internal forces [n1, n2, n12, m1, m2, m12, q13, q23] of the
+            shell elements (rotated the angle stored in the 'theta'
+            property if any) and an array with the average of the Von
+            Mises stresses at their nodes (NaN if not available).'''
+        numElements= len(self.elements['shell'])
+        forces= numpy.zeros((numElements, 8))
+        theta= numpy.zeros(numElements)
+        vonMises= numpy.full(numElements, numpy.nan)
+        for i, e in enumerate(self.elements['shell']):
+            e.getResistingForce()
+            physProp= e.getPhysicalProperties
+            forces[i]= [physProp.getMeanGeneralizedStressByName(code) for code in internal_forces.shellInternalForcesComponents]
+            if(e.hasProp('theta')):
+                theta[i]= e.getProp('theta')
+            # Silently ask about maximum Von-Mises stress.
+            maxVonMisesAtNodes= e.getValuesAtNodes(self.vonMisesStressId, True)
+            if(len(maxVonMisesAtNodes)>1): # vonMisesStressId found.
+                vonMises[i]= sum(maxVonMisesAtNodes[j][0] for j in range(0,4))/4.0 # average of the max. value at nodes.
+        forces= internal_forces.transformShellInternalForcesArray(forces, theta)
+        return forces, vonMises
+
+    def getFamilyForces(self):
+        ''' Return a dictionary containing, for each family, the tags of
+            the elements and the array with their internal forces (for
+            the shells the array of average internal forces returned by
+            getShellForces) and the array of the Von Mises stresses of
+            the shells.'''
+        retval= dict()
+        for family, getForces in [('beam2d', self.getBeam2dForces), ('beam3d', self.getBeam3dForces), ('truss', self.getTrussForces)]:
+            retval[family]= (self.getElementTags(family), getForces())
+        shellForces, vonMises= self.getShellForces()
+        retval['shell']= (self.getElementTags('shell'), shellForces)
+        forces, valid= self.getZeroLengthForces()
+        retval['zeroLength']= (self.getElementTags('zeroLength')[valid], forces[valid])
+        return retval, vonMises
+
+    def getFamilyRows(self, familyForces, vonMises= None):
+        ''' Return a dictionary containing, for each family, an structured
+            array (see rowType) with the internal forces of each element
+            section.
+
+        :param familyForces: dictionary containing the element tags and
+                             the internal forces of each family (see
+                             getFamilyForces).
+        :param vonMises: Von Mises stresses of the shells (NaN if None).
+        '''
+        retval= dict()
+        # Bars.
+        for family in ['beam2d', 'beam3d', 'truss']:
+            rows= getRows(*familyForces[family])
+            if(family!='beam2d'):
+                chiLT, chiN= self.getChiValues(family)
+                rows['chiLT']= numpy.repeat(chiLT, 2)
+                rows['chiN']= numpy.repeat(chiN, 2)
+            retval[family]= rows
+        # Shells (Wood-Armer internal forces for axis 1 and axis 2).
+        shellTags, shellForces= familyForces['shell']
+        rows= getRows(shellTags, internal_forces.getWoodArmerArray(shellForces))
+        if(vonMises is not None):
+            rows['vonMises']= numpy.repeat(vonMises, 2)
+        retval['shell']= rows
+        # Zero length elements.
+        retval['zeroLength']= getRows(*familyForces['zeroLength'])
+        return retval
+
+    def extract(self):
+        ''' Return a dictionary containing, for each family, an structured
+            array (see rowType) with the internal forces of each element
+            section.'''
+        familyForces, vonMises= self.getFamilyForces()
+        return self.getFamilyRows(familyForces, vonMises)
+
+    def getInternalForcesDict(self, nmbComb, familyRows= None):
+        ''' Return a dictionary with the element's internal forces (same
+            format as the one returned by
+            export_internal_forces.getInternalForcesDict).
+
+        :param nmbComb: combination name.
+        :param familyRows: arrays returned by extract (if None they're
+                           computed).
+        '''
+        if(familyRows is None):
+            familyRows= self.extract()
+        outDict= dict()
+        for tag in self.elementTypes:
+            outDict[tag]= {'type': self.elementTypes[tag], 'internalForces': dict()}
+        for family in families:
+            rows= familyRows[family]
+            for row in rows.tolist():
+                forces= dict(zip(forceComponents, row[2:8]))
+                chiLT, chiN, vonMises= row[8:11]
+                if(chiLT==chiLT): # not NaN.
+                    forces['chiLT']= chiLT
+                if(chiN==chiN):
+                    forces['chiN']= chiN
+                if(vonMises==vonMises):
+                    forces[self.vonMisesStressId]= vonMises
+                outDict[row[0]]['internalForces'][row[1]]= forces
+        return {nmbComb: outDict}
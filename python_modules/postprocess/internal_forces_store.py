@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+''' Columnar binary storage of the internal forces obtained for each
+    element and load combination. Each column (combination index, element
+    tag, section index, N, Vy, Vz, T, My, Mz, chiLT, chiN, von Mises stress)
+    is stored in its own raw binary file that can be memory mapped, the
+    combination names and the number of rows are stored in a small JSON
+    header and the element types in a separate JSON file (written only
+    when new elements are appended).'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import os
+import json
+import numpy
+from collections import defaultdict
+from materials.sections import internal_forces
+
+indexColumns= ['combIdx', 'elemTag', 'sectionIdx']
+forceColumns= ['N', 'Vy', 'Vz', 'T', 'My', 'Mz']
+optionalColumns= ['chiLT', 'chiN', 'vonMises'] # NaN when not available.
+columnTypes= dict([(name, '<i8') for name in indexColumns]+[(name, '<f8') for name in forceColumns+optionalColumns])
+
+class InternalForcesStore(object):
+    ''' Columnar binary storage of the internal forces.
+
+    :ivar path: directory containing the column files.
+    :ivar header: dictionary containing the number of rows and the
+                  combination names.
+    :ivar elementTypes: dictionary containing the type of each element
+                        (keys are the element tags as strings).
+    '''
+    headerFileName= 'header.json'
+    elementTypesFileName= 'element_types.json'
+
+    def __init__(self, path):
+        ''' Constructor.
+
+        :param path: directory containing the column files.
+        '''
+        self.path= path
+        self.header= None
+        self.elementTypes= None
+
+    def getColumnFileName(self, name):
+        ''' Return the name of the file that contains the column.
+
+        :param name: column name.
+        '''
+        return os.path.join(self.path, name+'.bin')
+
+    def getHeaderFileName(self):
+        ''' Return the name of the header file.'''
+        return os.path.join(self.path, self.headerFileName)
+
+    def getElementTypesFileName(self):
+        ''' Return the name of the file that contains the element types.'''
+        return os.path.join(self.path, self.elementTypesFileName)
+
+    def writeHeader(self):
+        ''' Write the header (the file is replaced at once so readers
+            never see a partially written header).'''
+        writeJSON(self.getHeaderFileName(), self.header)
+
+    def readHeader(self):
+        ''' Read the header.'''
+        with open(self.getHeaderFileName()) as json_file:
+            self.header= json.load(json_file)
+        return self.header
+
+    def getElementTypes(self):
+        ''' Return a dictionary containing the type of each element
+            (keys are the element tags as strings).'''
+        if(self.elementTypes is None):
+            if(self.header is None):
+                self.readHeader()
+            if('elementTypes' in self.header): # old format.
+                self.elementTypes= self.header.pop('elementTypes')
+                writeJSON(self.getElementTypesFileName(), self.elementTypes)
+            elif(os.path.isfile(self.getElementTypesFileName())):
+                with open(self.getElementTypesFileName()) as json_file:
+                    self.elementTypes= json.load(json_file)
+            else:
+                self.elementTypes= dict()
+        return self.elementTypes
+
+    def updateElementTypes(self, elementTypes):
+        ''' Add the types of the elements not already in the store and
+            write them (the file is written only if there are new
+            elements, so usually with the first combination).
+
+        :param elementTypes: dictionary containing the type of each element.
+        '''
+        storeElementTypes= self.getElementTypes()
+        newElementTypes= [(str(tag), elementTypes[tag]) for tag in elementTypes if(storeElementTypes.get(str(tag))!=elementTypes[tag])]
+        if(newElementTypes):
+            storeElementTypes.update(newElementTypes)
+            writeJSON(self.getElementTypesFileName(), storeElementTypes)
+
+    def create(self, vonMisesStressId= 'max_von_mises_stress', elementTypes= None):
+        ''' Create an empty store (the existing data are removed).
+
+        :param vonMisesStressId: identifier of the Von Mises stress
+                                 stored in the vonMises column.
+        :param elementTypes: dictionary containing the type of each
+                             element (if None they are written when
+                             the first combination is appended).
+        '''
+        if(not os.path.exists(self.path)):
+            os.makedirs(self.path)
+        for name in columnTypes:
+            open(self.getColumnFileName(name), 'wb').close()
+        self.elementTypes= dict()
+        writeJSON(self.getElementTypesFileName(), self.elementTypes)
+        if(elementTypes):
+            self.updateElementTypes(elementTypes)
+        self.header= {'numRows': 0, 'combinations': [], 'vonMisesStressId': vonMisesStressId}
+        self.writeHeader()
+
+    def getNumRows(self):
+        ''' Return the number of stored rows.'''
+        if(self.header is None):
+            self.readHeader()
+        return self.header['numRows']
+
+    def getCombinationNames(self):
+        ''' Return the names of the combinations (the combination index
+            column refers to this list).'''
+        if(self.header is None):
+            self.readHeader()
+        return self.header['combinations']
+
+    def getElementType(self, elemTag):
+        ''' Return the type of the element.
+
+        :param elemTag: element identifier.
+        '''
+        return self.getElementTypes()[str(elemTag)]
+
+    def appendInternalForcesDict(self, internalForcesDict):
+        ''' Append the internal forces in the dictionary (same format as
+            the one returned by export_internal_forces.getInternalForcesDict)
+            to the store.
+
+        :param internalForcesDict: dictionary containing the internal
+                                   forces for one or more combinations.
+        '''
+        if(self.header is None):
+            self.readHeader()
+        elementTypes= dict()
+        columns= getInternalForcesDictColumns(internalForcesDict, self.header['vonMisesStressId'], self.header['combinations'], elementTypes)
+        self.updateElementTypes(elementTypes)
+        numNewRows= len(columns['combIdx'])
+        if(numNewRows>0):
+            for name in columnTypes:
+                with open(self.getColumnFileName(name), 'ab') as f:
+                    columns[name].tofile(f)
+        self.header['numRows']+= numNewRows
+        self.writeHeader()
+
+    def appendCombinationArrays(self, combName, familyRows, elementTypes):
+        ''' Append the internal forces of a combination given as
+            structured arrays (see internal_forces_extractor module), each
+            column is written in a single step.
+
+        :param combName: combination name.
+        :param familyRows: dictionary containing the structured array of
+                           internal forces of each element family.
+        :param elementTypes: dictionary containing the type of each element.
+        '''
+        if(self.header is None):
+            self.readHeader()
+        combinations= self.header['combinations']
+        combIdx= len(combinations)
+        combinations.append(combName)
+        self.updateElementTypes(elementTypes)
+        rows= [familyRows[family] for family in familyRows if(len(familyRows[family])>0)]
+        numNewRows= sum(len(r) for r in rows)
+        if(numNewRows>0):
+            rows= numpy.concatenate(rows)
+            for name in columnTypes:
+                if(name=='combIdx'):
+                    values= numpy.full(numNewRows, combIdx, dtype= columnTypes[name])
+                else:
+                    values= numpy.asarray(rows[name], dtype= columnTypes[name])
+                with open(self.getColumnFileName(name), 'ab') as f:
+                    values.tofile(f)
+        self.header['numRows']+= numNewRows
+        self.writeHeader()
+
+    def getColumn(self, name):
+        ''' Return a read-only memory mapped array with the values of
+            the column.
+
+        :param name: column name.
+        '''
+        numRows= self.getNumRows()
+        if(numRows==0):
+            return numpy.empty(0, dtype= columnTypes[name])
+        return numpy.memmap(self.getColumnFileName(name), dtype= columnTypes[name], mode= 'r', shape= (numRows,))
+
+    def getRowIndexes(self, elemTags):
+        ''' Return the indexes of the rows that correspond to the elements
+            whose tags are in the argument.
+
+        :param elemTags: element identifiers.
+        '''
+        tags= numpy.fromiter(elemTags, dtype= columnTypes['elemTag'])
+        return numpy.nonzero(numpy.isin(self.getColumn('elemTag'), tags))[0]
+
+    def getColumns(self, names= None, elemTags= None):
+        ''' Return a dictionary with the values of the columns. If no
+            element tags are given the returned arrays are memory mapped
+            (no data is copied), otherwise only the rows corresponding to
+            those elements are read.
+
+        :param names: names of the columns to read (defaults to all of them).
+        :param elemTags: element identifiers (defaults to None which means
+                         all the elements).
+        '''
+        if(names is None):
+            names= indexColumns+forceColumns+optionalColumns
+        rows= None
+        if(elemTags is not None):
+            rows= self.getRowIndexes(elemTags)
+        retval= dict()
+        for name in names:
+            column= self.getColumn(name)
+            if(rows is None):
+                retval[name]= column
+            else:
+                retval[name]= column[rows]
+        return retval
+
+    def readColumns(self, setCalc= None, vonMisesStressId= 'max_von_mises_stress'):
+        ''' Return the combination names and a dictionary with the
+            values of the columns (memory mapped if no set is given) to
+            process the internal forces in bulk.
+
+        :param setCalc: set of elements to be analyzed (defaults to None
+                        which means that all the elements in the store
+                        are analyzed)
+        :param vonMisesStressId: identifier of the Von Mises stress to read
+                                (see NDMaterial and MembranePlateFiberSection).
+        '''
+        elemTags= None
+        if(setCalc):
+            elemTags= setCalc.getElementTags()
+        columns= self.getColumns(elemTags= elemTags)
+        if(vonMisesStressId!=self.header['vonMisesStressId']):
+            columns['vonMises']= numpy.full(len(columns['combIdx']), numpy.nan)
+        return self.getCombinationNames(), columns
+
+    def readInternalForces(self, setCalc= None, vonMisesStressId= 'max_von_mises_stress'):
+        ''' Return elementTags, idCombs and internal-forces values (same
+            output as limit_state_data.readIntForcesDict). Use readColumns
+            to avoid creating an object for each row.
+
+        :param setCalc: set of elements to be analyzed (defaults to None
+                        which means that all the elements in the store
+                        are analyzed)
+        :param vonMisesStressId: identifier of the Von Mises stress to read
+                                (see NDMaterial and MembranePlateFiberSection).
+        '''
+        combNames, columns= self.readColumns(setCalc, vonMisesStressId)
+        return getCrossSectionInternalForces(combNames, columns)
+
+def writeJSON(fileName, data):
+    ''' Write the data in a JSON file (the file is replaced at once so
+        readers never see a partially written file).
+
+    :param fileName: name of the file.
+    :param data: data to write.
+    '''
+    tmpFileName= fileName+'.tmp'
+    with open(tmpFileName, 'w') as outfile:
+        json.dump(data, outfile)
+    os.replace(tmpFileName, fileName)
+
+def getInternalForcesDictColumns(internalForcesDict, vonMisesStressId, combinations, elementTypes):
+    ''' Return a dictionary with the values of the columns for the
+        internal forces in the dictionary argument (same format as the
+        one returned by export_internal_forces.getInternalForcesDict).
+
+    :param internalForcesDict: dictionary containing the internal
+                               forces for one or more combinations.
+    :param vonMisesStressId: identifier of the Von Mises stress.
+    :param combinations: list of combination names (the names of the
+                         combinations in the dictionary are appended).
+    :param elementTypes: dictionary containing the type of each element
+                         (updated with the elements in the dictionary).
+    '''
+    columns= defaultdict(list)
+    for combName in internalForcesDict:
+        combIdx= len(combinations)
+        combinations.append(combName)
+        elements= internalForcesDict[combName]
+        for elemTag in elements:
+            elementData= elements[elemTag]
+            elementTypes[str(elemTag)]= elementData['type']
+            if('internalForces' in elementData):
+                internalForces= elementData['internalForces']
+                for sectionIdx in internalForces:
+                    forces= internalForces[sectionIdx]
+                    columns['combIdx'].append(combIdx)
+                    columns['elemTag'].append(int(elemTag))
+                    columns['sectionIdx'].append(int(sectionIdx))
+                    for name in forceColumns:
+                        columns[name].append(forces[name])
+                    columns['chiLT'].append(forces.get('chiLT', numpy.nan))
+                    columns['chiN'].append(forces.get('chiN', numpy.nan))
+                    columns['vonMises'].append(forces.get(vonMisesStressId, numpy.nan))
+    return dict((name, numpy.array(columns[name], dtype= columnTypes[name])) for name in columnTypes)
+
+def getCrossSectionInternalForces(combNames, columns):
+    ''' Return elementTags, idCombs and internal-forces values (same
+        output as limit_state_data.readIntForcesDict) from the values
+        of the columns (one object for each row, only for the code that
+        needs them).
+
+    :param combNames: names of the combinations (the combination index
+                      column refers to this list).
+    :param columns: dictionary with the values of the columns.
+    '''
+    elementTags= set()
+    idCombs= set()
+    internalForcesValues= defaultdict(list)
+    rows= zip(*[columns[name].tolist() for name in indexColumns+forceColumns+optionalColumns])
+    for (combIdx, tagElem, idSection, N, Vy, Vz, T, My, Mz, chiLT, chiN, vonMises) in rows:
+        idComb= combNames[combIdx]
+        idCombs.add(idComb)
+        elementTags.add(tagElem)
+        crossSectionInternalForces= internal_forces.CrossSectionInternalForces(N, Vy, Vz, T, My, Mz)
+        if(chiLT==chiLT): # not NaN.
+            crossSectionInternalForces.chiLT= chiLT
+        if(chiN==chiN):
+            crossSectionInternalForces.chiN= chiN
+        crossSectionInternalForces.idComb= idComb
+        crossSectionInternalForces.tagElem= tagElem
+        crossSectionInternalForces.idSection= idSection
+        if(vonMises==vonMises):
+            crossSectionInternalForces.vonMisesStress= vonMises
+        internalForcesValues[tagElem].append(crossSectionInternalForces)
+    return (elementTags,idCombs,internalForcesValues)
+
+def getInternalForcesColumns(internalForcesValues):
+    ''' Return the combination names and a dictionary with the values
+        of the columns for the internal forces objects argument (see
+        limit_state_data.readIntForcesFile).
+
+    :param internalForcesValues: dictionary containing the internal
+                                 forces for each element.
+    '''
+    combNames= list()
+    combIndexes= dict()
+    columns= defaultdict(list)
+    for tagElem in internalForcesValues:
+        for iForces in internalForcesValues[tagElem]:
+            if(not iForces.idComb in combIndexes):
+                combIndexes[iForces.idComb]= len(combNames)
+                combNames.append(iForces.idComb)
+            columns['combIdx'].append(combIndexes[iForces.idComb])
+            columns['elemTag'].append(tagElem)
+            columns['sectionIdx'].append(iForces.idSection)
+            for name, value in zip(forceColumns, iForces.getComponents()):
+                columns[name].append(value)
+            columns['chiLT'].append(getattr(iForces, 'chiLT', numpy.nan))
+            columns['chiN'].append(getattr(iForces, 'chiN', numpy.nan))
+            columns['vonMises'].append(getattr(iForces, 'vonMisesStress', numpy.nan))
+    return combNames, dict((name, numpy.array(columns[name], dtype= columnTypes[name])) for name in columnTypes)
+
+def isInternalForcesStore(path):
+    ''' Return true if the path corresponds to an internal forces store.
+
+    :param path: path to check.
+    '''
+    return os.path.isfile(os.path.join(path, InternalForcesStore.headerFileName))
@@ -14,12 +14,18 @@ import pickle
 import os
 from solution import predefined_solutions
 from postprocess.reports import export_internal_forces as eif
+from postprocess import load_superposition
+from postprocess import internal_forces_store
+from postprocess import internal_forces_extractor
 from misc_utils import log_messages as lmsg
+from misc import stage_profiler
 from materials.sections import internal_forces
 from collections import defaultdict
 import csv
 from postprocess import control_vars as cv
+from postprocess import control_vars_store
 import json
+import numpy
 
 defaultSolutionProcedureType=  predefined_solutions.SimpleStaticLinear
 
@@ -35,12 +41,16 @@ class VerifOutVars(object):
            is desired to be generated (defaults to 'N')
     :param calcMeanCF: 'Yes','Y','y',.., if average capacity factor is
            meant to be calculated (defaults to 'N')
+    :param structuredResults: 'Yes','Y','y',.., if the results are written
+           in a structured file (.npz, see control_vars_store module) 
+           instead of a Python file (defaults to 'N')
     '''
-    def __init__(self,setCalc=None,appendToResFile='N',listFile='N',calcMeanCF='N'):
+    def __init__(self,setCalc=None,appendToResFile='N',listFile='N',calcMeanCF='N',structuredResults='N'):
         self.setCalc= setCalc
         self.appendToResFile= appendToResFile
         self.listFile= listFile
         self.calcMeanCF= calcMeanCF
+        self.structuredResults= structuredResults
 
     def getCalcSetElements(self, preprocessor):
         ''' Return the set of elements to be analyzed.
@@ -63,9 +73,14 @@ class LimitStateData(object):
     :ivar outputDataBaseFileName: name (whithout extension) of the 
                                        file that contains the results to
                                        display.
+    :cvar columnarInternalForces: if True, write the internal forces in 
+                                  a columnar binary store (see
+                                  internal_forces_store module) instead
+                                  of a JSON file.
     '''
     
     envConfig= None
+    columnarInternalForces= False
 
     def __init__(self,limitStateLabel,outputDataBaseFileName):
         '''Limit state data constructor.
@@ -84,7 +99,12 @@ class LimitStateData(object):
     def getInternalForcesFileName(self):
         '''Return the file name to read: combination name, element number and 
         internal forces.'''
-        return self.envConfig.projectDirTree.getInternalForcesResultsPath()+'intForce_'+ self.label +'.json'
+        retval= self.envConfig.projectDirTree.getInternalForcesResultsPath()+'intForce_'+ self.label
+        if(self.columnarInternalForces):
+            retval+= '.cols'
+        else:
+            retval+= '.json'
+        return retval
         
     def readInternalForces(self, setCalc):
         ''' Read the internal forces for the elements in the set argument.
@@ -101,6 +121,14 @@ class LimitStateData(object):
         '''
         return eif.getInternalForcesDict(nmbComb,elems)
     
+    def getInternalForcesExtractor(self, elems):
+        '''Return an object that extracts the element's internal forces
+           as arrays.
+
+         :param elems: element set.
+        '''
+        return internal_forces_extractor.SetInternalForcesExtractor(elems)
+
     def getDisplacementsFileName(self):
         '''Return the file name to read: combination name, node number and 
         displacements (ux,uy,uz,rotX,rotY,rotZ).'''
@@ -113,6 +141,18 @@ class LimitStateData(object):
     def getOutputDataFileName(self):
         '''Return the Python executable file name.'''
         return self.getOutputDataBaseFileName() + '.py'
+
+    def getStructuredOutputDataFileName(self):
+        '''Return the structured (.npz) output file name.'''
+        return self.getOutputDataBaseFileName() + '.npz'
+
+    def loadOutputData(self, preprocessor):
+        '''Read the results of the checking and assign them to the 
+           elements of the model.
+
+        :param preprocessor: preprocessor of the finite element problem.
+        '''
+        control_vars_store.loadOutputData(self.getOutputDataBaseFileName(), preprocessor)
     
     def loadPickleObject(objName):
         '''Read a Python object from a pickle file.'''
@@ -135,6 +175,10 @@ class LimitStateData(object):
         self.fNameDispl= self.getDisplacementsFileName()
         os.system("rm -f " + self.fNameIntForc) #Clear obsolete files.
         os.system("rm -f " + self.fNameDispl)
+        self.internalForcesStore= None
+        if(self.columnarInternalForces):
+            self.internalForcesStore= internal_forces_store.InternalForcesStore(self.fNameIntForc)
+            self.internalForcesStore.create()
         fDisp= open(self.fNameDispl,"w")
         fDisp.write('Comb., Node, uX, uY, uZ, rotX, rotY , rotZ\n')
         fDisp.close()
@@ -152,13 +196,73 @@ class LimitStateData(object):
             fDisp.write(combNm+", "+str(n.tag)+", " + strDisp+'\n')
         fDisp.close()
 
+    def writeNodeDisplacements(self, combNm, nodeDisplacements):
+        '''Writes the displacements given as parameter for a load
+           combination.
+
+        :param combNM: name of the load combination
+        :param nodeDisplacements: list of (node tag, displacement vector)
+                                  tuples.
+        '''
+        fDisp= open(self.fNameDispl,"a")
+        for (tag, disp) in nodeDisplacements:
+            strDisp= str(disp).rstrip().replace(' ',', ') #displacement vector [ux,uy,uz,rotx,roty,rotz]
+            fDisp.write(combNm+", "+str(tag)+", " + strDisp+'\n')
+        fDisp.close()
+
     def writeInternalForces(self, internalForcesDict):
         '''Write the internal forces results.'''
         with open(self.fNameIntForc, 'w') as outfile:
             json.dump(internalForcesDict, outfile)
         outfile.close()
-        
-    def saveAll(self, combContainer, setCalc, solutionProcedureType= defaultSolutionProcedureType, lstSteelBeams=None):
+
+    def storeInternalForces(self, combInternalForcesDict, internalForcesDict):
+        '''Store the internal forces obtained for a combination. If the
+        columnar store is used they are appended to it, otherwise they 
+        are added to the dictionary that will be written at the end.
+
+        :param combInternalForcesDict: internal forces for the combination.
+        :param internalForcesDict: internal forces for all the combinations.
+        '''
+        if(self.internalForcesStore):
+            self.internalForcesStore.appendInternalForcesDict(combInternalForcesDict)
+        else:
+            internalForcesDict.update(combInternalForcesDict)
+
+    def appendCombinationRows(self, combinationRows, extractor):
+        '''Append to the internal forces file written by saveAll the
+        internal forces of some additional combinations (i.e. the
+        pseudo-combinations of a response spectrum analysis) so they
+        are verified with the other ones.
+
+        :param combinationRows: dictionary containing for each combination
+                                name the structured arrays of internal
+                                forces of each element family (see
+                                internal_forces_extractor module).
+        :param extractor: object that extracted the internal forces (see
+                          getInternalForcesExtractor).
+        '''
+        fNameIntForc= self.getInternalForcesFileName()
+        if(self.columnarInternalForces):
+            store= internal_forces_store.InternalForcesStore(fNameIntForc)
+            if(not internal_forces_store.isInternalForcesStore(fNameIntForc)):
+                self.envConfig.projectDirTree.createTree()
+                store.create(extractor.vonMisesStressId)
+            for combName in combinationRows:
+                store.appendCombinationArrays(combName, combinationRows[combName], extractor.elementTypes)
+        else:
+            internalForcesDict= dict()
+            if(os.path.exists(fNameIntForc)):
+                with open(fNameIntForc) as json_file:
+                    internalForcesDict= json.load(json_file)
+            else:
+                self.envConfig.projectDirTree.createTree()
+            for combName in combinationRows:
+                internalForcesDict.update(extractor.getInternalForcesDict(combName, combinationRows[combName]))
+            self.fNameIntForc= fNameIntForc
+            self.writeInternalForces(internalForcesDict)
+
+    def saveAll(self, combContainer, setCalc, solutionProcedureType= defaultSolutionProcedureType, lstSteelBeams=None, linearSuperposition= False):
         '''Write internal forces, displacements, .., for each combination
 
         :param setCalc: set of entities for which the verification is 
@@ -166,35 +270,79 @@ class LimitStateData(object):
         :param solutionProcedureType: type of the solution strategy to solve
                                       the finite element problem.
         :param lstSteelBeams: list of steel beams to analyze (defaults to None)
+        :param linearSuperposition: if True, solve each load pattern only
+                                    once and obtain the results of the
+                                    combinations by linear superposition
+                                    (only valid for linear analysis, 
+                                    defaults to False). Use it with the
+                                    MultiLoadCaseStaticLinear solution
+                                    procedure to factorize the stiffness
+                                    matrix only once.
         '''
-        preprocessor= setCalc.getPreprocessor
-        feProblem= preprocessor.getProblem
-        solutionProcedure= solutionProcedureType(feProblem)
-        preprocessor= feProblem.getPreprocessor
-        loadCombinations= preprocessor.getLoadHandler.getLoadCombinations
-        #Putting combinations inside XC.
-        loadCombinations= self.dumpCombinations(combContainer,loadCombinations)
-        elemSet= setCalc.elements
-        nodSet= setCalc.nodes
-        self.createOutputFiles()
-        internalForcesDict= dict()
-        for key in loadCombinations.getKeys():
-            comb= loadCombinations[key]
-            preprocessor.resetLoadCase()
-            preprocessor.getDomain.revertToStart()
-            comb.addToDomain() #Combination to analyze.
-            #Solution
-            result= solutionProcedure.solve()
-            if lstSteelBeams:
-                for sb in lstSteelBeams:
-                    sb.updateReductionFactors()
-            #Writing results.
-            internalForcesDict.update(self.getInternalForcesDict(comb.getName,elemSet))
-            self.writeDisplacements(comb.getName,nodSet)
-            comb.removeFromDomain() #Remove combination from the model.
-        self.writeInternalForces(internalForcesDict)
+        profiler= stage_profiler.profiler
+        with profiler.stage('saveAll', limitState= self.label):
+            if(linearSuperposition and lstSteelBeams):
+                lmsg.warning('linear superposition not available when computing steel beams reduction factors; each combination will be solved.')
+                linearSuperposition= False
+            preprocessor= setCalc.getPreprocessor
+            feProblem= preprocessor.getProblem
+            solutionProcedure= solutionProcedureType(feProblem)
+            preprocessor= feProblem.getPreprocessor
+            loadCombinations= preprocessor.getLoadHandler.getLoadCombinations
+            #Putting combinations inside XC.
+            loadCombinations= self.dumpCombinations(combContainer,loadCombinations)
+            elemSet= setCalc.elements
+            nodSet= setCalc.nodes
+            self.createOutputFiles()
+            internalForcesDict= dict()
+            if(linearSuperposition):
+                combFactors= load_superposition.getCombinationsFactors(loadCombinations)
+                loadPatternNames= list()
+                for combName in combFactors:
+                    for lpName in combFactors[combName]:
+                        if(not lpName in loadPatternNames):
+                            loadPatternNames.append(lpName)
+                superposition= load_superposition.LinearSuperposition(elemSet, nodSet)
+                with profiler.stage('computeLoadPatternResponses'):
+                    superposition.computeLoadPatternResponses(solutionProcedure, loadPatternNames)
+                for key in loadCombinations.getKeys():
+                    comb= loadCombinations[key]
+                    factors= combFactors[comb.getName]
+                    #Writing results.
+                    with profiler.stage('getInternalForces', combination= comb.getName):
+                        self.storeInternalForces(superposition.getInternalForcesDict(comb.getName,factors),internalForcesDict)
+                    with profiler.stage('writeDisplacements', combination= comb.getName):
+                        self.writeNodeDisplacements(comb.getName,superposition.getNodeDisplacements(factors))
+            else:
+                extractor= None
+                if(self.internalForcesStore):
+                    extractor= self.getInternalForcesExtractor(elemSet)
+                for key in loadCombinations.getKeys():
+                    comb= loadCombinations[key]
+                    preprocessor.resetLoadCase()
+                    preprocessor.getDomain.revertToStart()
+                    comb.addToDomain() #Combination to analyze.
+                    #Solution
+                    with profiler.stage('solve', combination= comb.getName):
+                        result= solutionProcedure.solve()
+                    if lstSteelBeams:
+                        with profiler.stage('updateReductionFactors', combination= comb.getName):
+                            for sb in lstSteelBeams:
+                                sb.updateReductionFactors()
+                    #Writing results.
+                    with profiler.stage('getInternalForces', combination= comb.getName):
+                        if(extractor):
+                            self.internalForcesStore.appendCombinationArrays(comb.getName, extractor.extract(), extractor.elementTypes)
+                        else:
+                            self.storeInternalForces(self.getInternalForcesDict(comb.getName,elemSet),internalForcesDict)
+                    with profiler.stage('writeDisplacements', combination= comb.getName):
+                        self.writeDisplacements(comb.getName,nodSet)
+                    comb.removeFromDomain() #Remove combination from the model.
+            if(not self.internalForcesStore):
+                with profiler.stage('writeInternalForces'):
+                    self.writeInternalForces(internalForcesDict)
 #20181117
-    def runChecking(self,outputCfg, sections= ['Sect1', 'Sect2']):
+    def runChecking(self,outputCfg, sections= ['Sect1', 'Sect2'], numProcesses= 1, incremental= False):
         '''This method reads, for the elements in setCalc,  the internal 
         forces previously calculated and saved in the corresponding file.
         Using the 'initControlVars' and 'checkSetFromIntForcFile' methods of 
@@ -208,14 +356,34 @@ class LimitStateData(object):
                result file [defatults to 'N'], generation or not
                of list file [defatults to 'N', ...)
         :param sections: names of the sections to write the output for.
+        :param numProcesses: number of worker processes to check the 
+                             elements in parallel (defaults to 1 which 
+                             means serial checking; if None the number
+                             of CPUs is used).
+        :param incremental: if true check only the elements and 
+                            combinations whose data have changed since 
+                            the last run (see incremental_checking module;
+                            the changed elements are checked using 
+                            numProcesses worker processes).
         '''
         retval=None
+        if(incremental):
+            from postprocess import incremental_checking # avoid circular import.
+            return incremental_checking.runSetChecking(self,outputCfg,sections,numProcesses= numProcesses)
+        if(numProcesses!=1):
+            from postprocess import parallel_checking # avoid circular import.
+            return parallel_checking.runSetChecking(self,outputCfg,sections,numProcesses)
         if outputCfg.setCalc:
-            prep= outputCfg.setCalc.getPreprocessor
-            intForcCombFileName= self.getInternalForcesFileName()
-            self.controller.initControlVars(outputCfg.setCalc)
-            self.controller.checkSetFromIntForcFile(intForcCombFileName,outputCfg.setCalc)
-            retval= cv.writeControlVarsFromElements(self.controller.limitStateLabel,prep,self.getOutputDataBaseFileName(),outputCfg, sections)
+            profiler= stage_profiler.profiler
+            with profiler.stage('runChecking', limitState= self.label):
+                prep= outputCfg.setCalc.getPreprocessor
+                intForcCombFileName= self.getInternalForcesFileName()
+                with profiler.stage('initControlVars'):
+                    self.controller.initControlVars(outputCfg.setCalc)
+                with profiler.stage('controller.check'):
+                    self.controller.checkSetFromIntForcFile(intForcCombFileName,outputCfg.setCalc)
+                with profiler.stage('writeControlVars'):
+                    retval= cv.writeControlVarsFromElements(self.controller.limitStateLabel,prep,self.getOutputDataBaseFileName(),outputCfg, sections)
         else:
             lmsg.error("Result file hasn't been created, you must specify a valid set of elements")
         return retval
@@ -415,6 +583,37 @@ class VonMisesStressLimitStateData(LimitStateData):
         :param elems: element set.
         '''
         return eif.getInternalForcesDict(nmbComb,elems, vonMisesStressId= self.vonMisesStressId)
+
+    def getInternalForcesExtractor(self, elems):
+        '''Return an object that extracts the element's internal forces
+           as arrays.
+
+         :param elems: element set.
+        '''
+        return internal_forces_extractor.SetInternalForcesExtractor(elems, vonMisesStressId= self.vonMisesStressId)
+
+    def createOutputFiles(self):
+        ''' Create the internal forces and displacement output files.'''
+        super(VonMisesStressLimitStateData,self).createOutputFiles()
+        if(self.internalForcesStore):
+            self.internalForcesStore.create(self.vonMisesStressId)
+    
+    def saveAll(self, combContainer, setCalc, solutionProcedureType= defaultSolutionProcedureType, lstSteelBeams=None, linearSuperposition= False):
+        '''Write internal forces, displacements, .., for each combination.
+           Von Mises stresses can't be obtained by linear superposition
+           so each combination is solved.
+
+        :param setCalc: set of entities for which the verification is 
+                          going to be performed
+        :param solutionProcedureType: type of the solution strategy to solve
+                                      the finite element problem.
+        :param lstSteelBeams: list of steel beams to analyze (defaults to None)
+        :param linearSuperposition: ignored.
+        '''
+        if(linearSuperposition):
+            lmsg.warning('Von Mises stresses cannot be obtained by linear superposition; each combination will be solved.')
+        super(VonMisesStressLimitStateData,self).saveAll(combContainer, setCalc, solutionProcedureType, lstSteelBeams, linearSuperposition= False)
+        
     def readInternalForces(self, setCalc):
         ''' Read the internal forces for the elements in the set argument.
 
@@ -446,7 +645,7 @@ class VonMisesStressLimitStateData(LimitStateData):
         '''
         return elementsToCheck.internalForcesVerification3D(self, "d",outputCfg)
     
-    def runChecking(self,outputCfg):
+    def runChecking(self,outputCfg, numProcesses= 1, incremental= False):
         '''This method reads, for the elements in setCalc,  the internal 
         forces previously calculated and saved in the corresponding file.
         Using the 'initControlVars' and 'checkSetFromIntForcFile' methods of 
@@ -459,9 +658,15 @@ class VonMisesStressLimitStateData(LimitStateData):
                elements to be analyzed, append or not the results to the 
                result file [defatults to 'N'], generation or not
                of list file [defatults to 'N', ...)
+        :param numProcesses: number of worker processes to check the 
+                             elements in parallel (defaults to 1 which 
+                             means serial checking).
+        :param incremental: if true check only the elements and 
+                            combinations whose data have changed since 
+                            the last run.
         '''
         self.controller.vonMisesStressId= self.vonMisesStressId
-        retval= super(VonMisesStressLimitStateData,self).runChecking(outputCfg, sections= [''])
+        retval= super(VonMisesStressLimitStateData,self).runChecking(outputCfg, sections= [''], numProcesses= numProcesses, incremental= incremental)
         return retval
 
 
@@ -596,6 +801,51 @@ def oldReadIntForcesFile(intForcCombFileName,setCalc=None):
     f.close()
     return (elementTags,idCombs,internalForcesValues)
 
+# Internal forces read in advance (see preloadIntForcesFile).
+_preloadedIntForces= None
+
+def preloadIntForcesFile(intForcCombFileName, vonMisesStressId= 'max_von_mises_stress'):
+    '''Read the internal forces file and keep its values in memory, so
+    the next calls to readIntForcesFile for the same file (i.e. from the
+    forked worker processes of the parallel checking) take the values
+    of their elements from there instead of parsing the file again.
+    Call releaseIntForcesFile when they are no longer needed.
+
+    :param intForcCombFileName: name of the file containing the internal
+                                forces obtained for each element for 
+                                the combinations analyzed
+    :param vonMisesStressId: identifier of the Von Mises stress to read
+                            (see NDMaterial and MembranePlateFiberSection).
+    '''
+    global _preloadedIntForces
+    _preloadedIntForces= None
+    _preloadedIntForces= (intForcCombFileName, vonMisesStressId, readIntForcesFile(intForcCombFileName, None, vonMisesStressId))
+
+def releaseIntForcesFile():
+    '''Forget the internal forces read by preloadIntForcesFile.'''
+    global _preloadedIntForces
+    _preloadedIntForces= None
+
+def getIntForcesSubset(intForcItems, setCalc):
+    '''Return elementTags, idCombs and internal-forces values of the
+    elements of the set.
+
+    :param intForcItems: elementTags, idCombs and internal-forces values
+                         of all the elements (see readIntForcesFile).
+    :param setCalc: set of elements to be analyzed (if None return all
+                    the values).
+    '''
+    if(not setCalc):
+        return intForcItems
+    allInternalForcesValues= intForcItems[2]
+    elementTags= set(tag for tag in setCalc.getElementTags() if(allInternalForcesValues.get(tag)))
+    idCombs= set()
+    internalForcesValues= defaultdict(list)
+    for tagElem in elementTags:
+        internalForcesValues[tagElem]= allInternalForcesValues[tagElem]
+        idCombs.update(iForces.idComb for iForces in internalForcesValues[tagElem])
+    return (elementTags,idCombs,internalForcesValues)
+
 def readIntForcesFile(intForcCombFileName, setCalc=None, vonMisesStressId= 'max_von_mises_stress'):
     '''Extracts element and combination identifiers from the internal
     forces listing file. Return elementTags, idCombs and 
@@ -610,6 +860,11 @@ def readIntForcesFile(intForcCombFileName, setCalc=None, vonMisesStressId= 'max_
     :param vonMisesStressId: identifier of the Von Mises stress to read
                             (see NDMaterial and MembranePlateFiberSection).
     '''
+    if(_preloadedIntForces and (_preloadedIntForces[:2]==(intForcCombFileName, vonMisesStressId))):
+        return getIntForcesSubset(_preloadedIntForces[2], setCalc)
+    if(internal_forces_store.isInternalForcesStore(intForcCombFileName)):
+        store= internal_forces_store.InternalForcesStore(intForcCombFileName)
+        return store.readInternalForces(setCalc, vonMisesStressId)
     f= open(intForcCombFileName,"r")
     c= f.read(1)
     if(c=='{'):
@@ -618,6 +873,71 @@ def readIntForcesFile(intForcCombFileName, setCalc=None, vonMisesStressId= 'max_
         return oldReadIntForcesFile(intForcCombFileName,setCalc)
     f.close()
 
+def readIntForcesArrays(intForcCombFileName, setCalc=None, vonMisesStressId= 'max_von_mises_stress'):
+    '''Read the internal forces file in bulk. Return the combination names
+    and a dictionary with the values of the columns (see 
+    internal_forces_store module; with the columnar store the arrays are
+    memory mapped if no set is given).
+
+    :param intForcCombFileName: name of the file containing the internal
+                                forces obtained for each element for 
+                                the combinations analyzed
+    :param setCalc: set of elements to be analyzed (defaults to None which 
+                    means that all the elements in the file of internal forces
+                    results are analyzed) 
+    :param vonMisesStressId: identifier of the Von Mises stress to read
+                            (see NDMaterial and MembranePlateFiberSection).
+    '''
+    if(internal_forces_store.isInternalForcesStore(intForcCombFileName)):
+        store= internal_forces_store.InternalForcesStore(intForcCombFileName)
+        return store.readColumns(setCalc, vonMisesStressId)
+    with open(intForcCombFileName,"r") as f:
+        c= f.read(1)
+    if(c=='{'):
+        with open(intForcCombFileName) as json_file:
+            combInternalForcesDict= json.load(json_file)
+        combNames= list()
+        columns= internal_forces_store.getInternalForcesDictColumns(combInternalForcesDict, vonMisesStressId, combNames, dict())
+        if(setCalc):
+            rows= numpy.isin(columns['elemTag'], numpy.fromiter(setCalc.getElementTags(), dtype= columns['elemTag'].dtype))
+            columns= dict((name, columns[name][rows]) for name in columns)
+        return combNames, columns
+    else:
+        return internal_forces_store.getInternalForcesColumns(oldReadIntForcesFile(intForcCombFileName,setCalc)[2])
+
+def getExtremeAxialForces(setCalc, intForcCombFileName, sign):
+    '''Return a list of tuples (element tag, section index, combination
+    name, axial force) with the maximum tension (sign= 1) or compression
+    (sign= -1) axial force at the first two sections of the elements 
+    included in setCalc (zero and an empty combination name if there is
+    no force of that sign).
+
+    :param setCalc: set of elements to be analyzed.
+    :param intForcCombFileName: name of the file containing the internal
+                                forces.
+    :param sign: 1 for tension, -1 for compression.
+    '''
+    combNames, columns= readIntForcesArrays(intForcCombFileName,setCalc)
+    rows= numpy.nonzero(columns['sectionIdx']<2)[0]
+    elemTags= columns['elemTag'][rows]
+    sectionIndexes= columns['sectionIdx'][rows]
+    values= sign*columns['N'][rows]
+    # Group the rows by element and section (keeping the order of the
+    # combinations).
+    order= numpy.lexsort((sectionIndexes, elemTags))
+    elemTags= elemTags[order]; sectionIndexes= sectionIndexes[order]
+    values= values[order]; rows= rows[order]
+    starts= numpy.flatnonzero((numpy.diff(elemTags)!=0) | (numpy.diff(sectionIndexes)!=0))+1
+    retval= list()
+    for first, last in zip(numpy.r_[0, starts], numpy.r_[starts, len(values)]):
+        if(first<last):
+            k= first+numpy.argmax(values[first:last])
+            combName= ''; N= 0.0
+            if(values[k]>0.0):
+                combName= combNames[columns['combIdx'][rows[k]]]
+                N= float(columns['N'][rows[k]])
+            retval.append((int(elemTags[k]), int(sectionIndexes[k]), combName, N))
+    return retval
 
 def string_el_max_axial_force(element,section,setName,combName,axialForc):
     retval='preprocessor.getElementHandler.getElement('+str(element)+').setProp("maxAxialForceSect'+str(section)+'",AxialForceControlVars('+'idSection= "' + setName + 'Sects'+str(section)+'"' + ', combName= "' + combName +'", N= ' + str(axialForc) + ')) \n'
@@ -631,28 +951,10 @@ def calc_max_tension_axial_forces(setCalc,intForcCombFileName,outputFileName):
 
     :param setCalc: set of elements to be analyzed.
     '''
-    f=open(outputFileName,"w")
-    etags,combs,intForc=readIntForcesFile(intForcCombFileName,setCalc)
     setName=setCalc.name
-    for el in etags:
-        #init tension axial forces
-        maxNsect1,maxNsect2=(0.0,0.0)
-        maxCmbsect1,maxCmbsect2=('','')
-        elIntF=intForc[el]
-        for ind in range(len(combs)):
-            Nsect1=elIntF[2*ind].N
-            Nsect2=elIntF[2*ind+1].N
-            if Nsect1>maxNsect1:
-                maxNsect1=Nsect1
-                maxCmbsect1=elIntF[2*ind].idComb
-            if Nsect2>maxNsect2:
-                maxNsect2=Nsect2
-                maxCmbsect2=elIntF[2*ind+1].idComb
-        strSect1=string_el_max_axial_force(el,1,setName,maxCmbsect1,maxNsect1)
-        strSect2=string_el_max_axial_force(el,2,setName,maxCmbsect2,maxNsect2)
-        f.write(strSect1) 
-        f.write(strSect2) 
-    f.close()
+    with open(outputFileName,"w") as f:
+        for (el, sectionIdx, combName, N) in getExtremeAxialForces(setCalc, intForcCombFileName, 1):
+            f.write(string_el_max_axial_force(el,sectionIdx+1,setName,combName,N))
 
 def calc_max_compression_axial_forces(setCalc,intForcCombFileName,outputFileName):
     '''Calculate maximum compression forces for the elements included in setCalc 
@@ -662,28 +964,10 @@ def calc_max_compression_axial_forces(setCalc,intForcCombFileName,outputFileName
 
     :param setCalc: set of elements to be analyzed.
     '''
-    f=open(outputFileName,"w")
-    etags,combs,intForc=readIntForcesFile(intForcCombFileName,setCalc)
-    setName= setCalc.name
-    for el in etags:
-        #init compression axial forces
-        maxNsect1,maxNsect2=(0.0,0.0)
-        maxCmbsect1,maxCmbsect2=('','')
-        elIntF=intForc[el]
-        for ind in range(len(combs)):
-            Nsect1=elIntF[2*ind].N
-            Nsect2=elIntF[2*ind+1].N
-            if Nsect1<maxNsect1:
-                maxNsect1=Nsect1
-                maxCmbsect1=elIntF[2*ind].idComb
-            if Nsect2<maxNsect2:
-                maxNsect2=Nsect2
-                maxCmbsect2=elIntF[2*ind+1].idComb
-        strSect1=string_el_max_axial_force(el,1,setName,maxCmbsect1,maxNsect1)
-        strSect2=string_el_max_axial_force(el,2,setName,maxCmbsect2,maxNsect2)
-        f.write(strSect1) 
-        f.write(strSect2) 
-    f.close()
+    setName=setCalc.name
+    with open(outputFileName,"w") as f:
+        for (el, sectionIdx, combName, N) in getExtremeAxialForces(setCalc, intForcCombFileName, -1):
+            f.write(string_el_max_axial_force(el,sectionIdx+1,setName,combName,N))
 
 
 
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+''' Results of load combinations obtained by linear superposition of the
+    results of its load patterns. Only valid for linear analysis.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import numpy
+import xc
+from actions import combinations
+from materials.sections import internal_forces
+from misc_utils import log_messages as lmsg
+
+def getValuesAtNodes(element, code):
+    ''' Return the values of the element response identified by the code
+        argument at its first and second nodes (zero if not found).
+
+    :param element: finite element to read the response from.
+    :param code: response identifier ('N', 'Vy', 'My',...).
+    '''
+    retval= [0.0, 0.0]
+    values= element.getValuesAtNodes(code, False)
+    if(len(values)>1): # code found.
+        retval= [values[0], values[1]]
+    return retval
+
+def getElementLinearResponse(element):
+    ''' Return the values of the element response that can be obtained
+        by linear superposition:
+
+        - bar like elements: [N,Vy,Vz,T,My,Mz] on each section.
+        - shell elements: average [n1,n2,n12,m1,m2,m12,q13,q23] (the
+          Wood-Armer transformation is not linear so it must be computed
+          after the superposition).
+
+        Return a tuple (elementType, isShell, values) where values is
+        None if the element type is not supported.
+
+    :param element: finite element to read the response from.
+    '''
+    elementType= element.type()
+    isShell= False
+    values= None
+    if('Shell' in elementType):
+        isShell= True
+        shellForces= internal_forces.ShellMaterialInternalForces()
+        shellForces.setFromAverageInShellElement(element)
+        values= [shellForces.n1, shellForces.n2, shellForces.n12, shellForces.m1, shellForces.m2, shellForces.m12, shellForces.q13, shellForces.q23]
+    elif('Beam2d' in elementType):
+        element.getResistingForce()
+        N= getValuesAtNodes(element, 'N')
+        V= getValuesAtNodes(element, 'V')
+        M= getValuesAtNodes(element, 'M')
+        values= [N[0], V[0], 0.0, 0.0, 0.0, M[0], N[1], V[1], 0.0, 0.0, 0.0, M[1]]
+    elif('Beam' in elementType):
+        element.getResistingForce()
+        N= getValuesAtNodes(element, 'N')
+        Vy= getValuesAtNodes(element, 'Vy')
+        Vz= getValuesAtNodes(element, 'Vz')
+        T= getValuesAtNodes(element, 'T')
+        My= getValuesAtNodes(element, 'My')
+        Mz= getValuesAtNodes(element, 'Mz')
+        values= [N[0], Vy[0], Vz[0], T[0], My[0], Mz[0], N[1], Vy[1], Vz[1], T[1], My[1], Mz[1]]
+    elif('Truss' in elementType):
+        element.getResistingForce()
+        N= getValuesAtNodes(element, 'N')
+        values= [N[0], 0.0, 0.0, 0.0, 0.0, 0.0, N[1], 0.0, 0.0, 0.0, 0.0, 0.0]
+    elif('ZeroLength' in elementType):
+        element.getResistingForce()
+        F= element.getValuesAtNodes("stress", False)
+        nDOFs= len(F[0]) # Number of degrees of freedom.
+        if(nDOFs!= 6):
+            lmsg.warning('linear superposition for '+str(nDOFs)+ " DOFs in element type: '"+elementType+"' not implemented.")
+            values= list()
+        else:
+            values= list(F[0])+list(F[1])
+    else:
+        lmsg.error("linear superposition error; element type: '"+elementType+"' unknown.")
+    return elementType, isShell, values
+
+def getElementProperties(element, elementType):
+    ''' Return a dictionary containing the element properties that
+        must be written along with its internal forces (steel beams
+        reduction factors, see export_internal_forces module).
+
+    :param element: finite element to read the properties from.
+    :param elementType: type of the element.
+    '''
+    retval= dict()
+    if((('Beam' in elementType) and not ('Beam2d' in elementType)) or ('Truss' in elementType)):
+        for key in ['chiLT', 'chiN']:
+            if(element.hasProp(key)):
+                retval[key]= element.getProp(key)
+    return retval
+
+class LinearSuperposition(object):
+    ''' Obtain the results for each load combination as a linear
+        combination of the results computed (only once) for each of
+        its load patterns. Only valid for linear analysis.
+
+    :ivar elemSet: elements to obtain the internal forces for.
+    :ivar nodSet: nodes to obtain the displacements for.
+    :ivar elemLayout: list of tuples (tag, type, isShell, offset, size)
+                      that locate the response of each element in the
+                      value arrays.
+    :ivar nodeLayout: list of tuples (tag, offset, size) that locate the
+                      displacement of each node in the value arrays.
+    :ivar elemProperties: dictionary containing the properties to write
+                          along with the internal forces of each element
+                          (see getElementProperties).
+    :ivar elemResponses: dictionary containing the array of element
+                         response values for each load pattern.
+    :ivar nodeResponses: dictionary containing the array of node
+                         displacements for each load pattern.
+    '''
+    def __init__(self, elemSet, nodSet):
+        ''' Constructor.
+
+        :param elemSet: elements to obtain the internal forces for.
+        :param nodSet: nodes to obtain the displacements for.
+        '''
+        self.elemSet= elemSet
+        self.nodSet= nodSet
+        self.elemLayout= None
+        self.nodeLayout= None
+        self.elemProperties= dict()
+        self.elemResponses= dict()
+        self.nodeResponses= dict()
+
+    def getLoadPatternNames(self):
+        ''' Return the names of the load patterns already solved.'''
+        return list(self.elemResponses.keys())
+
+    def storeResponses(self, loadPatternName):
+        ''' Store the current response of the model as the response
+            corresponding to the load pattern argument.
+
+        :param loadPatternName: name of the load pattern.
+        '''
+        elemLayout= list()
+        elemValues= list()
+        for e in self.elemSet:
+            elementType, isShell, values= getElementLinearResponse(e)
+            elemProperties= getElementProperties(e, elementType)
+            if(elemProperties):
+                self.elemProperties[e.tag]= elemProperties
+            if(values is None):
+                elemLayout.append((e.tag, elementType, isShell, len(elemValues), None))
+            else:
+                elemLayout.append((e.tag, elementType, isShell, len(elemValues), len(values)))
+                elemValues.extend(values)
+        nodeLayout= list()
+        nodeValues= list()
+        for n in self.nodSet:
+            disp= list(n.getDisp)
+            nodeLayout.append((n.tag, len(nodeValues), len(disp)))
+            nodeValues.extend(disp)
+        if(self.elemLayout is None):
+            self.elemLayout= elemLayout
+            self.nodeLayout= nodeLayout
+        self.elemResponses[loadPatternName]= numpy.array(elemValues)
+        self.nodeResponses[loadPatternName]= numpy.array(nodeValues)
+
+    def computeLoadPatternResponses(self, solutionProcedure, loadPatternNames):
+        ''' Solve each load pattern (if not already solved) and store its
+            response.
+
+        :param solutionProcedure: linear solution procedure (use 
+                                  MultiLoadCaseStaticLinear to factorize
+                                  the stiffness matrix only once).
+        :param loadPatternNames: names of the load patterns to solve.
+        '''
+        pendingNames= list()
+        for name in loadPatternNames:
+            if(not name in self.elemResponses):
+                pendingNames.append(name)
+        solutionProcedure.solveLoadCases(pendingNames, getDisplacements= False, callback= self.storeResponses)
+
+    def getCombinedValues(self, responses, factors):
+        ''' Return the weighted sum of the responses.
+
+        :param responses: dictionary containing the response values for
+                          each load pattern.
+        :param factors: dictionary containing the factor for each load
+                        pattern.
+        '''
+        retval= None
+        for name in factors:
+            if(retval is None):
+                retval= factors[name]*responses[name]
+            else:
+                retval+= factors[name]*responses[name]
+        return retval
+
+    def getInternalForcesDict(self, combName, factors):
+        ''' Return a dictionary with the elements internal forces for the
+            combination (same format as the one returned by
+            export_internal_forces.getInternalForcesDict). The Von Mises
+            stresses of the shell elements are not written since they
+            can't be obtained by linear superposition.
+
+        :param combName: combination name.
+        :param factors: dictionary containing the factor for each load
+                        pattern of the combination.
+        '''
+        values= self.getCombinedValues(self.elemResponses, factors).tolist()
+        outDict= dict()
+        for (tag, elementType, isShell, offset, size) in self.elemLayout:
+            elemDict= dict()
+            outDict[tag]= elemDict
+            elemDict['type']= elementType
+            if(size is not None):
+                v= values[offset:offset+size]
+                internalForcesDict= dict()
+                if(isShell):
+                    shellForces= internal_forces.ShellMaterialInternalForces(*v)
+                    forces= shellForces.getWoodArmer()
+                    for i in range(0,len(forces)):
+                        internalForcesDict[i]= forces[i].getDict()
+                else:
+                    elemProperties= self.elemProperties.get(tag, dict())
+                    for i in range(0,size//6):
+                        forces= internal_forces.CrossSectionInternalForces(*v[6*i:6*i+6])
+                        internalForcesDict[i]= forces.getDict()
+                        internalForcesDict[i].update(elemProperties)
+                elemDict['internalForces']= internalForcesDict
+        return {combName: outDict}
+
+    def getNodeDisplacements(self, factors):
+        ''' Return a list of tuples (nodeTag, displacement vector) with the
+            node displacements for the combination.
+
+        :param factors: dictionary containing the factor for each load
+                        pattern of the combination.
+        '''
+        values= self.getCombinedValues(self.nodeResponses, factors).tolist()
+        retval= list()
+        for (tag, offset, size) in self.nodeLayout:
+            retval.append((tag, xc.Vector(values[offset:offset+size])))
+        return retval
+
+def getCombinationsFactors(loadCombinations):
+    ''' Return a dictionary containing the load pattern factors of each
+        combination in the XC combination handler.
+
+    :param loadCombinations: load combination handler inside the XC solver.
+    '''
+    retval= dict()
+    for key in loadCombinations.getKeys():
+        comb= loadCombinations[key]
+        retval[comb.getName]= combinations.getLoadCaseFactors(comb.getDescomp(''))
+    return retval
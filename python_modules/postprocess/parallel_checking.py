@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+''' Limit state checking distributed among several worker processes.
+    The worst case of each element doesn't depend on the other elements
+    so the elements are split in shards that are checked in parallel. The
+    results are merged in the same order used by the serial checking, so
+    the output files are identical.
+
+    The worker processes are created by forking the current process (they
+    inherit the finite element model), so this module is only available
+    on platforms that support the 'fork' start method.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT), Ana Ortega(AO_O)"
+__copyright__= "Copyright 2020,LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.Ortega@ciccp.es"
+
+import os
+import multiprocessing
+from concurrent import futures
+import xc_base
+import geom
+import xc
+from misc_utils import log_messages as lmsg
+from postprocess import phantom_model as phm
+from postprocess import control_vars as cv
+from postprocess import limit_state_data as lsd
+from postprocess import internal_forces_store
+
+# Data shared with the worker processes (inherited when forking).
+_workerContext= None
+
+def getShards(items, numShards):
+    ''' Split the items in (at most) numShards contiguous chunks.
+
+    :param items: list of items to split.
+    :param numShards: number of chunks.
+    '''
+    numShards= max(1, min(numShards, len(items)))
+    sz= len(items)//numShards
+    remainder= len(items)%numShards
+    retval= list()
+    first= 0
+    for i in range(0, numShards):
+        last= first+sz
+        if(i<remainder):
+            last+= 1
+        retval.append(items[first:last])
+        first= last
+    return retval
+
+def getNumProcesses(numProcesses):
+    ''' Return the number of worker processes to use.
+
+    :param numProcesses: number of processes (if None, use the number
+                         of CPUs).
+    '''
+    retval= numProcesses
+    if(retval is None):
+        retval= os.cpu_count() or 1
+    return retval
+
+def runInWorkers(function, shards, context, numProcesses):
+    ''' Call the function for each shard in a pool of worker processes
+        and return the list of results (in the order of the shards).
+
+    :param function: function to call for each shard.
+    :param shards: arguments of the function calls.
+    :param context: data shared with the worker processes.
+    :param numProcesses: maximum number of worker processes.
+    '''
+    global _workerContext
+    _workerContext= context
+    try:
+        mpContext= multiprocessing.get_context('fork')
+        with futures.ProcessPoolExecutor(max_workers= numProcesses, mp_context= mpContext) as executor:
+            retval= list(executor.map(function, shards))
+    finally:
+        _workerContext= None
+    return retval
+
+def checkRCElements(rcMaterialDistribution, limitStateData, matDiagType, threeDim, elementTags, idCombs, internalForcesValues):
+    ''' Check the sections of the elements argument in a new phantom
+        model. Return a list of (element tag, section index, control var)
+        tuples.
+
+    :param rcMaterialDistribution: reinforced concrete sections on each
+                                   element.
+    :param limitStateData: object that contains the controller to use
+                           for the checking.
+    :param matDiagType: type of the material diagram (d: design,
+           k: characteristic).
+    :param threeDim: true if it's 3D (Fx,Fy,Fz,Mx,My,Mz)
+           false if it's 2D (Fx,Fy,Mz).
+    :param elementTags: tags of the elements to check.
+    :param idCombs: identifiers of the combinations.
+    :param internalForcesValues: dictionary containing the internal 
+                                 forces for each element.
+    '''
+    controller= limitStateData.controller
+    sectionNames= set()
+    for tagElem in elementTags:
+        elementSectionNames= rcMaterialDistribution.getSectionNamesForElement(tagElem)
+        if(elementSectionNames):
+            sectionNames.update(elementSectionNames)
+    feProblem= xc.FEProblem()
+    preprocessor= feProblem.getPreprocessor
+    rcMaterialDistribution.setupSections(preprocessor, limitStateData, matDiagType, threeDim, sectionNames)
+    controller.solutionProcedure= controller.solutionProcedureType(feProblem)
+    phantomModel= phm.PhantomModel(preprocessor, rcMaterialDistribution)
+    elementsInternalForces= dict()
+    for tagElem in elementTags:
+        elementsInternalForces[tagElem]= internalForcesValues[tagElem]
+    phantomModel.setInternalForces(elementTags, idCombs, elementsInternalForces)
+    phantomElements= phantomModel.createPhantomElements(controller)
+    if(getattr(controller,'directCheck',False)):
+        phantomModel.checkInternalForces(controller)
+    else:
+        phantomModel.createLoads(None, controller)
+        phantomModel.check(controller)
+    retval= list()
+    for e in phantomElements:
+        retval.append((e.getProp("idElem"), e.getProp("dir"), e.getProp(controller.limitStateLabel)))
+    feProblem.clearAll()
+    return retval
+
+def checkRCShard(elementTags):
+    ''' Check the sections of the elements argument in a new phantom
+        model (executed by the worker processes). Return a list of
+        (element tag, section index, control var) tuples.
+
+    :param elementTags: tags of the elements to check.
+    '''
+    (rcMaterialDistribution, limitStateData, matDiagType, threeDim, idCombs, internalForcesValues)= _workerContext
+    return checkRCElements(rcMaterialDistribution, limitStateData, matDiagType, threeDim, elementTags, idCombs, internalForcesValues)
+
+def checkRCElementsInWorkers(rcMaterialDistribution, limitStateData, matDiagType, threeDim, elementTags, idCombs, internalForcesValues, numProcesses= None):
+    ''' Check the sections of the elements argument splitting them in
+        shards that are checked by several worker processes (see 
+        checkRCElements). Return a list of (element tag, section index,
+        control var) tuples.
+
+    :param rcMaterialDistribution: reinforced concrete sections on each
+                                   element.
+    :param limitStateData: object that contains the controller to use
+                           for the checking.
+    :param matDiagType: type of the material diagram (d: design,
+           k: characteristic).
+    :param threeDim: true if it's 3D (Fx,Fy,Fz,Mx,My,Mz)
+           false if it's 2D (Fx,Fy,Mz).
+    :param elementTags: tags of the elements to check.
+    :param idCombs: identifiers of the combinations.
+    :param internalForcesValues: dictionary containing the internal 
+                                 forces for each element.
+    :param numProcesses: number of worker processes (if None, use the
+                         number of CPUs).
+    '''
+    shards= getShards(elementTags, getNumProcesses(numProcesses))
+    context= (rcMaterialDistribution, limitStateData, matDiagType, threeDim, idCombs, internalForcesValues)
+    retval= list()
+    for shardRecords in runInWorkers(checkRCShard, shards, context, len(shards)):
+        retval.extend(shardRecords)
+    return retval
+
+def runRCChecking(rcMaterialDistribution, limitStateData, matDiagType, threeDim= True, outputCfg= lsd.VerifOutVars(), numProcesses= None):
+    ''' Check the reinforced concrete sections using several worker
+        processes (each one of them builds its own phantom model with
+        the sections of its elements) and write the results.
+
+    :param rcMaterialDistribution: reinforced concrete sections on each
+                                   element.
+    :param limitStateData: object that contains the name of the file
+                           containing the internal forces obtained for
+                           each element for the combinations analyzed and
+                           the controller to use for the checking.
+    :param matDiagType: type of the material diagram (d: design,
+           k: characteristic).
+    :param threeDim: true if it's 3D (Fx,Fy,Fz,Mx,My,Mz)
+           false if it's 2D (Fx,Fy,Mz).
+    :param outputCfg: instance of class 'VerifOutVars' which defines the
+               variables that control the output of the checking (set of
+               elements to be analyzed, append or not the results to a file,
+               generation or not of lists, ...)
+    :param numProcesses: number of worker processes (if None, use the
+                         number of CPUs).
+    '''
+    retval= None
+    controller= limitStateData.controller
+    if(controller):
+        intForcItems= lsd.readIntForcesFile(limitStateData.getInternalForcesFileName(), outputCfg.setCalc)
+        elementTags= list(intForcItems[0]) # Same order as the serial checking.
+        controlVars= dict()
+        for (tagElem, sectionIndex, controlVar) in checkRCElementsInWorkers(rcMaterialDistribution, limitStateData, matDiagType, threeDim, elementTags, intForcItems[1], intForcItems[2], numProcesses):
+            controlVars[(tagElem, sectionIndex)]= controlVar
+        records= list()
+        for tagElem in elementTags:
+            elementSectionNames= rcMaterialDistribution.getSectionNamesForElement(tagElem)
+            if(elementSectionNames):
+                for i in range(0,len(elementSectionNames)):
+                    sectionIndex= i+1
+                    records.append((tagElem, sectionIndex, controlVars[(tagElem, sectionIndex)]))
+        retval= cv.writeControlVarsFromRecords(controller.limitStateLabel, records, limitStateData.getOutputDataBaseFileName(), outputCfg)
+    else:
+        lmsg.error('runRCChecking: controller not defined.')
+    return retval
+
+def checkSetShard(elementTags):
+    ''' Check the elements argument (executed by the worker processes,
+        that inherit the finite element model). Return a list of
+        (element tag, [(property name, control var),...]) tuples.
+
+    :param elementTags: tags of the elements to check.
+    '''
+    (limitStateData, preprocessor, propNames, intForcFileName)= _workerContext
+    controller= limitStateData.controller
+    shardSet= preprocessor.getSets.defSet('parallelCheckingShard')
+    elementHandler= preprocessor.getElementHandler
+    for tagElem in elementTags:
+        shardSet.elements.append(elementHandler.getElement(tagElem))
+    controller.initControlVars(shardSet)
+    controller.checkSetFromIntForcFile(intForcFileName, shardSet)
+    retval= list()
+    for e in shardSet.elements:
+        retval.append((e.tag, [(propName, e.getProp(propName)) for propName in propNames]))
+    return retval
+
+def checkSetElementsInWorkers(limitStateData, preprocessor, propNames, intForcFileName, elementTags, numProcesses= None):
+    ''' Check the elements argument splitting them in shards that are
+        checked by several worker processes and assign the control
+        variables obtained to the elements (that must be initialized
+        before with controller.initControlVars).
+
+    :param limitStateData: object that contains the controller to use
+                           for the checking.
+    :param preprocessor: preprocessor of the finite element problem.
+    :param propNames: names of the properties that store the control
+                      variables.
+    :param intForcFileName: name of the file containing the internal
+                            forces.
+    :param elementTags: tags of the elements to check.
+    :param numProcesses: number of worker processes (if None, use the
+                         number of CPUs).
+    '''
+    shards= getShards(elementTags, getNumProcesses(numProcesses))
+    # Parse the file only once; the workers inherit the values and
+    # take those of their elements (the columnar store is memory mapped
+    # so each worker reads only its rows).
+    preload= not internal_forces_store.isInternalForcesStore(intForcFileName)
+    if(preload):
+        lsd.preloadIntForcesFile(intForcFileName, getattr(limitStateData.controller, 'vonMisesStressId', 'max_von_mises_stress'))
+    try:
+        shardResults= runInWorkers(checkSetShard, shards, (limitStateData, preprocessor, propNames, intForcFileName), len(shards))
+    finally:
+        if(preload):
+            lsd.releaseIntForcesFile()
+    elementHandler= preprocessor.getElementHandler
+    for shardRecords in shardResults:
+        for (tagElem, controlVars) in shardRecords:
+            e= elementHandler.getElement(tagElem)
+            for (propName, controlVar) in controlVars:
+                e.setProp(propName, controlVar)
+
+def runSetChecking(limitStateData, outputCfg, sections= ['Sect1', 'Sect2'], numProcesses= None):
+    ''' Check the elements of the set (see LimitStateData.runChecking)
+        using several worker processes and write the results.
+
+    :param limitStateData: object that contains the name of the file
+                           containing the internal forces and the
+                           controller to use for the checking.
+    :param outputCfg: instance of class 'VerifOutVars' which defines the
+           variables that control the output of the checking (set of
+           elements to be analyzed, append or not the results to the
+           result file [defatults to 'N'], generation or not
+           of list file [defatults to 'N', ...)
+    :param sections: names of the sections to write the output for.
+    :param numProcesses: number of worker processes (if None, use the
+                         number of CPUs).
+    '''
+    retval= None
+    if outputCfg.setCalc:
+        setCalc= outputCfg.setCalc
+        prep= setCalc.getPreprocessor
+        controller= limitStateData.controller
+        propNames= [controller.limitStateLabel+s for s in sections]
+        elementTags= [e.tag for e in setCalc.elements]
+        controller.initControlVars(setCalc)
+        checkSetElementsInWorkers(limitStateData, prep, propNames, limitStateData.getInternalForcesFileName(), elementTags, numProcesses)
+        retval= cv.writeControlVarsFromElements(controller.limitStateLabel,prep,limitStateData.getOutputDataBaseFileName(),outputCfg, sections)
+    else:
+        lmsg.error("Result file hasn't been created, you must specify a valid set of elements")
+    return retval
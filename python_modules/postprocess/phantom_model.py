@@ -19,6 +19,7 @@ from materials.sections import section_properties
 from postprocess import control_vars as cv
 from solution import predefined_solutions
 from misc_utils import log_messages as lmsg
+from misc import stage_profiler
 from collections import defaultdict
 from postprocess import limit_state_data as lsd
 
@@ -65,9 +66,20 @@ class PhantomModel(object):
                         results are analyzed) 
         '''
         intForcItems=lsd.readIntForcesFile(intForcCombFileName,setCalc)
-        self.elementTags= intForcItems[0]
-        self.idCombs=intForcItems[1]
-        self.internalForcesValues=intForcItems[2]    
+        self.setInternalForces(intForcItems[0],intForcItems[1],intForcItems[2])
+
+    def setInternalForces(self,elementTags,idCombs,internalForcesValues):
+        '''Sets the element and combination identifiers and the internal
+           forces to check.
+
+        :param elementTags: identifiers of the elements to check.
+        :param idCombs: identifiers of the combinations.
+        :param internalForcesValues: dictionary containing the internal 
+                                     forces for each element.
+        '''
+        self.elementTags= elementTags
+        self.idCombs= idCombs
+        self.internalForcesValues= internalForcesValues
 
     def createPhantomElement(self,idElem,sectionName,sectionDefinition,sectionIndex,interactionDiagram,fakeSection):
         '''Creates a phantom element (that represents a section to check) 
@@ -114,7 +126,15 @@ class PhantomModel(object):
                         results are analyzed) 
         '''
         self.setupForElementsAndCombinations(intForcCombFileName,setCalc)
+        return self.createPhantomElements(controller)
+
+    def createPhantomElements(self,controller):
+        '''Creates the phantom model elements for the elements and 
+           combinations already set up.
 
+        :param controller: object that takes the internal forces and the
+                           section definition and checks the limit state.
+        '''
         retval= []
         nodes= self.preprocessor.getNodeHandler
         self.modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
@@ -124,6 +144,7 @@ class PhantomModel(object):
         fkSection= sccFICT.defElasticShearSection3d(self.preprocessor,matSccFICT) # The problem is isostatic, so the section is not a matter
         elements.dimElem= 1
         self.tagsNodesToLoad= defaultdict(list)
+        self.phantomElementIndexes= defaultdict(list)
         if(controller.fakeSection):
             elements.defaultMaterial= sccFICT.sectionName
         for tagElem in self.elementTags:
@@ -139,12 +160,14 @@ class PhantomModel(object):
                         diagInt= mapInteractionDiagrams[sectionName]
           #         print('tagElem =',tagElem,' sectionName=',sectionName,' elSecDef=',elementSectionDefinitions[i],' sectIndex=', i+1,' diagInt=', diagInt)
                     phantomElem= self.createPhantomElement(tagElem,sectionName,elementSectionDefinitions[i],i+1,diagInt,controller.fakeSection)
+                    self.phantomElementIndexes[tagElem].append(len(retval))
                     retval.append(phantomElem)
                     self.tagsNodesToLoad[tagElem].append(phantomElem.getNodes[1].tag) #Node to load
                                                                                       #for this element
             else:
               lmsg.error("Element section names not found for element with tag: "+str(tagElem))
         controller.initControlVars(retval)
+        self.phantomElements= retval
         return retval
 
     def createLoads(self,intForcCombFileName,controller):
@@ -206,6 +229,38 @@ class PhantomModel(object):
             controller.preprocessor=self.preprocessor
             controller.check(elements,key)
 
+    def getInternalForcesArray(self):
+        '''Return the names of the combinations and an array (number of
+        phantom elements x number of combinations x 6) containing the 
+        internal forces [N,Vy,Vz,T,My,Mz] that act on each phantom 
+        element under each combination (the loads that would be applied
+        to its loaded node).
+        '''
+        combNames= sorted(self.idCombs) # Same order as the load patterns.
+        combIndexes= dict()
+        for i, comb in enumerate(combNames):
+            combIndexes[comb]= i
+        retval= numpy.zeros((len(self.phantomElements),len(combNames),6))
+        for key in self.internalForcesValues:
+            elementIndexes= self.phantomElementIndexes[key]
+            if(elementIndexes):
+                for iforce in self.internalForcesValues[key]:
+                    retval[elementIndexes[iforce.idSection],combIndexes[iforce.idComb]]+= iforce.getComponents()
+        return combNames, retval
+
+    def checkInternalForces(self, controller):
+        '''Check the combinations computing the capacity factors directly
+        from the internal forces (the phantom model is not analyzed,
+        its elements are used only to store the results).
+
+        :param controller: object that controls limit state in elements
+                           (must implement the checkInternalForces method).
+        '''
+        combNames, internalForces= self.getInternalForcesArray()
+        if(combNames):
+            controller.preprocessor= self.preprocessor
+            controller.checkInternalForces(self.phantomElements, combNames, internalForces)
+
     def write(self,controller,outputFileName,outputCfg):
         '''Writes results into the output file
 
@@ -234,9 +289,19 @@ class PhantomModel(object):
         intForcCombFileName= limitStateData.getInternalForcesFileName()
         controller= limitStateData.controller
         if(controller):
-            self.build(intForcCombFileName,controller,outputCfg.setCalc)
-            self.check(controller)
-            retval=self.write(controller,limitStateData.getOutputDataBaseFileName(),outputCfg)
+            profiler= stage_profiler.profiler
+            if(getattr(controller,'directCheck',False)):
+                with profiler.stage('PhantomModel.createElements'):
+                    self.createElements(intForcCombFileName,controller,outputCfg.setCalc)
+                with profiler.stage('controller.check'):
+                    self.checkInternalForces(controller)
+            else:
+                with profiler.stage('PhantomModel.build'):
+                    self.build(intForcCombFileName,controller,outputCfg.setCalc)
+                with profiler.stage('controller.check'):
+                    self.check(controller)
+            with profiler.stage('writeControlVars'):
+                retval=self.write(controller,limitStateData.getOutputDataBaseFileName(),outputCfg)
         else:
             lmsg.error('PhantomModel::runChecking controller not defined.')
         return retval
@@ -18,10 +18,10 @@ def installNodeDisplacementRecorder(recorderName, nodeSet):
   recorder= domain.newRecorder(recorderName,None)
   recorder.setNodes(nodeSet.getTags())
   if(nodes.numDOFs==3):
-    recorder.callbackRecord= callback_controls.controlMovModulusUV()
+    recorder.callbackRecordSet= callback_controls.DisplacementModulusControl(2)
   else:
-    recorder.callbackRecord= callback_controls.controlMovModulusUVW()
+    recorder.callbackRecordSet= callback_controls.DisplacementModulusControl(3)
 
-  recorder.callbackRestart= "print \"Restart method called.\""
+  recorder.callbackRestart= callback_controls.fnRestartMessage
   return recorder
 
@@ -282,10 +282,7 @@ class PartToDisplayContainer(dict):
         :param resultToDisplay: collection of results to be displayed.
         '''
         #Load properties to display:
-        fName= resultsToDisplay.limitStateData.getOutputDataFileName()
-        print('******* calling: ', fName)
-        with open(fName) as infile:
-            exec(infile.read())
+        resultsToDisplay.limitStateData.loadOutputData(preprocessor)
         for k in self.keys():
             part= self[k]
             part.display(preprocessor,tp,resultsToDisplay)
@@ -12,7 +12,9 @@ __version__= "3.0"
 __email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
 
 import sys
+import numpy
 import vtk
+from vtk.util import numpy_support
 from misc_utils import log_messages as lmsg
 import xc_base
 from vtk_utils import utils_vtk
@@ -22,6 +24,160 @@ from postprocess.xcVtk.fields import local_axes_vector_field as lavf
 import random as rd 
 import xc
 
+def getSetSignature(xcSet):
+    ''' Return a tuple that identifies the contents of the set: the domain
+        stamp and the tags of its nodes, elements and constraints.
+
+    :param xcSet: XC set.
+    '''
+    geoTag= xcSet.getPreprocessor.getDomain.hasDomainChanged() # updated stamp.
+    nodeTags= numpy.array(list(xcSet.nodes.getTags()), dtype= int)
+    elemTags= numpy.array(list(xcSet.elements.getTags()), dtype= int)
+    constraintTags= numpy.array(list(xcSet.getConstraints.getTags()), dtype= int)
+    return (geoTag, nodeTags.tobytes(), elemTags.tobytes(), constraintTags.tobytes())
+
+class MeshTopology(object):
+    ''' Cells of the VTK grid that represents a set, stored in contiguous
+        arrays so they can be reused by subsequent displays of the same set
+        (only the point coordinates and the scalar values change).
+
+    :ivar signature: contents of the set when the topology was computed
+                     (see getSetSignature).
+    :ivar numberOfPoints: number of nodes of the set.
+    :ivar cellTypes: VTK cell type of each cell.
+    :ivar offsets: position of the first vertex of each cell in the
+                   connectivity array (plus its total length).
+    :ivar connectivity: indexes of the vertices of the cells.
+    '''
+    def __init__(self, signature, numberOfPoints, cellTypes, offsets, connectivity):
+        ''' Constructor.
+
+        :param signature: contents of the set (see getSetSignature).
+        :param numberOfPoints: number of nodes of the set.
+        :param cellTypes: VTK cell type of each cell.
+        :param offsets: position of the first vertex of each cell in the
+                        connectivity array (plus its total length).
+        :param connectivity: indexes of the vertices of the cells.
+        '''
+        self.signature= signature
+        self.numberOfPoints= numberOfPoints
+        self.cellTypes= numpy.asarray(cellTypes, dtype= numpy.uint8)
+        self.offsets= numpy.asarray(offsets, dtype= numpy_support.ID_TYPE_CODE)
+        self.connectivity= numpy.asarray(connectivity, dtype= numpy_support.ID_TYPE_CODE)
+        self.vtkCellTypes= None
+        self.vtkCells= None
+        self.vtkCellLocations= None
+
+    @staticmethod
+    def fromSet(xcSet, signature= None):
+        ''' Compute the topology of the grid from the elements and
+            constraints of the set (the set must be numerated).
+
+        :param xcSet: XC set.
+        :param signature: contents of the set (if None it's computed).
+        '''
+        if(signature is None):
+            signature= getSetSignature(xcSet)
+        cellTypes= list()
+        cellVertices= list()
+        for e in xcSet.elements:
+            cellType= e.getVtkCellType
+            if(cellType!= vtk.VTK_VERTEX):
+                cellTypes.append(cellType)
+                cellVertices.append(xc_base.vector_int_to_py_list(e.getIdxNodes))
+        for c in xcSet.getConstraints:
+            if(hasattr(c,'getIdxNodes')):
+                cellType= c.getVtkCellType
+                if(cellType!= vtk.VTK_VERTEX):
+                    cellTypes.append(cellType)
+                    cellVertices.append(xc_base.vector_int_to_py_list(c.getIdxNodes))
+        offsets= numpy.zeros(len(cellVertices)+1, dtype= int)
+        offsets[1:]= numpy.cumsum([len(v) for v in cellVertices], dtype= int)
+        connectivity= [i for v in cellVertices for i in v]
+        return MeshTopology(signature, len(xcSet.nodes), cellTypes, offsets, connectivity)
+
+    def getNumberOfCells(self):
+        ''' Return the number of cells.'''
+        return len(self.cellTypes)
+
+    def getLegacyCellArray(self):
+        ''' Return the cells in the legacy VTK layout (number of vertices
+            of each cell followed by their indexes).'''
+        numVertices= numpy.diff(self.offsets)
+        retval= numpy.empty(len(self.connectivity)+len(numVertices), dtype= self.connectivity.dtype)
+        positions= self.offsets[:-1]+numpy.arange(len(numVertices))
+        retval[positions]= numVertices
+        mask= numpy.ones(len(retval), dtype= bool)
+        mask[positions]= False
+        retval[mask]= self.connectivity
+        return retval
+
+    def createVtkCells(self):
+        ''' Create the VTK arrays that define the cells (shared by all the
+            grids that use this topology).'''
+        self.vtkCellTypes= numpy_support.numpy_to_vtk(self.cellTypes, deep= 1, array_type= vtk.VTK_UNSIGNED_CHAR)
+        self.vtkCells= vtk.vtkCellArray()
+        if(vtk.vtkVersion.GetVTKMajorVersion()>=9):
+            self.vtkCells.SetData(numpy_support.numpy_to_vtkIdTypeArray(self.offsets, deep= 1), numpy_support.numpy_to_vtkIdTypeArray(self.connectivity, deep= 1))
+        else:
+            self.vtkCells.SetCells(self.getNumberOfCells(), numpy_support.numpy_to_vtkIdTypeArray(self.getLegacyCellArray(), deep= 1))
+            locations= self.offsets[:-1]+numpy.arange(self.getNumberOfCells(), dtype= self.offsets.dtype)
+            self.vtkCellLocations= numpy_support.numpy_to_vtkIdTypeArray(locations, deep= 1)
+
+    def setupOnGrid(self, uGrid):
+        ''' Assign the cells to the grid argument.
+
+        :param uGrid: vtkUnstructuredGrid.
+        '''
+        if(self.getNumberOfCells()>0):
+            if(self.vtkCells is None):
+                self.createVtkCells()
+            if(self.vtkCellLocations is None):
+                uGrid.SetCells(self.vtkCellTypes, self.vtkCells)
+            else:
+                uGrid.SetCells(self.vtkCellTypes, self.vtkCellLocations, self.vtkCells)
+
+# Topologies of the displayed sets (indexed by set name).
+meshTopologyCache= dict()
+
+def getMeshTopology(xcSet):
+    ''' Return the topology of the grid that represents the set, reusing
+        the one computed in a previous display if the set has not changed
+        since (the set must be numerated).
+
+    :param xcSet: XC set.
+    '''
+    signature= getSetSignature(xcSet)
+    retval= meshTopologyCache.get(xcSet.name, None)
+    if((retval is None) or (retval.signature!=signature)):
+        retval= MeshTopology.fromSet(xcSet, signature)
+        meshTopologyCache[xcSet.name]= retval
+    return retval
+
+def clearMeshTopologyCache():
+    ''' Remove the stored topologies (i.e. after remeshing the model
+        without changing the tags of the nodes and elements).'''
+    meshTopologyCache.clear()
+
+def getNodesPositions(nodeSet, defFScale= 0.0, eigenMode= None):
+    ''' Return an array (number of nodes x 3) with the display positions
+        of the nodes.
+
+    :param nodeSet: nodes to display.
+    :param defFScale: factor to apply to the displacement (or the
+                      eigenvector) of the nodes.
+    :param eigenMode: eigenvibration mode to display (if None use the
+                      current displacements).
+    '''
+    retval= numpy.zeros((len(nodeSet), 3))
+    for n in nodeSet:
+        if eigenMode==None:
+            pos= n.getCurrentPos3d(defFScale)
+        else:
+            pos= n.getEigenPos3d(defFScale,eigenMode)
+        retval[n.getIdx]= (pos.x, pos.y, pos.z)
+    return retval
+
 class DisplaySettingsFE(vtk_graphic_base.DisplaySettings):
     ''' Define the parameters to configure the output for
         displaying the finite element mesh.
@@ -103,9 +259,7 @@ class DisplaySettingsFE(vtk_graphic_base.DisplaySettings):
                           Defaults to None: no modal analysis.
         '''
         # Define grid
-        self.nodes= vtk.vtkPoints()
         self.gridRecord.uGrid= vtk.vtkUnstructuredGrid()
-        self.gridRecord.uGrid.SetPoints(self.nodes)
         eSet= self.gridRecord.xcSet
         eSet.numerate()
         self.gridRecord.uGrid.name= eSet.name+'_grid'
@@ -115,32 +269,13 @@ class DisplaySettingsFE(vtk_graphic_base.DisplaySettings):
             arr= field.fillArray(nodeSet)
             field.creaLookUpTable()      
         # Load nodes in vtk
-        if eigenMode==None:
-            for n in nodeSet:
-                pos= n.getCurrentPos3d(defFScale)
-                self.nodes.InsertPoint(n.getIdx,pos.x,pos.y,pos.z)
-        else:
-            for n in nodeSet:
-                pos= n.getEigenPos3d(defFScale,eigenMode)
-                self.nodes.InsertPoint(n.getIdx,pos.x,pos.y,pos.z)
-         # Load elements in vtk
-        setElems= eSet.elements
-        for e in setElems:
-            vertices= xc_base.vector_int_to_py_list(e.getIdxNodes)
-            vtx= vtk.vtkIdList()
-            for vIndex in vertices:
-                vtx.InsertNextId(vIndex)
-            if(e.getVtkCellType!= vtk.VTK_VERTEX):
-                self.gridRecord.uGrid.InsertNextCell(e.getVtkCellType,vtx)
-        setConstraints= eSet.getConstraints
-        for c in setConstraints:
-            if(hasattr(c,'getIdxNodes')):
-                vertices= xc_base.vector_int_to_py_list(c.getIdxNodes)
-                vtx= vtk.vtkIdList()
-                for vIndex in vertices:
-                    vtx.InsertNextId(vIndex)
-                if(c.getVtkCellType!= vtk.VTK_VERTEX):
-                    self.gridRecord.uGrid.InsertNextCell(c.getVtkCellType,vtx)
+        self.nodes= vtk.vtkPoints()
+        positions= getNodesPositions(nodeSet, defFScale, eigenMode)
+        self.nodes.SetData(numpy_support.numpy_to_vtk(positions, deep= 1))
+        self.gridRecord.uGrid.SetPoints(self.nodes)
+        # Load elements and constraints in vtk
+        meshTopology= getMeshTopology(eSet)
+        meshTopology.setupOnGrid(self.gridRecord.uGrid)
 
     def defineMeshScene(self, field: fields.ScalarField, defFScale= 0.0, eigenMode= None, color= xc.Vector([rd.random(),rd.random(),rd.random()])):
         '''Define the scene for the mesh
@@ -11,7 +11,9 @@ __version__= "3.0"
 __email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
 
 
+import numpy
 import vtk
+from vtk.util import numpy_support
 from misc_utils import log_messages as lmsg
 from postprocess.xcVtk.fields import field_base as fb
 from postprocess import extrapolate_elem_attr
@@ -39,37 +41,54 @@ class ScalarField(fb.FieldBase):
             self.rgMinMax= None
         self.arr= None
 
+    def getNodeValue(self, n):
+        '''Return the value of the field at the node argument.
+
+        :param n: node.
+        '''
+        attr= getattr(n,self.attrName)
+        tmp= None
+        if hasattr(attr,"__getitem__"):
+            tmp= attr[self.attrComponent]
+        elif callable(attr):
+            if(attr.__name__!='getProp'):
+                tmp= attr(self.name)
+            elif(n.hasProp(self.name)):
+                tmp= attr(self.name)
+            else:
+                tmp= 0.0
+        else:
+            tmp= attr
+        if(hasattr(tmp,"__getitem__")):
+            tmp= tmp[self.attrComponent]
+        return tmp
+
+    def getNodeValues(self, nodeSet):
+        '''Return an array with the values of the field at the nodes
+           (sorted by its index, see getIdx).
+
+        :param nodeSet: nodes of the set to display (already numerated).
+        '''
+        retval= numpy.zeros(len(nodeSet))
+        for n in nodeSet:
+            retval[n.getIdx]= self.getNodeValue(n)
+        return retval
+
     def fillArray(self, nodeSet):
         '''Creates an vtkDoubleArray filled with the proper values.
 
         '''
         # Scalar values.
-        self.arr= vtk.vtkDoubleArray()
-        self.arr.SetName(self.name)
-        self.arr.SetNumberOfTuples(len(nodeSet))
-        self.arr.SetNumberOfComponents(1)
-        for n in nodeSet:
-            attr= getattr(n,self.attrName)
-            tmp= None
-            if hasattr(attr,"__getitem__"):
-                tmp= attr[self.attrComponent]
-            elif callable(attr):
-                if(attr.__name__!='getProp'):
-                    tmp= attr(self.name)
-                elif(n.hasProp(self.name)):
-                    tmp= attr(self.name)
-                else:
-                    tmp= 0.0
-            else:
-                tmp= attr
-            if(hasattr(tmp,"__getitem__")):
-                tmp= tmp[self.attrComponent]
-            tmp*= self.fUnitConv
+        values= self.getNodeValues(nodeSet)*self.fUnitConv
+        if(len(values)>0):
             if not(self.rgMinMax):
-                self.updateMinMax(tmp)
+                self.updateMinMax(values.min())
+                self.updateMinMax(values.max())
             else:
-                self.updateMinMaxWithinRange(tmp,self.rgMinMax)
-            self.arr.SetTuple1(n.getIdx,tmp)
+                self.updateMinMaxWithinRange(values.min(),self.rgMinMax)
+                self.updateMinMaxWithinRange(values.max(),self.rgMinMax)
+        self.arr= numpy_support.numpy_to_vtk(values, deep= 1, array_type= vtk.VTK_DOUBLE)
+        self.arr.SetName(self.name)
         return self.arr
 
     def setupOnGrid(self,uGrid):
@@ -92,9 +111,45 @@ class ExtrapolatedScalarField(ScalarField):
               less than vmin are displayed in blue and those greater than vmax 
               in red (defaults to None)
   '''
-  def __init__(self,name, functionName, xcSet, component= None, fUnitConv= 1.0,rgMinMax=None):
+  def __init__(self,name, functionName, xcSet, component= None, fUnitConv= 1.0,rgMinMax=None, nodeTags= None, nodeValues= None):
     super(ExtrapolatedScalarField,self).__init__(name,functionName,component,fUnitConv,rgMinMax)
     self.xcSet= xcSet
+    self.setNodeValues(nodeTags, nodeValues)
+
+  def setNodeValues(self, nodeTags, nodeValues):
+    '''Assign the values of the field at the nodes (if None the values
+       are read from the nodes using the function name).
+
+    :param nodeTags: tags of the nodes.
+    :param nodeValues: values of the field at those nodes.
+    '''
+    self.nodeTags= None
+    self.nodeValues= None
+    if(nodeTags is not None):
+      self.nodeTags= numpy.asarray(nodeTags, dtype= int)
+      self.nodeValues= numpy.asarray(nodeValues, dtype= float)
+
+  def getNodeValues(self, nodeSet):
+    '''Return an array with the values of the field at the nodes
+       (sorted by its index, see getIdx).
+
+    :param nodeSet: nodes of the set to display (already numerated).
+    '''
+    if(self.nodeValues is None):
+      return super(ExtrapolatedScalarField,self).getNodeValues(nodeSet)
+    retval= numpy.zeros(len(nodeSet))
+    if(len(self.nodeTags)>0):
+      order= numpy.argsort(self.nodeTags)
+      sortedTags= self.nodeTags[order]
+      setTags= numpy.zeros(len(nodeSet), dtype= int)
+      setIndexes= numpy.zeros(len(nodeSet), dtype= int)
+      for i, n in enumerate(nodeSet):
+        setTags[i]= n.tag
+        setIndexes[i]= n.getIdx
+      positions= numpy.minimum(numpy.searchsorted(sortedTags, setTags), len(sortedTags)-1)
+      found= (sortedTags[positions]==setTags)
+      retval[setIndexes[found]]= self.nodeValues[order[positions[found]]]
+    return retval
 
   def display(self,displaySettings,caption= '',fileName= None, defFScale=0.0):
     '''Display the scalar field graphic.
@@ -139,5 +194,6 @@ def getScalarFieldFromControlVar(attributeName,argument,xcSet,component,fUnitCon
        :param component: component of the control var to represent.
        :param fUnitConv: unit conversion factor (i.e N->kN => fUnitConv= 1e-3).
     '''
-    nodePropName= cv.extrapolate_control_var(xcSet,attributeName,argument)
-    return ExtrapolatedScalarField(nodePropName,"getProp",xcSet,component,fUnitConv,rgMinMax)
+    nodePropName= attributeName+'_'+argument
+    nodeTags, nodeValues= cv.get_control_var_node_values(xcSet,attributeName,argument)
+    return ExtrapolatedScalarField(nodePropName,"getProp",xcSet,component,fUnitConv,rgMinMax, nodeTags= nodeTags, nodeValues= nodeValues)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+''' Cache of the solutions of the eigenvalue problems (frequency
+    analysis, zero energy modes, ill-conditioning analysis). The
+    eigenpairs and the modal masses (see modal_basis module) are written
+    in a compressed binary file whose name is obtained from a
+    fingerprint of the stiffness and mass of the model. When the model
+    doesn't change the eigenpairs are read from that file (and copied
+    to the domain) instead of solving the eigenvalue problem again, so
+    parametric studies (spectrum, damping, direction of the action,...)
+    don't pay for the eigen solution on each run:
+
+      solProc= predefined_solutions.FrequencyAnalysis(feProblem)
+      modalBasis= solProc.solveEigenProblem(numModes= 10, cacheDirectory= '/tmp/eigen_cache')
+'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com, ana.ortega.ort@gmail.com"
+
+import os
+import hashlib
+import numpy
+import xc
+from misc_utils import log_messages as lmsg
+from misc import stage_profiler
+from solution import modal_basis
+
+cacheFormatVersion= 1
+
+def getMatrixArray(m):
+    ''' Return the values of the matrix as a numpy array (row by row,
+        faster than reading them one by one).
+
+    :param m: XC matrix.
+    '''
+    return numpy.array([list(m.getRow(i)) for i in range(0, m.noRows)], dtype= float)
+
+def getModelFingerprint(preprocessor, xcSet= None, extraData= None):
+    ''' Return a hash of the data that define the stiffness and mass
+        matrices of the model: node coordinates and masses, element
+        connectivity, tangent stiffness and mass matrices, and
+        constraints.
+
+    :param preprocessor: preprocessor of the finite element problem.
+    :param xcSet: set with the nodes and elements of the model (defaults
+                  to the total set).
+    :param extraData: other data that define the solution (type of
+                      analysis, number of modes,...).
+    '''
+    if(xcSet is None):
+        xcSet= preprocessor.getSets.getSet('total')
+    h= hashlib.sha256()
+    h.update(repr((cacheFormatVersion, extraData)).encode('utf-8'))
+    for n in xcSet.nodes:
+        h.update(repr((n.tag, n.getNumberDOF, [x for x in n.getCoo])).encode('utf-8'))
+        h.update(getMatrixArray(n.mass).tobytes())
+    for e in xcSet.elements:
+        h.update(repr((e.tag, e.type(), [tag for tag in e.getNodes.getExternalNodes])).encode('utf-8'))
+        h.update(getMatrixArray(e.getTangentStiff()).tobytes())
+        h.update(getMatrixArray(e.getMass()).tobytes())
+    constraints= preprocessor.getDomain.getConstraints
+    singlePointConstraints= list()
+    spIter= constraints.getSPs
+    sp= spIter.next()
+    while sp:
+        singlePointConstraints.append((sp.nodeTag, sp.getDOFNumber))
+        sp= spIter.next()
+    h.update(repr((sorted(singlePointConstraints), constraints.getNumMPs(), constraints.getNumMRMPs())).encode('utf-8'))
+    return h.hexdigest()
+
+def getSolutionFingerprint(solutionProcedure, numModes, xcSet= None):
+    ''' Return the fingerprint of the model and the solution
+        procedure: type of analysis, number of modes and solver
+        settings (see getModelFingerprint).
+
+    :param solutionProcedure: eigenvalue solution procedure
+                              (FrequencyAnalysis, ZeroEnergyModes,...).
+    :param numModes: number of modes to compute.
+    :param xcSet: set with all the nodes and elements of the model
+                  (defaults to the total set).
+    '''
+    extraData= (type(solutionProcedure).__name__, numModes, solutionProcedure.getEigenSolverSettings())
+    return getModelFingerprint(solutionProcedure.feProblem.getPreprocessor, xcSet, extraData)
+
+def getCacheFileName(cacheDirectory, fingerprint):
+    ''' Return the name of the file that stores the eigenpairs of
+        the model.
+
+    :param cacheDirectory: directory that contains the cached solutions.
+    :param fingerprint: fingerprint of the model (see getModelFingerprint).
+    '''
+    return os.path.join(cacheDirectory, 'eigen_'+fingerprint[:32]+'.npz')
+
+def setDomainEigenpairs(preprocessor, modalBasis, eigenvalues):
+    ''' Copy the eigenvalues and the eigenvectors to the domain (as the
+        eigenvalue analysis does).
+
+    :param preprocessor: preprocessor of the finite element problem.
+    :param modalBasis: modal basis containing the eigenvectors.
+    :param eigenvalues: eigenvalues.
+    '''
+    numModes= modalBasis.getNumModes()
+    nodeHandler= preprocessor.getNodeHandler
+    for i, tag in enumerate(modalBasis.nodeTags.tolist()):
+        n= nodeHandler.getNode(tag)
+        nDOF= modalBasis.numDOFs[i]
+        n.setNumEigenvectors(numModes)
+        for k in range(0, numModes):
+            n.setEigenvector(k+1, xc.Vector(modalBasis.eigenvectors[k,i,:nDOF].tolist()))
+    preprocessor.getDomain.setEigenvalues(xc.Vector([float(v) for v in eigenvalues]))
+
+def loadEigenSolution(fileName, fingerprint):
+    ''' Return the modal basis and the eigenvalues stored in the file
+        (None if the file doesn't exist or doesn't correspond to the
+        fingerprint).
+
+    :param fileName: name of the cache file.
+    :param fingerprint: fingerprint of the model.
+    '''
+    retval= None
+    if(os.path.exists(fileName)):
+        try:
+            modalBasis, arrays= modal_basis.ModalBasis.load(fileName)
+            if(str(arrays['fingerprint'])==fingerprint):
+                retval= (modalBasis, arrays['eigenvalues'])
+        except (IOError, OSError, KeyError, ValueError) as e:
+            lmsg.warning('loadEigenSolution; cache file: '+fileName+' ignored: '+str(e))
+    return retval
+
+def solveEigenProblem(solutionProcedure, numModes, cacheDirectory= None, xcSet= None):
+    ''' Compute the first modes of the eigenvalue problem and return the
+        modal basis (see modal_basis module). If a cache directory is
+        given and it contains the solution for the same model it is read
+        from there (and copied to the domain) instead.
+
+    :param solutionProcedure: eigenvalue solution procedure
+                              (FrequencyAnalysis, ZeroEnergyModes,...).
+    :param numModes: number of modes to compute.
+    :param cacheDirectory: directory that contains the cached solutions
+                           (if None, the solution is not cached).
+    :param xcSet: set with all the nodes and elements of the model
+                  (defaults to the total set).
+    '''
+    profiler= stage_profiler.profiler
+    preprocessor= solutionProcedure.feProblem.getPreprocessor
+    if(cacheDirectory):
+        with profiler.stage('eigenFingerprint'):
+            fingerprint= getSolutionFingerprint(solutionProcedure, numModes, xcSet)
+        fileName= getCacheFileName(cacheDirectory, fingerprint)
+        cached= loadEigenSolution(fileName, fingerprint)
+        if(cached):
+            modalBasis, eigenvalues= cached
+            setDomainEigenpairs(preprocessor, modalBasis, eigenvalues)
+            profiler.count('eigenCacheHits')
+            return modalBasis
+    with profiler.stage('eigenSolve', numModes= numModes):
+        result= solutionProcedure.analysis.analyze(numModes)
+    profiler.count('eigenSolutions')
+    if(result!=0):
+        lmsg.error('solveEigenProblem; the eigenvalue analysis failed.')
+        return None
+    retval= modal_basis.getModalBasis(preprocessor, xcSet)
+    if(cacheDirectory):
+        if(not os.path.exists(cacheDirectory)):
+            os.makedirs(cacheDirectory)
+        eigenvalues= numpy.array([v for v in preprocessor.getDomain.getEigenvalues()])
+        retval.save(fileName, fingerprint= numpy.array(fingerprint), eigenvalues= eigenvalues)
+    return retval
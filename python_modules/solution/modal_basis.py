@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+''' Modal basis of the model: eigenvectors stored as arrays together with
+    the modal quantities derived from them (generalized masses, modal
+    participation factors, effective modal masses,...) and the internal
+    forces of the elements for each mode. Use it after the computation
+    of the eigenmodes (see FrequencyAnalysis in predefined_solutions).'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com, ana.ortega.ort@gmail.com"
+
+import os
+import math
+import numpy
+import xc
+from misc import matrix_utils
+from misc import stage_profiler
+from postprocess import internal_forces_extractor
+
+class MassMatrix(object):
+    ''' Mass matrix of the model stored as the mass matrices of the nodes
+        and the elements (the global matrix is never assembled).
+
+    :ivar numNodes: number of nodes.
+    :ivar maxDOF: maximum number of degrees of freedom of the nodes.
+    :ivar nodeMasses: array (number of nodes x maxDOF x maxDOF) with
+                      the mass matrices of the nodes.
+    :ivar elementMasses: list of (dofs indexes, mass matrix) tuples for
+                         the elements with mass, the indexes refer to
+                         the flattened (number of nodes x maxDOF)
+                         displacement arrays.
+    '''
+    def __init__(self, numNodes, maxDOF):
+        ''' Constructor.
+
+        :param numNodes: number of nodes.
+        :param maxDOF: maximum number of degrees of freedom of the nodes.
+        '''
+        self.numNodes= numNodes
+        self.maxDOF= maxDOF
+        self.nodeMasses= numpy.zeros((numNodes, maxDOF, maxDOF))
+        self.elementMasses= list()
+
+    def getProducts(self, U, V):
+        ''' Return the array (a x b) of products U_i^T M V_j.
+
+        :param U: array (a x number of nodes x maxDOF).
+        :param V: array (b x number of nodes x maxDOF).
+        '''
+        retval= numpy.einsum('anr,nrs,bns->ab', U, self.nodeMasses, V)
+        if(self.elementMasses):
+            Uf= U.reshape(U.shape[0],-1)
+            Vf= V.reshape(V.shape[0],-1)
+            for (dofs, mass) in self.elementMasses:
+                retval+= numpy.einsum('ar,rs,bs->ab', Uf[:,dofs], mass, Vf[:,dofs])
+        return retval
+
+class ModalBasis(object):
+    ''' Eigenmodes of the model as arrays.
+
+    :ivar nodeTags: array with the tags of the nodes.
+    :ivar numDOFs: array with the number of degrees of freedom of each node.
+    :ivar dimSpace: dimension of the space (2 or 3).
+    :ivar angularFrequencies: array with the angular frequency of each mode.
+    :ivar eigenvectors: array (number of modes x number of nodes x maxDOF)
+                        with the eigenvectors (zero for the DOFs that the
+                        node doesn't have).
+    :ivar generalizedMasses: array with the generalized mass of each
+                             mode (phi^T M phi).
+    :ivar modalExcitations: array (number of modes x dimSpace) with the
+                            modal excitation factors of each mode on
+                            each direction (phi^T M r).
+    :ivar totalMasses: array with the total mass on each direction
+                       (r^T M r).
+    '''
+    def __init__(self, nodeTags, numDOFs, dimSpace, angularFrequencies, eigenvectors, generalizedMasses, modalExcitations, totalMasses):
+        ''' Constructor.
+
+        :param nodeTags: tags of the nodes.
+        :param numDOFs: number of degrees of freedom of each node.
+        :param dimSpace: dimension of the space (2 or 3).
+        :param angularFrequencies: angular frequency of each mode.
+        :param eigenvectors: eigenvectors (number of modes x number of nodes x maxDOF).
+        :param generalizedMasses: generalized mass of each mode.
+        :param modalExcitations: modal excitation factors (number of modes x dimSpace).
+        :param totalMasses: total mass on each direction.
+        '''
+        self.nodeTags= numpy.asarray(nodeTags, dtype= int)
+        self.numDOFs= numpy.asarray(numDOFs, dtype= int)
+        self.dimSpace= dimSpace
+        self.angularFrequencies= numpy.asarray(angularFrequencies, dtype= float)
+        self.eigenvectors= numpy.asarray(eigenvectors, dtype= float)
+        self.generalizedMasses= numpy.asarray(generalizedMasses, dtype= float)
+        self.modalExcitations= numpy.asarray(modalExcitations, dtype= float)
+        self.totalMasses= numpy.asarray(totalMasses, dtype= float)
+
+    def getNumModes(self):
+        ''' Return the number of modes.'''
+        return len(self.angularFrequencies)
+
+    def getNodeIndexes(self):
+        ''' Return a dictionary containing the row index of each node.'''
+        return dict((tag, i) for i, tag in enumerate(self.nodeTags.tolist()))
+
+    def getPeriods(self):
+        ''' Return the periods of the modes.'''
+        return 2.0*math.pi/self.angularFrequencies
+
+    def getFrequencies(self):
+        ''' Return the frequencies of the modes.'''
+        return self.angularFrequencies/(2.0*math.pi)
+
+    def getModalParticipationFactors(self):
+        ''' Return the array (number of modes x dimSpace) with the modal
+            participation factors of each mode on each direction.'''
+        return self.modalExcitations/self.generalizedMasses[:,numpy.newaxis]
+
+    def getEffectiveModalMasses(self):
+        ''' Return the array (number of modes x dimSpace) with the
+            effective modal masses of each mode on each direction.'''
+        return self.modalExcitations**2/self.generalizedMasses[:,numpy.newaxis]
+
+    def getEffectiveModalMassRatios(self):
+        ''' Return the array (number of modes x dimSpace) with the ratio
+            between the effective modal mass and the total mass for each
+            mode and direction.'''
+        totalMasses= numpy.where(self.totalMasses>0.0, self.totalMasses, 1.0)
+        return self.getEffectiveModalMasses()/totalMasses
+
+    def getArrays(self):
+        ''' Return a dictionary containing the arrays that define the
+            modal basis.'''
+        return {'nodeTags': self.nodeTags, 'numDOFs': self.numDOFs, 'dimSpace': numpy.array(self.dimSpace), 'angularFrequencies': self.angularFrequencies, 'eigenvectors': self.eigenvectors, 'generalizedMasses': self.generalizedMasses, 'modalExcitations': self.modalExcitations, 'totalMasses': self.totalMasses}
+
+    def save(self, fileName, **extraArrays):
+        ''' Write the modal basis in a compressed binary (.npz) file (the
+            file is replaced at once so readers never see a partially
+            written file).
+
+        :param fileName: name of the output file.
+        :param extraArrays: other arrays to write in the file.
+        '''
+        arrays= self.getArrays()
+        arrays.update(extraArrays)
+        tmpFileName= fileName+'.tmp'
+        with open(tmpFileName, 'wb') as f:
+            numpy.savez_compressed(f, **arrays)
+        os.replace(tmpFileName, fileName)
+
+    @staticmethod
+    def load(fileName):
+        ''' Read the modal basis from the file and return it along with
+            a dictionary containing the other arrays stored in the file.
+
+        :param fileName: name of the input file.
+        '''
+        with numpy.load(fileName) as data:
+            arrays= dict((name, data[name]) for name in data.files)
+        retval= ModalBasis(arrays.pop('nodeTags'), arrays.pop('numDOFs'), int(arrays.pop('dimSpace')), arrays.pop('angularFrequencies'), arrays.pop('eigenvectors'), arrays.pop('generalizedMasses'), arrays.pop('modalExcitations'), arrays.pop('totalMasses'))
+        return retval, arrays
+
+    def getNodeEigenvectors(self, tag):
+        ''' Return the array (number of modes x number of DOFs) with the
+            eigenvectors at the node.
+
+        :param tag: node identifier.
+        '''
+        i= self.getNodeIndexes()[tag]
+        return self.eigenvectors[:, i, :self.numDOFs[i]]
+
+def getTranslationalDOFs(dimSpace, numDOF):
+    ''' Return the number of translational degrees of freedom of the node.
+
+    :param dimSpace: dimension of the space.
+    :param numDOF: number of degrees of freedom of the node.
+    '''
+    return min(dimSpace, numDOF)
+
+def getMassMatrix(xcSet, nodeIndexes, maxDOF, numDOFs):
+    ''' Return the mass matrix (see MassMatrix) of the nodes and elements
+        of the set.
+
+    :param xcSet: set with the nodes and elements of the model.
+    :param nodeIndexes: dictionary containing the row index of each node.
+    :param maxDOF: maximum number of degrees of freedom of the nodes.
+    :param numDOFs: number of degrees of freedom of each node.
+    '''
+    retval= MassMatrix(len(nodeIndexes), maxDOF)
+    for n in xcSet.nodes:
+        i= nodeIndexes[n.tag]
+        nDOF= numDOFs[i]
+        mass= n.mass
+        if(mass.noRows==nDOF):
+            retval.nodeMasses[i,:nDOF,:nDOF]= matrix_utils.matrixToNumpyArray(mass)
+    for e in xcSet.elements:
+        mass= e.getMass()
+        if(mass.noRows>0 and mass.Norm()>0.0):
+            dofs= list()
+            for tag in e.getNodes.getExternalNodes:
+                i= nodeIndexes[tag]
+                dofs.extend(range(i*maxDOF, i*maxDOF+numDOFs[i]))
+            retval.elementMasses.append((numpy.array(dofs, dtype= int), matrix_utils.matrixToNumpyArray(mass)))
+    return retval
+
+def getModalBasis(preprocessor, xcSet= None):
+    ''' Return the modal basis of the model from the eigenmodes stored
+        in the domain (the eigenvalue problem must be solved before).
+
+    :param preprocessor: preprocessor of the finite element problem.
+    :param xcSet: set with all the nodes and elements with mass (defaults
+                  to the total set).
+    '''
+    profiler= stage_profiler.profiler
+    with profiler.stage('getModalBasis'):
+        if(xcSet is None):
+            xcSet= preprocessor.getSets.getSet('total')
+        domain= preprocessor.getDomain
+        angularFrequencies= numpy.array([w for w in domain.getAngularFrequencies()])
+        numModes= len(angularFrequencies)
+        nodes= [n for n in xcSet.nodes]
+        nodeTags= [n.tag for n in nodes]
+        nodeIndexes= dict((tag, i) for i, tag in enumerate(nodeTags))
+        numDOFs= numpy.array([n.getNumberDOF for n in nodes], dtype= int)
+        maxDOF= int(numDOFs.max()) if(len(nodes)>0) else 0
+        dimSpace= max([len(n.getCoo) for n in nodes]+[1])
+        # Eigenvectors.
+        eigenvectors= numpy.zeros((numModes, len(nodes), maxDOF))
+        for i, n in enumerate(nodes):
+            nDOF= numDOFs[i]
+            for k in range(0, numModes):
+                v= n.getEigenvector(k+1)
+                eigenvectors[k,i,:nDOF]= [v[j] for j in range(0,nDOF)]
+        # Influence vectors (unit rigid body translation on each direction).
+        influence= numpy.zeros((dimSpace, len(nodes), maxDOF))
+        for i, nDOF in enumerate(numDOFs):
+            for d in range(0, getTranslationalDOFs(dimSpace, nDOF)):
+                influence[d,i,d]= 1.0
+        mass= getMassMatrix(xcSet, nodeIndexes, maxDOF, numDOFs)
+        generalizedMasses= numpy.diagonal(mass.getProducts(eigenvectors, eigenvectors)).copy()
+        modalExcitations= mass.getProducts(eigenvectors, influence)
+        totalMasses= numpy.diagonal(mass.getProducts(influence, influence)).copy()
+        profiler.count('modes', numModes)
+    return ModalBasis(nodeTags, numDOFs, dimSpace, angularFrequencies, eigenvectors, generalizedMasses, modalExcitations, totalMasses)
+
+class ModalInternalForces(object):
+    ''' Internal forces of the elements for each mode (the
+        displacements of the nodes are equal to the eigenvector).
+
+    :ivar extractor: object used to extract the internal forces (see
+                     internal_forces_extractor module).
+    :ivar elementTags: dictionary containing the tags of the elements
+                       of each family.
+    :ivar modalForces: dictionary containing for each family an array
+                       (number of modes x number of elements x ...) with
+                       the internal forces of each mode (for the shells
+                       the average internal forces returned by
+                       SetInternalForcesExtractor.getShellForces).
+    '''
+    def __init__(self, extractor, elementTags, modalForces):
+        ''' Constructor.
+
+        :param extractor: object used to extract the internal forces.
+        :param elementTags: tags of the elements of each family.
+        :param modalForces: internal forces of each mode for each family.
+        '''
+        self.extractor= extractor
+        self.elementTags= elementTags
+        self.modalForces= modalForces
+
+    def getFamilyForces(self, factors):
+        ''' Return the internal forces of each family (same format as
+            SetInternalForcesExtractor.getFamilyForces) for the linear
+            combination of the modes.
+
+        :param factors: factor of each mode.
+        '''
+        retval= dict()
+        for family in self.modalForces:
+            forces= numpy.tensordot(factors, self.modalForces[family], axes= 1)
+            retval[family]= (self.elementTags[family], forces)
+        return retval
+
+def setTrialDisplacements(nodes, nodeIndexes, displacements):
+    ''' Set the trial displacements of the nodes.
+
+    :param nodes: nodes to set the displacements for.
+    :param nodeIndexes: dictionary containing the row index of each node.
+    :param displacements: array (number of nodes x maxDOF) with the
+                          displacements of the nodes.
+    '''
+    for n in nodes:
+        i= nodeIndexes[n.tag]
+        n.setTrialDisp(xc.Vector(displacements[i,:n.getNumberDOF].tolist()))
+
+def getModalInternalForces(modalBasis, xcSet, extractor= None):
+    ''' Return the internal forces of the elements of the set for each
+        mode of the modal basis (see ModalInternalForces). The
+        trial displacements of the nodes are set to the eigenvector of
+        each mode and the state of the elements is updated; at the end
+        the previous displacements are restored. The elements must not
+        have any load applied (element loads would be added to the
+        modal internal forces).
+
+    :param modalBasis: modal basis of the model (see getModalBasis).
+    :param xcSet: set with the elements to compute the internal forces for.
+    :param extractor: object used to extract the internal forces (defaults
+                      to a SetInternalForcesExtractor for the elements
+                      of the set).
+    '''
+    profiler= stage_profiler.profiler
+    with profiler.stage('getModalInternalForces'):
+        if(extractor is None):
+            extractor= internal_forces_extractor.SetInternalForcesExtractor(xcSet.elements)
+        preprocessor= xcSet.getPreprocessor
+        allNodes= preprocessor.getSets.getSet('total').nodes
+        nodeIndexes= modalBasis.getNodeIndexes()
+        nodes= [n for n in allNodes if(n.tag in nodeIndexes)]
+        elements= [e for e in xcSet.elements]
+        previousDisplacements= numpy.zeros(modalBasis.eigenvectors.shape[1:])
+        for n in nodes:
+            previousDisplacements[nodeIndexes[n.tag],:n.getNumberDOF]= [v for v in n.getDisp]
+        modalForces= dict()
+        elementTags= None
+        for k in range(0, modalBasis.getNumModes()):
+            setTrialDisplacements(nodes, nodeIndexes, modalBasis.eigenvectors[k])
+            for e in elements:
+                e.update()
+            familyForces, vonMises= extractor.getFamilyForces()
+            if(elementTags is None):
+                elementTags= dict((family, familyForces[family][0]) for family in familyForces)
+                for family in familyForces:
+                    modalForces[family]= numpy.zeros((modalBasis.getNumModes(),)+familyForces[family][1].shape)
+            for family in familyForces:
+                modalForces[family][k]= familyForces[family][1]
+        # Restore the previous state.
+        setTrialDisplacements(nodes, nodeIndexes, previousDisplacements)
+        for e in elements:
+            e.update()
+    return ModalInternalForces(extractor, elementTags, modalForces)
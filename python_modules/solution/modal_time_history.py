@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+''' Linear time-history analysis by modal superposition. The modes are
+    computed once (see FrequencyAnalysis and the modal_basis module), the
+    time-dependent loads (nodal loads, series of moving loads, ground
+    accelerations) are projected on the modal coordinates and the
+    uncoupled equations of the modes are integrated with the exact
+    solution for loads that vary linearly inside each time step
+    (Nigam and Jennings, see table 5.2.1 of the book "Dynamics of
+    structures" from Chopra). The integration is vectorized over the
+    modes and the responses (nodal displacements and accelerations,
+    internal forces) are recovered from the modal coordinates.
+
+    Example:
+
+      modalBasis= modal_basis.getModalBasis(preprocessor)
+      th= modal_time_history.ModalTimeHistory(modalBasis, timeStep= 0.005, duration= 10.0, dampingRatios= 0.01)
+      train= modal_time_history.MovingLoadSeries(pathNodes, *loadModel.getAxleLoads(), speed= 50.0)
+      th.addMovingLoads(train)
+      th.solve()
+      minAccel, maxAccel= th.getNodeEnvelopes('accel')
+'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com, ana.ortega.ort@gmail.com"
+
+import math
+import numpy
+from misc_utils import log_messages as lmsg
+from misc import stage_profiler
+
+def getPiecewiseLinearCoefficients(angularFrequencies, dampingRatios, timeStep):
+    ''' Return the coefficients of the recurrence formulas:
+
+        q(i+1)= A*q(i)+B*v(i)+C*p(i)+D*p(i+1)
+        v(i+1)= Ap*q(i)+Bp*v(i)+Cp*p(i)+Dp*p(i+1)
+
+        that give the exact solution of the equations
+        q''+2*zeta*omega*q'+omega^2*q= p for loads that vary linearly
+        inside each time step (table 5.2.1 of the book "Dynamics of
+        structures" from Chopra).
+
+    :param angularFrequencies: angular frequency of each mode.
+    :param dampingRatios: damping ratio of each mode (less than one).
+    :param timeStep: time step.
+    '''
+    w= numpy.asarray(angularFrequencies, dtype= float)
+    z= numpy.broadcast_to(numpy.asarray(dampingRatios, dtype= float), w.shape)
+    dt= timeStep
+    k= w**2 # unit modal mass.
+    sq= numpy.sqrt(1.0-z**2)
+    wD= w*sq
+    e= numpy.exp(-z*w*dt)
+    s= numpy.sin(wD*dt)
+    c= numpy.cos(wD*dt)
+    A= e*(z/sq*s+c)
+    B= e*s/wD
+    C= (2*z/(w*dt)+e*(((1-2*z**2)/(wD*dt)-z/sq)*s-(1+2*z/(w*dt))*c))/k
+    D= (1-2*z/(w*dt)+e*((2*z**2-1)/(wD*dt)*s+2*z/(w*dt)*c))/k
+    Ap= -e*w/sq*s
+    Bp= e*(c-z/sq*s)
+    Cp= (-1/dt+e*((w/sq+z/(dt*sq))*s+c/dt))/k
+    Dp= (1-e*(z/sq*s+c))/(k*dt)
+    return A, B, C, D, Ap, Bp, Cp, Dp
+
+def integrateModalEquations(angularFrequencies, dampingRatios, timeStep, modalLoads, q0= None, v0= None):
+    ''' Return the arrays (number of modes x number of instants) of
+        modal coordinates, velocities and accelerations obtained by
+        integration of the uncoupled equations of the modes:
+        q''+2*zeta*omega*q'+omega^2*q= p.
+
+    :param angularFrequencies: angular frequency of each mode.
+    :param dampingRatios: damping ratio of each mode.
+    :param timeStep: time step.
+    :param modalLoads: array (number of modes x number of instants) with
+                       the modal loads divided by the generalized mass.
+    :param q0: initial values of the modal coordinates (defaults to zero).
+    :param v0: initial values of the modal velocities (defaults to zero).
+    '''
+    w= numpy.asarray(angularFrequencies, dtype= float)
+    z= numpy.broadcast_to(numpy.asarray(dampingRatios, dtype= float), w.shape)
+    p= numpy.asarray(modalLoads, dtype= float)
+    A, B, C, D, Ap, Bp, Cp, Dp= getPiecewiseLinearCoefficients(w, z, timeStep)
+    q= numpy.zeros(p.shape)
+    v= numpy.zeros(p.shape)
+    if(q0 is not None):
+        q[:,0]= q0
+    if(v0 is not None):
+        v[:,0]= v0
+    for i in range(0, p.shape[1]-1):
+        q[:,i+1]= A*q[:,i]+B*v[:,i]+C*p[:,i]+D*p[:,i+1]
+        v[:,i+1]= Ap*q[:,i]+Bp*v[:,i]+Cp*p[:,i]+Dp*p[:,i+1]
+    a= p-2.0*(z*w)[:,numpy.newaxis]*v-(w**2)[:,numpy.newaxis]*q
+    return q, v, a
+
+class MovingLoadSeries(object):
+    ''' Series of point loads (i.e. the axles of a train) that move at
+        constant speed along a path of nodes. The load is distributed
+        between the two nodes of the path segment where it is (lever
+        rule).
+
+    :ivar pathNodeTags: tags of the nodes of the path (in the direction
+                        of motion).
+    :ivar pathAbscissae: curvilinear abscissa of each node of the path.
+    :ivar loadPositions: distance from the first load to each load.
+    :ivar loadValues: value of each load.
+    :ivar speed: speed of the loads.
+    :ivar direction: direction of the loads (i.e. [0,0,-1] for vertical
+                     loads in a 3D model).
+    :ivar startPosition: abscissa of the first load at time zero.
+    '''
+    def __init__(self, pathNodes, loadPositions, loadValues, speed, direction= None, startPosition= 0.0):
+        ''' Constructor.
+
+        :param pathNodes: nodes of the path (in the direction of motion).
+        :param loadPositions: distance from the first load to each load
+                              (see getAxleLoads in the roadway and
+                              railway load models).
+        :param loadValues: value of each load.
+        :param speed: speed of the loads.
+        :param direction: direction of the loads (defaults to the
+                          negative direction of the last coordinate
+                          axis: [0,-1] in 2D and [0,0,-1] in 3D).
+        :param startPosition: abscissa of the first load at time zero
+                              (defaults to zero: the first node of the
+                              path).
+        '''
+        self.pathNodeTags= [n.tag for n in pathNodes]
+        coords= numpy.array([[x for x in n.getCoo] for n in pathNodes])
+        self.pathAbscissae= numpy.concatenate([[0.0], numpy.cumsum(numpy.linalg.norm(numpy.diff(coords, axis= 0), axis= 1))])
+        self.loadPositions= numpy.asarray(loadPositions, dtype= float)
+        self.loadValues= numpy.asarray(loadValues, dtype= float)
+        self.speed= speed
+        if(direction is None):
+            direction= [0.0]*coords.shape[1]
+            direction[-1]= -1.0
+        self.direction= numpy.asarray(direction, dtype= float)
+        self.startPosition= startPosition
+
+    def getCrossingTime(self):
+        ''' Return the time needed by all the loads to cross the path.'''
+        return (self.pathAbscissae[-1]-self.startPosition+self.loadPositions.max())/self.speed
+
+    def getModalLoads(self, modalBasis, times):
+        ''' Return the array (number of modes x number of instants) with
+            the modal loads (phi^T p(t)).
+
+        :param modalBasis: modal basis of the model.
+        :param times: instants to compute the modal loads for.
+        '''
+        nodeIndexes= modalBasis.getNodeIndexes()
+        indexes= [nodeIndexes[tag] for tag in self.pathNodeTags]
+        dim= len(self.direction)
+        # Component of the eigenvectors on the load direction (modes x path nodes).
+        pathModes= numpy.einsum('knd,d->kn', modalBasis.eigenvectors[:,indexes,:dim], self.direction)
+        # Position of each load (instants x loads).
+        s= self.startPosition+self.speed*numpy.asarray(times, dtype= float)[:,numpy.newaxis]-self.loadPositions
+        onPath= (s>=self.pathAbscissae[0]) & (s<=self.pathAbscissae[-1])
+        segment= numpy.clip(numpy.searchsorted(self.pathAbscissae, s, side= 'right')-1, 0, len(self.pathAbscissae)-2)
+        s0= self.pathAbscissae[segment]
+        s1= self.pathAbscissae[segment+1]
+        weight= numpy.clip((s-s0)/(s1-s0), 0.0, 1.0)
+        loads= numpy.where(onPath, self.loadValues, 0.0)
+        retval= numpy.einsum('ta,kta->kt', loads*(1.0-weight), pathModes[:,segment])
+        retval+= numpy.einsum('ta,kta->kt', loads*weight, pathModes[:,segment+1])
+        return retval
+
+class ModalTimeHistory(object):
+    ''' Linear time-history analysis by modal superposition.
+
+    :ivar modalBasis: modal basis of the model (see solution.modal_basis).
+    :ivar timeStep: time step.
+    :ivar times: instants of the analysis.
+    :ivar dampingRatios: damping ratio of each mode.
+    :ivar modalLoads: array (number of modes x number of instants) with
+                      the modal loads (phi^T p(t)).
+    :ivar groundAccelerations: array (dimSpace x number of instants) with
+                               the ground acceleration on each direction.
+    :ivar q: modal coordinates (number of modes x number of instants).
+    :ivar v: modal velocities.
+    :ivar a: modal accelerations.
+    '''
+    def __init__(self, modalBasis, timeStep, duration, dampingRatios= 0.02):
+        ''' Constructor.
+
+        :param modalBasis: modal basis of the model.
+        :param timeStep: time step.
+        :param duration: duration of the analysis.
+        :param dampingRatios: damping ratio of each mode (or a single
+                              value for all the modes).
+        '''
+        self.modalBasis= modalBasis
+        self.timeStep= timeStep
+        numSteps= int(math.ceil(duration/timeStep-1e-9))
+        self.times= timeStep*numpy.arange(numSteps+1)
+        numModes= modalBasis.getNumModes()
+        self.dampingRatios= numpy.broadcast_to(numpy.asarray(dampingRatios, dtype= float), (numModes,)).copy()
+        self.modalLoads= numpy.zeros((numModes, len(self.times)))
+        self.groundAccelerations= numpy.zeros((modalBasis.dimSpace, len(self.times)))
+        self.q= None
+        self.v= None
+        self.a= None
+
+    def getNumInstants(self):
+        ''' Return the number of instants of the analysis.'''
+        return len(self.times)
+
+    def addNodalLoads(self, nodalLoads, timeFunction):
+        ''' Add the nodal loads multiplied by the time function.
+
+        :param nodalLoads: dictionary containing the load vector of each
+                           node.
+        :param timeFunction: function of time or array with its value
+                             on each instant.
+        '''
+        if(callable(timeFunction)):
+            factors= numpy.array([timeFunction(t) for t in self.times])
+        else:
+            factors= numpy.asarray(timeFunction, dtype= float)
+        nodeIndexes= self.modalBasis.getNodeIndexes()
+        loads= numpy.zeros(self.modalBasis.eigenvectors.shape[1:])
+        for tag in nodalLoads:
+            load= numpy.asarray(nodalLoads[tag], dtype= float)
+            loads[nodeIndexes[tag],:len(load)]+= load
+        self.modalLoads+= numpy.outer(numpy.einsum('knd,nd->k', self.modalBasis.eigenvectors, loads), factors)
+
+    def addMovingLoads(self, movingLoadSeries):
+        ''' Add the loads of the series of moving loads.
+
+        :param movingLoadSeries: series of moving loads (see MovingLoadSeries).
+        '''
+        self.modalLoads+= movingLoadSeries.getModalLoads(self.modalBasis, self.times)
+
+    def addGroundAcceleration(self, direction, accelerations):
+        ''' Add the effective loads of a ground acceleration.
+
+        :param direction: direction index (0: x, 1: y, 2: z).
+        :param accelerations: function of time or array with the ground
+                              acceleration on each instant.
+        '''
+        if(callable(accelerations)):
+            accelerations= numpy.array([accelerations(t) for t in self.times])
+        accelerations= numpy.asarray(accelerations, dtype= float)
+        self.groundAccelerations[direction]+= accelerations
+        self.modalLoads-= numpy.outer(self.modalBasis.modalExcitations[:,direction], accelerations)
+
+    def solve(self):
+        ''' Integrate the equations of the modes.'''
+        profiler= stage_profiler.profiler
+        with profiler.stage('modalTimeHistory', numModes= self.modalBasis.getNumModes(), numInstants= self.getNumInstants()):
+            p= self.modalLoads/self.modalBasis.generalizedMasses[:,numpy.newaxis]
+            self.q, self.v, self.a= integrateModalEquations(self.modalBasis.angularFrequencies, self.dampingRatios, self.timeStep, p)
+            profiler.count('timeSteps', self.getNumInstants()-1)
+        return self.q
+
+    def getModalHistory(self, quantity):
+        ''' Return the history of the modal coordinates, velocities or
+            accelerations.
+
+        :param quantity: disp, vel or accel.
+        '''
+        if(self.q is None):
+            self.solve()
+        retval= None
+        if(quantity=='disp'):
+            retval= self.q
+        elif(quantity=='vel'):
+            retval= self.v
+        elif(quantity=='accel'):
+            retval= self.a
+        else:
+            lmsg.error("ModalTimeHistory; quantity: '"+str(quantity)+"' unknown.")
+        return retval
+
+    def getNodeHistories(self, nodeTags, quantity= 'disp', absolute= False):
+        ''' Return a dictionary containing for each node the array
+            (number of instants x number of DOFs) with the history of
+            its displacements, velocities or accelerations.
+
+        :param nodeTags: tags of the nodes.
+        :param quantity: disp, vel or accel.
+        :param absolute: if true add the ground acceleration to the
+                         (relative) accelerations of the translational
+                         DOFs.
+        '''
+        modal= self.getModalHistory(quantity)
+        nodeIndexes= self.modalBasis.getNodeIndexes()
+        retval= dict()
+        for tag in nodeTags:
+            i= nodeIndexes[tag]
+            nDOF= self.modalBasis.numDOFs[i]
+            history= numpy.dot(modal.T, self.modalBasis.eigenvectors[:,i,:nDOF])
+            if(absolute and quantity=='accel'):
+                for d in range(0, min(self.modalBasis.dimSpace, nDOF)):
+                    history[:,d]+= self.groundAccelerations[d]
+            retval[tag]= history
+        return retval
+
+    def getEnvelopes(self, modalResponses, quantity= 'disp', chunkSize= 256):
+        ''' Return the arrays with the minimum and maximum values of the
+            response along the time.
+
+        :param modalResponses: array (number of modes x ...) with the
+                               response of each mode for a unit value
+                               of the modal coordinate.
+        :param quantity: disp, vel or accel.
+        :param chunkSize: number of instants computed at once (to limit
+                          the memory needed).
+        '''
+        modal= self.getModalHistory(quantity)
+        R= numpy.asarray(modalResponses, dtype= float)
+        minValues= numpy.full(R.shape[1:], numpy.inf)
+        maxValues= numpy.full(R.shape[1:], -numpy.inf)
+        for start in range(0, self.getNumInstants(), chunkSize):
+            values= numpy.tensordot(modal[:,start:start+chunkSize], R, axes= ([0],[0]))
+            minValues= numpy.minimum(minValues, values.min(axis= 0))
+            maxValues= numpy.maximum(maxValues, values.max(axis= 0))
+        return minValues, maxValues
+
+    def getNodeEnvelopes(self, quantity= 'disp'):
+        ''' Return the arrays (number of nodes x maxDOF) with the minimum
+            and maximum values of the displacements, velocities or
+            (relative) accelerations of the nodes.
+
+        :param quantity: disp, vel or accel.
+        '''
+        return self.getEnvelopes(self.modalBasis.eigenvectors, quantity)
+
+    def getInternalForcesEnvelopes(self, modalInternalForces):
+        ''' Return a dictionary containing for each element family the
+            tags of the elements and the arrays with the minimum and
+            maximum values of their internal forces.
+
+        :param modalInternalForces: internal forces for each mode (see
+                                    modal_basis.getModalInternalForces).
+        '''
+        retval= dict()
+        for family in modalInternalForces.modalForces:
+            minValues, maxValues= self.getEnvelopes(modalInternalForces.modalForces[family])
+            retval[family]= (modalInternalForces.elementTags[family], minValues, maxValues)
+        return retval
+
+    def getInternalForcesHistories(self, modalInternalForces, elemTags):
+        ''' Return a dictionary containing for each element the array
+            (number of instants x ...) with the history of its
+            internal forces.
+
+        :param modalInternalForces: internal forces for each mode (see
+                                    modal_basis.getModalInternalForces).
+        :param elemTags: tags of the elements.
+        '''
+        q= self.getModalHistory('disp')
+        retval= dict()
+        for family in modalInternalForces.modalForces:
+            tags= list(modalInternalForces.elementTags[family])
+            for tag in elemTags:
+                if(tag in tags):
+                    forces= modalInternalForces.modalForces[family][:,tags.index(tag)]
+                    retval[tag]= numpy.tensordot(q, forces, axes= ([0],[0]))
+        return retval
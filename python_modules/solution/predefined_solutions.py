@@ -9,10 +9,12 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@gmail.com, ana.ortega.ort@gmail.com"
 
+import time
 import xc_base
 import geom
 import xc
 from misc_utils import log_messages as lmsg
+from misc import stage_profiler
 
 class SolutionProcedure(object):
     '''
@@ -190,11 +192,48 @@ class SolutionProcedure(object):
         :param includeInertia: if true calculate reactions including inertia
                                effects.
         '''
+        profiler= stage_profiler.profiler
+        if(profiler.enabled):
+            return self.profiledSolve(profiler, calculateNodalReactions, includeInertia)
         result= self.analysis.analyze(self.numSteps)
         if(calculateNodalReactions):
             preprocessor= self.feProblem.getPreprocessor
             preprocessor.getNodeHandler.calculateNodalReactions(includeInertia,1e-7)
-            return result
+        return result
+
+    def profiledSolve(self, profiler, calculateNodalReactions= False, includeInertia= False):
+        ''' Compute the solution and report the time spent in the
+            analysis to the profiler argument. If the solution algorithm
+            measures times, the analysis time is split into the stages
+            of the algorithm (formTangent, formUnbalance, solve and
+            update); the rest of the time (numbering, system of
+            equations setup, commit,...) is reported as 'setup'.
+
+        :param profiler: stage profiler to report to.
+        :param calculateNodalReactions: if true calculate reactions at
+                                        nodes.
+        :param includeInertia: if true calculate reactions including inertia
+                               effects.
+        '''
+        measureTimes= hasattr(self.solAlgo, 'measureTimes')
+        if(measureTimes):
+            self.solAlgo.measureTimes= True
+            self.solAlgo.resetStageTimes()
+        with profiler.stage('analyze', solutionProcedure= self.name):
+            start= time.time()
+            result= self.analysis.analyze(self.numSteps)
+            elapsed= time.time()-start
+            if(measureTimes):
+                stageTimes= self.solAlgo.stageTimes
+                self.solAlgo.measureTimes= False
+                stageTimes['setup']= max(elapsed-sum(stageTimes.values()), 0.0)
+                profiler.addSubstageTimes(stageTimes, solutionProcedure= self.name)
+        profiler.count('analyses')
+        if(calculateNodalReactions):
+            with profiler.stage('calculateNodalReactions'):
+                preprocessor= self.feProblem.getPreprocessor
+                preprocessor.getNodeHandler.calculateNodalReactions(includeInertia,1e-7)
+        return result
 
     def resetLoadCase(self):
         ''' Remove previous load from the domain.'''
@@ -219,6 +258,54 @@ class SolutionProcedure(object):
         # lmsg.info("Combination: ",combName," solved.\n")
         return analOk
 
+    def getNodeDisplacements(self, nodSet= None):
+        ''' Return a dictionary containing the displacement vector
+            of each node.
+
+        :param nodSet: set of nodes to get the displacements from
+                       (if None return the displacements of all nodes).
+        '''
+        if(nodSet is None):
+            nodSet= self.feProblem.getPreprocessor.getSets.getSet('total').nodes
+        retval= dict()
+        for n in nodSet:
+            retval[n.tag]= list(n.getDisp)
+        return retval
+
+    def solveLoadCases(self, loadCaseNames, nodSet= None, getDisplacements= True, callback= None, calculateNodalReactions= False, includeInertia= False):
+        ''' Obtains the solution for each of the load cases (load 
+            patterns) whose names are passed as parameter. Each load 
+            case is solved with a unit partial safety factor.
+
+        :param loadCaseNames: names of the load cases to solve.
+        :param nodSet: set of nodes to get the displacements from
+                       (if None return the displacements of all nodes).
+        :param getDisplacements: if true return the displacements 
+                                 obtained for each load case.
+        :param callback: function to call (with the load case name as
+                         argument) after each load case is solved
+                         (i.e. to store the results of interest).
+        :param calculateNodalReactions: if true calculate reactions at
+                                        nodes.
+        :param includeInertia: if true calculate reactions including inertia
+                               effects.
+        '''
+        retval= dict()
+        loadPatterns= self.feProblem.getPreprocessor.getLoadHandler.getLoadPatterns
+        for name in loadCaseNames:
+            lp= loadPatterns[name]
+            gammaF= lp.gammaF # may have been set by a combination.
+            lp.gammaF= 1.0
+            analOk= self.solveComb(name, calculateNodalReactions, includeInertia)
+            lp.gammaF= gammaF
+            if(analOk!=0):
+                lmsg.error('load case: '+name+' not solved.')
+            if(getDisplacements):
+                retval[name]= self.getNodeDisplacements(nodSet)
+            if(callback):
+                callback(name)
+        return retval
+
 #Typical solution procedures.
 
 ## Linear static analysis.
@@ -291,6 +378,81 @@ class SimpleTransformationStaticLinear(SolutionProcedure):
         self.defineSysOfEq(soeType= 'sparse_gen_col_lin_soe', solverType= 'super_lu_solver')
         self.defineAnalysis('static_analysis')
 
+class MultiLoadCaseStaticLinear(SolutionProcedure):
+    ''' Linear static solution procedure that forms and factorizes
+        the stiffness matrix only once and then obtains the solution
+        for each load case by back substitution (see solveLoadCases).
+        The load patterns to solve must not contain single point
+        constraints (they are added to the domain simultaneously).
+    '''
+    def __init__(self, prb, name= None, maxNumIter= 10, convergenceTestTol= 1e-9, printFlag= 0, numSteps= 1, soeType= 'band_spd_lin_soe', solverType= 'band_spd_lin_lapack_solver'):
+        ''' Constructor.
+
+        :param prb: XC finite element problem.
+        :param name: identifier for the solution procedure.
+        :param maxNumIter: maximum number of iterations (defauts to 10)
+        :param convergenceTestTol: convergence tolerance (defaults to 1e-9)
+        :param printFlag: if not zero print convergence results on each step.
+        :param numSteps: number of steps to use in the analysis (useful only when loads are variable in time).
+        :param soeType: type of the system of equations object (band_spd_lin_soe, sparse_gen_col_lin_soe, umfpack_gen_lin_soe,...).
+        :param solverType: type of the solver (band_spd_lin_lapack_solver, super_lu_solver, umfpack_gen_lin_solver,...).
+        '''
+        super(MultiLoadCaseStaticLinear,self).__init__(name, maxNumIter, convergenceTestTol, printFlag, numSteps)
+        modelWrapperName= self.defineModelWrapper(prb, numberingMethod= 'rcm')
+        self.defineConstraintHandler('penalty')
+        self.defineSolutionAlgorithm(solAlgType= 'linear_soln_algo', integratorType= 'load_control_integrator', convTestType= None)
+        self.solAlgo.factorOnce= True
+        self.defineSysOfEq(soeType= soeType, solverType= solverType)
+        self.defineAnalysis('static_analysis')
+
+    def solveLoadCases(self, loadCaseNames, nodSet= None, getDisplacements= True, callback= None, calculateNodalReactions= False, includeInertia= False):
+        ''' Obtains the solution for each of the load cases (load 
+            patterns) whose names are passed as parameter. All the load
+            cases are added to the domain at once so the stiffness 
+            matrix is formed and factorized only one time; then each
+            load case is activated by setting its partial safety factor
+            to one (and the others to zero).
+
+        :param loadCaseNames: names of the load cases to solve.
+        :param nodSet: set of nodes to get the displacements from
+                       (if None return the displacements of all nodes).
+        :param getDisplacements: if true return the displacements 
+                                 obtained for each load case.
+        :param callback: function to call (with the load case name as
+                         argument) after each load case is solved
+                         (i.e. to store the results of interest).
+        :param calculateNodalReactions: if true calculate reactions at
+                                        nodes.
+        :param includeInertia: if true calculate reactions including inertia
+                               effects.
+        '''
+        retval= dict()
+        preprocessor= self.feProblem.getPreprocessor
+        loadHandler= preprocessor.getLoadHandler
+        loadPatterns= loadHandler.getLoadPatterns
+        self.resetLoadCase() # Remove previous loads.
+        gammaFs= dict()
+        for name in loadCaseNames:
+            lp= loadPatterns[name]
+            gammaFs[name]= lp.gammaF # may have been set by a combination.
+            loadHandler.addToDomain(name)
+        for name in loadCaseNames:
+            for otherName in loadCaseNames:
+                loadPatterns[otherName].gammaF= 0.0
+            loadPatterns[name].gammaF= 1.0
+            preprocessor.getDomain.revertToStart()
+            analOk= self.solve(calculateNodalReactions, includeInertia)
+            if(analOk!=0):
+                lmsg.error('load case: '+name+' not solved.')
+            if(getDisplacements):
+                retval[name]= self.getNodeDisplacements(nodSet)
+            if(callback):
+                callback(name)
+        for name in loadCaseNames:
+            loadHandler.removeFromDomain(name)
+            loadPatterns[name].gammaF= gammaFs[name]
+        return retval
+
 ## Non-linear static analysis.
 class PlainNewtonRaphson(SolutionProcedure):
     ''' Newton-Raphson solution algorithm with a 
@@ -554,7 +716,35 @@ class PenaltyNewmarkNewtonRapshon(SolutionProcedure):
 
 
 ## Eigen analysis
-class FrequencyAnalysis(SolutionProcedure):
+class EigenSolutionProcedure(SolutionProcedure):
+    ''' Base class for the solution procedures of eigenvalue
+        problems.
+
+    :ivar systemPrefix: prefix of the names of the system of equations
+                        and solver types.
+    :ivar shift: shift applied to the eigenvalues (None if not used).
+    '''
+    systemPrefix= None
+    shift= None
+
+    def getEigenSolverSettings(self):
+        ''' Return the parameters of the eigen solver that change
+            the computed solution.'''
+        return (self.systemPrefix, self.shift)
+
+    def solveEigenProblem(self, numModes, cacheDirectory= None):
+        ''' Compute the first modes and return the modal basis (see
+            eigen_cache and modal_basis modules).
+
+        :param numModes: number of modes to compute.
+        :param cacheDirectory: directory to store and reuse the
+                               eigen solutions (if None they're not
+                               stored).
+        '''
+        from solution import eigen_cache
+        return eigen_cache.solveEigenProblem(self, numModes, cacheDirectory)
+
+class FrequencyAnalysis(EigenSolutionProcedure):
     ''' Return a natural frequency computation procedure.'''
 
     def __init__(self, prb, name= None, printFlag= 0, systemPrefix= 'sym_band'):
@@ -565,6 +755,7 @@ class FrequencyAnalysis(SolutionProcedure):
         :param printFlag: if not zero print convergence results on each step.
         '''        
         super(FrequencyAnalysis,self).__init__(name, printFlag)
+        self.systemPrefix= systemPrefix
         modelWrapperName= self.defineModelWrapper(prb, numberingMethod= 'rcm')
         self.defineConstraintHandler('transformation')
         self.defineSolutionAlgorithm(solAlgType= 'frequency_soln_algo', integratorType= 'eigen_integrator', convTestType= None)
@@ -572,7 +763,7 @@ class FrequencyAnalysis(SolutionProcedure):
         solver_string= systemPrefix+'_eigen_solver'
         self.defineSysOfEq(soeType= soe_string, solverType= solver_string)
         self.defineAnalysis('modal_analysis')
-        
+
 ### Convenience function
 def frequency_analysis(prb):
     ''' Return a solution procedure that computes the natural
@@ -580,7 +771,7 @@ def frequency_analysis(prb):
     solProc= FrequencyAnalysis(prb)
     return solProc.analysis
 
-class IllConditioningAnalysisBase(SolutionProcedure):
+class IllConditioningAnalysisBase(EigenSolutionProcedure):
     ''' Base class for ill-conditioning
         solution procedures.
     '''
@@ -596,10 +787,12 @@ class IllConditioningAnalysisBase(SolutionProcedure):
         self.defineConstraintHandler('penalty')
         self.defineSolutionAlgorithm(solAlgType= 'ill-conditioning_soln_algo', integratorType= 'ill-conditioning_integrator', convTestType= None)
         self.defineSysOfEq(soeType= systemPrefix+"_soe", solverType= systemPrefix+"_solver")
+        self.systemPrefix= systemPrefix
         if(shift):
             self.soe.shift= shift
+            self.shift= shift
         self.defineAnalysis('ill-conditioning_analysis')
-    
+
 class ZeroEnergyModes(IllConditioningAnalysisBase):
     ''' Procedure to obtain the zero energy modes
         of the finite element model.'''
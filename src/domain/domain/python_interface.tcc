@@ -38,6 +38,8 @@ class_<XC::Domain, bases<XC::ObjWithRecorders>, boost::noncopyable >("Domain", n
   .add_property("getConstraints", make_function( getConstraintsRef, return_internal_reference<>() ),"returns mesh constraints.")
   .add_property("getTimeTracker", make_function( &XC::Domain::getTimeTracker, return_internal_reference<>() ),"returns the pseudo-time tracker of the domain.")
   .add_property("currentCombinationName", &XC::Domain::getCurrentCombinationName,"returns current combination/load case name.")
+  .add_property("currentGeoTag", &XC::Domain::getCurrentGeoTag,"returns the integer stamp that marks the changes of the domain (nodes, elements or constraints added or removed).")
+  .def("hasDomainChanged",&XC::Domain::hasDomainChanged,"updates (if nodes, elements or constraints have been added or removed since the last call) and returns the integer stamp that marks the changes of the domain.")
   .def("setDeadSRF",XC::Domain::setDeadSRF,"Assigns Stress Reduction Factor for element deactivation.")
   .def("commit",&XC::Domain::commit)
   .def("revertToLastCommit",&XC::Domain::revertToLastCommit)
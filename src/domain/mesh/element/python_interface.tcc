@@ -32,6 +32,7 @@ Pos3d (XC::Element::*getProjection3D)(const Pos3d &,bool) const= &XC::Element::g
 XC::NodePtrsWithIDs &(XC::Element::*getNodePtrsRef)(void)= &XC::Element::getNodePtrs;
 const XC::Vector &(XC::Element::*getResistingForceRef)(void) const= &XC::Element::getResistingForce;
 const XC::Matrix &(XC::Element::*getInitialStiffRef)(void) const= &XC::Element::getInitialStiff;
+const XC::Matrix &(XC::Element::*getMassRef)(void) const= &XC::Element::getMass;
 const XC::Matrix &(XC::Element::*getTangentStiffRef)(void) const= &XC::Element::getTangentStiff;
 bool (XC::Element::*ElementIn3D)(const GeomObj3d &,const double &,const double &) const= &XC::Element::In;
 bool (XC::Element::*ElementOut3D)(const GeomObj3d &,const double &,const double &) const= &XC::Element::Out;
@@ -54,6 +55,9 @@ class_<XC::Element, XC::Element *,bases<XC::MeshComponent>, boost::noncopyable >
   .def("getResistingForce",make_function(getResistingForceRef, return_internal_reference<>() ),"Calculates element's resisting force.")
   .def("getTangentStiff",make_function(getTangentStiffRef, return_internal_reference<>() ),"Return tangent stiffness matrix.")
   .def("getInitialStiff",make_function(getInitialStiffRef, return_internal_reference<>() ),"Return initial stiffness matrix.")
+  .def("getMass",make_function(getMassRef, return_internal_reference<>() ),"Return the mass matrix.")
+  .def("getEquivalentStaticLoad",&XC::Element::getEquivalentStaticLoad,"getEquivalentStaticLoad(mode,modeAccel): return the equivalent static load for the mode being passed as parameter and the acceleration corresponding to that mode.")
+  .def("getEquivalentStaticNodalLoads",&XC::Element::getEquivalentStaticNodalLoads,"getEquivalentStaticNodalLoads(mode,modeAccel): return the equivalent static loads on each node (as matrix rows) for the mode being passed as parameter and the acceleration corresponding to that mode.")
   .def("setDeadSRF",XC::Element::setDeadSRF,"Assigns Stress Reduction Factor for element deactivation.")
   .add_property("getVtkCellType",&XC::Element::getVtkCellType,"Return cell type for Vtk graphics.")
   .def("getPosCentroid",&XC::Element::getCenterOfMassPosition,"Return centroid's position.")
@@ -34,6 +34,7 @@
 #include "xc_utils/src/geom/d3/BND3d.h"
 #include "xc_utils/src/geom/d1/Segment3d.h"
 #include "utility/matrix/Vector.h"
+#include "utility/matrix/Matrix.h"
 
 #include "material/section/fiber_section/FiberSectionBase.h"
 #include "material/section/interaction_diagram/InteractionDiagramData.h"
@@ -172,14 +173,32 @@ const Trihedron *XC::InteractionDiagram::findTrihedronPtr(const Pos3d &p) const
     return retval;
   }
 
+//! @brief Search for the trihedron that contains the point being passed
+//! as parameter checking first the hint (i.e. the trihedron that contains
+//! the previous point of a batch).
+const Trihedron *XC::InteractionDiagram::findTrihedronPtr(const Pos3d &p, const Trihedron *hint) const
+  {
+    if(hint)
+      if(hint->In(p,tol))
+        return hint;
+    return findTrihedronPtr(p);
+  }
+
 //! @brief Return the intersection of the half-line that links the
 //! origin (0,0,0) and p and the interaction diagram.
 GeomObj::list_Pos3d XC::InteractionDiagram::get_intersection(const Pos3d &p) const
   {
-    GeomObj::list_Pos3d lst_intersec;
-    const Pos3d O= Pos3d(0.0,0.0,0.0);
     //Search for the trihedron that contains p.
     const Trihedron *i= findTrihedronPtr(p);
+    return get_intersection(p,i);
+  }
+
+//! @brief Return the intersection of the half-line that links the
+//! origin (0,0,0) and p and the face of the trihedron i.
+GeomObj::list_Pos3d XC::InteractionDiagram::get_intersection(const Pos3d &p, const Trihedron *i) const
+  {
+    GeomObj::list_Pos3d lst_intersec;
+    const Pos3d O= Pos3d(0.0,0.0,0.0);
     if(!i)
       {
 	std::cerr << getClassName() << "::" << __FUNCTION__
@@ -254,8 +273,13 @@ Pos3d XC::InteractionDiagram::getIntersection(const Pos3d &esf_d) const
     return retval;    
   }
 
-//! @brief Return the capacity factor for the internal forces triplet being passed as parameters.
-double XC::InteractionDiagram::getCapacityFactor(const Pos3d &esf_d) const
+//! @brief Return the capacity factor for the internal forces triplet
+//! being passed as parameters.
+//!
+//! @param esf_d: internal forces triplet (N,My,Mz).
+//! @param hint: trihedron to check first when searching the one that
+//! contains the triplet (updated with the trihedron found).
+double XC::InteractionDiagram::get_capacity_factor(const Pos3d &esf_d, const Trihedron *&hint) const
   {
     double retval= 1e6;
     assert(rMax>0.0);
@@ -271,7 +295,10 @@ double XC::InteractionDiagram::getCapacityFactor(const Pos3d &esf_d) const
         const double minThreshold= rMin/10.0;
         if(d<minThreshold) //Point is inside the diagram.
           retval= d/rMin;
-        const GeomObj::list_Pos3d lst_intersec= get_intersection(esf_d);
+        const Trihedron *i= findTrihedronPtr(esf_d,hint);
+        if(i)
+          hint= i;
+        const GeomObj::list_Pos3d lst_intersec= get_intersection(esf_d,i);
         if(!lst_intersec.empty())
           {
             const Pos3d C= *(lst_intersec.begin());
@@ -289,12 +316,49 @@ double XC::InteractionDiagram::getCapacityFactor(const Pos3d &esf_d) const
     return retval;
   }
 
+//! @brief Return the capacity factor for the internal forces triplet being passed as parameters.
+double XC::InteractionDiagram::getCapacityFactor(const Pos3d &esf_d) const
+  {
+    const Trihedron *hint= nullptr;
+    return get_capacity_factor(esf_d,hint);
+  }
+
+//! @brief Return the capacity factors for the internal forces triplets
+//! being passed as parameters.
 XC::Vector XC::InteractionDiagram::getCapacityFactor(const GeomObj::list_Pos3d &lp) const
   {
     Vector retval(lp.size());
     int i= 0;
+    const Trihedron *hint= nullptr;
     for(GeomObj::list_Pos3d::const_iterator j= lp.begin();j!=lp.end(); j++, i++)
-      retval[i]= getCapacityFactor(*j);
+      retval[i]= get_capacity_factor(*j,hint);
+    return retval;
+  }
+
+//! @brief Return the capacity factors for the internal forces triplets
+//! (N,My,Mz) in the rows of the matrix being passed as parameter.
+//!
+//! Consecutive triplets (i.e. the internal forces of the same section
+//! under different combinations) are often contained in the same
+//! trihedron, so the trihedron found for each triplet is checked first
+//! when searching the one of the next triplet.
+XC::Vector XC::InteractionDiagram::getCapacityFactors(const Matrix &internalForces) const
+  {
+    const int nRows= internalForces.noRows();
+    Vector retval(nRows);
+    if(internalForces.noCols()<3)
+      {
+	std::cerr << getClassName() << "::" << __FUNCTION__
+		  << "; the matrix must have three columns (N,My,Mz)."
+                  << std::endl;
+        return retval;
+      }
+    const Trihedron *hint= nullptr;
+    for(int i= 0;i<nRows;i++)
+      {
+        const Pos3d esf_d(internalForces(i,0),internalForces(i,1),internalForces(i,2));
+        retval[i]= get_capacity_factor(esf_d,hint);
+      }
     return retval;
   }
 
@@ -40,6 +40,7 @@ class Triang3dMesh;
 namespace XC {
 
 class Vector;
+class Matrix;
 class FiberSectionBase;
 class InteractionDiagramData;
 
@@ -57,7 +58,9 @@ class InteractionDiagram: public ClosedTriangleMesh
     void classify_trihedron(const Trihedron &tdro);
     void classify_trihedrons(void);
     void setPositionsMatrix(const Matrix &);
+    GeomObj::list_Pos3d get_intersection(const Pos3d &p, const Trihedron *) const;
     GeomObj::list_Pos3d get_intersection(const Pos3d &p) const;
+    double get_capacity_factor(const Pos3d &, const Trihedron *&) const;
   public:
     InteractionDiagram(void);
     InteractionDiagram(const Pos3d &org,const Triang3dMesh &mll);
@@ -66,9 +69,11 @@ class InteractionDiagram: public ClosedTriangleMesh
     virtual InteractionDiagram *clon(void) const;
 
     const Trihedron *findTrihedronPtr(const Pos3d &p) const;
+    const Trihedron *findTrihedronPtr(const Pos3d &p, const Trihedron *hint) const;
     Pos3d getIntersection(const Pos3d &) const;
     double getCapacityFactor(const Pos3d &) const;
     Vector getCapacityFactor(const GeomObj::list_Pos3d &) const;
+    Vector getCapacityFactors(const Matrix &) const;
 
     void Print(std::ostream &os) const;
   };
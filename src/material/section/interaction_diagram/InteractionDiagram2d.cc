@@ -29,6 +29,7 @@
 #include "InteractionDiagram2d.h"
 #include "xc_utils/src/geom/d1/Segment2d.h"
 #include "utility/matrix/Vector.h"
+#include "utility/matrix/Matrix.h"
 
 #include "material/section/fiber_section/FiberSectionBase.h"
 #include "material/section/interaction_diagram/InteractionDiagramData.h"
@@ -129,6 +130,24 @@ XC::Vector XC::InteractionDiagram2d::getCapacityFactor(const GeomObj::list_Pos2d
     return retval;
   }
 
+//! @brief Return the capacity factors for the internal forces pairs
+//! (N,M) in the rows of the matrix being passed as parameter.
+XC::Vector XC::InteractionDiagram2d::getCapacityFactors(const Matrix &internalForces) const
+  {
+    const int nRows= internalForces.noRows();
+    Vector retval(nRows);
+    if(internalForces.noCols()<2)
+      {
+	std::cerr << getClassName() << "::" << __FUNCTION__
+		  << "; the matrix must have two columns (N,M)."
+                  << std::endl;
+        return retval;
+      }
+    for(int i= 0;i<nRows;i++)
+      retval[i]= getCapacityFactor(Pos2d(internalForces(i,0),internalForces(i,1)));
+    return retval;
+  }
+
 
 void XC::InteractionDiagram2d::Print(std::ostream &os) const
   {
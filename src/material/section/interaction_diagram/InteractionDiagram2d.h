@@ -35,6 +35,7 @@
 namespace XC {
 
 class Vector;
+class Matrix;
 class FiberSectionBase;
 class InteractionDiagramData;
 
@@ -55,6 +56,7 @@ class InteractionDiagram2d: public Polygon2d
     Pos2d getIntersection(const Pos2d &) const;
     double getCapacityFactor(const Pos2d &esf_d) const;
     Vector getCapacityFactor(const GeomObj::list_Pos2d &lp) const;
+    Vector getCapacityFactors(const Matrix &) const;
 
     void Print(std::ostream &os) const;
   };
@@ -70,6 +70,7 @@ class_<XC::InteractionDiagram, bases<XC::ClosedTriangleMesh>, boost::noncopyable
   .def("getLength",&XC::InteractionDiagram::getLength)
   .def("getIntersection",&XC::InteractionDiagram::getIntersection,"Returns the intersection of the ray O->point(N,My,Mz) with the interaction diagram.")
   .def("getCapacityFactor",getCF)
+  .def("getCapacityFactors",&XC::InteractionDiagram::getCapacityFactors,"getCapacityFactors(internalForces): return the capacity factors for the internal forces triplets (N,My,Mz) in the rows of the matrix argument.")
   .def("writeTo",&XC::InteractionDiagram::writeTo)
   .def("readFrom",&XC::InteractionDiagram::readFrom)
   ;
@@ -78,5 +79,6 @@ double (XC::InteractionDiagram2d::*getCF2d)(const Pos2d &esf_d) const= &XC::Inte
 class_<XC::InteractionDiagram2d, bases<Polygon2d>, boost::noncopyable >("InteractionDiagram2d", no_init)
   .def("getIntersection",&XC::InteractionDiagram2d::getIntersection,"Returns the intersection of the ray O->point(N,My,Mz) with the interaction diagram.")
   .def("getCapacityFactor",getCF2d)
+  .def("getCapacityFactors",&XC::InteractionDiagram2d::getCapacityFactors,"getCapacityFactors(internalForces): return the capacity factors for the internal forces pairs (N,M) in the rows of the matrix argument.")
   .def("simplify",&XC::InteractionDiagram2d::Simplify)
   ;
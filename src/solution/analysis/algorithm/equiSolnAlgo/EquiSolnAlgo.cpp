@@ -75,7 +75,90 @@
 //! @param owr: SolutionStrategy that owns this solution algorithm.
 //! @param classTag: class identifier.
 XC::EquiSolnAlgo::EquiSolnAlgo(SolutionStrategy *owr,int classTag)
-  :SolutionAlgorithm(owr,classTag) {}
+  :SolutionAlgorithm(owr,classTag), measureTimes(false) {}
+
+//! @brief Constructor; starts the timer if the algorithm measures times.
+//! @param a: solution algorithm.
+//! @param name: name of the stage (formTangent, solve,...).
+XC::EquiSolnAlgo::StageTimer::StageTimer(EquiSolnAlgo &a, const char *name)
+  : algo(a), stageName(name), running(a.measureTimes)
+  {
+    if(running)
+      start= std::chrono::steady_clock::now();
+  }
+
+//! @brief Adds the time elapsed since the construction to the stage.
+void XC::EquiSolnAlgo::StageTimer::stop(void)
+  {
+    if(running)
+      {
+        const std::chrono::duration<double> elapsed= std::chrono::steady_clock::now()-start;
+        algo.addStageTime(stageName, elapsed.count());
+        running= false;
+      }
+  }
+
+//! @brief Destructor; adds the elapsed time to the stage (if not
+//! stopped yet).
+XC::EquiSolnAlgo::StageTimer::~StageTimer(void)
+  { stop(); }
+
+//! @brief Add the time argument to the stage and increment its count.
+//! @param name: name of the stage.
+//! @param t: time (seconds).
+void XC::EquiSolnAlgo::addStageTime(const std::string &name, const double &t)
+  {
+    stageTimes[name]+= t;
+    stageCounts[name]+= 1;
+  }
+
+//! @brief Return true if the algorithm measures the time spent
+//! in each stage.
+bool XC::EquiSolnAlgo::getMeasureTimes(void) const
+  { return measureTimes; }
+
+//! @brief If true the algorithm measures the time spent in each
+//! stage (defaults to false).
+void XC::EquiSolnAlgo::setMeasureTimes(const bool &b)
+  { measureTimes= b; }
+
+//! @brief Set to zero the times spent in each stage (and the
+//! number of times each stage has been executed).
+void XC::EquiSolnAlgo::resetStageTimes(void)
+  {
+    stageTimes.clear();
+    stageCounts.clear();
+  }
+
+//! @brief Return the time (seconds) spent in each stage since the
+//! last reset.
+const std::map<std::string, double> &XC::EquiSolnAlgo::getStageTimes(void) const
+  { return stageTimes; }
+
+//! @brief Return the time (seconds) spent in each stage since the
+//! last reset in a Python dictionary.
+boost::python::dict XC::EquiSolnAlgo::getStageTimesPy(void) const
+  {
+    boost::python::dict retval;
+    for(std::map<std::string, double>::const_iterator i= stageTimes.begin();i!=stageTimes.end();i++)
+      retval[i->first]= i->second;
+    return retval;
+  }
+
+//! @brief Return the number of times each stage has been executed
+//! since the last reset (only counted while measuring times).
+const std::map<std::string, int> &XC::EquiSolnAlgo::getStageCounts(void) const
+  { return stageCounts; }
+
+//! @brief Return the number of times each stage has been executed
+//! since the last reset in a Python dictionary.
+boost::python::dict XC::EquiSolnAlgo::getStageCountsPy(void) const
+  {
+    boost::python::dict retval;
+    for(std::map<std::string, int>::const_iterator i= stageCounts.begin();i!=stageCounts.end();i++)
+      retval[i->first]= i->second;
+    return retval;
+  }
 
 //! @brief Returns a pointer to the convergence test.
 const XC::ConvergenceTest *XC::EquiSolnAlgo::getConvergenceTestPtr(void) const
@@ -70,6 +70,10 @@
 
 #include <solution/analysis/algorithm/SolutionAlgorithm.h>
 #include <iostream>
+#include <map>
+#include <string>
+#include <chrono>
+#include <boost/python/dict.hpp>
 
 namespace XC {
 class AnalysisModel;
@@ -90,7 +94,27 @@ class IncrementalIntegrator;
 //! increment in a static analysis.
 class EquiSolnAlgo: public SolutionAlgorithm
   {
+  private:
+    bool measureTimes; //!< if true, accumulate the time spent in each stage.
+    std::map<std::string, double> stageTimes; //!< time (seconds) spent in each stage (formTangent, formUnbalance, solve, update).
+    std::map<std::string, int> stageCounts; //!< number of times each stage has been executed.
   protected:
+    //! @brief Accumulates the time elapsed from its construction to
+    //! its destruction (or to the call to stop) in the stage of the
+    //! algorithm (if the algorithm measures times).
+    class StageTimer
+      {
+        EquiSolnAlgo &algo;
+        const char *stageName;
+        bool running;
+        std::chrono::steady_clock::time_point start;
+      public:
+        StageTimer(EquiSolnAlgo &, const char *);
+        void stop(void);
+        ~StageTimer(void);
+      };
+    void addStageTime(const std::string &, const double &);
+
     EquiSolnAlgo(SolutionStrategy *,int classTag);
   public:
     // virtual functions
@@ -110,6 +134,14 @@ class EquiSolnAlgo: public SolutionAlgorithm
     // the following are not protected as convergence test
     // may need access to them
     IncrementalIntegrator *getIncrementalIntegratorPtr(void);
+
+    bool getMeasureTimes(void) const;
+    void setMeasureTimes(const bool &);
+    void resetStageTimes(void);
+    const std::map<std::string, double> &getStageTimes(void) const;
+    boost::python::dict getStageTimesPy(void) const;
+    const std::map<std::string, int> &getStageCounts(void) const;
+    boost::python::dict getStageCountsPy(void) const;
   };
 } // end of XC namespace
 
@@ -73,7 +73,7 @@
 
 //! @brief Constructor
 XC::Linear::Linear(SolutionStrategy *owr)
-  :EquiSolnAlgo(owr,EquiALGORITHM_TAGS_Linear) {}
+  :EquiSolnAlgo(owr,EquiALGORITHM_TAGS_Linear), factorOnce(false), tangentFormed(false) {}
 
 XC::SolutionAlgorithm *XC::Linear::getCopy(void) const
   { return new Linear(*this); }
@@ -93,32 +93,44 @@ int XC::Linear::resuelve(void)
         return -5;
       }
 
-    if(theIncIntegrator->formTangent()<0) //Builds tangent stiffness matrix.
+    if(!(factorOnce && tangentFormed)) //Reuse the factorized tangent if possible.
       {
-        std::cerr << getClassName() << "::" << __FUNCTION__
-                  << "; WARNING the XC::Integrator"
-                  << " failed in formTangent().\n";
-        return -1;
-      }
-
-    if(theIncIntegrator->formUnbalance()<0) //Builds load vector.
-      {
-        std::cerr << getClassName() << "::" << __FUNCTION__
-                  << "; WARNING the XC::Integrator"
-                  << " failed in formUnbalance().\n";
-        return -2;
+        StageTimer timer(*this, "formTangent");
+        if(theIncIntegrator->formTangent()<0) //Builds tangent stiffness matrix.
+          {
+            std::cerr << getClassName() << "::" << __FUNCTION__
+                      << "; WARNING the XC::Integrator"
+                      << " failed in formTangent().\n";
+            return -1;
+          }
+        tangentFormed= true;
       }
 
-    if(theSOE->solve() < 0) //launches SOE solution.
-      {
-        std::cerr << getClassName() << "::" << __FUNCTION__
-                  << "; WARNING the " << theSOE->getClassName()
-                  << " failed in solve()\n";        
-        return -3;
-      }
+    {
+      StageTimer timer(*this, "formUnbalance");
+      if(theIncIntegrator->formUnbalance()<0) //Builds load vector.
+        {
+          std::cerr << getClassName() << "::" << __FUNCTION__
+                    << "; WARNING the XC::Integrator"
+                    << " failed in formUnbalance().\n";
+          return -2;
+        }
+    }
+
+    {
+      StageTimer timer(*this, "solve"); // factorization (if needed) and substitution.
+      if(theSOE->solve() < 0) //launches SOE solution.
+        {
+          std::cerr << getClassName() << "::" << __FUNCTION__
+                    << "; WARNING the " << theSOE->getClassName()
+                    << " failed in solve()\n";        
+          return -3;
+        }
+    }
 
     const Vector &deltaU = theSOE->getX(); //Gets the displacement vector.
 
+    StageTimer timer(*this, "update");
     if(theIncIntegrator->update(deltaU) < 0) //Updates displacements.
       {
         std::cerr << getClassName() << "::" << __FUNCTION__
@@ -153,6 +165,27 @@ int XC::Linear::solveCurrentStep(void)
     return resuelve();
   }
 
+//! @brief The tangent must be formed again after a change in the domain.
+int XC::Linear::domainChanged(void)
+  {
+    tangentFormed= false;
+    return EquiSolnAlgo::domainChanged();
+  }
+
+//! @brief Return true if the tangent is formed and factorized only once
+//! (until the domain changes).
+bool XC::Linear::getFactorOnce(void) const
+  { return factorOnce; }
+
+//! @brief If true the tangent is formed and factorized only once
+//! (until the domain changes). Useful to solve several load vectors
+//! on a linear problem.
+void XC::Linear::setFactorOnce(const bool &b)
+  {
+    factorOnce= b;
+    tangentFormed= false;
+  }
+
 //! @brief Sets the convergence test to use in the analysis.
 int XC::Linear::setConvergenceTest(ConvergenceTest *theNewTest)
   { return 0; }
@@ -95,6 +95,8 @@ namespace XC {
 //! response quantities are chosen as approximate solution quantities.
 class Linear: public EquiSolnAlgo
   {
+    bool factorOnce; //!< if true form and factorize the tangent only once.
+    bool tangentFormed; //!< true if the tangent has been formed after the last domain change.
     int resuelve();
   protected:
     friend class SolutionStrategy;
@@ -105,6 +107,10 @@ class Linear: public EquiSolnAlgo
 
     int solveCurrentStep(void);
     int setConvergenceTest(ConvergenceTest *theNewTest);
+    int domainChanged(void);
+
+    bool getFactorOnce(void) const;
+    void setFactorOnce(const bool &);
     
     virtual int sendSelf(Communicator &);
     virtual int recvSelf(const Communicator &);
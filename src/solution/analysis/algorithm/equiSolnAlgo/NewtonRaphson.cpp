@@ -127,12 +127,15 @@ int XC::NewtonRaphson::solveCurrentStep(void)
         return -5;
       }
 
-    if(theIntegrator->formUnbalance() < 0)
-      {
-        std::cerr << getClassName() << "::" << __FUNCTION__
-                  << "; the Integrator failed in formUnbalance().\n";
-        return -2;
-      }
+    {
+      StageTimer timer(*this, "formUnbalance");
+      if(theIntegrator->formUnbalance() < 0)
+        {
+          std::cerr << getClassName() << "::" << __FUNCTION__
+                    << "; the Integrator failed in formUnbalance().\n";
+          return -2;
+        }
+    }
 
     // set itself as the ConvergenceTest objects EquiSolnAlgo
     theTest->set_owner(getSolutionStrategy());
@@ -147,7 +150,7 @@ int XC::NewtonRaphson::solveCurrentStep(void)
     int count = 0;
     do
       {
-
+        StageTimer tangentTimer(*this, "formTangent");
         if(tangent == INITIAL_THEN_CURRENT_TANGENT)
           {
             if(count == 0)
@@ -178,12 +181,16 @@ int XC::NewtonRaphson::solveCurrentStep(void)
                 return -1;
               }
           }
+        tangentTimer.stop();
+        StageTimer solveTimer(*this, "solve");
         if(theSOE->solve() < 0)
           {
             std::cerr << getClassName() << "::" << __FUNCTION__
 		      << "; the LinearSysOfEqn failed in solve()\n";
             return -3;
           }
+        solveTimer.stop();
+        StageTimer updateTimer(*this, "update");
         if(theIntegrator->update(theSOE->getX()) < 0)
           {
             std::cerr << getClassName() << "::" << __FUNCTION__
@@ -191,12 +198,15 @@ int XC::NewtonRaphson::solveCurrentStep(void)
             return -4;
           }
 
+        updateTimer.stop();
+        StageTimer unbalanceTimer(*this, "formUnbalance");
         if(theIntegrator->formUnbalance() < 0)
           {
             std::cerr << getClassName() << "::" << __FUNCTION__
 		      << "; the Integrator failed in formUnbalance()\n";
             return -2;
           }
+        unbalanceTimer.stop();
 
         result = theTest->test();
         this->record(count++); //Call the record(...) method of all recorders.
@@ -21,7 +21,12 @@
 //----------------------------------------------------------------------------
 //python_interface.tcc
 
-class_<XC::EquiSolnAlgo, bases<XC::SolutionAlgorithm>, boost::noncopyable >("EquiSolnAlgo", no_init);
+class_<XC::EquiSolnAlgo, bases<XC::SolutionAlgorithm>, boost::noncopyable >("EquiSolnAlgo", no_init)
+  .add_property("measureTimes", &XC::EquiSolnAlgo::getMeasureTimes, &XC::EquiSolnAlgo::setMeasureTimes,"if true, measure the time spent in each stage of the algorithm (default = false).")
+  .add_property("stageTimes", &XC::EquiSolnAlgo::getStageTimesPy,"return a dictionary with the time (seconds) spent in each stage (formTangent, formUnbalance, solve, update) since the last reset.")
+  .add_property("stageCounts", &XC::EquiSolnAlgo::getStageCountsPy,"return a dictionary with the number of times each stage (formTangent, formUnbalance, solve, update) has been executed since the last reset (counted while measureTimes is true).")
+  .def("resetStageTimes", &XC::EquiSolnAlgo::resetStageTimes,"set to zero the time spent in each stage.")
+  ;
 
 class_<XC::EquiSolnConvAlgo, bases<XC::EquiSolnAlgo>, boost::noncopyable >("EquiSolnConvAlgo", no_init);
 
@@ -35,7 +40,9 @@ class_<XC::KrylovNewton, bases<XC::EquiSolnAlgo>, boost::noncopyable >("KrylovNe
   .add_property("maxDimension", &XC::KrylovNewton::getMaxDimension, &XC::KrylovNewton::setMaxDimension,"max number of iterations until the tangent is reformed and the acceleration restarts (default = 3)")
   ;
 
-class_<XC::Linear, bases<XC::EquiSolnAlgo>, boost::noncopyable >("Linear", no_init);
+class_<XC::Linear, bases<XC::EquiSolnAlgo>, boost::noncopyable >("Linear", no_init)
+  .add_property("factorOnce", &XC::Linear::getFactorOnce, &XC::Linear::setFactorOnce,"if true, the tangent is formed and factorized only once until the domain changes (default = false).")
+  ;
 
 class_<XC::NewtonBased, bases<XC::EquiSolnAlgo>, boost::noncopyable >("NewtonBased", no_init);
 
@@ -41,6 +41,7 @@ XC::ElementPropRecorder::ElementPropRecorder(Domain *ptr_dom)
 void XC::ElementPropRecorder::setElements(const ID &iElements)
   {
     const int sz= iElements.Size();
+    pyObjectsUpToDate= false;
     if(sz)
       {
         for(int i= 0;i<sz;i++)
@@ -41,6 +41,7 @@ XC::NodePropRecorder::NodePropRecorder(Domain *ptr_dom)
 void XC::NodePropRecorder::setNodes(const ID &iNodes)
   {
     const int sz= iNodes.Size();
+    pyObjectsUpToDate= false;
     if(sz)
       {
         for(int i= 0;i<sz;i++)
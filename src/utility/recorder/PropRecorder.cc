@@ -35,7 +35,7 @@
 //! @brief Constructor.
 XC::PropRecorder::PropRecorder(int classTag,Domain *ptr_dom)
   : DomainRecorderBase(classTag,ptr_dom), CallbackRecord(), CallbackRestart(),
-  lastCommitTag(-1),lastTimeStamp(-1.0) {}
+  pyObjectsUpToDate(false), lastCommitTag(-1),lastTimeStamp(-1.0) {}
 
 double XC::PropRecorder::getCurrentTime(void) const
   { return theDomain->getTimeTracker().getCurrentTime(); }
@@ -53,27 +53,108 @@ std::string XC::PropRecorder::getCurrentCombinationName(void) const
     return retval;
   }
 
+//! @brief Assigns the callback from the Python object argument: a string
+//! containing the code to execute or a callable (None removes the callback).
+//!
+//! @param obj: Python object (string, callable or None).
+//! @param code: string to store the code.
+//! @param callable: object to store the callable.
+void XC::PropRecorder::setCallback(const boost::python::object &obj, std::string &code, boost::python::object &callable)
+  {
+    boost::python::extract<std::string> str(obj);
+    if(str.check())
+      {
+        code= str();
+        callable= boost::python::object();
+      }
+    else if(obj.is_none())
+      {
+        code.clear();
+        callable= boost::python::object();
+      }
+    else if(PyCallable_Check(obj.ptr()))
+      {
+        code.clear();
+        callable= obj;
+      }
+    else
+      std::cerr << "PropRecorder::" << __FUNCTION__
+                << "; argument must be a string or a callable object."
+                << std::endl;
+  }
+
+//! @brief Returns the callable if any, otherwise returns the code string.
+boost::python::object XC::PropRecorder::getCallback(const std::string &code, const boost::python::object &callable)
+  {
+    if(!callable.is_none())
+      return callable;
+    else
+      return boost::python::str(code);
+  }
+
+//! @brief Calls the callable with this recorder and the argument.
+void XC::PropRecorder::callCallable(const boost::python::object &callable, const boost::python::object &arg)
+  {
+    boost::python::object self(boost::ref(*this));
+    try
+      { callable(self,arg); }
+    catch(boost::python::error_already_set &)
+      {
+	std::cerr << getClassName() << "::" << __FUNCTION__
+	          << "; error in callback." << std::endl;
+        PyErr_Print();
+      }
+  }
+
 //! @brief Runs setup callback.
 void XC::PropRecorder::callSetupCallback(const int &commitTag,const double &timeStamp)
   {
     this->lastCommitTag= commitTag;
     this->lastTimeStamp= timeStamp;
     boost::python::object pyObj(boost::ref(*this));
-    if(!CallbackSetup.empty())
+    if(!callableSetup.is_none())
+      {
+        try
+          { callableSetup(pyObj); }
+        catch(boost::python::error_already_set &)
+          {
+	    std::cerr << getClassName() << "::" << __FUNCTION__
+	              << "; error in callback." << std::endl;
+            PyErr_Print();
+          }
+      }
+    else if(!CallbackSetup.empty())
       CommandEntity_exec(pyObj,CallbackSetup);
   }
 
-
-void XC::PropRecorder::setCallbackRecord(const std::string &str)
-  { CallbackRecord= str; }
-std::string XC::PropRecorder::getCallbackRecord(void)
-  { return CallbackRecord; }
-void XC::PropRecorder::setCallbackSetup(const std::string &str)
-  { CallbackSetup= str; }
-std::string XC::PropRecorder::getCallbackSetup(void)
-  { return CallbackSetup; }
-void XC::PropRecorder::setCallbackRestart(const std::string &str)
-  { CallbackRestart= str; }
-std::string XC::PropRecorder::getCallbackRestart(void)
-  { return CallbackRestart; }
-
+//! @brief Assigns the code (string) or the callable (f(recorder, obj)) to
+//! call for each recorded object on each record call.
+void XC::PropRecorder::setCallbackRecord(const boost::python::object &obj)
+  { setCallback(obj,CallbackRecord,callableRecord); }
+boost::python::object XC::PropRecorder::getCallbackRecord(void)
+  { return getCallback(CallbackRecord,callableRecord); }
+//! @brief Assigns the code (string) or the callable (f(recorder)) to
+//! call before any record calls.
+void XC::PropRecorder::setCallbackSetup(const boost::python::object &obj)
+  { setCallback(obj,CallbackSetup,callableSetup); }
+boost::python::object XC::PropRecorder::getCallbackSetup(void)
+  { return getCallback(CallbackSetup,callableSetup); }
+//! @brief Assigns the code (string) or the callable (f(recorder, obj)) to
+//! call for each recorded object on each restart call.
+void XC::PropRecorder::setCallbackRestart(const boost::python::object &obj)
+  { setCallback(obj,CallbackRestart,callableRestart); }
+boost::python::object XC::PropRecorder::getCallbackRestart(void)
+  { return getCallback(CallbackRestart,callableRestart); }
+//! @brief Assigns the callable (f(recorder, objects)) to call once on each
+//! record call with the list of all the recorded objects.
+void XC::PropRecorder::setCallbackRecordSet(const boost::python::object &obj)
+  {
+    if(obj.is_none() || PyCallable_Check(obj.ptr()))
+      callableRecordSet= obj;
+    else
+      std::cerr << getClassName() << "::" << __FUNCTION__
+                << "; argument must be a callable object."
+                << std::endl;
+  }
+boost::python::object XC::PropRecorder::getCallbackRecordSet(void)
+  { return callableRecordSet; }
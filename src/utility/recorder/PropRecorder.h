@@ -43,11 +43,22 @@ class PropRecorder: public DomainRecorderBase
     std::string CallbackSetup; //!< Python script to execute before any record calls.
     std::string CallbackRecord; //!< Python script to execute on each record call.
     std::string CallbackRestart; //!< Python script to execute on each restart call.
+    boost::python::object callableSetup; //!< Python callable to call before any record calls: f(recorder).
+    boost::python::object callableRecord; //!< Python callable to call on each record call: f(recorder, obj).
+    boost::python::object callableRestart; //!< Python callable to call on each restart call: f(recorder, obj).
+    boost::python::object callableRecordSet; //!< Python callable to call once on each record call with all the objects: f(recorder, objects).
+    boost::python::list pyObjects; //!< Python list of the recorded objects (passed to callableRecordSet).
+    bool pyObjectsUpToDate; //!< False if pyObjects must be rebuilt.
     int lastCommitTag; //!< CommitTag of the last record call.
     double lastTimeStamp; //!< TimeStamp of the last record call.
 
+    static void setCallback(const boost::python::object &,std::string &,boost::python::object &);
+    static boost::python::object getCallback(const std::string &,const boost::python::object &);
+    void callCallable(const boost::python::object &,const boost::python::object &);
     void callSetupCallback(const int &,const double &);
     template <class Container>
+    void callRecordSetCallback(Container &c);
+    template <class Container>
     void callRecordCallback(Container &c,const int &,const double &);
     template <class Container>
     void callRestartCallback(Container &c);
@@ -64,31 +75,64 @@ class PropRecorder: public DomainRecorderBase
     double getCommittedTime(void) const;
     int getCommitTag(void) const;
 
-    void setCallbackSetup(const std::string &);
-    std::string getCallbackSetup(void);
-    void setCallbackRecord(const std::string &);
-    std::string getCallbackRecord(void);
-    void setCallbackRestart(const std::string &);
-    std::string getCallbackRestart(void);
+    void setCallbackSetup(const boost::python::object &);
+    boost::python::object getCallbackSetup(void);
+    void setCallbackRecord(const boost::python::object &);
+    boost::python::object getCallbackRecord(void);
+    void setCallbackRestart(const boost::python::object &);
+    boost::python::object getCallbackRestart(void);
+    void setCallbackRecordSet(const boost::python::object &);
+    boost::python::object getCallbackRecordSet(void);
 
   };
 
+//! @brief Calls the set callback with the list of all the container
+//! elements (the list is built only when the container changes).
+template <class Container>
+void XC::PropRecorder::callRecordSetCallback(Container &c)
+  {
+    if(!pyObjectsUpToDate)
+      {
+        pyObjects= boost::python::list();
+        for(typename Container::iterator i= c.begin();i!=c.end();i++)
+          {
+	    typename Container::value_type tmp= *i;
+            if(tmp)
+              pyObjects.append(boost::python::object(boost::ref(*tmp)));
+            else
+	      std::cerr << getClassName() << "::" << __FUNCTION__
+	                << "; pointer is null." << std::endl;
+          }
+        pyObjectsUpToDate= true;
+      }
+    callCallable(callableRecordSet,pyObjects);
+  }
+
 //! @brief Calls record callback on each container element.
 template <class Container>
 void XC::PropRecorder::callRecordCallback(Container &c,const int &commitTag,const double &timeStamp)
   {
     this->callSetupCallback(commitTag,timeStamp);
-    for(typename Container::iterator i= c.begin();i!=c.end();i++)
+    if(!callableRecordSet.is_none())
+      callRecordSetCallback(c);
+    const bool hasCallable= !callableRecord.is_none();
+    if(hasCallable || !CallbackRecord.empty())
       {
-	typename Container::value_type tmp= *i;
-        if(tmp)
+        for(typename Container::iterator i= c.begin();i!=c.end();i++)
           {
-            boost::python::object pyObj(boost::ref(*tmp));
-            CommandEntity_exec(pyObj,CallbackRecord);
+	    typename Container::value_type tmp= *i;
+            if(tmp)
+              {
+                boost::python::object pyObj(boost::ref(*tmp));
+                if(hasCallable)
+                  callCallable(callableRecord,pyObj);
+                else
+                  CommandEntity_exec(pyObj,CallbackRecord);
+              }
+            else
+	      std::cerr << getClassName() << "::" << __FUNCTION__
+	                << "; pointer is null." << std::endl;
           }
-        else
-	  std::cerr << getClassName() << "::" << __FUNCTION__
-	            << "; pointer is null." << std::endl;
       }
   }
 
@@ -102,7 +146,10 @@ void PropRecorder::callRestartCallback(Container &c)
         if(tmp)
           {
             boost::python::object pyObj(boost::ref(*tmp));
-            CommandEntity_exec(pyObj,this->CallbackRestart);
+            if(!callableRestart.is_none())
+              callCallable(callableRestart,pyObj);
+            else
+              CommandEntity_exec(pyObj,this->CallbackRestart);
           }
         else
 	  std::cerr << getClassName() << "::" << __FUNCTION__
@@ -35,9 +35,10 @@ class_<XC::DomainRecorderBase, bases<XC::Recorder>, boost::noncopyable >("Domain
 //class_<XC::FilePlotter , bases<XC::Recorder>, boost::noncopyable >("FilePlotter", no_init);
 
 class_<XC::PropRecorder, bases<XC::Recorder>, boost::noncopyable >("PropRecorder", no_init)
-  .add_property("callbackSetup",&XC::PropRecorder::getCallbackSetup,&XC::PropRecorder::setCallbackSetup,"Assigns code to execute to setup recording.")
-  .add_property("callbackRecord",&XC::PropRecorder::getCallbackRecord,&XC::PropRecorder::setCallbackRecord,"Assigns code to execute while recording.")
-  .add_property("callbackRestart",&XC::PropRecorder::getCallbackRestart,&XC::PropRecorder::setCallbackRestart,"Assigns code to execute while restartingg.")
+  .add_property("callbackSetup",&XC::PropRecorder::getCallbackSetup,&XC::PropRecorder::setCallbackSetup,"Assigns code (string) or callable f(recorder) to execute to setup recording.")
+  .add_property("callbackRecord",&XC::PropRecorder::getCallbackRecord,&XC::PropRecorder::setCallbackRecord,"Assigns code (string) or callable f(recorder, obj) to execute for each object while recording.")
+  .add_property("callbackRestart",&XC::PropRecorder::getCallbackRestart,&XC::PropRecorder::setCallbackRestart,"Assigns code (string) or callable f(recorder, obj) to execute for each object while restarting.")
+  .add_property("callbackRecordSet",&XC::PropRecorder::getCallbackRecordSet,&XC::PropRecorder::setCallbackRecordSet,"Assigns callable f(recorder, objects) to call once while recording with the list of all the recorded objects.")
   .add_property("getLastCommitTag",&XC::PropRecorder::getLastCommitTag)
   .add_property("getLastTimeStamp",&XC::PropRecorder::getLastTimeStamp)
   .add_property("getCurrentTime",&XC::PropRecorder::getCurrentTime)
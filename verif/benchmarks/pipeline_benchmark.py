@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+''' Time and peak memory of the stages of the analysis pipeline (mesh
+    generation, solution, internal forces export, limit state checking
+    and display of the results) for parametric beam, shell and frame
+    models of several sizes.
+
+    Each model and size is run in its own process so the peak resident
+    set size measured corresponds only to that case. The results are
+    written in JSON format so two runs can be compared.
+
+    Usage:
+      python pipeline_benchmark.py [--models beam shell frame]
+                                   [--dofs 10000 100000 1000000]
+                                   [--output results.json]
+                                   [--compare reference.json]
+'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import sys
+import os
+import math
+import json
+import time
+import datetime
+import platform
+import resource
+import argparse
+import subprocess
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from model.geometry import grid_model as gm
+from materials import typical_materials
+from materials.astm_aisc import ASTM_materials
+from materials.astm_aisc import AISC_limit_state_checking as aisc
+from actions import load_cases
+from actions import combinations as combs
+from solution import predefined_solutions
+from postprocess import limit_state_data as lsd
+from postprocess import output_handler
+from postprocess.config import default_config
+
+modelTypes= ['beam', 'shell', 'frame']
+defaultDOFs= [10000, 100000, 1000000]
+
+def getPeakRSS():
+    ''' Return the peak resident set size of this process (MB).'''
+    peak= resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if(sys.platform=='darwin'): # bytes in macOS, kilobytes in Linux.
+        peak/= 1024.0
+    return peak/1024.0
+
+class StageTimer(object):
+    ''' Record the wall time and the peak memory after each stage.
+
+    :ivar stages: list of dictionaries containing the name, the elapsed
+                  time (s) and the peak RSS (MB) of each stage.
+    '''
+    def __init__(self):
+        ''' Constructor.'''
+        self.stages= list()
+
+    def run(self, name, function, *args, **kwargs):
+        ''' Run the function and record its elapsed time.
+
+        :param name: name of the stage.
+        :param function: function to run.
+        '''
+        start= time.time()
+        retval= function(*args, **kwargs)
+        self.stages.append({'name': name, 'time': time.time()-start, 'peakRSS': getPeakRSS()})
+        return retval
+
+def getCaseDir(modelType, targetDOFs):
+    ''' Return the working directory of the case.'''
+    return '/tmp/pipeline_benchmark/'+modelType+'_'+str(targetDOFs)
+
+class BenchmarkModel(object):
+    ''' Parametric model whose size is defined by the approximate number
+        of degrees of freedom.
+
+    :ivar targetDOFs: approximate number of degrees of freedom.
+    '''
+    def __init__(self, targetDOFs):
+        ''' Constructor.
+
+        :param targetDOFs: approximate number of degrees of freedom.
+        '''
+        self.targetDOFs= targetDOFs
+        self.feProblem= xc.FEProblem()
+        self.feProblem.logFileName= "/tmp/erase.log" # Ignore warning messages
+        self.preprocessor= self.feProblem.getPreprocessor
+        self.nodes= self.preprocessor.getNodeHandler
+        self.modelSpace= predefined_spaces.StructuralMechanics3D(self.nodes)
+        self.steel= ASTM_materials.A992
+        self.steel.gammaM= 1.0
+
+    def getTotalSet(self):
+        ''' Return the set containing all the model.'''
+        return self.modelSpace.getTotalSet()
+
+    def getNumDOFs(self):
+        ''' Return the number of degrees of freedom of the model.'''
+        return sum(n.getNumberDOF for n in self.getTotalSet().nodes)
+
+    def defineLoads(self):
+        ''' Define the load cases and return the load combinations.'''
+        loadCaseManager= load_cases.LoadCaseManager(self.preprocessor)
+        loadCaseNames= ['G', 'Q', 'W']
+        loadCaseManager.defineSimpleLoadCases(loadCaseNames)
+        for name, load in zip(loadCaseNames, [[0,0,-10e3,0,0,0], [0,0,-5e3,0,0,0], [2e3,1e3,0,0,0,0]]):
+            cLC= loadCaseManager.setCurrentLoadCase(name)
+            for n in self.getTotalSet().nodes:
+                cLC.newNodalLoad(n.tag,xc.Vector(load))
+        combContainer= combs.CombContainer()
+        combContainer.ULS.perm.add('ULS01', '1.35*G+1.5*Q')
+        combContainer.ULS.perm.add('ULS02', '1.35*G+1.5*W')
+        combContainer.ULS.perm.add('ULS03', '1.35*G+1.5*Q+0.9*W')
+        combContainer.ULS.perm.add('ULS04', '1.0*G+1.5*W')
+        combContainer.dumpCombinations(self.preprocessor)
+        return combContainer
+
+    def solve(self):
+        ''' Solve the first load combination.'''
+        self.modelSpace.removeAllLoadPatternsFromDomain()
+        self.modelSpace.addLoadCaseToDomain('ULS01')
+        solProc= predefined_solutions.SimpleStaticLinear(self.feProblem)
+        result= solProc.solve()
+        self.modelSpace.removeAllLoadPatternsFromDomain()
+        self.modelSpace.revertToStart()
+        return result
+
+    def runChecking(self, limitState):
+        ''' Run the limit state checking.'''
+        outCfg= lsd.VerifOutVars(setCalc= self.getTotalSet(), appendToResFile='N', listFile='N', calcMeanCF='Y')
+        return limitState.runChecking(outCfg)
+
+    def displayField(self, limitState, section, caseDir):
+        ''' Display the capacity factors (offscreen, the image is
+            written in the case directory).'''
+        oh= output_handler.OutputHandler(self.modelSpace)
+        fileName= os.path.join(caseDir, 'capacity_factors.png')
+        oh.displayField(limitStateLabel= limitState.label, section= section, argument= 'CF', component= None, setToDisplay= self.getTotalSet(), fileName= fileName)
+
+class BeamBenchmarkModel(BenchmarkModel):
+    ''' Continuous beam supported each ten elements.'''
+    section= 1
+
+    def __init__(self, targetDOFs):
+        ''' Constructor.
+
+        :param targetDOFs: approximate number of degrees of freedom.
+        '''
+        super(BeamBenchmarkModel,self).__init__(targetDOFs)
+        self.numElements= max(int(targetDOFs/6)-1, 10)
+
+    def genMesh(self):
+        ''' Generate the finite element mesh.'''
+        self.shape= ASTM_materials.WShape(self.steel,'W18X50')
+        xcSection= self.shape.defElasticShearSection3d(self.preprocessor)
+        lin= self.modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+        elements= self.preprocessor.getElementHandler
+        elements.defaultTransformation= lin.name
+        elements.defaultMaterial= xcSection.name
+        beamNodes= [self.nodes.newNodeXYZ(i*0.5,0.0,0.0) for i in range(0,self.numElements+1)]
+        for nA, nB in zip(beamNodes[:-1],beamNodes[1:]):
+            e= elements.newElement("ElasticBeam3d",xc.ID([nA.tag,nB.tag]))
+            e.setProp('crossSection',self.shape)
+            e.setProp('sectionClass',aisc.SectionClassif.compact)
+        self.modelSpace.fixNode000_000(beamNodes[0].tag)
+        for n in beamNodes[10::10]:
+            self.modelSpace.fixNode000_FFF(n.tag)
+
+    def getLimitState(self):
+        ''' Return the limit state to check.'''
+        limitState= lsd.normalStressesResistance
+        limitState.controller= aisc.BiaxialBendingNormalStressController(limitState.label)
+        return limitState
+
+class FrameBenchmarkModel(BeamBenchmarkModel):
+    ''' Ten storey building frame with square bays generated with
+        GridModel; each column and each beam is meshed with two elements.'''
+    numStoreys= 10
+    bayLength= 5.0
+    storeyHeight= 3.0
+
+    def __init__(self, targetDOFs):
+        ''' Constructor.
+
+        :param targetDOFs: approximate number of degrees of freedom.
+        '''
+        super(FrameBenchmarkModel,self).__init__(targetDOFs)
+        # Approximately 4*numStoreys+1 nodes for each bay in plan.
+        self.numBays= max(int(math.sqrt(targetDOFs/6.0/(4*self.numStoreys+1))), 1)
+
+    def genMesh(self):
+        ''' Generate the finite element mesh.'''
+        self.shape= ASTM_materials.WShape(self.steel,'W18X50')
+        xcSection= self.shape.defElasticShearSection3d(self.preprocessor)
+        xyList= [i*self.bayLength for i in range(0,self.numBays+1)]
+        zList= [k*self.storeyHeight for k in range(0,self.numStoreys+1)]
+        grid= gm.GridModel(self.preprocessor,xyList,xyList,zList)
+        grid.generatePoints()
+        floorRanges= [gm.IJKRange((0,0,k),(self.numBays,self.numBays,k)) for k in range(1,self.numStoreys+1)]
+        beams= grid.genLinMultiRegion(floorRanges,'beams')
+        columnRanges= [gm.IJKRange((i,j,0),(i,j,self.numStoreys)) for i in range(0,self.numBays+1) for j in range(0,self.numBays+1)]
+        columns= grid.genLinMultiRegion(columnRanges,'columns')
+        seedElemHandler= self.preprocessor.getElementHandler.seedElemHandler
+        seedElemHandler.defaultMaterial= xcSection.name
+        for lineSet, xzVector in [(beams, [0,0,1]), (columns, [1,0,0])]:
+            lin= self.modelSpace.newLinearCrdTransf(lineSet.name+'Lin',xc.Vector(xzVector))
+            seedElemHandler.defaultTransformation= lin.name
+            seedElemHandler.newElement("ElasticBeam3d",xc.ID([0,0]))
+            for l in lineSet.getLines:
+                l.nDiv= 2
+            lineSet.genMesh(xc.meshDir.I)
+        for e in self.getTotalSet().elements:
+            e.setProp('crossSection',self.shape)
+            e.setProp('sectionClass',aisc.SectionClassif.compact)
+        for n in self.getTotalSet().nodes:
+            if(abs(n.getInitialPos3d.z)<1e-6):
+                self.modelSpace.fixNode000_000(n.tag)
+
+class ShellBenchmarkModel(BenchmarkModel):
+    ''' Square steel plate simply supported on its contour, generated
+        with GridModel.'''
+    section= None
+    thickness= 0.02
+    elemSize= 0.25
+
+    def __init__(self, targetDOFs):
+        ''' Constructor.
+
+        :param targetDOFs: approximate number of degrees of freedom.
+        '''
+        super(ShellBenchmarkModel,self).__init__(targetDOFs)
+        self.numDivisions= max(int(math.sqrt(targetDOFs/6.0))-1, 2)
+
+    def genMesh(self):
+        ''' Generate the finite element mesh.'''
+        steel3d= typical_materials.defElasticIsotropic3d(self.preprocessor, "steel3d",self.steel.E,self.steel.nu,rho= self.steel.rho)
+        plateFiber= typical_materials.defMembranePlateFiberSection(self.preprocessor, name= "plateFiber", h= self.thickness, nDMaterial= steel3d)
+        side= self.numDivisions*self.elemSize
+        grid= gm.GridModel(self.preprocessor,[0.0,side],[0.0,side],[0.0])
+        grid.generatePoints()
+        plate= grid.genSurfOneXYZRegion(((0.0,0.0,0.0),(side,side,0.0)),'plate')
+        seedElemHandler= self.preprocessor.getElementHandler.seedElemHandler
+        seedElemHandler.defaultMaterial= plateFiber.name
+        seedElemHandler.newElement("ShellMITC4",xc.ID([0,0,0,0]))
+        for s in plate.getSurfaces:
+            s.nDivI= self.numDivisions
+            s.nDivJ= self.numDivisions
+        plate.genMesh(xc.meshDir.I)
+        for e in self.getTotalSet().elements:
+            e.setProp('yieldStress', self.steel.fy)
+        tol= 1e-6
+        for n in self.getTotalSet().nodes:
+            pos= n.getInitialPos3d
+            if((min(pos.x,pos.y)<tol) or (max(pos.x,pos.y)>side-tol)):
+                self.modelSpace.fixNode000_FFF(n.tag)
+
+    def getLimitState(self):
+        ''' Return the limit state to check.'''
+        limitState= lsd.vonMisesStressResistance
+        limitState.controller= aisc.VonMisesStressController(limitState.label)
+        return limitState
+
+benchmarkModels= {'beam': BeamBenchmarkModel, 'shell': ShellBenchmarkModel, 'frame': FrameBenchmarkModel}
+
+def runCase(modelType, targetDOFs):
+    ''' Run all the stages of the pipeline for the model and return a
+        dictionary with the results.
+
+    :param modelType: type of the model (beam, shell or frame).
+    :param targetDOFs: approximate number of degrees of freedom.
+    '''
+    caseDir= getCaseDir(modelType, targetDOFs)
+    cfg= default_config.EnvConfig(language='en',intForcPath= 'results/internalForces/',verifPath= 'results/verifications/',reportPath='./',resultsPath= 'annex/',grWidth='120mm')
+    cfg.projectDirTree.workingDirectory= caseDir
+    lsd.LimitStateData.envConfig= cfg
+    timer= StageTimer()
+    model= benchmarkModels[modelType](targetDOFs)
+    timer.run('mesh', model.genMesh)
+    combContainer= model.defineLoads()
+    timer.run('solve', model.solve)
+    limitState= model.getLimitState()
+    timer.run('saveAll', limitState.saveAll, combContainer, model.getTotalSet())
+    timer.run('runChecking', model.runChecking, limitState)
+    timer.run('displayField', model.displayField, limitState, model.section, caseDir)
+    totalSet= model.getTotalSet()
+    return {'model': modelType, 'targetDOFs': targetDOFs, 'numDOFs': model.getNumDOFs(), 'numNodes': totalSet.getNumNodes, 'numElements': totalSet.getNumElements, 'stages': timer.stages}
+
+def runCaseInSubprocess(modelType, targetDOFs):
+    ''' Run the case in a new process (so the peak memory is not
+        affected by the previous cases) and return its results.'''
+    command= [sys.executable, os.path.abspath(__file__), '--case', modelType, str(targetDOFs)]
+    output= subprocess.run(command, stdout= subprocess.PIPE, universal_newlines= True)
+    if(output.returncode!=0):
+        return {'model': modelType, 'targetDOFs': targetDOFs, 'error': 'return code: '+str(output.returncode)}
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def getGitRevision():
+    ''' Return the current git revision of the source tree (None if
+        not available).'''
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd= os.path.dirname(os.path.abspath(__file__)), universal_newlines= True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def getStageTimes(results):
+    ''' Return a dictionary with the time of each stage of each case.'''
+    retval= dict()
+    for case in results['cases']:
+        for stage in case.get('stages', list()):
+            retval[(case['model'], case['targetDOFs'], stage['name'])]= stage['time']
+    return retval
+
+def compare(results, reference):
+    ''' Print the ratio between the times of each stage and those of the
+        reference run.'''
+    times= getStageTimes(results)
+    referenceTimes= getStageTimes(reference)
+    print('model', 'DOFs', 'stage', 'time(s)', 'reference(s)', 'ratio')
+    for key in sorted(times):
+        if key in referenceTimes:
+            ratio= times[key]/referenceTimes[key] if(referenceTimes[key]>0.0) else float('nan')
+            print(key[0], key[1], key[2], '{:.3f}'.format(times[key]), '{:.3f}'.format(referenceTimes[key]), '{:.2f}'.format(ratio))
+
+if __name__ == '__main__':
+    parser= argparse.ArgumentParser(description= 'Time the stages of the analysis pipeline.')
+    parser.add_argument('--models', nargs= '+', choices= modelTypes, default= modelTypes)
+    parser.add_argument('--dofs', nargs= '+', type= int, default= defaultDOFs)
+    parser.add_argument('--output', default= 'pipeline_benchmark.json', help= 'file to write the results into.')
+    parser.add_argument('--compare', default= None, help= 'results of a previous run to compare with.')
+    parser.add_argument('--case', nargs= 2, default= None, help= argparse.SUPPRESS) # run a single case.
+    args= parser.parse_args()
+    if(args.case):
+        print(json.dumps(runCase(args.case[0], int(args.case[1]))))
+    else:
+        results= {'date': datetime.datetime.now().isoformat(), 'gitRevision': getGitRevision(), 'python': platform.python_version(), 'platform': platform.platform(), 'cases': list()}
+        for modelType in args.models:
+            for targetDOFs in args.dofs:
+                case= runCaseInSubprocess(modelType, targetDOFs)
+                results['cases'].append(case)
+                for stage in case.get('stages', list()):
+                    print(modelType, case.get('numDOFs', targetDOFs), stage['name'], '{:.3f}'.format(stage['time']), 's', '{:.1f}'.format(stage['peakRSS']), 'MB')
+        with open(args.output,'w') as f:
+            json.dump(results, f, indent= 2)
+        if(args.compare):
+            with open(args.compare,'r') as f:
+                compare(results, json.load(f))
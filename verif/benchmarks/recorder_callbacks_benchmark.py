@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+''' Per-commit overhead of the element and node property recorders
+    using the legacy code strings, the per-object callables and the
+    set-level callables (see postprocess/callback_controls.py).
+
+    Usage: python recorder_callbacks_benchmark.py [number of elements]
+'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import sys
+import time
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials.sections.structural_shapes import arcelor_metric_shapes
+from materials.sections import structural_steel
+from materials.ec3 import EC3_materials
+from postprocess import def_vars_control as vc
+from postprocess import callback_controls as cc
+
+numElements= int(sys.argv[1]) if(len(sys.argv)>1) else 2000
+numCommits= 20
+
+# Continuous beam.
+feProblem= xc.FEProblem()
+preprocessor= feProblem.getPreprocessor   
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+HE400B= structural_steel.SteelShape(EC3_materials.S275JR,"HE_400_B",arcelor_metric_shapes.HE)
+profil= HE400B.defElasticShearSection3d(preprocessor)
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= HE400B.sectionName
+beamNodes= [nodes.newNodeXYZ(i*0.5,0.0,0.0) for i in range(0,numElements+1)]
+beamElements= [elements.newElement("ElasticBeam3d",xc.ID([nA.tag,nB.tag])) for nA, nB in zip(beamNodes[:-1],beamNodes[1:])]
+for n in beamNodes[10::10]:
+    modelSpace.fixNode000_FFF(n.tag)
+modelSpace.fixNode000_000(beamNodes[0].tag)
+for e in beamElements:
+    vc.defSteelShapeElasticRangeElementParameters(e,HE400B)
+vc.defVarsControlTensRegElastico3d(beamElements)
+vc.defVarsControlMovModulus(beamNodes)
+lp= modelSpace.newLoadPattern(name= 'A')
+for n in beamNodes:
+    lp.newNodalLoad(n.tag,xc.Vector([0,1e3,-10e3,0,0,0]))
+modelSpace.addLoadCaseToDomain(lp.name)
+solProc= predefined_solutions.SimpleStaticLinear(feProblem)
+solProc.solve()
+
+domain= feProblem.getDomain
+elemRecorder= domain.newRecorder("element_prop_recorder",None)
+elemRecorder.setElements(xc.ID([e.tag for e in beamElements]))
+nodeRecorder= domain.newRecorder("node_prop_recorder",None)
+nodeRecorder.setNodes(xc.ID([n.tag for n in beamNodes]))
+recorder= elemRecorder # used by the legacy code strings.
+
+def timeCommits():
+    ''' Return the mean time of a commit (seconds).'''
+    start= time.time()
+    for i in range(0,numCommits):
+        domain.commit()
+    return (time.time()-start)/numCommits
+
+def setCallbacks(elemRecord= None, elemRecordSet= None, nodeRecord= None, nodeRecordSet= None):
+    elemRecorder.callbackRecord= elemRecord
+    elemRecorder.callbackRecordSet= elemRecordSet
+    nodeRecorder.callbackRecord= nodeRecord
+    nodeRecorder.callbackRecordSet= nodeRecordSet
+
+setCallbacks()
+tBase= timeCommits() # commit without callbacks.
+results= list()
+setCallbacks(elemRecord= cc.controTensRecElastico3d(), nodeRecord= cc.controlMovModulusUVW())
+results.append(('code strings', timeCommits()-tBase))
+setCallbacks(elemRecordSet= cc.ElasticRangeStressControl(is3D= True), nodeRecord= cc.fnControlMovModulusUVW)
+results.append(('per-object callables (nodes)', timeCommits()-tBase))
+setCallbacks(elemRecordSet= cc.ElasticRangeStressControl(is3D= True), nodeRecordSet= cc.DisplacementModulusControl(3))
+results.append(('set-level callables', timeCommits()-tBase))
+
+print('number of elements: ', numElements, ' commits: ', numCommits)
+print('commit without callbacks: ', '{:.6f}'.format(tBase), 's')
+for label, t in results:
+    print(label, ': ', '{:.6f}'.format(t), 's/commit (x', '{:.1f}'.format(results[0][1]/t) if(t>0.0) else '-', ')')
@@ -23,6 +23,7 @@ python tests/actions/mononobe_okabe_test_01.py
 python tests/actions/test_earth_pressure.py
 python tests/actions/test_earth_pressure_sloped_wall.py
 python tests/actions/test_surf_unif_load_distributed.py
+python tests/actions/test_influence_surface_01.py
 echo "$BLEU" "  Wind action tests." "$NORMAL"
 python tests/actions/wind/test_windSIA.py
 python tests/actions/wind/test_wind_cylindr_01.py
@@ -203,7 +204,9 @@ echo "$BLEU" "Solver tests." "$NORMAL"
 python tests/solution/superlu_solver_test_01.py
 python tests/solution/superlu_solver_test_02.py
 python tests/solution/umf_solver_test_01.py
+python tests/solution/multi_load_case_static_linear_01.py
 python tests/solution/ill_conditioning_01.py
+python tests/solution/stage_profiler_01.py
 
 ## Constraint handlers tests.
 echo "$BLEU" "  Constraint handler tests." "$NORMAL"
@@ -235,6 +238,9 @@ python tests/solution/eigenvalues/modal_analysis_test_03.py
 python tests/solution/eigenvalues/modal_analysis_test_04.py
 python tests/solution/eigenvalues/modal_analysis_test_05.py
 python tests/solution/eigenvalues/test_cqc_01.py
+python tests/solution/eigenvalues/test_response_spectrum_01.py
+python tests/solution/eigenvalues/test_modal_time_history_01.py
+python tests/solution/eigenvalues/test_eigen_cache_01.py
 python tests/solution/eigenvalues/test_band_arpackpp_solver_01.py
 
 ## Geometric non-linearity.
@@ -343,6 +349,7 @@ python tests/preprocessor/sets/test_resisting_svd01.py
 python tests/preprocessor/sets/test_get_contours_01.py
 python tests/preprocessor/sets/test_get_contours_02.py
 python tests/preprocessor/sets/test_pick_entities.py
+python tests/preprocessor/sets/test_spatial_index_01.py
 python tests/preprocessor/sets/test_sets_and_grids.py
 python tests/preprocessor/sets/test_sets_and_grids_02.py
 python tests/preprocessor/sets/test_get_bnd_01.py
@@ -353,12 +360,14 @@ python tests/preprocessor/sets/test_set_transformation_02.py
 echo "$BLEU" "  Preprocessor grid model tests." "$NORMAL"
 python tests/preprocessor/grid_model/test_grid_model_01.py
 python tests/preprocessor/grid_model/test_grid_model_02.py
+python tests/preprocessor/grid_model/test_grid_model_03.py
 python tests/preprocessor/grid_model/test_elliptical_coord_01.py
 echo "$BLEU" "  Import/export tests." "$NORMAL"
 python tests/preprocessor/import_export/test_split_lines.py
 python tests/preprocessor/import_export/test_dxf_groups.py
 python tests/preprocessor/import_export/test_dxf_surfaces.py
 python tests/preprocessor/import_export/test_dxf_export_01.py
+python tests/preprocessor/import_export/test_reader_base_kpoints.py
 python tests/preprocessor/import_export/test_ifc_points.py
 python tests/preprocessor/import_export/test_ifc_lines.py
 python tests/preprocessor/import_export/test_ifc_surface.py
@@ -383,6 +392,7 @@ python tests/constraints/test_glue_node_to_element_03.py
 python tests/constraints/test_glue_node_to_element_04.py
 python tests/constraints/test_glue_node_to_element_05.py
 python tests/constraints/test_glue_node_to_element_06.py
+python tests/constraints/test_glue_sets_01.py
 python tests/constraints/test_pile_01.py
 
 #Load tests
@@ -566,6 +576,8 @@ python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/t
 python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram04.py
 python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram05.py
 python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram06.py
+python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram07.py
+python tests/materials/xc_materials/sections/fiber_section/interaction_diagram/test_interaction_diagram_cache_01.py
 python tests/materials/xc_materials/sections/fiber_section/plastic_hinge_on_IPE200.py
 echo "$BLEU" "        Membrane plate fiber section tests." "$NORMAL"
 python tests/materials/xc_materials/sections/fiber_section/membrane_plate/test_membrane_plate_fiber_material_01.py
@@ -647,6 +659,7 @@ python tests/materials/steel_shapes/test_aisc_w_shapes.py
 python tests/materials/steel_shapes/test_aisc_hss_shapes.py
 python tests/materials/steel_shapes/test_steel_shape_01.py
 python tests/materials/steel_shapes/test_steel_shape_02.py
+python tests/materials/steel_shapes/test_shapes_catalogue_01.py
 echo "$BLEU" "    EC3 tests." "$NORMAL"
 python tests/materials/ec3/test_buckling_resistance_01.py
 python tests/materials/ec3/test_lateral_torsional_buckling00.py
@@ -790,9 +803,21 @@ python tests/rough_calculations/retaining_wall_test_01.py
 #Postprocess tests
 echo "$BLEU" "Verifiying routines for post processing." "$NORMAL"
 python tests/postprocess/test_export_shell_internal_forces.py
+python tests/postprocess/test_linear_superposition_01.py
+python tests/postprocess/test_internal_forces_envelope_01.py
+python tests/postprocess/test_recorder_callables_01.py
+python tests/postprocess/test_internal_forces_store_01.py
+python tests/postprocess/test_control_vars_store_01.py
+python tests/postprocess/test_extrapolate_elem_attr_01.py
+python tests/postprocess/test_extrapolated_scalar_field_01.py
+python tests/postprocess/test_internal_forces_extractor_01.py
+python tests/postprocess/test_mesh_topology_cache_01.py
 echo "$BLEU" "  limit state checking." "$NORMAL"
 echo "$BLEU" "    SIA 262 limit state checking." "$NORMAL"
 python tests/postprocess/limit_state_checking/sia262/test_shell_normal_stresses_uls_checking.py
+python tests/postprocess/limit_state_checking/sia262/test_normal_stresses_direct_checking.py
+python tests/postprocess/limit_state_checking/sia262/test_parallel_checking.py
+python tests/postprocess/limit_state_checking/sia262/test_incremental_checking.py
 echo "$BLEU" "    ACI limit state checking." "$NORMAL"
 python tests/postprocess/limit_state_checking/aci/test_shear_uls_checking_aci.py
 echo "$BLEU" "    EHE limit state checking." "$NORMAL"
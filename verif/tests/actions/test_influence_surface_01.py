@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+''' Envelope of the effects of a moving load on a simply supported beam
+    obtained from its influence lines. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from solution import predefined_solutions
+from actions import influence_surface
+from actions.roadway_trafic import load_model_base as lmb
+
+L= 10.0 # Span.
+P= 100e3 # Axle load.
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+
+# Mesh (beam along the Y axis).
+numElements= 50
+beamNodes= [nodes.newNodeXYZ(5.0,i*L/numElements,0.0) for i in range(0,numElements+1)]
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([1,0,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+beamElements= list()
+for nA, nB in zip(beamNodes[:-1], beamNodes[1:]):
+    beamElements.append(elements.newElement("ElasticBeam3d",xc.ID([nA.tag,nB.tag])))
+
+# Constraints.
+modelSpace.fixNode('000_F0F',beamNodes[0].tag)
+modelSpace.fixNode('0F0_F0F',beamNodes[-1].tag)
+
+# Influence lines.
+midElement= beamElements[numElements//2] # first node at midspan.
+responses= [influence_surface.NodeReaction('R0', beamNodes[0], 2),
+            influence_surface.ElementInternalForce('My', midElement, 'My', 0),
+            influence_surface.ElementInternalForce('Mz', midElement, 'Mz', 0)]
+xcTotalSet= preprocessor.getSets.getSet('total')
+surfaces= influence_surface.InfluenceSurfaces('beam', xcTotalSet.nodes, responses)
+solProc= predefined_solutions.MultiLoadCaseStaticLinear(feProblem)
+surfaces.compute(solProc)
+
+# Two axles 1.2 m apart moving along the beam.
+loadModel= lmb.LoadModel(wLoads= [lmb.WheelLoad(pos=geom.Pos2d(0.0,-0.6),ld=P),lmb.WheelLoad(pos=geom.Pos2d(0.0,0.6),ld=P)])
+lane= influence_surface.Lane(geom.Pos2d(5.0,-1.0),geom.Pos2d(5.0,L+1.0))
+envelope= surfaces.sweep(loadModel, [lane], longStep= 0.1)
+
+RMax= envelope['R0']['max']
+RMaxRef= P*(1.0+(L-1.2)/L) # axles at y=0 and y=1.2
+M= max(abs(envelope[code][key].value) for code in ['My','Mz'] for key in ['max','min'])
+MRef= P*(L-1.2)/2.0 # one axle on each side of midspan (ordinates: a/2).
+ratio1= abs(RMax.value-RMaxRef)/RMaxRef
+ratio2= abs(RMax.yCentr-0.6)
+ratio3= abs(M-MRef)/MRef
+
+# Computing again must give the same coefficients (the unit load
+# patterns are reused, not loaded twice).
+coefficients0= surfaces.coefficients.copy()
+surfaces.compute(solProc)
+ratio4= abs(surfaces.coefficients-coefficients0).max()/abs(coefficients0).max()
+
+# Axle with two wheels 2 m apart, off the beam axis: the wheels are
+# projected onto the beam, so the effect is that of a single load P.
+axleModel= lmb.LoadModel(wLoads= [lmb.WheelLoad(pos=geom.Pos2d(-1.0,0.0),ld=P/2.0),lmb.WheelLoad(pos=geom.Pos2d(1.0,0.0),ld=P/2.0)])
+axleEnvelope= surfaces.sweep(axleModel, [lane], longStep= 0.1)
+axleR= axleEnvelope['R0']['max'].value
+axleM= max(abs(axleEnvelope[code][key].value) for code in ['My','Mz'] for key in ['max','min'])
+ratio5= abs(axleR-P)/P
+ratio6= abs(axleM-P*L/4.0)/(P*L/4.0)
+
+'''
+print('RMax= ', RMax.value/1e3, 'kN (', RMaxRef/1e3,') at y= ', RMax.yCentr)
+print('M= ', M/1e3, 'kN m (', MRef/1e3,')')
+print('ratio4= ', ratio4)
+print('axle R= ', axleR/1e3, 'kN (', P/1e3,')')
+print('axle M= ', axleM/1e3, 'kN m (', P*L/4.0/1e3,')')
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((ratio1<1e-6) and (ratio2<1e-6) and (ratio3<1e-6) and (ratio4<1e-9) and (ratio5<1e-6) and (ratio6<1e-6)):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
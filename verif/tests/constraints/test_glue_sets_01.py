@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+''' Check that glueSets couples each node of the master set with the
+    nearest node of the slave set (computed with a KD-tree), honouring
+    the tolerance and the one to one check. Home made test.'''
+
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es" "ana.ortega.ort@gmail.com"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from model.sets import sets_mng
+from misc_utils import log_messages as lmsg
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Deck nodes (master) and girder nodes (slave, slightly shifted).
+deckSet= preprocessor.getSets.defSet('deckSet')
+girderSet= preprocessor.getSets.defSet('girderSet')
+nDiv= 12; size= 0.5
+for i in range(0,nDiv+1):
+    for j in range(0,3):
+        deckSet.nodes.append(nodes.newNodeXYZ(i*size,j*size,0.0))
+        girderSet.nodes.append(nodes.newNodeXYZ(i*size+0.01*((i+j)%3),j*size-0.01,-0.02))
+# Node of the deck far from the girder.
+farNode= nodes.newNodeXYZ(20.0,0.0,0.0)
+deckSet.nodes.append(farNode)
+
+def nearestNodeTag(n, slaveNodes):
+    ''' Return the tag of the slave node nearest to n (brute force).'''
+    pos= n.getInitialPos3d
+    return min(slaveNodes, key= lambda s: s.getInitialPos3d.dist(pos)).tag
+
+# Reference pairs.
+refPairs= [(n.tag, nearestNodeTag(n, girderSet.nodes)) for n in deckSet.nodes if(n.tag!=farNode.tag)]
+
+# Glue with tolerance (the far node is not glued).
+matching= predefined_spaces.glueSets(preprocessor,[0,1,2],deckSet,girderSet,tol= 0.1)
+pairs= [(m.tag, s.tag) for m, s in matching.getPairs()]
+ok= (sorted(pairs)==sorted(refPairs))
+ok= ok and ([n.tag for n in matching.getUnmatchedNodes()]==[farNode.tag])
+ok= ok and (modelSpace.constraints.getNumMPs==len(refPairs))
+ok= ok and matching.isOneToOne()
+
+# Without tolerance the far node is glued to the nearest girder node,
+# which is already coupled, so the one to one check fails and no
+# constraint is created.
+numMPs= modelSpace.constraints.getNumMPs
+matching= predefined_spaces.glueSets(preprocessor,[0,1,2],deckSet,girderSet,oneToOne= True)
+ok= ok and (not matching.isOneToOne()) and (modelSpace.constraints.getNumMPs==numMPs)
+
+# Search based on one coordinate.
+matching= predefined_spaces.glueSets(preprocessor,[0],deckSet,girderSet,onCoord= 'Z')
+firstGirderNode= [n for n in girderSet.nodes][0]
+ok= ok and all(s.tag==firstGirderNode.tag for m, s in matching.getPairs())
+
+# Nearest nodes to a list of positions.
+positions= [geom.Pos3d(1.02,0.49,-0.01), geom.Pos3d(5.9,1.1,0.0)]
+nodeList= sets_mng.get_lstNod_from_lst3DPos(preprocessor,positions)
+mesh= preprocessor.getDomain.getMesh
+ok= ok and ([n.tag for n in nodeList]==[mesh.getNearestNode(p).tag for p in positions])
+
+'''
+print(pairs)
+print(matching.getReport())
+print(ok)
+'''
+
+import os
+fname= os.path.basename(__file__)
+if(ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+''' Check that the shapes read from the catalogue tables are equal to
+    those defined in the dictionaries modules and that the property-range
+    queries return the same shapes than a loop over the dictionaries.
+    Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import copy
+from materials.sections.structural_shapes import shapes_catalogue
+from materials.sections.structural_shapes import aisc_metric_shapes
+from materials.sections.structural_shapes import arcelor_metric_shapes
+from materials.sections.structural_shapes import aisc_shapes_dictionaries
+from materials.sections.structural_shapes import arcelor_shapes_dictionaries
+
+def sameShape(shapeA, shapeB):
+    ''' Return true if both dictionaries contain the same values (of the
+        same type).'''
+    retval= (list(shapeA.keys())==list(shapeB.keys()))
+    if(retval):
+        for key in shapeA:
+            if((type(shapeA[key])!=type(shapeB[key])) or (shapeA[key]!=shapeB[key])):
+                retval= False
+                break
+    return retval
+
+# Shapes from the tables.
+ok= True
+for table, dictModule in [(shapes_catalogue.aiscShapes, aisc_shapes_dictionaries), (shapes_catalogue.arcelorShapes, arcelor_shapes_dictionaries)]:
+    for familyName, shapes in shapes_catalogue.getFamilies(dictModule).items():
+        family= shapes_catalogue.ShapeFamily(familyName, table) # no derived properties.
+        ok= ok and (list(family.keys())==list(shapes.keys()))
+        for shapeName in shapes:
+            ok= ok and sameShape(family[shapeName], shapes[shapeName])
+
+# Derived properties.
+shape= copy.deepcopy(aisc_shapes_dictionaries.W['W8X21'])
+aisc_metric_shapes.setWShapeDerivedProperties(shape)
+ok= ok and sameShape(aisc_metric_shapes.W['W8X21'], shape)
+ok= ok and (aisc_metric_shapes.shapes.W is aisc_metric_shapes.W)
+shape= copy.deepcopy(arcelor_shapes_dictionaries.HE['HE_400_B'])
+arcelor_metric_shapes.setHEShapeDerivedProperties(shape)
+ok= ok and sameShape(arcelor_metric_shapes.HE['HE_400_B'], shape)
+
+# Lightest W shape with Wzpl >= 2e-3 m3 and h <= 0.5 m.
+WzplMin= 2e-3; hMax= 0.5
+W= aisc_metric_shapes.W
+ref= [name for name in aisc_shapes_dictionaries.W if((aisc_shapes_dictionaries.W[name]['Wzpl']>=WzplMin) and (aisc_shapes_dictionaries.W[name]['h']<=hMax))]
+ref.sort(key= lambda name: aisc_shapes_dictionaries.W[name]['P'])
+selection= W.select(minValues= {'Wzpl':WzplMin}, maxValues= {'h':hMax})
+lightest= W.getLightest(minValues= {'Wzpl':WzplMin}, maxValues= {'h':hMax})
+ok= ok and (len(ref)>0) and (selection==ref) and (lightest==ref[0])
+# Derived property (shear area) query.
+IPE= arcelor_metric_shapes.IPE
+ref= [name for name in arcelor_shapes_dictionaries.IPE if(IPE[name]['AreaQy']>=5e-3)]
+ok= ok and (len(ref)>0) and (IPE.select(minValues= {'AreaQy':5e-3}, sortBy= None)==ref)
+# Nothing found.
+ok= ok and (W.getLightest(minValues= {'h':100.0}) is None)
+
+'''
+print('selection: ', selection[:5])
+print('lightest: ', lightest)
+print(ok)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
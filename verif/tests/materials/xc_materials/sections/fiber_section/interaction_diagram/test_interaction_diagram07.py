@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+''' Check that the capacity factors computed in a single call
+    (getCapacityFactors) are equal to those computed point by point.
+    Home made test.'''
+from __future__ import print_function
+from __future__ import division
+
+import xc_base
+import geom
+import xc
+import numpy
+
+from materials.ehe import EHE_materials
+from materials.sections.fiber_section import def_simple_RC_section
+from materials import limit_state_checking_base as lscb
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2020, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+concrete= EHE_materials.HA30
+reinfSteel= EHE_materials.B500S
+areaFi16= 2.01e-4
+
+sccData=def_simple_RC_section.RCRectangularSection()
+sccData.sectionName= "sccData"
+sccData.sectionDescr= "Test."
+sccData.fiberSectionParameters.concrType= concrete
+sccData.h= 0.5
+sccData.b= 0.4
+sccData.fiberSectionParameters.reinfSteelType= reinfSteel
+sccData.negatvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam=16e-3,areaRebar= areaFi16,rebarsSpacing=0.1,width=0.4,nominalCover=0.04)])
+sccData.positvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam=16e-3,areaRebar= areaFi16,rebarsSpacing=0.1,width=0.4,nominalCover=0.04)])
+
+feProblem= xc.FEProblem()
+feProblem.logFileName= "/tmp/erase.log" # Don't print(warnings.)
+preprocessor=  feProblem.getPreprocessor
+sccData.defRCSection(preprocessor, 'd')
+diag3d= sccData.defInteractionDiagram(preprocessor)
+diag2d= sccData.defInteractionDiagramNMy(preprocessor)
+
+# Internal forces (N, My, Mz).
+numpy.random.seed(1)
+numPoints= 50
+internalForces= numpy.column_stack([numpy.random.uniform(-2000e3,500e3,numPoints), numpy.random.uniform(-150e3,150e3,numPoints), numpy.random.uniform(-150e3,150e3,numPoints)])
+
+# 3D diagram.
+CF3d= lscb.getCapacityFactors(diag3d, internalForces)
+CF3dRef= numpy.array([diag3d.getCapacityFactor(geom.Pos3d(N,My,Mz)) for N, My, Mz in internalForces.tolist()])
+ratio1= numpy.abs(CF3d-CF3dRef).max()
+
+# 2D diagram.
+CF2d= lscb.getCapacityFactors(diag2d, internalForces[:,0:2])
+CF2dRef= numpy.array([diag2d.getCapacityFactor(geom.Pos2d(N,My)) for N, My in internalForces[:,0:2].tolist()])
+ratio2= numpy.abs(CF2d-CF2dRef).max()
+
+feProblem.logFileName= "clog" # Display warnings if any.
+
+'''
+print('CF3d= ', CF3d)
+print('ratio1= ', ratio1)
+print('CF2d= ', CF2d)
+print('ratio2= ', ratio2)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((ratio1<1e-6) and (ratio2<1e-12) and (len(CF3d)==numPoints) and (CF3dRef.max()>1.0)):
+  print('test '+fname+': ok.')
+else:
+  lmsg.error(fname+' ERROR.')
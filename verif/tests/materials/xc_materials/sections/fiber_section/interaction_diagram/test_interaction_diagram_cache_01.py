@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+''' Check that the interaction diagrams read from the on-disk cache are
+    the same that those computed from the section definition and that
+    the cache key changes when the reinforcement changes. Home made test.'''
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import os
+import shutil
+import xc_base
+import geom
+import xc
+from materials.ehe import EHE_materials
+from materials.sections.fiber_section import def_simple_RC_section
+from materials.sections import RC_sections_container as sc
+from materials.sections import interaction_diagram_cache
+
+concrete= EHE_materials.HA30
+reinfSteel= EHE_materials.B500S
+
+def getSectionData(name, diam):
+    ''' Return a rectangular reinforced concrete section.'''
+    retval= def_simple_RC_section.RCRectangularSection()
+    retval.sectionName= name
+    retval.fiberSectionParameters.concrType= concrete
+    retval.h= 0.4
+    retval.b= 1.0
+    retval.fiberSectionParameters.reinfSteelType= reinfSteel
+    retval.negatvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam= diam, areaRebar= EHE_materials.Fi16, rebarsSpacing= 0.15, width= 1.0, nominalCover= 0.035)])
+    retval.positvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam= 12e-3, areaRebar= EHE_materials.Fi12, rebarsSpacing= 0.15, width= 1.0, nominalCover= 0.035)])
+    return retval
+
+feProblem= xc.FEProblem()
+feProblem.logFileName= "/tmp/erase.log" # Don't print warnings.
+preprocessor=  feProblem.getPreprocessor
+
+cachePath= '/tmp/interaction_diagram_cache_01'
+if(os.path.exists(cachePath)):
+    shutil.rmtree(cachePath)
+
+sectA= getSectionData('sectA', 16e-3) # Diagram computed without cache.
+sectB= getSectionData('sectB', 16e-3) # Same data, different name.
+sectC= getSectionData('sectC', 16e-3) # Same data, different name.
+sectD= getSectionData('sectD', 20e-3) # Rebar diameter changed.
+sectD.negatvRebarRows[0].areaRebar= EHE_materials.Fi20
+for s in [sectA, sectB, sectC, sectD]:
+    s.defRCSection(preprocessor, 'd')
+
+container= sc.SectionContainer()
+container.interactionDiagramCache= interaction_diagram_cache.InteractionDiagramCache(cachePath)
+diagramCache= container.interactionDiagramCache
+
+diagA= sectA.defInteractionDiagram(preprocessor)
+diagB= diagramCache.getInteractionDiagram(sectB, preprocessor) # Computed and stored.
+numFiles1= len(os.listdir(cachePath))
+diagC= diagramCache.getInteractionDiagram(sectC, preprocessor) # Read from cache.
+numFiles2= len(os.listdir(cachePath))
+diagD= diagramCache.getInteractionDiagram(sectD, preprocessor) # Computed and stored.
+numFiles3= len(os.listdir(cachePath))
+
+sameKey= (diagramCache.getKey(sectB)==diagramCache.getKey(sectC))
+differentKey= (diagramCache.getKey(sectB)!=diagramCache.getKey(sectD))
+
+internalForces= [geom.Pos3d(-1000e3,50e3,0.0), geom.Pos3d(200e3,-80e3,10e3), geom.Pos3d(-3000e3,0.0,150e3), geom.Pos3d(500e3,20e3,-30e3)]
+err= 0.0
+for f in internalForces:
+    cfA= diagA.getCapacityFactor(f)
+    err+= (diagB.getCapacityFactor(f)-cfA)**2
+    err+= (diagC.getCapacityFactor(f)-cfA)**2
+err= err**0.5
+
+'''
+print('numFiles: ', numFiles1, numFiles2, numFiles3)
+print('sameKey= ', sameKey)
+print('differentKey= ', differentKey)
+print('err= ', err)
+'''
+
+feProblem.logFileName= "clog" # Display warnings if any.
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((numFiles1==1) and (numFiles2==1) and (numFiles3==2) and sameKey and differentKey and (err<1e-10)):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
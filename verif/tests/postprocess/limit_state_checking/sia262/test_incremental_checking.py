@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+''' Check that the results of the incremental limit state checking (only
+    the elements and combinations whose data have changed are checked
+    again) are identical to those of the complete checking. Home made
+    test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from materials.ehe import EHE_materials
+from materials.sections.fiber_section import def_simple_RC_section
+from postprocess import element_section_map
+from postprocess import RC_material_distribution
+from materials.sections import RC_sections_container as sc
+from materials.sia262 import SIA262_limit_state_checking #Change SIA262->EHE
+from postprocess import limit_state_data as lsd
+from postprocess import incremental_checking
+from postprocess.config import default_config
+import shutil
+
+import logging
+
+
+#Hide INFO messages from modules.
+rootLogger = logging.getLogger()
+rootLogger.setLevel(logging.ERROR)
+
+feProblem= xc.FEProblem()
+feProblem.logFileName= "/tmp/erase.log" # Don't pring warnings
+feProblem.errFileName= "/tmp/erase.err" # Ignore warning messagess about maximum error in computation of the interaction diagram.
+
+
+elementTags= [2524,2527]
+#Reinforced concrete sections on each element.
+reinfConcreteSections= RC_material_distribution.RCMaterialDistribution()
+
+for eTag in elementTags:
+  reinfConcreteSections.sectionDistribution[eTag]= ["deck2","deck1"]
+
+# deck.
+concrete= EHE_materials.HA30
+concrete.alfacc= 0.85  #f_maxd= 0.85*fcd concrete long term compressive strength factor (normally alfacc=1)
+reinfSteel= EHE_materials.B500S
+areaFi12= 1.13e-4
+areaFi20= 3.14e-4
+areaFi25= 4.608e-4
+basicCover= 0.06
+numReinfBarsT= 5
+sepT= 1.0/numReinfBarsT
+numReinfBarsL= 7
+sepL= 1.0/numReinfBarsL
+
+sections= reinfConcreteSections.sectionDefinition
+
+deckSections= element_section_map.RCSlabBeamSection("deck","RC deck.",concrete, reinfSteel,0.3)
+deckSections.dir2PositvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam=12e-3,areaRebar=areaFi12,rebarsSpacing=sepT,nominalCover=basicCover)])
+deckSections.dir2NegatvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam=12e-3,areaRebar=areaFi12,rebarsSpacing=sepT,nominalCover=basicCover)])
+deckSections.dir1PositvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam=20e-3,areaRebar=areaFi20,rebarsSpacing=sepL,nominalCover=basicCover+12e-3)])
+deckSections.dir1NegatvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam=20e-3,areaRebar=areaFi20,rebarsSpacing=sepL,nominalCover=basicCover+12e-3)])
+sections.append(deckSections)
+
+import os
+pth= os.path.dirname(__file__)
+#print("pth= ", pth)
+if(not pth):
+  pth= "."
+fname= os.path.basename(__file__)
+
+#Checking normal stresses.
+lsd.normalStressesResistance.controller= SIA262_limit_state_checking.BiaxialBendingNormalStressController('ULS_normalStress')
+cfg=default_config.EnvConfig(language='en',intForcPath= 'results/internalForces/',verifPath= 'results/verifications/',reportPath='./',resultsPath= 'annex/',grWidth='120mm')
+cfg.projectDirTree.workingDirectory= '/tmp/'+os.path.splitext(fname)[0]
+cfg.projectDirTree.createTree() # To allow copying existing internal force data into.
+lsd.LimitStateData.envConfig= cfg
+intForcFileName= lsd.normalStressesResistance.getInternalForcesFileName()
+shutil.copy(pth+'/intForce_ULS_normalStressesResistance.csv',intForcFileName)
+stateFileName= incremental_checking.getStateFileName(lsd.normalStressesResistance)
+if(os.path.exists(stateFileName)):
+    os.remove(stateFileName)
+
+outCfg= lsd.VerifOutVars(listFile='N',calcMeanCF='Y')
+
+def readResults(limitState):
+    ''' Read the results file.'''
+    with open(limitState.getOutputDataFileName()) as f:
+        retval= f.read()
+    return retval
+
+def checkIncremental(numProcesses= 1):
+    ''' Compare the results of the incremental checking with those of
+        the complete checking and return the statistics of the incremental
+        checking.
+
+    :param numProcesses: number of worker processes used by the
+                         incremental checking.
+    '''
+    meanFCsRef= reinfConcreteSections.internalForcesVerification3D(lsd.normalStressesResistance,"d",outCfg)
+    resultsRef= readResults(lsd.normalStressesResistance)
+    meanFCs= reinfConcreteSections.internalForcesVerification3D(lsd.normalStressesResistance,"d",outCfg, numProcesses= numProcesses, incremental= True)
+    results= readResults(lsd.normalStressesResistance)
+    statistics= incremental_checking.CheckingState.load(stateFileName).statistics
+    ok= (len(resultsRef)>0) and (results==resultsRef) and (meanFCs==meanFCsRef)
+    return ok, statistics
+
+# First run: everything is checked.
+ok, statistics= checkIncremental()
+numPairs= statistics['pairs']
+ok= ok and (statistics['checkedElements']==2) and (statistics['checkedPairs']==numPairs)
+
+# Nothing changes: nothing is checked.
+okNoChanges, statistics= checkIncremental()
+ok= ok and okNoChanges and (statistics['checkedElements']==0) and (statistics['checkedPairs']==0)
+
+# The internal forces of a combination change for one element.
+with open(pth+'/intForce_ULS_normalStressesResistance.csv') as f:
+    lines= f.readlines()
+with open(intForcFileName,'w') as f:
+    for l in lines:
+        if(l.startswith('ELU0002, 2527,')):
+            values= l.split(',')
+            l= ', '.join(values[0:3]+[str(1.2*float(v)) for v in values[3:]])+'\n'
+        f.write(l)
+okForces, statistics= checkIncremental()
+ok= ok and okForces and (statistics['checkedElements']==1) and (statistics['checkedPairs']<numPairs)
+
+# The reinforcement of a section changes: all the combinations of the
+# elements that have it are checked (using two worker processes).
+deck1= sections.mapSections['deck1']
+deck1.positvRebarRows= def_simple_RC_section.LongReinfLayers([def_simple_RC_section.ReinfRow(rebarsDiam=25e-3,areaRebar=areaFi25,rebarsSpacing=sepL,nominalCover=basicCover+12e-3)])
+okSection, statistics= checkIncremental(numProcesses= 2)
+ok= ok and okSection and (statistics['checkedElements']==2) and (statistics['checkedPairs']==numPairs)
+
+'''
+print("statistics= ", statistics)
+print("ok= ", ok)
+'''
+
+feProblem.errFileName= "cerr" # Display errors if any.
+from misc_utils import log_messages as lmsg
+if(ok):
+  print('test '+fname+': ok.')
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+''' Check that the control variables read from the structured results
+    file (.npz) are the same that those obtained executing the Python
+    results file. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import os
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from postprocess import limit_state_data as lsd
+from postprocess import control_vars as cv
+from postprocess import control_vars_store
+from postprocess.config import default_config
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+
+# Mesh (simple frame).
+n1= nodes.newNodeXYZ(0.0,0.0,0.0)
+n2= nodes.newNodeXYZ(0.0,0.0,3.0)
+n3= nodes.newNodeXYZ(4.0,0.0,3.0)
+n4= nodes.newNodeXYZ(4.0,0.0,0.0)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+e1= elements.newElement("ElasticBeam3d",xc.ID([n1.tag,n2.tag]))
+e2= elements.newElement("ElasticBeam3d",xc.ID([n2.tag,n3.tag]))
+e3= elements.newElement("ElasticBeam3d",xc.ID([n3.tag,n4.tag]))
+
+# Control variables.
+totalSet= preprocessor.getSets.getSet('total')
+for e in totalSet.elements:
+    e.setProp('ULS_normalStressesResistanceSect1', cv.BiaxialBendingControlVars('sect1','ELU0'+str(e.tag),0.1*e.tag,-1e3*e.tag,2e3/3.0,3e3))
+    crackPos= cv.CrackControlBaseVars('ELS01',0.5/e.tag,1e3,2e3,3e3,200e6)
+    e.setProp('ULS_normalStressesResistanceSect2', cv.CrackControlVars('sect2',crackPos))
+
+fname= os.path.basename(__file__)
+cfg= default_config.EnvConfig(language='en',intForcPath= 'results/internalForces/',verifPath= 'results/verifications/',reportPath='./',resultsPath= 'annex/',grWidth='120mm')
+cfg.projectDirTree.workingDirectory= '/tmp/'+os.path.splitext(fname)[0]
+cfg.projectDirTree.createTree()
+lsd.LimitStateData.envConfig= cfg
+limitState= lsd.normalStressesResistance
+baseFileName= limitState.getOutputDataBaseFileName()
+sections= ['Sect1','Sect2']
+propNames= [limitState.label+s for s in sections]
+
+def getStrConstructors():
+    ''' Return the constructor strings of the control variables.'''
+    retval= list()
+    for e in totalSet.elements:
+        for propName in propNames:
+            retval.append(e.getProp(propName).getStrConstructor())
+    return retval
+
+def resetProps():
+    ''' Overwrite the control variables.'''
+    for e in totalSet.elements:
+        for propName in propNames:
+            e.setProp(propName, cv.BiaxialBendingControlVars())
+
+refValues= getStrConstructors()
+# Python file.
+cv.writeControlVarsFromElements(limitState.label, preprocessor, baseFileName, lsd.VerifOutVars(setCalc= totalSet), sections)
+resetProps()
+with open(baseFileName+'.py') as infile:
+    exec(infile.read())
+pyValues= getStrConstructors()
+# Structured file.
+if(os.path.exists(baseFileName+'.npz')):
+    os.remove(baseFileName+'.npz')
+cv.writeControlVarsFromElements(limitState.label, preprocessor, baseFileName, lsd.VerifOutVars(setCalc= totalSet, structuredResults= 'Y'), sections)
+resetProps()
+limitState.loadOutputData(preprocessor) # the .npz file is newer.
+npzValues= getStrConstructors()
+
+# Python file written from records (phantom model checking) without
+# import sentences.
+os.remove(baseFileName+'.npz')
+records= list()
+for e in totalSet.elements:
+    for i, propName in enumerate(propNames):
+        records.append((e.tag, i+1, e.getProp(propName)))
+cv.writeControlVarsFromRecords(limitState.label, records, baseFileName, lsd.VerifOutVars(setCalc= totalSet))
+resetProps()
+limitState.loadOutputData(preprocessor) # no .npz file.
+recordsValues= getStrConstructors()
+cv.writeControlVarsFromElements(limitState.label, preprocessor, baseFileName, lsd.VerifOutVars(setCalc= totalSet, structuredResults= 'Y'), sections)
+
+# Read the values as arrays.
+table= control_vars_store.ControlVarsTable(limitState.getStructuredOutputDataFileName())
+tags, CFs= table.getValues(propNames[0], 'CF')
+tags2, steelStresses= table.getValues(propNames[1], 'crackControlVarsPos.steelStress')
+ok= (tags.tolist()==[e1.tag, e2.tag, e3.tag]) and (CFs.tolist()==[0.1*e1.tag, 0.1*e2.tag, 0.1*e3.tag])
+ok= ok and (steelStresses.tolist()==[200e6]*3)
+
+'''
+print(refValues)
+print(npzValues)
+print(recordsValues)
+print(ok)
+'''
+
+from misc_utils import log_messages as lmsg
+if((len(refValues)==6) and (pyValues==refValues) and (npzValues==refValues) and (recordsValues==refValues) and ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+''' Check the extrapolation of element values to the nodes using the
+    sparse element-node incidence matrix. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from postprocess import extrapolate_elem_attr
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Mesh: three shell elements in a row (widths 1, 1 and 2).
+xi= [0.0, 1.0, 2.0, 4.0]
+bottomNodes= [nodes.newNodeXYZ(x,0.0,0.0) for x in xi]
+topNodes= [nodes.newNodeXYZ(x,1.0,0.0) for x in xi]
+memb1= typical_materials.defElasticMembranePlateSection(preprocessor, "memb1",2.1e6,0.3,0.0,0.1)
+elements= preprocessor.getElementHandler
+elements.defaultMaterial= memb1.name
+shells= list()
+for i in range(0,3):
+    shells.append(elements.newElement("ShellMITC4",xc.ID([bottomNodes[i].tag, bottomNodes[i+1].tag, topNodes[i+1].tag, topNodes[i].tag])))
+
+# Element values.
+for i, e in enumerate(shells):
+    e.setProp('v', float(i+1))
+
+xcTotalSet= preprocessor.getSets.getSet('total')
+# Extrapolation.
+extrapolate_elem_attr.extrapolate_elem_function_attr(xcTotalSet.elements,'v','getProp','v')
+values= [n.getProp('v') for n in bottomNodes]
+valuesRef= [1.0, 1.5, 2.5, 3.0]
+err= sum((a-b)**2 for a, b in zip(values, valuesRef))**0.5
+
+# Extrapolation weighted by element area.
+incidence= extrapolate_elem_attr.get_element_node_incidence(xcTotalSet.elements)
+elemValues= incidence.getElementValues(lambda e: e.getProp('v'))
+weightedValues= incidence.average(elemValues, incidence.getElementAreas())
+weightedValuesRef= {bottomNodes[1].tag: 1.5, bottomNodes[2].tag: (2.0+3.0*2.0)/3.0, bottomNodes[3].tag: 3.0}
+for tag, value in zip(incidence.nodeTags.tolist(), weightedValues.tolist()):
+    if(tag in weightedValuesRef):
+        err+= (value-weightedValuesRef[tag])**2
+err= err**0.5
+
+# The incidence matrix is reused (the cache doesn't keep the elements).
+sameIncidence= (extrapolate_elem_attr.get_element_node_incidence(xcTotalSet.elements).matrix is incidence.matrix)
+numIncidences= incidence.matrix.nnz
+
+# Mesh changed: the matrix is computed again and the old one discarded.
+shells.append(elements.newElement("ShellMITC4",xc.ID([bottomNodes[3].tag, nodes.newNodeXYZ(5.0,0.0,0.0).tag, nodes.newNodeXYZ(5.0,1.0,0.0).tag, topNodes[3].tag])))
+newIncidence= extrapolate_elem_attr.get_element_node_incidence(xcTotalSet.elements)
+cacheOk= (newIncidence.matrix is not incidence.matrix) and (newIncidence.getNumberOfElements()==4) and (len(extrapolate_elem_attr.incidenceCache)==1)
+
+'''
+print('values= ', values)
+print('weighted values= ', weightedValues)
+print('err= ', err)
+print('same incidence: ', sameIncidence)
+print('cache ok: ', cacheOk)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((err<1e-10) and sameIncidence and (numIncidences==12) and cacheOk):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+''' Check that the values of an ExtrapolatedScalarField defined by arrays
+    are placed at the index of each node (see getIdx) when the nodes have
+    been added to the set out of tag order. Home made test.'''
+
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from postprocess.xcVtk.fields import fields
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodeHandler= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodeHandler)
+
+nodes= [nodeHandler.newNodeXYZ(float(i),0.0,0.0) for i in range(0,5)]
+# Nodes added to the set out of tag order (the last one has no value).
+testSet= preprocessor.getSets.defSet('testSet')
+for i in [3,1,0,2,4]:
+    testSet.nodes.append(nodes[i])
+testSet.numerate()
+
+# Values given in yet another order.
+valueIndexes= [2,0,3,1]
+nodeTags= [nodes[i].tag for i in valueIndexes]
+nodeValues= [10.0*(i+1) for i in valueIndexes]
+field= fields.ExtrapolatedScalarField('v','getProp',testSet,nodeTags= nodeTags,nodeValues= nodeValues)
+values= field.getNodeValues(testSet.nodes)
+
+valuesRef= [10.0, 20.0, 30.0, 40.0, 0.0]
+err= 0.0
+for n, vRef in zip(nodes, valuesRef):
+    err+= (values[n.getIdx]-vRef)**2
+err= err**0.5
+
+'''
+print('values= ', values)
+print('err= ', err)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((err<1e-10) and (len(values)==5)):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+''' Check that the envelopes of internal forces computed with
+    BeamInternalForcesEnvelope are equal to those obtained updating the
+    element properties element by element. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from solution import predefined_solutions
+from postprocess import def_vars_control as vc
+from postprocess import internal_forces_envelope as ife
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+
+# Mesh (simple frame).
+n1= nodes.newNodeXYZ(0.0,0.0,0.0)
+n2= nodes.newNodeXYZ(0.0,0.0,3.0)
+n3= nodes.newNodeXYZ(4.0,0.0,3.0)
+n4= nodes.newNodeXYZ(4.0,0.0,0.0)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+e1= elements.newElement("ElasticBeam3d",xc.ID([n1.tag,n2.tag]))
+e2= elements.newElement("ElasticBeam3d",xc.ID([n2.tag,n3.tag]))
+e3= elements.newElement("ElasticBeam3d",xc.ID([n3.tag,n4.tag]))
+
+# Constraints.
+modelSpace.fixNode000_000(n1.tag)
+modelSpace.fixNode000_000(n4.tag)
+
+# Loads.
+lpG= modelSpace.newLoadPattern(name= 'G')
+lpG.newNodalLoad(n2.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpG.newNodalLoad(n3.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpQ= modelSpace.newLoadPattern(name= 'Q')
+lpQ.newNodalLoad(n2.tag,xc.Vector([5e3,2e3,0,0,0,0]))
+lpW= modelSpace.newLoadPattern(name= 'W')
+lpW.newNodalLoad(n3.tag,xc.Vector([0,-3e3,0,0,0,1e3]))
+loadCaseNames= ['G','Q','W']
+
+xcTotalSet= preprocessor.getSets.getSet('total')
+vc.defVarsEnvelopeInternalForcesBeamElems(xcTotalSet.elements)
+envelope= ife.BeamInternalForcesEnvelope(xcTotalSet.elements)
+
+def updateEnvelopes(name):
+    for e in xcTotalSet.elements:
+        vc.updateEnvelopeInternalForcesBeamElem(e)
+    envelope.updateFromModel(name)
+
+solProc= predefined_solutions.SimpleStaticLinear(feProblem)
+solProc.solveLoadCases(loadCaseNames, getDisplacements= False, callback= updateEnvelopes)
+
+err= 0.0
+for i, e in enumerate(envelope.elements):
+    for component in ife.components:
+        err+= sum((a-b)**2 for a, b in zip(e.getProp(component+'+'), envelope.getMax(component)[i]))
+        err+= sum((a-b)**2 for a, b in zip(e.getProp(component+'-'), envelope.getMin(component)[i]))
+err= err**0.5
+
+# Vz and T are tracked too.
+maxVz= abs(envelope.getMax('Vz')).max()+abs(envelope.getMin('Vz')).max()
+maxT= abs(envelope.getMax('T')).max()+abs(envelope.getMin('T')).max()
+# Governing combinations.
+governingN= envelope.getGoverningCombinations('N','-')[0][0]
+
+'''
+print('err= ', err)
+print('maxVz= ', maxVz, 'maxT= ', maxT)
+print('governing N-: ', governingN)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((err<1e-6) and (maxVz>1.0) and (maxT>1.0) and (governingN in loadCaseNames)):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
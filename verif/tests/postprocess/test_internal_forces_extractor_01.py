@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+''' Check that the internal forces extracted in bulk with
+    SetInternalForcesExtractor are equal to those obtained element by
+    element with export_internal_forces.getInternalForcesDict.
+    Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+import numpy
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from materials.sections import internal_forces
+from solution import predefined_solutions
+from postprocess.reports import export_internal_forces as eif
+from postprocess import internal_forces_extractor as ife
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+steel= typical_materials.defElasticMaterial(preprocessor, "steel",210e9)
+slab= typical_materials.defElasticMembranePlateSection(preprocessor, "slab",30e9,0.2,2500,0.25)
+
+# Mesh: a frame (3D beams), a brace (truss) and a slab (shells).
+n1= nodes.newNodeXYZ(0.0,0.0,0.0)
+n2= nodes.newNodeXYZ(0.0,0.0,3.0)
+n3= nodes.newNodeXYZ(4.0,0.0,3.0)
+n4= nodes.newNodeXYZ(4.0,0.0,0.0)
+n5= nodes.newNodeXYZ(0.0,2.0,3.0)
+n6= nodes.newNodeXYZ(4.0,2.0,3.0)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+beams= [elements.newElement("ElasticBeam3d",xc.ID([n1.tag,n2.tag])), elements.newElement("ElasticBeam3d",xc.ID([n2.tag,n3.tag])), elements.newElement("ElasticBeam3d",xc.ID([n3.tag,n4.tag]))]
+beams[1].setProp('chiLT', 0.8)
+elements.defaultMaterial= steel.name
+elements.dimElem= 3
+truss= elements.newElement("Truss",xc.ID([n1.tag,n3.tag]))
+truss.sectionArea= 1e-3
+elements.defaultMaterial= slab.name
+shell= elements.newElement("ShellMITC4",xc.ID([n2.tag,n3.tag,n6.tag,n5.tag]))
+shell.setProp('theta', 0.3)
+
+# Constraints.
+modelSpace.fixNode000_000(n1.tag)
+modelSpace.fixNode000_000(n4.tag)
+modelSpace.fixNode000_FFF(n5.tag)
+modelSpace.fixNode000_FFF(n6.tag)
+
+# Loads.
+lp0= modelSpace.newLoadPattern(name= '0')
+lp0.newNodalLoad(n2.tag,xc.Vector([5e3,2e3,-10e3,0,0,0]))
+lp0.newNodalLoad(n3.tag,xc.Vector([0,-3e3,-10e3,0,0,1e3]))
+modelSpace.addLoadCaseToDomain(lp0.name)
+
+# Solution
+solProc= predefined_solutions.SimpleStaticLinear(feProblem)
+result= solProc.solve()
+
+xcTotalSet= preprocessor.getSets.getSet('total')
+# Element by element.
+valuesRef= eif.getInternalForcesDict('0', xcTotalSet.elements)['0']
+# In bulk.
+extractor= ife.SetInternalForcesExtractor(xcTotalSet.elements)
+familyRows= extractor.extract()
+values= extractor.getInternalForcesDict('0', familyRows)['0']
+
+err= 0.0
+ok= (sorted(values.keys())==sorted(valuesRef.keys()))
+for tag in valuesRef:
+    ok= ok and (values[tag]['type']==valuesRef[tag]['type'])
+    forcesRef= valuesRef[tag]['internalForces']
+    forces= values[tag]['internalForces']
+    ok= ok and (sorted(forces.keys())==sorted(forcesRef.keys()))
+    for idx in forcesRef:
+        ok= ok and (sorted(forces[idx].keys())==sorted(forcesRef[idx].keys()))
+        for code in forcesRef[idx]:
+            err+= (forces[idx][code]-forcesRef[idx][code])**2
+err= err**0.5
+ok= ok and (len(familyRows['beam3d'])==6) and (len(familyRows['truss'])==2) and (len(familyRows['shell'])==2)
+
+# Wood-Armer internal forces.
+shellForces= numpy.array([[1e3,-2e3,0.5e3,3e3,-1e3,2e3,0.1e3,0.2e3],[-1e3,2e3,-0.5e3,-3e3,1e3,-2e3,0.3e3,0.4e3]])
+woodArmer= internal_forces.getWoodArmerArray(shellForces)
+errWA= 0.0
+for i, row in enumerate(shellForces.tolist()):
+    shellIF= internal_forces.ShellMaterialInternalForces(*row)
+    for j, iForces in enumerate(shellIF.getWoodArmer()):
+        errWA+= sum((a-b)**2 for a, b in zip(iForces.getComponents(), woodArmer[i,j].tolist()))
+errWA= errWA**0.5
+
+'''
+print('err= ', err)
+print('errWA= ', errWA)
+print('ok= ', ok)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((result==0) and (err<1e-6) and (errWA<1e-10) and ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
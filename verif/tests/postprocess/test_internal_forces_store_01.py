@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+''' Check that the internal forces read from the columnar binary store
+    are the same that those read from the JSON file. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import os
+import numpy
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from actions import combinations as combs
+from postprocess import limit_state_data as lsd
+from postprocess import internal_forces_store
+from postprocess.config import default_config
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+
+# Mesh (simple frame).
+n1= nodes.newNodeXYZ(0.0,0.0,0.0)
+n2= nodes.newNodeXYZ(0.0,0.0,3.0)
+n3= nodes.newNodeXYZ(4.0,0.0,3.0)
+n4= nodes.newNodeXYZ(4.0,0.0,0.0)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+e1= elements.newElement("ElasticBeam3d",xc.ID([n1.tag,n2.tag]))
+e2= elements.newElement("ElasticBeam3d",xc.ID([n2.tag,n3.tag]))
+e3= elements.newElement("ElasticBeam3d",xc.ID([n3.tag,n4.tag]))
+
+# Constraints.
+modelSpace.fixNode000_000(n1.tag)
+modelSpace.fixNode000_000(n4.tag)
+
+# Loads.
+lpG= modelSpace.newLoadPattern(name= 'G')
+lpG.newNodalLoad(n2.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpG.newNodalLoad(n3.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpQ= modelSpace.newLoadPattern(name= 'Q')
+lpQ.newNodalLoad(n2.tag,xc.Vector([5e3,2e3,0,0,0,0]))
+lpW= modelSpace.newLoadPattern(name= 'W')
+lpW.newNodalLoad(n3.tag,xc.Vector([0,-3e3,0,0,0,1e3]))
+
+# Load combinations
+combContainer= combs.CombContainer()
+combContainer.ULS.perm.add('ELU01', '1.35*G+1.5*Q')
+combContainer.ULS.perm.add('ELU02', '1.0*G+1.5*W')
+combContainer.ULS.perm.add('ELU03', '1.35*G+1.5*Q+0.9*W')
+totalSet= preprocessor.getSets.getSet('total')
+
+fname= os.path.basename(__file__)
+cfg= default_config.EnvConfig(language='en',intForcPath= 'results/internalForces/',verifPath= 'results/verifications/',reportPath='./',resultsPath= 'annex/',grWidth='120mm')
+cfg.projectDirTree.workingDirectory= '/tmp/'+os.path.splitext(fname)[0]
+lsd.LimitStateData.envConfig= cfg
+
+def getValues(internalForcesValues):
+    ''' Return a dictionary with the internal forces of each element,
+        section and combination.'''
+    retval= dict()
+    for tagElem in internalForcesValues:
+        for iforce in internalForcesValues[tagElem]:
+            retval[(iforce.tagElem, iforce.idSection, iforce.idComb)]= iforce.getComponents()
+    return retval
+
+# JSON file.
+lsd.normalStressesResistance.saveAll(combContainer,totalSet)
+elementTagsRef, idCombsRef, internalForcesRef= lsd.readIntForcesFile(lsd.normalStressesResistance.getInternalForcesFileName())
+valuesRef= getValues(internalForcesRef)
+jsonCombNames, jsonColumns= lsd.readIntForcesArrays(lsd.normalStressesResistance.getInternalForcesFileName())
+# Preloaded internal forces (parallel checking): the file is parsed only
+# once and the values of the elements of a set are taken from memory.
+jsonFileName= lsd.normalStressesResistance.getInternalForcesFileName()
+lsd.preloadIntForcesFile(jsonFileName)
+os.rename(jsonFileName, jsonFileName+'.bak') # not parsed again.
+setE2= preprocessor.getSets.defSet('setE2')
+setE2.elements.append(e2)
+preloadedItems= lsd.readIntForcesFile(jsonFileName, setE2)
+lsd.releaseIntForcesFile()
+os.rename(jsonFileName+'.bak', jsonFileName)
+preloadedValues= getValues(preloadedItems[2])
+preloadOk= (preloadedItems[0]==set([e2.tag])) and (preloadedItems[1]==idCombsRef)
+preloadOk= preloadOk and (preloadedValues==dict((key, valuesRef[key]) for key in valuesRef if(key[0]==e2.tag)))
+# Columnar binary store.
+lsd.LimitStateData.columnarInternalForces= True
+lsd.normalStressesResistance.saveAll(combContainer,totalSet)
+storeName= lsd.normalStressesResistance.getInternalForcesFileName()
+elementTags, idCombs, internalForces= lsd.readIntForcesFile(storeName)
+values= getValues(internalForces)
+lsd.LimitStateData.columnarInternalForces= False
+
+err= 0.0
+for key in valuesRef:
+    for vRef, v in zip(valuesRef[key], values[key]):
+        err+= (v-vRef)**2
+err= err**0.5
+
+# Read only the rows of one element.
+store= internal_forces_store.InternalForcesStore(storeName)
+columns= store.getColumns(['elemTag','N'], elemTags= [e2.tag])
+ok= (len(columns['N'])==len(idCombsRef)*2) and (set(columns['elemTag'].tolist())==set([e2.tag]))
+ok= ok and (store.getCombinationNames()==sorted(idCombsRef)) and (store.getElementType(e2.tag)=='ElasticBeam3d')
+# The element types are not in the header and they are written only when
+# new elements are appended.
+ok= ok and ('elementTypes' not in store.readHeader())
+elementTypesFileName= store.getElementTypesFileName()
+elementTypesMTime= os.stat(elementTypesFileName).st_mtime_ns
+store.updateElementTypes({e1.tag: 'ElasticBeam3d', e2.tag: 'ElasticBeam3d'})
+ok= ok and (os.stat(elementTypesFileName).st_mtime_ns==elementTypesMTime)
+
+# Bulk read (no object for each row): same values from both formats, the
+# store columns are memory mapped.
+combNames, columns= lsd.readIntForcesArrays(storeName)
+ok= ok and isinstance(columns['N'], numpy.memmap) and (len(columns['N'])==len(valuesRef))
+arrayValues= dict()
+for (combIdx, tagElem, idSection, N, Mz) in zip(columns['combIdx'].tolist(), columns['elemTag'].tolist(), columns['sectionIdx'].tolist(), columns['N'].tolist(), columns['Mz'].tolist()):
+    arrayValues[(tagElem, idSection, combNames[combIdx])]= (N, Mz)
+for key in valuesRef:
+    err+= (arrayValues[key][0]-valuesRef[key][0])**2+(arrayValues[key][1]-valuesRef[key][5])**2
+jsonTags= [int(tagElem) for tagElem in jsonColumns['elemTag'].tolist()]
+ok= ok and (sorted(jsonCombNames)==sorted(combNames)) and (len(jsonTags)==len(valuesRef)) and (set(jsonTags)==elementTagsRef)
+
+'''
+print('err= ', err)
+print('ok= ', ok)
+print('preloadOk= ', preloadOk)
+'''
+
+from misc_utils import log_messages as lmsg
+if((err<1e-10) and ok and preloadOk and (elementTags==elementTagsRef) and (idCombs==idCombsRef) and (len(values)==len(valuesRef))):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
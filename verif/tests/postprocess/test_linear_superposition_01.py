@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+''' Check that the internal forces and displacements obtained by linear
+    superposition of the load patterns results are the same that those
+    obtained solving each combination. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import os
+import json
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from actions import combinations as combs
+from postprocess import limit_state_data as lsd
+from postprocess.config import default_config
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+
+# Mesh (simple frame).
+n1= nodes.newNodeXYZ(0.0,0.0,0.0)
+n2= nodes.newNodeXYZ(0.0,0.0,3.0)
+n3= nodes.newNodeXYZ(4.0,0.0,3.0)
+n4= nodes.newNodeXYZ(4.0,0.0,0.0)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+e1= elements.newElement("ElasticBeam3d",xc.ID([n1.tag,n2.tag]))
+e2= elements.newElement("ElasticBeam3d",xc.ID([n2.tag,n3.tag]))
+e3= elements.newElement("ElasticBeam3d",xc.ID([n3.tag,n4.tag]))
+# Steel beam reduction factors (written along with the internal forces).
+e2.setProp('chiLT', 0.8)
+e2.setProp('chiN', 0.9)
+
+# Constraints.
+modelSpace.fixNode000_000(n1.tag)
+modelSpace.fixNode000_000(n4.tag)
+
+# Loads.
+lpG= modelSpace.newLoadPattern(name= 'G')
+lpG.newNodalLoad(n2.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpG.newNodalLoad(n3.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpQ= modelSpace.newLoadPattern(name= 'Q')
+lpQ.newNodalLoad(n2.tag,xc.Vector([5e3,2e3,0,0,0,0]))
+lpW= modelSpace.newLoadPattern(name= 'W')
+lpW.newNodalLoad(n3.tag,xc.Vector([0,-3e3,0,0,0,1e3]))
+
+# Load combinations
+combContainer= combs.CombContainer()
+combContainer.ULS.perm.add('ELU01', '1.35*G+1.5*Q')
+combContainer.ULS.perm.add('ELU02', '1.0*G+1.5*W')
+combContainer.ULS.perm.add('ELU03', '1.35*G+1.5*Q+0.9*W')
+totalSet= preprocessor.getSets.getSet('total')
+
+fname= os.path.basename(__file__)
+cfg= default_config.EnvConfig(language='en',intForcPath= 'results/internalForces/',verifPath= 'results/verifications/',reportPath='./',resultsPath= 'annex/',grWidth='120mm')
+cfg.projectDirTree.workingDirectory= '/tmp/'+os.path.splitext(fname)[0]
+lsd.LimitStateData.envConfig= cfg
+
+def readResults(limitState):
+    ''' Read the internal forces and the displacements.'''
+    with open(limitState.getInternalForcesFileName()) as json_file:
+        intForces= json.load(json_file)
+    with open(limitState.getDisplacementsFileName()) as f:
+        displacements= f.readlines()[1:]
+    return intForces, displacements
+
+# Solve each combination.
+lsd.normalStressesResistance.saveAll(combContainer,totalSet)
+intForcesRef, displacementsRef= readResults(lsd.normalStressesResistance)
+# Linear superposition.
+lsd.normalStressesResistance.saveAll(combContainer,totalSet, linearSuperposition= True)
+intForces, displacements= readResults(lsd.normalStressesResistance)
+
+err= 0.0
+count= 0
+for combName in intForcesRef:
+    for elemTag in intForcesRef[combName]:
+        elemDictRef= intForcesRef[combName][elemTag]
+        elemDict= intForces[combName][elemTag]
+        for sectionId in elemDictRef['internalForces']:
+            forcesRef= elemDictRef['internalForces'][sectionId]
+            forces= elemDict['internalForces'][sectionId]
+            if(set(forces.keys())!=set(forcesRef.keys())):
+                err+= 1.0
+            for key in forcesRef:
+                err+= (forces[key]-forcesRef[key])**2
+                count+= 1
+err= err**0.5
+
+dispErr= 0.0
+for lnRef, ln in zip(displacementsRef, displacements):
+    valuesRef= lnRef.split(',')
+    values= ln.split(',')
+    if(valuesRef[:2]!=values[:2]):
+        dispErr+= 1.0
+    for vRef, v in zip(valuesRef[2:],values[2:]):
+        dispErr+= (float(v)-float(vRef))**2
+dispErr= dispErr**0.5
+
+# Parsing of the combination expressions (implicit unit factors, signs and
+# load case names with hyphens).
+factorsOk= (combs.getLoadCaseFactors('G+1.5*Q')=={'G':1.0, 'Q':1.5})
+factorsOk= factorsOk and (combs.getLoadCaseFactors('1.35*G - Q+-0.5*W')=={'G':1.35, 'Q':-1.0, 'W':-0.5})
+factorsOk= factorsOk and (combs.getLoadCaseFactors('LC-1-0.5*LC-2')=={'LC-1':1.0, 'LC-2':-0.5})
+try:
+    combs.getLoadCaseFactors('1.35*G+1.5Q')
+    factorsOk= False
+except ValueError:
+    pass
+
+'''
+print('err= ', err)
+print('count= ', count)
+print('dispErr= ', dispErr)
+print('factorsOk= ', factorsOk)
+'''
+
+from misc_utils import log_messages as lmsg
+if((err<1e-3) and (count==3*3*2*6+3*2*2) and (len(displacements)==len(displacementsRef)) and (dispErr<1e-6) and factorsOk):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+''' Check that the topology of the VTK grid of a set is reused when the
+    same set is displayed again and rebuilt when the mesh changes (see
+    MeshTopology in vtk_FE_graphic). Home made test.'''
+
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from postprocess.xcVtk.FE_model import vtk_FE_graphic
+
+E= 30e6 # Young modulus
+l= 10 # Bar length
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodeHandler= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.SolidMechanics2D(nodeHandler)
+elast= typical_materials.defElasticMaterial(preprocessor, "elast",E)
+elements= preprocessor.getElementHandler
+elements.dimElem= 2 #Bars defined in a two dimensional space.
+elements.defaultMaterial= elast.name
+
+# Three bars.
+nodes= [nodeHandler.newNodeXY(i*l,0) for i in range(0,4)]
+trussSet= preprocessor.getSets.defSet('trussSet')
+for nA, nB in zip(nodes[:-1],nodes[1:]):
+    truss= elements.newElement("Truss",xc.ID([nA.tag,nB.tag]))
+    truss.sectionArea= 1
+    trussSet.elements.append(truss)
+trussSet.fillDownwards()
+
+def defineMeshScene(xcSet):
+    ''' Define the scene of the set and return the topology used for its
+        grid and the number of cells of the grid.'''
+    displaySettings= vtk_FE_graphic.DisplaySettingsFE()
+    displaySettings.setupGrid(xcSet)
+    displaySettings.defineMeshScene(None)
+    return vtk_FE_graphic.meshTopologyCache[xcSet.name], displaySettings.gridRecord.uGrid.GetNumberOfCells()
+
+vtk_FE_graphic.clearMeshTopologyCache()
+# First display: the topology is computed.
+topology0, numCells0= defineMeshScene(trussSet)
+# Same set again: the topology is reused.
+topology1, numCells1= defineMeshScene(trussSet)
+ok= (topology1 is topology0) and (numCells0==3) and (numCells1==3)
+
+# Change the mesh (a new bar outside the set): the domain stamp
+# (currentGeoTag) changes so the topology is rebuilt.
+geoTag0= preprocessor.getDomain.currentGeoTag # updated by the display.
+n4= nodeHandler.newNodeXY(3*l,l)
+truss= elements.newElement("Truss",xc.ID([nodes[-1].tag,n4.tag]))
+truss.sectionArea= 1
+topology2, numCells2= defineMeshScene(trussSet)
+ok= ok and (preprocessor.getDomain.currentGeoTag!=geoTag0) and (topology2 is not topology0) and (numCells2==3)
+
+# Add the new bar to the set: the topology is rebuilt again.
+trussSet.elements.append(truss)
+trussSet.fillDownwards()
+topology3, numCells3= defineMeshScene(trussSet)
+ok= ok and (topology3 is not topology2) and (numCells3==4)
+
+'''
+print('numCells: ', numCells0, numCells1, numCells2, numCells3)
+print('ok= ', ok)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+''' Check that the property recorders give the same results using the
+    legacy code strings, the per-object callables and the set-level
+    callables. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials.sections.structural_shapes import arcelor_metric_shapes
+from materials.sections import structural_steel
+from materials.ec3 import EC3_materials
+from postprocess import def_vars_control as vc
+from postprocess import callback_controls as cc
+
+L= 5.0 # Bar length (m)
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor= feProblem.getPreprocessor   
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+S275JR= EC3_materials.S275JR
+HE400B= structural_steel.SteelShape(S275JR,"HE_400_B",arcelor_metric_shapes.HE)
+profil= HE400B.defElasticShearSection3d(preprocessor)
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= HE400B.sectionName
+
+# Three identical cantilevers (one for each recorder).
+numElements= 4
+cantilevers= list()
+for k in range(0,3):
+    y= 2.0*k
+    cNodes= [nodes.newNodeXYZ(i*L/numElements,y,0.0) for i in range(0,numElements+1)]
+    cElements= [elements.newElement("ElasticBeam3d",xc.ID([nA.tag,nB.tag])) for nA, nB in zip(cNodes[:-1],cNodes[1:])]
+    modelSpace.fixNode000_000(cNodes[0].tag)
+    for e in cElements:
+        vc.defSteelShapeElasticRangeElementParameters(e,HE400B)
+    vc.defVarsControlTensRegElastico3d(cElements)
+    vc.defVarsControlMovModulus(cNodes[1:])
+    cantilevers.append((cNodes, cElements))
+
+def newRecorders(k):
+    cNodes, cElements= cantilevers[k]
+    elemRecorder= feProblem.getDomain.newRecorder("element_prop_recorder",None)
+    elemRecorder.setElements(xc.ID([e.tag for e in cElements]))
+    nodeRecorder= feProblem.getDomain.newRecorder("node_prop_recorder",None)
+    nodeRecorder.setNodes(xc.ID([n.tag for n in cNodes[1:]]))
+    return elemRecorder, nodeRecorder
+
+# Legacy strings (the code refers to the global "recorder" variable).
+recorder, nodeRecorder= newRecorders(0)
+recorder.callbackRecord= cc.controTensRecElastico3d()
+nodeRecorder.callbackRecord= cc.controlMovModulusUVW()
+# Per-object callables (nodes) and set-level callables (elements).
+recorder1, nodeRecorder1= newRecorders(1)
+recorder1.callbackRecordSet= cc.ElasticRangeStressControl(is3D= True)
+nodeRecorder1.callbackRecord= cc.fnControlMovModulusUVW
+# Set-level callables (nodes and elements).
+recorder2, nodeRecorder2= newRecorders(2)
+recorder2.callbackRecordSet= cc.ElasticRangeStressControl(is3D= True)
+nodeRecorder2.callbackRecordSet= cc.DisplacementModulusControl(3)
+
+# Load cases.
+loadCaseNames= list()
+for name, load in [('A',[0,0,-50e3,0,0,0]),('B',[0,20e3,-10e3,0,0,0]),('C',[10e3,-30e3,40e3,0,0,5e3])]:
+    lp= modelSpace.newLoadPattern(name= name)
+    for cNodes, cElements in cantilevers:
+        lp.newNodalLoad(cNodes[-1].tag,xc.Vector(load))
+    loadCaseNames.append(name)
+
+solProc= predefined_solutions.SimpleStaticLinear(feProblem)
+solProc.solveLoadCases(loadCaseNames)
+
+elementProps= cc.ElasticRangeStressControl.tnVars3d+cc.ElasticRangeStressControl.vVars3d
+nodeProps= ['dispMax', 'CombDispMax']
+def getProps(k):
+    cNodes, cElements= cantilevers[k]
+    retval= [[e.getProp(p) for p in elementProps] for e in cElements]
+    retval+= [[n.getProp(p) for p in nodeProps] for n in cNodes[1:]]
+    return retval
+
+def equal(a, b):
+    if(isinstance(a, str)):
+        return a==b
+    return abs(a-b)<=1e-9*max(1.0,abs(a))
+
+ref= getProps(0)
+ok= True
+for k in [1,2]:
+    for rowRef, row in zip(ref, getProps(k)):
+        ok= ok and all(equal(a,b) for a, b in zip(rowRef,row))
+# Something has been recorded.
+FCTNCP= max(e.getProp('FCTNCP') for e in cantilevers[2][1])
+ok= ok and (FCTNCP>0.0) and (cantilevers[2][1][0].getProp('HIPCPTN')!='')
+# Reset the control variables and run again: the set-level callables must
+# read the new values of the properties (and forget the old maxima).
+for cNodes, cElements in cantilevers:
+    vc.defVarsControlTensRegElastico3d(cElements)
+    vc.defVarsControlMovModulus(cNodes[1:])
+solProc.solveLoadCases(['A'])
+ref= getProps(0)
+for k in [1,2]:
+    for rowRef, row in zip(ref, getProps(k)):
+        ok= ok and all(equal(a,b) for a, b in zip(rowRef,row))
+ok= ok and (cantilevers[2][1][0].getProp('HIPCPTN')=='A') and (cantilevers[2][0][-1].getProp('CombDispMax')=='A')
+# Reset the properties directly (without def_vars_control): the
+# set-level callables must notice it too.
+for cNodes, cElements in cantilevers:
+    for e in cElements:
+        for p in elementProps:
+            e.setProp(p, '' if p.startswith('HIP') else 0.0)
+    for n in cNodes[1:]:
+        n.setProp('dispMax', 0.0)
+        n.setProp('CombDispMax', '')
+solProc.solveLoadCases(['B'])
+ref= getProps(0)
+for k in [1,2]:
+    for rowRef, row in zip(ref, getProps(k)):
+        ok= ok and all(equal(a,b) for a, b in zip(rowRef,row))
+ok= ok and (cantilevers[2][1][0].getProp('HIPCPTN')=='B') and (cantilevers[2][0][-1].getProp('CombDispMax')=='B')
+# Callables are returned by the properties.
+ok= ok and (nodeRecorder1.callbackRecord==cc.fnControlMovModulusUVW) and (recorder1.callbackRecord=='')
+
+'''
+print('ok= ', ok)
+print('FCTNCP= ', FCTNCP)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+#Test grid model 03. Generation/selection of geometric entities with
+#point tags greater than 999999 and vectorized transformations of points.
+__author__= "Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "ana.Ortega@ciccp.es"
+
+import os
+import math
+import xc_base
+import geom
+import xc
+from model.geometry import grid_model as gm
+
+# *** GEOMETRY ***
+FEcase= xc.FEProblem()
+prep=FEcase.getPreprocessor
+points= prep.getMultiBlockTopology.getPoints
+points.defaultTag= 999990 # point tags will exceed 999999
+
+xList=[i for i in range(6)]
+yList=[i for i in range(5)]
+zList=[i for i in range(3)]
+gridModel=gm.GridModel(prep,xList,yList,zList)
+gridModel.generatePoints()
+ratio0= gridModel.pointCounter-6*5*3
+# Point tags.
+pntTag= gridModel.getTagPntGrid((5,4,2))
+ratio1= pntTag-gridModel.getPntGrid((5,4,2)).tag
+
+# Surfaces and lines.
+setSurf= gridModel.genSurfOneRegion(gm.IJKRange((0,0,1),(5,4,1)),'setSurf')
+ratio2= setSurf.getSurfaces.size-5*4
+setLin= gridModel.genLinOneRegion(gm.IJKRange((0,0,0),(0,4,2)),'setLin')
+ratio3= setLin.getLines.size-(5*2+3*4)
+# Selection of existing entities.
+selSurf= gridModel.getSetSurfOneRegion(gm.IJKRange((1,1,0),(3,4,2)),'selSurf')
+ratio4= selSurf.getSurfaces.size-2*3
+selLin= gridModel.getSetLinOneRegion(gm.IJKRange((0,1,1),(2,3,2)),'selLin')
+ratio5= selLin.getLines.size-(2*2+3*1)
+# Surface vertices.
+s= [x for x in gridModel.getSetSurfOneRegion(gm.IJKRange((4,3,1),(5,4,1)),'s').getSurfaces][0]
+kPoints= [tag for tag in s.getKPoints()]
+ratio6= (kPoints[0]-gridModel.getTagPntGrid((4,3,1)))
+ratio7= (s.name!=gridModel.gridSurfName(*kPoints))
+# Lines from list of points.
+lstLin= gridModel.genSetLinFromLstGridPnt([(0,0,2),(1,0,2),(1,1,2)],'lstLin')
+lstLin2= gridModel.getSetLinFromLstGridPnt([(0,0,2),(1,0,2),(1,1,2)],'lstLin2')
+ratio8= lstLin2.getLines.size-2
+ratio9= len(gridModel.getLstLinRange(gm.IJKRange((0,0,2),(1,1,2))))-3
+
+# Transformations.
+rg= gm.IJKRange((0,0,0),(5,4,0))
+gridModel.movePointsRange(rg,xc.Vector([1.0,0.0,-1.0]))
+gridModel.rotPntsZAxis(rg,90,[1.0,0.0])
+pos= gridModel.getPntGrid((5,4,0)).getPos
+ratio10= math.sqrt((pos.x-(1.0-4.0))**2+(pos.y-5.0)**2+(pos.z+1.0)**2)
+gridModel.movePointsRangeToZcylinder(gm.IJKRange((1,1,2),(5,4,2)),0.0,0.0,10.0)
+pos= gridModel.getPntGrid((3,4,2)).getPos
+ratio11= math.sqrt(pos.x**2+pos.y**2)-10.0
+
+# Grid whose points are not generated by the grid model (only one of
+# them is assigned): the missing points are skipped.
+gridModel2=gm.GridModel(prep,[0,1],[0,1],[5])
+pnt= points.newPntFromPos3d(geom.Pos3d(1.0,1.0,5.0))
+gridModel2.indices.setPnt(2,2,1,pnt.tag)
+lstPnt= gridModel2.getLstPntRange(gm.IJKRange((0,0,0),(1,1,0)))
+ratio12= len(lstPnt)-1
+ratio13= lstPnt[0].tag-pnt.tag
+
+# Surfaces and lines on a grid whose points are all assigned through
+# its indices (not generated by the grid model).
+gridModel3=gm.GridModel(prep,[0,1],[0,1],[7])
+netTags= list()
+for i, j in [(1,1),(2,1),(2,2),(1,2)]:
+    pnt= points.newPntFromPos3d(geom.Pos3d(i-1.0,j-1.0,7.0))
+    gridModel3.indices.setPnt(i,j,1,pnt.tag)
+    netTags.append(pnt.tag)
+rg3= gm.IJKRange((0,0,0),(1,1,0))
+setSurf3= gridModel3.genSurfOneRegion(rg3,'setSurf3')
+s3= [x for x in setSurf3.getSurfaces][0]
+ratio14= setSurf3.getSurfaces.size-1
+ratio15= (sorted([tag for tag in s3.getKPoints()])!=sorted(netTags)) or (gridModel3.getNmSurfInRange(rg3)!=[s3.name])
+setLin3= gridModel3.genLinOneRegion(rg3,'setLin3')
+linKPoints= [tag for l in setLin3.getLines for tag in l.getKPoints()]
+ratio16= setLin3.getLines.size-4
+ratio17= (sorted(linKPoints)!=sorted(2*netTags))
+
+'''
+print(ratio0,ratio1,ratio2,ratio3,ratio4,ratio5,ratio6,ratio7,ratio8,ratio9,ratio10,ratio11,ratio12,ratio13,ratio14,ratio15,ratio16,ratio17)
+'''
+
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if (abs(ratio0)<1e-10) & (abs(ratio1)<1e-10) & (abs(ratio2)<1e-10) & (abs(ratio3)<1e-10) & (abs(ratio4)<1e-10) & (abs(ratio5)<1e-10) & (abs(ratio6)<1e-10) & (not ratio7) & (abs(ratio8)<1e-10) & (abs(ratio9)<1e-10) & (abs(ratio10)<1e-10) & (abs(ratio11)<1e-10) & (abs(ratio12)<1e-10) & (abs(ratio13)<1e-10) & (abs(ratio14)<1e-10) & (not ratio15) & (abs(ratio16)<1e-10) & (not ratio17):
+  print('test '+fname+': ok.')
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+''' Check that the k-points selected by ReaderBase (using a spatial
+    index) are the same that those obtained by computing the distances
+    to all the previous k-points. Home made test.'''
+from __future__ import division
+from __future__ import print_function
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es" "ana.ortega.ort@gmail.com"
+
+import os
+import random
+from scipy.spatial.distance import cdist
+from import_export import reader_base
+from import_export import block_topology_entities as bte
+
+random.seed(1234)
+# Points of a grid with some noise (each grid point appears several times).
+points= list()
+for i in range(0,600):
+    gridPoint= [random.randint(0,20)*0.5, random.randint(0,20)*0.5, random.randint(0,4)*3.0]
+    points.append([x+random.uniform(-0.004,0.004) for x in gridPoint])
+points.extend([[0.0,0.0,0.0],[0.01,0.0,0.0],[0.005,0.0,0.0]]) # ties.
+
+class TestReader(reader_base.ReaderBase):
+    ''' Reader that "imports" the points defined above.'''
+    def extractPoints(self):
+        ''' Return the points and their properties.'''
+        properties= list()
+        for i, p in enumerate(points):
+            objProperties= bte.BlockProperties()
+            objProperties.extendLabels(['p'+str(i)])
+            properties.append(('p'+str(i), objProperties))
+        return points, properties
+
+def bruteForceKPoints(threshold):
+    ''' Return the k-points and the merged labels computing the distances
+        to all the previous k-points.'''
+    kPoints= [points[0]]
+    labels= [['p0']]
+    for i, p in enumerate(points):
+        idx= cdist([p], kPoints).argmin()
+        if(cdist([p],[kPoints[idx]])[0][0]>threshold):
+            kPoints.append(p)
+            labels.append(['p'+str(i)])
+        else:
+            labels[idx].append('p'+str(i))
+    return kPoints, labels
+
+ok= True
+for threshold in [0.01, 0.6, 0.0]:
+    reader= TestReader('test_reader_base_kpoints', None, threshold)
+    kPointsNames= reader.selectKPoints()
+    refKPoints, refLabels= bruteForceKPoints(threshold)
+    ok= ok and (reader.kPoints==refKPoints)
+    for i in range(0,len(refKPoints)):
+        labels= reader.propertyDict[kPointsNames[i]].labels
+        ok= ok and (sorted(set(labels))==sorted(set(refLabels[i])))
+    # Nearest k-point.
+    for p in points[:100]+[[random.uniform(0,10) for j in range(3)] for k in range(100)]:
+        ok= ok and (reader.getIndexNearestPoint(p)==cdist([p], refKPoints).argmin())
+
+'''
+print(len(reader.kPoints), ok)
+'''
+
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+''' Check that the queries made using the spatial index of a set return
+    the same entities that those obtained by checking every node or
+    element of the set. Home made test.'''
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from model.sets import sets_mng
+from model.sets import spatial_index
+from model.geometry import geom_utils as gu
+from materials import typical_materials
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es" "ana.ortega.ort@gmail.com"
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Mesh of shell elements over the slab (two levels).
+nDivX= 20; nDivY= 12; size= 0.5
+nodeTags= dict()
+for k, z in enumerate([0.0, 3.0]):
+    for i in range(0,nDivX+1):
+        for j in range(0,nDivY+1):
+            n= nodes.newNodeXYZ(i*size,j*size,z)
+            nodeTags[(i,j,k)]= n.tag
+
+memb= typical_materials.defElasticMembranePlateSection(preprocessor, "memb",30e9,0.2,0.0,0.25)
+elements= preprocessor.getElementHandler
+elements.defaultMaterial= memb.name
+for k in range(0,2):
+    for i in range(0,nDivX):
+        for j in range(0,nDivY):
+            elements.newElement("ShellMITC4",xc.ID([nodeTags[(i,j,k)],nodeTags[(i+1,j,k)],nodeTags[(i+1,j+1,k)],nodeTags[(i,j+1,k)]]))
+
+totalSet= preprocessor.getSets.getSet('total')
+index= spatial_index.SetSpatialIndex(totalSet)
+
+def tags(entities):
+    return sorted([x.tag for x in entities])
+
+ok= True
+# Elements inside a prism.
+for xCent, yCent in [(2.3,1.7),(0.0,0.0),(9.9,5.9),(5.0,3.0)]:
+    prismBase= gu.rect2DPolygon(xCent=xCent,yCent=yCent,Lx=1.6,Ly=1.1)
+    ref= [e for e in totalSet.elements if prismBase.In(geom.Pos2d(e.getPosCentroid(True).x,e.getPosCentroid(True).y),0)]
+    s= sets_mng.set_included_in_orthoPrism(preprocessor,totalSet,prismBase,'Z','prism'+str(xCent),index)
+    ok= ok and (tags(s.elements)==tags(ref)) and (len(ref)>0)
+    ok= ok and (tags(index.getElementsInOrthoPrism(prismBase,'z'))==tags(ref))
+
+# Nodes in planes.
+sXY= sets_mng.get_set_nodes_plane_XY('planeXY',totalSet,3.0,spatialIndex= index)
+ok= ok and (tags(sXY.nodes)==tags([n for n in totalSet.nodes if abs(n.getCurrentPos3d(0).z-3.0)<=1e-4]))
+sXZ= sets_mng.get_set_nodes_plane_XZ('planeXZ',totalSet,2.5)
+ok= ok and (tags(sXZ.nodes)==tags([n for n in totalSet.nodes if abs(n.getCurrentPos3d(0).y-2.5)<=1e-4]))
+sYZ= sets_mng.get_set_nodes_plane_YZ('planeYZ',totalSet,1.0,0.6,index)
+ok= ok and (tags(sYZ.nodes)==tags([n for n in totalSet.nodes if abs(n.getCurrentPos3d(0).x-1.0)<=0.6]))
+
+# Nodes on a wire.
+wire= [geom.Pos3d(0.0,0.0,0.0),geom.Pos3d(10.0,6.0,0.0),geom.Pos3d(10.0,6.0,3.0)]
+ref= list()
+for pA, pB in zip(wire[:-1],wire[1:]):
+    segm= geom.Segment3d(pA,pB)
+    ref.extend([n for n in totalSet.nodes if n.getInitialPos3d.dist(segm)<0.01])
+ok= ok and (tags(sets_mng.get_nodes_wire(totalSet,wire,spatialIndex= index))==sorted(set(tags(ref))))
+
+# Nearest node.
+mesh= preprocessor.getDomain.getMesh
+for p in [geom.Pos3d(1.1,2.2,0.3),geom.Pos3d(9.3,-1.0,2.0)]:
+    ok= ok and (index.getNearestNode(p).tag==mesh.getNearestNode(p).tag)
+
+'''
+print(ok)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if(ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+''' Reuse of the eigen solutions (see eigen_cache module). The model
+is the one of test_cqc_01.py. The eigenvalue problem is solved only
+when the stiffness or the mass of the model change; otherwise the
+eigenpairs are read from the cache and copied to the domain.
+Home made test. '''
+import xc_base
+import geom
+import xc
+
+from model import predefined_spaces
+from materials import typical_materials
+from solution import predefined_solutions
+from solution import eigen_cache
+from misc import stage_profiler
+import os
+import shutil
+import numpy
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2020, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+def getNodeMassMatrix(m):
+    return xc.Matrix([[m,0,0,0,0,0],
+                      [0,m,0,0,0,0],
+                      [0,0,m,0,0,0],
+                      [0,0,0,0,0,0],
+                      [0,0,0,0,0,0],
+                      [0,0,0,0,0,0]])
+masaExtremo= 1e-2 # Masa en kg.
+EMat= 1 # Elastic modulus.
+nuMat= 0 # Poisson's ratio.
+GMat= EMat/(2.0*(1+nuMat)) # Shear modulus.
+
+Iyy= 1 # Flexural inertia on y axis.
+Izz= 1 # Flexural inertia on z axis.
+Ir= 4/3.0 # Torsional inertia.
+area= 1e7 # Section area.
+Lx= 1
+Ly= 1
+Lz= 1
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nod0= nodes.newNodeIDXYZ(0,0,0,0)
+nod1= nodes.newNodeXYZ(0,-Ly,0)
+nod2= nodes.newNodeXYZ(0,-Ly,-Lz)
+nod3= nodes.newNodeXYZ(Lx,-Ly,-Lz)
+nod3.mass= getNodeMassMatrix(masaExtremo)
+
+constraints= preprocessor.getBoundaryCondHandler
+nod0.fix(xc.ID([0,1,2,3,4,5]),xc.Vector([0,0,0,0,0,0]))
+
+# Materials definition
+scc= typical_materials.defElasticSection3d(preprocessor, "scc",area,EMat,GMat,Izz,Iyy,Ir)
+
+# Geometric transformation(s)
+linX= modelSpace.newLinearCrdTransf("linX",xc.Vector([1,0,0]))
+linY= modelSpace.newLinearCrdTransf("linY",xc.Vector([0,1,0]))
+
+# Elements definition
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= linX.name
+elements.defaultMaterial= scc.name
+beam3d= elements.newElement("ElasticBeam3d",xc.ID([0,1]))
+beam3d= elements.newElement("ElasticBeam3d",xc.ID([1,2]))
+elements.defaultTransformation= linY.name
+beam3d= elements.newElement("ElasticBeam3d",xc.ID([2,3]))
+
+fname= os.path.basename(__file__)
+cacheDirectory= '/tmp/'+os.path.splitext(fname)[0]
+if(os.path.exists(cacheDirectory)):
+    shutil.rmtree(cacheDirectory)
+profiler= stage_profiler.profiler
+profiler.enable()
+profiler.reset()
+
+# First run: the eigenvalue problem is solved and the solution stored.
+solProc= predefined_solutions.FrequencyAnalysis(feProblem, systemPrefix= 'full_gen')
+modalBasis0= solProc.solveEigenProblem(numModes= 3, cacheDirectory= cacheDirectory)
+eigenvector0= numpy.array([x for x in nod3.getEigenvector(1)])
+periods0= numpy.array([T for T in preprocessor.getDomain.getPeriods()])
+ok= (len(os.listdir(cacheDirectory))==1)
+
+# Change the mass: the solution must be computed again.
+nod3.mass= getNodeMassMatrix(4.0*masaExtremo)
+modalBasis1= solProc.solveEigenProblem(numModes= 3, cacheDirectory= cacheDirectory)
+ratio0= numpy.linalg.norm(modalBasis1.angularFrequencies-0.5*modalBasis0.angularFrequencies)/numpy.linalg.norm(modalBasis0.angularFrequencies)
+ok= ok and (len(os.listdir(cacheDirectory))==2)
+
+# Restore the mass: the solution is read from the cache and copied to the
+# domain.
+nod3.mass= getNodeMassMatrix(masaExtremo)
+modalBasis2= solProc.solveEigenProblem(numModes= 3, cacheDirectory= cacheDirectory)
+ratio1= numpy.linalg.norm(modalBasis2.eigenvectors-modalBasis0.eigenvectors)
+ratio2= numpy.linalg.norm(modalBasis2.getEffectiveModalMasses()-modalBasis0.getEffectiveModalMasses())
+ratio3= numpy.linalg.norm(numpy.array([x for x in nod3.getEigenvector(1)])-eigenvector0)
+ratio4= numpy.linalg.norm(numpy.array([T for T in preprocessor.getDomain.getPeriods()])-periods0)/numpy.linalg.norm(periods0)
+counters= dict(profiler.counters)
+
+# Other solver settings: the cached solution must not be reused.
+solProc2= predefined_solutions.FrequencyAnalysis(feProblem, systemPrefix= 'sym_band')
+fingerprints= [eigen_cache.getSolutionFingerprint(sp, 3) for sp in [solProc, solProc2]]
+ok= ok and (fingerprints[0]!=fingerprints[1])
+ok= ok and (counters.get('eigenSolutions')==2) and (counters.get('eigenCacheHits')==1)
+
+profiler.enable(False)
+profiler.reset()
+shutil.rmtree(cacheDirectory)
+
+'''
+print("angular frequencies: ",modalBasis0.angularFrequencies)
+print("ratio0= ",ratio0)
+print("ratio1= ",ratio1)
+print("ratio2= ",ratio2)
+print("ratio3= ",ratio3)
+print("ratio4= ",ratio4)
+print("counters: ",counters)
+print("ok= ",ok)
+   '''
+
+from misc_utils import log_messages as lmsg
+if((ratio0<1e-8) & (ratio1<1e-15) & (ratio2<1e-15) & (ratio3<1e-15) & (ratio4<1e-12) & ok):
+  print('test '+fname+': ok.')
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+''' Linear time-history analysis by modal superposition (see
+modal_time_history module). Response of a cantilever with a mass at
+its tip to a step load, compared with the exact solution of the
+equivalent single degree of freedom system. Home made test. '''
+import xc_base
+import geom
+import xc
+
+from model import predefined_spaces
+from materials import typical_materials
+from solution import predefined_solutions
+from solution import modal_basis
+from solution import modal_time_history
+import os
+import math
+import numpy
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2020, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+m= 1000.0 # Mass at the tip (kg).
+E= 30e9 # Elastic modulus.
+b= 0.3; h= 0.3 # Cross section dimensions.
+A= b*h # Cross section area.
+I= b*h**3/12.0 # Cross section moment of inertia.
+L= 3.0 # Length of the cantilever.
+P= 10e3 # Load at the tip.
+zeta= 0.05 # Damping ratio.
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+n0= nodes.newNodeXY(0,0)
+n1= nodes.newNodeXY(0,L)
+n1.mass= xc.Matrix([[m,0,0],[0,m,0],[0,0,0]])
+modelSpace.fixNode000(n0.tag)
+
+# Materials definition
+scc= typical_materials.defElasticSection2d(preprocessor, "scc",A,E,I)
+
+# Elements definition
+lin= modelSpace.newLinearCrdTransf("lin")
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= scc.name
+beam2d= elements.newElement("ElasticBeam2d",xc.ID([n0.tag,n1.tag]))
+
+# Modes.
+solProc= predefined_solutions.FrequencyAnalysis(feProblem, systemPrefix= 'full_gen')
+analOk= solProc.analysis.analyze(1)
+modalBasis= modal_basis.getModalBasis(preprocessor)
+totalSet= preprocessor.getSets.getSet('total')
+modalForces= modal_basis.getModalInternalForces(modalBasis, totalSet)
+
+k= 3*E*I/L**3 # Stiffness of the cantilever.
+omega= math.sqrt(k/m)
+ratio1= abs(modalBasis.angularFrequencies[0]-omega)/omega
+
+# Step load at the tip.
+T= 2*math.pi/omega
+th= modal_time_history.ModalTimeHistory(modalBasis, timeStep= T/40.0, duration= 5*T, dampingRatios= zeta)
+th.addNodalLoads({n1.tag: [P,0,0]}, lambda t: 1.0)
+th.solve()
+uTip= th.getNodeHistories([n1.tag])[n1.tag][:,0]
+t= th.times
+omegaD= omega*math.sqrt(1-zeta**2)
+uTipTeor= P/k*(1-numpy.exp(-zeta*omega*t)*(numpy.cos(omegaD*t)+zeta/math.sqrt(1-zeta**2)*numpy.sin(omegaD*t)))
+ratio2= numpy.abs(uTip-uTipTeor).max()/(P/k)
+
+# Envelope of the bending moment at the base of the cantilever.
+envelopes= th.getInternalForcesEnvelopes(modalForces)
+tags, minForces, maxForces= envelopes['beam2d']
+maxBaseMoment= max(abs(minForces[0,0,5]),abs(maxForces[0,0,5]))
+maxBaseMomentTeor= k*L*uTipTeor.max()
+ratio3= abs(maxBaseMoment-maxBaseMomentTeor)/maxBaseMomentTeor
+baseMomentHistory= th.getInternalForcesHistories(modalForces, [beam2d.tag])[beam2d.tag][:,0,5]
+ratio4= abs(numpy.abs(baseMomentHistory).max()-maxBaseMoment)/maxBaseMoment
+
+# Moving load along the cantilever: when the load is at the middle
+# half of the load goes to the tip.
+movingLoad= modal_time_history.MovingLoadSeries([n0,n1], [0.0], [P], speed= 2.0, direction= [1,0])
+modalLoad= movingLoad.getModalLoads(modalBasis, [0.5*L/2.0])[0,0]
+modalLoadTeor= 0.5*P*modalBasis.getNodeEigenvectors(n1.tag)[0,0]
+ratio5= abs(modalLoad-modalLoadTeor)/abs(modalLoadTeor)
+
+'''
+print("omega= ",modalBasis.angularFrequencies[0], " (",omega,")")
+print("ratio1= ",ratio1)
+print("ratio2= ",ratio2)
+print("maxBaseMoment= ",maxBaseMoment/1e3, " (",maxBaseMomentTeor/1e3,") kN m")
+print("ratio3= ",ratio3)
+print("ratio4= ",ratio4)
+print("ratio5= ",ratio5)
+   '''
+
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((ratio1<1e-6) & (ratio2<1e-6) & (ratio3<1e-6) & (ratio4<1e-10) & (ratio5<1e-12)):
+  print('test '+fname+': ok.')
+else:
+  lmsg.error(fname+' ERROR.')
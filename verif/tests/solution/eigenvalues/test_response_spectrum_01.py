@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+''' Response spectrum analysis by modal superposition (see
+response_spectrum module). The model is the one of test_cqc_01.py
+(example A87 of Solvia Verification Manual, based on example E26.8 of
+the book «Dynamics of Structures» by Clough, R. W., and Penzien, J.). '''
+import xc_base
+import geom
+import xc
+
+from model import predefined_spaces
+from materials import typical_materials
+from solution import predefined_solutions
+from solution import modal_basis
+from actions.quake import response_spectrum
+from postprocess import limit_state_data as lsd
+from postprocess.config import default_config
+import os
+import math
+import numpy
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2020, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+masaExtremo= 1e-2 # Masa en kg.
+nodeMassMatrix= xc.Matrix([[masaExtremo,0,0,0,0,0],
+                                         [0,masaExtremo,0,0,0,0],
+                                         [0,0,masaExtremo,0,0,0],
+                                         [0,0,0,0,0,0],
+                                         [0,0,0,0,0,0],
+                                         [0,0,0,0,0,0]])
+EMat= 1 # Elastic modulus.
+nuMat= 0 # Poisson's ratio.
+GMat= EMat/(2.0*(1+nuMat)) # Shear modulus.
+
+Iyy= 1 # Flexural inertia on y axis.
+Izz= 1 # Flexural inertia on z axis.
+Ir= 4/3.0 # Torsional inertia.
+area= 1e7 # Section area.
+Lx= 1
+Ly= 1
+Lz= 1
+
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nod0= nodes.newNodeIDXYZ(0,0,0,0)
+nod1= nodes.newNodeXYZ(0,-Ly,0)
+nod2= nodes.newNodeXYZ(0,-Ly,-Lz)
+nod3= nodes.newNodeXYZ(Lx,-Ly,-Lz)
+nod3.mass= nodeMassMatrix
+
+constraints= preprocessor.getBoundaryCondHandler
+nod0.fix(xc.ID([0,1,2,3,4,5]),xc.Vector([0,0,0,0,0,0]))
+
+# Materials definition
+scc= typical_materials.defElasticSection3d(preprocessor, "scc",area,EMat,GMat,Izz,Iyy,Ir)
+
+# Geometric transformation(s)
+linX= modelSpace.newLinearCrdTransf("linX",xc.Vector([1,0,0]))
+linY= modelSpace.newLinearCrdTransf("linY",xc.Vector([0,1,0]))
+
+# Elements definition
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= linX.name
+elements.defaultMaterial= scc.name
+baseBeam= elements.newElement("ElasticBeam3d",xc.ID([0,1]))
+beam3d= elements.newElement("ElasticBeam3d",xc.ID([1,2]))
+elements.defaultTransformation= linY.name
+beam3d= elements.newElement("ElasticBeam3d",xc.ID([2,3]))
+
+# Solution procedure
+solProc= predefined_solutions.FrequencyAnalysis(feProblem, systemPrefix= 'full_gen')
+analOk= solProc.analysis.analyze(3)
+
+# Modal basis.
+totalSet= preprocessor.getSets.getSet('total')
+modalBasis= modal_basis.getModalBasis(preprocessor)
+periods= modalBasis.getPeriods()
+
+# Theorethical values taken from the exampleE26.8 of the book: Clough, R. W., and Penzien, J., Dynamics of Structures
+angularFrequenciesTeor= numpy.array([4.59,4.83,14.56])
+ratio0= numpy.linalg.norm(modalBasis.angularFrequencies-angularFrequenciesTeor)
+effectiveModalMassesXTeor= masaExtremo*numpy.array([.731**2/1.588,.271**2/1.075,1/1.678])
+effectiveModalMassesX= modalBasis.getEffectiveModalMasses()[:,0]
+ratio1= numpy.linalg.norm(effectiveModalMassesX-effectiveModalMassesXTeor)/masaExtremo
+ratio2= abs(modalBasis.totalMasses[0]-masaExtremo)/masaExtremo
+
+# Response spectrum (spectral acceleration of each mode).
+aceleraciones= [2.27,2.45,6.98]
+def spectrum(T):
+    return aceleraciones[numpy.argmin(abs(periods-T))]
+rsAnalysis= response_spectrum.ResponseSpectrumAnalysis(modalBasis, {0: spectrum}, dampingRatio= 0.05, modalCombination= 'CQC')
+
+# This CQC coefficientes are taken from Solvia manual
+crossCQCCoefficientsTeor= numpy.array([[1,0.79280,0.005705],[0.79280,1,0.006383],[0.005705,0.006383,1]])
+ratio3= numpy.linalg.norm(rsAnalysis.getCorrelationCoefficients()-crossCQCCoefficientsTeor)
+
+# This displacements coefficients are taken from the Solvia manual.
+amplitudes= rsAnalysis.getModalAmplitudes(0)
+maxDispModTeor= numpy.array([[36.202e-3,-11.549e-3,49.548e-3],[7.123e-3,26.38e-3,0.945e-3],[19.625e-3,-4.746e-3,-15.445e-3]])
+maxDispMod= amplitudes[:,numpy.newaxis]*modalBasis.getNodeEigenvectors(nod3.tag)[:,0:3]
+ratio4= numpy.linalg.norm(abs(maxDispMod)-abs(maxDispModTeor))
+maxDispCQCTeor= numpy.array([46.53e-3,19.18e-3,52.53e-3])
+maxDispCQC= rsAnalysis.getNodeDisplacements()[modalBasis.getNodeIndexes()[nod3.tag],0:3]
+ratio5= numpy.linalg.norm(maxDispCQC-maxDispCQCTeor)
+
+# Modal internal forces: the force at the base of the first beam
+# equals the inertia forces of the mass (omega^2*m*phi).
+modalForces= modal_basis.getModalInternalForces(modalBasis, totalSet)
+beamIndex= list(modalForces.elementTags['beam3d']).index(baseBeam.tag)
+baseForces= modalForces.modalForces['beam3d'][:,beamIndex,0,0:3]
+baseForcesTeor= modalBasis.angularFrequencies[:,numpy.newaxis]**2*masaExtremo*modalBasis.getNodeEigenvectors(nod3.tag)[:,0:3]
+ratio6= numpy.linalg.norm(numpy.linalg.norm(baseForces,axis= 1)-numpy.linalg.norm(baseForcesTeor,axis= 1))/numpy.linalg.norm(baseForcesTeor)
+
+# Pseudo-combinations written in the internal forces file of a limit state.
+fname= os.path.basename(__file__)
+cfg= default_config.EnvConfig(language='en',intForcPath= 'results/internalForces/',verifPath= 'results/verifications/',reportPath='./',resultsPath= 'annex/',grWidth='120mm')
+cfg.projectDirTree.workingDirectory= '/tmp/'+os.path.splitext(fname)[0]
+lsd.LimitStateData.envConfig= cfg
+limitState= lsd.normalStressesResistance
+intForcFileName= limitState.getInternalForcesFileName()
+if(os.path.exists(intForcFileName)):
+    os.remove(intForcFileName)
+combRows= rsAnalysis.getPseudoCombinationRows(modalForces, 'EQ')
+limitState.appendCombinationRows(combRows, modalForces.extractor)
+elementTags, idCombs, internalForcesValues= lsd.readIntForcesFile(intForcFileName)
+envelope= rsAnalysis.getInternalForces(modalForces)['beam3d'][1]
+ok= (idCombs==set(['EQ+','EQ-'])) and (len(elementTags)==3)
+for iForces in internalForcesValues[baseBeam.tag]:
+    sign= 1.0 if(iForces.idComb=='EQ+') else -1.0
+    ok= ok and (abs(iForces.N-sign*envelope[beamIndex,iForces.idSection,0])<1e-9)
+
+'''
+print("angular frequencies: ",modalBasis.angularFrequencies)
+print("ratio0= ",ratio0)
+print("effective modal masses: ",effectiveModalMassesX)
+print("ratio1= ",ratio1)
+print("ratio2= ",ratio2)
+print("ratio3= ",ratio3)
+print("maximum modal displacements: ",maxDispMod*1000)
+print("ratio4= ",ratio4)
+print("maxDispCQC= ",maxDispCQC*1e3)
+print("ratio5= ",ratio5)
+print("ratio6= ",ratio6)
+print("ok= ",ok)
+   '''
+
+from misc_utils import log_messages as lmsg
+if((ratio0<1e-2) & (ratio1<5e-3) & (ratio2<1e-12) & (ratio3<1e-5) & (ratio4<1e-5) & (ratio5<1e-5) & (ratio6<1e-6) & ok):
+  print('test '+fname+': ok.')
+else:
+  lmsg.error(fname+' ERROR.')
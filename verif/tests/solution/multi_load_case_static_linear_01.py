@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+''' Check that the displacements obtained with the MultiLoadCaseStaticLinear
+    solution procedure (stiffness matrix factorized only once) are equal to
+    those obtained solving each load case separately and that the tangent
+    is formed only once. Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from solution import predefined_solutions
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+
+# Mesh (simple frame).
+n1= nodes.newNodeXYZ(0.0,0.0,0.0)
+n2= nodes.newNodeXYZ(0.0,0.0,3.0)
+n3= nodes.newNodeXYZ(4.0,0.0,3.0)
+n4= nodes.newNodeXYZ(4.0,0.0,0.0)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+e1= elements.newElement("ElasticBeam3d",xc.ID([n1.tag,n2.tag]))
+e2= elements.newElement("ElasticBeam3d",xc.ID([n2.tag,n3.tag]))
+e3= elements.newElement("ElasticBeam3d",xc.ID([n3.tag,n4.tag]))
+
+# Constraints.
+modelSpace.fixNode000_000(n1.tag)
+modelSpace.fixNode000_000(n4.tag)
+
+# Loads.
+lpG= modelSpace.newLoadPattern(name= 'G')
+lpG.newNodalLoad(n2.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpG.newNodalLoad(n3.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpQ= modelSpace.newLoadPattern(name= 'Q')
+lpQ.newNodalLoad(n2.tag,xc.Vector([5e3,2e3,0,0,0,0]))
+eleLoad= lpQ.newElementalLoad("beam3d_uniform_load")
+eleLoad.elementTags= xc.ID([e2.tag])
+eleLoad.transZComponent= -2e3
+lpW= modelSpace.newLoadPattern(name= 'W')
+lpW.newNodalLoad(n3.tag,xc.Vector([0,-3e3,0,0,0,1e3]))
+loadCaseNames= ['G','Q','W']
+
+# Solve each load case separately.
+solProc= predefined_solutions.SimpleStaticLinear(feProblem)
+refDisplacements= solProc.solveLoadCases(loadCaseNames)
+
+err= 0.0
+countsOk= True
+for soeType, solverType in [('band_spd_lin_soe', 'band_spd_lin_lapack_solver'), ('sparse_gen_col_lin_soe', 'super_lu_solver')]:
+    # Solve all the load cases with a single factorization.
+    multiSolProc= predefined_solutions.MultiLoadCaseStaticLinear(feProblem, soeType= soeType, solverType= solverType)
+    multiSolProc.solAlgo.measureTimes= True # count the stages too.
+    multiSolProc.solAlgo.resetStageTimes()
+    displacements= multiSolProc.solveLoadCases(loadCaseNames)
+    stageCounts= multiSolProc.solAlgo.stageCounts
+    # The tangent is formed (and factorized) only once.
+    countsOk= countsOk and (stageCounts.get('formTangent')==1) and (stageCounts.get('solve')==len(loadCaseNames))
+    for name in loadCaseNames:
+        for tag in refDisplacements[name]:
+            for uRef, u in zip(refDisplacements[name][tag], displacements[name][tag]):
+                err+= (u-uRef)**2
+err= err**0.5
+
+maxDisp= 0.0
+for name in loadCaseNames:
+    for tag in refDisplacements[name]:
+        for u in refDisplacements[name][tag]:
+            maxDisp= max(maxDisp, abs(u))
+
+'''
+print('err= ', err)
+print('maxDisp= ', maxDisp)
+print('countsOk= ', countsOk)
+'''
+
+import os
+from misc_utils import log_messages as lmsg
+fname= os.path.basename(__file__)
+if((err<1e-10) and (maxDisp>1e-6) and countsOk):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')
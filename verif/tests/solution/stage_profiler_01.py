@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+''' Check the time of each stage recorded by the stage profiler when
+    computing the internal forces of some load combinations.
+    Home made test.'''
+
+from __future__ import print_function
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2020, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega@ciccp.es"
+
+import os
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from materials.sections import section_properties
+from actions import combinations as combs
+from postprocess import limit_state_data as lsd
+from postprocess.config import default_config
+from misc import stage_profiler
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+
+# Materials
+sectionGeometry= section_properties.RectangularSection("test",b=.3,h=.4)
+section= typical_materials.defElasticShearSection3d(preprocessor, "section", sectionGeometry.A(), 30e9, 12.5e9, sectionGeometry.Iz(), sectionGeometry.Iy(), sectionGeometry.J(), sectionGeometry.alphaY())
+
+# Mesh (simple frame).
+n1= nodes.newNodeXYZ(0.0,0.0,0.0)
+n2= nodes.newNodeXYZ(0.0,0.0,3.0)
+n3= nodes.newNodeXYZ(4.0,0.0,3.0)
+n4= nodes.newNodeXYZ(4.0,0.0,0.0)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= lin.name
+elements.defaultMaterial= section.name
+e1= elements.newElement("ElasticBeam3d",xc.ID([n1.tag,n2.tag]))
+e2= elements.newElement("ElasticBeam3d",xc.ID([n2.tag,n3.tag]))
+e3= elements.newElement("ElasticBeam3d",xc.ID([n3.tag,n4.tag]))
+
+# Constraints.
+modelSpace.fixNode000_000(n1.tag)
+modelSpace.fixNode000_000(n4.tag)
+
+# Loads.
+lpG= modelSpace.newLoadPattern(name= 'G')
+lpG.newNodalLoad(n2.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpG.newNodalLoad(n3.tag,xc.Vector([0,0,-10e3,0,0,0]))
+lpQ= modelSpace.newLoadPattern(name= 'Q')
+lpQ.newNodalLoad(n2.tag,xc.Vector([5e3,2e3,0,0,0,0]))
+
+# Load combinations
+combContainer= combs.CombContainer()
+combContainer.ULS.perm.add('ELU01', '1.35*G+1.5*Q')
+combContainer.ULS.perm.add('ELU02', '1.0*G+1.5*Q')
+totalSet= preprocessor.getSets.getSet('total')
+
+fname= os.path.basename(__file__)
+cfg= default_config.EnvConfig(language='en',intForcPath= 'results/internalForces/',verifPath= 'results/verifications/',reportPath='./',resultsPath= 'annex/',grWidth='120mm')
+cfg.projectDirTree.workingDirectory= '/tmp/'+os.path.splitext(fname)[0]
+lsd.LimitStateData.envConfig= cfg
+
+profiler= stage_profiler.profiler
+# Disabled profiler: nothing is recorded.
+profiler.enable(False)
+profiler.reset()
+lsd.normalStressesResistance.saveAll(combContainer,totalSet)
+ok= (len(profiler.records)==0)
+
+# Enabled profiler.
+profiler.enable()
+lsd.normalStressesResistance.saveAll(combContainer,totalSet)
+summary= profiler.getSummary()
+counters= dict(profiler.counters)
+profiler.enable(False)
+profiler.reset()
+
+ok= ok and (summary['saveAll']['calls']==1) and (summary['saveAll/solve']['calls']==2)
+ok= ok and (counters['analyses']==2)
+# Split of the analysis time (from the solution algorithm).
+analyzeTime= summary['saveAll/solve/analyze']['time']
+substagesTime= 0.0
+for stage in ['formTangent', 'formUnbalance', 'solve', 'update', 'setup']:
+    substage= summary['saveAll/solve/analyze/'+stage]
+    ok= ok and (substage['calls']==2)
+    substagesTime+= substage['time']
+ok= ok and (abs(substagesTime-analyzeTime)<=0.01*analyzeTime+1e-4)
+ok= ok and ('saveAll/getInternalForces' in summary) and ('saveAll/writeInternalForces' in summary)
+
+'''
+print(summary)
+print('ok= ', ok)
+'''
+
+from misc_utils import log_messages as lmsg
+if(ok):
+    print('test '+fname+': ok.')
+else:
+    lmsg.error(fname+' ERROR.')